@@ -270,9 +270,11 @@ plugins: Dict[str, Set[str]] = {
     # Sink plugins.
     "datahub-kafka": kafka_common,
     "datahub-rest": rest_common,
+    "datahub-rest-async": rest_common,
     "sync-file-emitter": {"filelock"},
     "datahub-lite": {
-        "duckdb",
+        # The bulk write path unpacks batches with the json extension's from_json.
+        "duckdb>=0.9.0",
         "fastapi",
         "uvicorn",
     },
@@ -506,6 +508,7 @@ base_dev_requirements = {
             "sagemaker",
             "kafka",
             "datahub-rest",
+            "datahub-rest-async",
             "datahub-lite",
             "great-expectations",
             "presto",
@@ -659,6 +662,7 @@ entry_points = {
         "blackhole = datahub.ingestion.sink.blackhole:BlackHoleSink",
         "datahub-kafka = datahub.ingestion.sink.datahub_kafka:DatahubKafkaSink",
         "datahub-rest = datahub.ingestion.sink.datahub_rest:DatahubRestSink",
+        "datahub-rest-async = datahub.ingestion.sink.datahub_rest_async:DatahubRestAsyncSink",
         "datahub-lite = datahub.ingestion.sink.datahub_lite:DataHubLiteSink",
     ],
     "datahub.ingestion.checkpointing_provider.plugins": [
@@ -1,8 +1,11 @@
+import contextlib
+import itertools
 import logging
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from random import choices
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import click
 import humanfriendly
@@ -17,13 +20,19 @@ from datahub.ingestion.graph.client import DataHubGraph, get_default_graph
 from datahub.ingestion.graph.filters import RemovedStatusFilter
 from datahub.telemetry import telemetry
 from datahub.upgrade import upgrade
+from datahub.utilities.bounded_scheduler import run_with_bounded_concurrency
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.ratelimiter import ConcurrentRateLimiter
 from datahub.utilities.urns.urn import guess_entity_type
 
 logger = logging.getLogger(__name__)
 
 _RUN_TABLE_COLUMNS = ["urn", "aspect name", "created at"]
 _UNKNOWN_NUM_RECORDS = -1
+_DELETE_RUN_ID = "__datahub-delete-cli"
+
+# Soft deletes are sent as batches of status aspects of this size.
+_SOFT_DELETE_BATCH_SIZE = 100
 
 _DELETE_WITH_REFERENCES_TYPES = {
     "tag",
@@ -295,6 +304,26 @@ def references(urn: str, dry_run: bool, force: bool) -> None:
     default=False,
     help="Only delete soft-deleted entities, for hard deletion",
 )
+@click.option(
+    "--workers",
+    required=False,
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of entities (or batches of soft-deleted entities) to delete concurrently",
+)
+@click.option(
+    "--rate-limit",
+    required=False,
+    type=click.IntRange(min=1),
+    help="Maximum number of deletions per second, where a batch of soft-deleted entities counts as one",
+)
+@click.option(
+    "--progress-file",
+    required=False,
+    type=click.Path(dir_okay=False),
+    help="File to record the deleted urns in. If the file already exists, the urns in it are skipped, "
+    "which allows resuming an interrupted deletion",
+)
 @upgrade.check_upgrade
 @telemetry.with_telemetry()
 def by_filter(
@@ -312,6 +341,9 @@ def by_filter(
     batch_size: int,
     dry_run: bool,
     only_soft_deleted: bool,
+    workers: int,
+    rate_limit: Optional[int],
+    progress_file: Optional[str],
 ) -> None:
     """Delete metadata from datahub using a single urn or a combination of filters."""
 
@@ -340,88 +372,107 @@ def by_filter(
     graph = get_default_graph()
     logger.info(f"Using {graph}")
 
-    # Determine which urns to delete.
+    # Determine which urns to delete. The urns are streamed, so that deletion can
+    # start without waiting for all of them to be fetched.
     delete_by_urn = bool(urn) and not recursive
+    urns: Iterable[str]
     if urn:
         urns = [urn]
 
         if recursive:
             # Add children urns to the list.
             if guess_entity_type(urn) == "dataPlatformInstance":
-                urns.extend(
-                    graph.get_urns_by_filter(
-                        platform_instance=urn,
-                        status=soft_delete_filter,
-                        batch_size=batch_size,
-                    )
+                children = graph.get_urns_by_filter(
+                    platform_instance=urn,
+                    status=soft_delete_filter,
+                    batch_size=batch_size,
                 )
             else:
-                urns.extend(
-                    graph.get_urns_by_filter(
-                        container=urn,
-                        status=soft_delete_filter,
-                        batch_size=batch_size,
-                    )
+                children = graph.get_urns_by_filter(
+                    container=urn,
+                    status=soft_delete_filter,
+                    batch_size=batch_size,
                 )
+            urns = itertools.chain(urns, children)
     else:
-        urns = list(
-            graph.get_urns_by_filter(
-                entity_types=[entity_type] if entity_type else None,
-                platform=platform,
-                env=env,
-                query=query,
-                status=soft_delete_filter,
-                batch_size=batch_size,
-            )
+        urns = graph.get_urns_by_filter(
+            entity_types=[entity_type] if entity_type else None,
+            platform=platform,
+            env=env,
+            query=query,
+            status=soft_delete_filter,
+            batch_size=batch_size,
+        )
+
+    deleted_urns: Set[str] = set()
+    if progress_file and os.path.exists(progress_file):
+        deleted_urns = _read_progress_file(progress_file)
+        click.echo(
+            f"Skipping {len(deleted_urns)} urn(s) that were already deleted according to {progress_file}"
         )
-        if len(urns) == 0:
+        urns = (urn for urn in urns if urn not in deleted_urns)
+
+    # Print out a summary of the urns to be deleted and confirm with the user.
+    if not delete_by_urn:
+        # Only the first batch of urns is fetched before asking for confirmation.
+        urns_preview, has_more_urns, urns = _peek(urns, batch_size)
+        if len(urns_preview) == 0:
             click.echo(
                 "Found no urns to delete. Maybe you want to change your filters to be something different?"
             )
             return
+        num_urns = (
+            f"more than {len(urns_preview)}"
+            if has_more_urns
+            else str(len(urns_preview))
+        )
 
-    # Print out a summary of the urns to be deleted and confirm with the user.
-    if not delete_by_urn:
         urns_by_type: Dict[str, List[str]] = {}
-        for urn in urns:
+        for urn in urns_preview:
             entity_type = guess_entity_type(urn)
             urns_by_type.setdefault(entity_type, []).append(urn)
         if len(urns_by_type) > 1:
             # Display a breakdown of urns by entity type if there's multiple.
-            click.echo("Found urns of multiple entity types")
+            click.echo(
+                f"Found {num_urns} urns of multiple entity types"
+                + (
+                    f", including the first {len(urns_preview)}"
+                    if has_more_urns
+                    else ""
+                )
+            )
             for entity_type, entity_urns in urns_by_type.items():
                 click.echo(
                     f"- {len(entity_urns)} {entity_type} urn(s). Sample: {choices(entity_urns, k=min(5, len(entity_urns)))}"
                 )
         else:
             click.echo(
-                f"Found {len(urns)} {entity_type} urn(s). Sample: {choices(urns, k=min(5, len(urns)))}"
+                f"Found {num_urns} {entity_type} urn(s). Sample: {choices(urns_preview, k=min(5, len(urns_preview)))}"
             )
 
         if not force and not dry_run:
             click.confirm(
-                f"This will delete {len(urns)} entities from DataHub. Do you want to continue?",
+                f"This will delete {num_urns} entities from DataHub. Do you want to continue?",
                 abort=True,
             )
 
-    urns_iter = urns
     if not delete_by_urn and not dry_run:
-        urns_iter = progressbar.progressbar(urns, redirect_stdout=True)
+        urns = progressbar.progressbar(urns, redirect_stdout=True)
 
     # Run the deletion.
-    deletion_result = DeletionResult()
     with PerfTimer() as timer:
-        for urn in urns_iter:
-            one_result = _delete_one_urn(
-                graph=graph,
-                urn=urn,
-                aspect_name=aspect,
-                soft=soft,
-                dry_run=dry_run,
-                start_time=start_time,
-                end_time=end_time,
-            )
-            deletion_result.merge(one_result)
+        deletion_result = _delete_urns(
+            graph=graph,
+            urns=urns,
+            aspect_name=aspect,
+            soft=soft,
+            dry_run=dry_run,
+            start_time=start_time,
+            end_time=end_time,
+            workers=workers,
+            rate_limit=rate_limit,
+            progress_file=progress_file,
+        )
 
     # Report out a summary of the deletion result.
     click.echo(
@@ -539,6 +590,72 @@ def _validate_batch_size(batch_size: int) -> None:
         raise click.UsageError("Batch size cannot exceed 10,000.")
 
 
+def _peek(urns: Iterable[str], count: int) -> Tuple[List[str], bool, Iterator[str]]:
+    # Returns the first count urns, whether there are more, and all of the urns.
+    urns_iter = iter(urns)
+    preview = list(itertools.islice(urns_iter, count + 1))
+    return preview[:count], len(preview) > count, itertools.chain(preview, urns_iter)
+
+
+def _read_progress_file(progress_file: str) -> Set[str]:
+    with open(progress_file) as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+def _delete_urns(
+    graph: DataHubGraph,
+    urns: Iterable[str],
+    soft: bool,
+    dry_run: bool,
+    aspect_name: Optional[str],
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+    workers: int,
+    rate_limit: Optional[int],
+    progress_file: Optional[str] = None,
+) -> DeletionResult:
+    # Shared by all the workers, so it must account for calls that are still running.
+    rate_limiter = ConcurrentRateLimiter(max_calls=rate_limit) if rate_limit else None
+
+    def _delete_batch(batch: List[str]) -> DeletionResult:
+        with rate_limiter or contextlib.nullcontext():
+            if len(batch) > 1:
+                graph.soft_delete_entities(urns=batch, run_id=_DELETE_RUN_ID)
+                return DeletionResult(num_entities=len(batch), num_records=len(batch))
+            return _delete_one_urn(
+                graph=graph,
+                urn=batch[0],
+                aspect_name=aspect_name,
+                soft=soft,
+                dry_run=dry_run,
+                start_time=start_time,
+                end_time=end_time,
+            )
+
+    # Soft deletes are grouped into batched writes of the status aspect.
+    urns_iter = iter(urns)
+    batch_size = _SOFT_DELETE_BATCH_SIZE if soft and not dry_run else 1
+    batches = iter(lambda: list(itertools.islice(urns_iter, batch_size)), [])
+
+    deletion_result = DeletionResult()
+    with contextlib.ExitStack() as stack:
+        progress = (
+            stack.enter_context(open(progress_file, "a"))
+            if progress_file and not dry_run
+            else None
+        )
+        for batch, result in run_with_bounded_concurrency(
+            _delete_batch, batches, max_workers=workers, ordered=False
+        ):
+            if isinstance(result, Exception):
+                raise result
+            deletion_result.merge(result)
+            if progress:
+                progress.writelines(f"{urn}\n" for urn in batch)
+                progress.flush()
+    return deletion_result
+
+
 def _delete_one_urn(
     graph: DataHubGraph,
     urn: str,
@@ -547,7 +664,7 @@ def _delete_one_urn(
     aspect_name: Optional[str] = None,
     start_time: Optional[datetime] = None,
     end_time: Optional[datetime] = None,
-    run_id: str = "__datahub-delete-cli",
+    run_id: str = _DELETE_RUN_ID,
 ) -> DeletionResult:
     rows_affected: int = 0
     ts_rows_affected: int = 0
@@ -302,3 +302,13 @@ class LineageConfig(ConfigModel):
         default=False,
         description="When enabled, sql parser will run in isolated in a separate process. This can affect processing time but can protect from sql parser's mem leak.",
     )
+
+    sql_parsing_cache_path: Optional[str] = Field(
+        default=None,
+        description="If set, the results of parsing SQL statements for lineage are cached in this file, and reused across runs as long as the schemas of the tables involved don't change. The file can only be used by one ingestion run at a time.",
+    )
+
+    sql_parsing_cache_max_size_mb: int = Field(
+        default=1024,
+        description="Approximate size limit of the SQL parsing cache. The least recently used results are evicted at the end of each run.",
+    )
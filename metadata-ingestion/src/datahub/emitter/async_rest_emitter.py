@@ -0,0 +1,347 @@
+import asyncio
+import datetime
+import logging
+import ssl
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import aiohttp
+
+from datahub.cli.cli_utils import get_system_auth
+from datahub.configuration.common import ConfigurationError, OperationalError
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.request_helper import (
+    SUPPORTED_REQUEST_COMPRESSIONS,
+    compress_payload,
+    server_accepts_compression,
+)
+from datahub.emitter.rest_emitter import (
+    _DEFAULT_COMPRESSION_MIN_SIZE,
+    _DEFAULT_CONNECT_TIMEOUT_SEC,
+    _DEFAULT_READ_TIMEOUT_SEC,
+    _DEFAULT_RETRY_MAX_TIMES,
+    _DEFAULT_RETRY_METHODS,
+    _DEFAULT_RETRY_STATUS_CODES,
+    _make_mce_payload,
+    _make_mcp_payload,
+    _make_operational_error,
+)
+from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
+    MetadataChangeEvent,
+    MetadataChangeProposal,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_CONNECTIONS = 100
+_DEFAULT_KEEPALIVE_TIMEOUT_SEC = 30.0
+
+# These mirror the urllib3 Retry configuration used by the sync emitter.
+_RETRY_BACKOFF_FACTOR = 2
+_RETRY_BACKOFF_MAX_SEC = 120
+_RETRY_AFTER_STATUS_CODES = {413, 429, 503}
+
+
+class AsyncDataHubRestEmitter:
+    """An asyncio-native version of DataHubRestEmitter.
+
+    All requests share a single aiohttp session, so connections are pooled and
+    kept alive across requests. Retries follow the same rules as the sync
+    emitter: up to `retry_max_times` retries on connection errors and on the
+    configured status codes, with exponential backoff.
+
+    The underlying session is bound to the event loop that first uses it,
+    so an instance should only be used from a single event loop.
+    """
+
+    _gms_server: str
+    _token: Optional[str]
+    _connect_timeout_sec: float = _DEFAULT_CONNECT_TIMEOUT_SEC
+    _read_timeout_sec: float = _DEFAULT_READ_TIMEOUT_SEC
+    _retry_status_codes: List[int] = _DEFAULT_RETRY_STATUS_CODES
+    _retry_methods: List[str] = _DEFAULT_RETRY_METHODS
+    _retry_max_times: int = _DEFAULT_RETRY_MAX_TIMES
+
+    def __init__(
+        self,
+        gms_server: str,
+        token: Optional[str] = None,
+        connect_timeout_sec: Optional[float] = None,
+        read_timeout_sec: Optional[float] = None,
+        retry_status_codes: Optional[List[int]] = None,
+        retry_methods: Optional[List[str]] = None,
+        retry_max_times: Optional[int] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+        ca_certificate_path: Optional[str] = None,
+        client_certificate_path: Optional[str] = None,
+        disable_ssl_verification: bool = False,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        keepalive_timeout_sec: float = _DEFAULT_KEEPALIVE_TIMEOUT_SEC,
+        compression: Optional[str] = None,
+        compression_min_size: Optional[int] = None,
+    ):
+        if not gms_server:
+            raise ConfigurationError("gms server is required")
+        if (
+            compression is not None
+            and compression not in SUPPORTED_REQUEST_COMPRESSIONS
+        ):
+            raise ConfigurationError(
+                f"Unsupported compression {compression}; must be one of {sorted(SUPPORTED_REQUEST_COMPRESSIONS)}"
+            )
+        self._gms_server = gms_server
+        self._token = token
+        self.server_config: Dict[str, Any] = {}
+
+        self._headers: Dict[str, str] = {
+            "X-RestLi-Protocol-Version": "2.0.0",
+            "Content-Type": "application/json",
+        }
+        if token:
+            self._headers["Authorization"] = f"Bearer {token}"
+        else:
+            system_auth = get_system_auth()
+            if system_auth is not None:
+                self._headers["Authorization"] = system_auth
+
+        if extra_headers:
+            self._headers.update(extra_headers)
+
+        self._ssl: Union[ssl.SSLContext, bool] = True
+        if ca_certificate_path or client_certificate_path:
+            ssl_context = ssl.create_default_context(cafile=ca_certificate_path)
+            if client_certificate_path:
+                ssl_context.load_cert_chain(client_certificate_path)
+            self._ssl = ssl_context
+        if disable_ssl_verification:
+            self._ssl = False
+
+        if connect_timeout_sec:
+            self._connect_timeout_sec = connect_timeout_sec
+
+        if read_timeout_sec:
+            self._read_timeout_sec = read_timeout_sec
+
+        if retry_status_codes is not None:  # Only if missing. Empty list is allowed
+            self._retry_status_codes = retry_status_codes
+
+        if retry_methods is not None:
+            self._retry_methods = retry_methods
+
+        if retry_max_times:
+            self._retry_max_times = retry_max_times
+
+        # Set to None if the server turns out to not support compressed requests.
+        self._compression = compression
+        self._compression_checked = False
+        self._compression_min_size = (
+            compression_min_size
+            if compression_min_size is not None
+            else _DEFAULT_COMPRESSION_MIN_SIZE
+        )
+
+        self._max_connections = max_connections
+        self._keepalive_timeout_sec = keepalive_timeout_sec
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                keepalive_timeout=self._keepalive_timeout_sec,
+                ssl=self._ssl,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self._connect_timeout_sec,
+                    sock_read=self._read_timeout_sec,
+                ),
+            )
+        return self._session
+
+    async def test_connection(self) -> dict:
+        url = f"{self._gms_server}/config"
+        async with self._get_session().get(url) as response:
+            if response.status == 200:
+                config: dict = await response.json(content_type=None)
+                if config.get("noCode") == "true":
+                    self.server_config = config
+                    return config
+                raise ConfigurationError(
+                    "You have either connected to a pre-v0.8.0 DataHub GMS instance, or to a different server altogether! "
+                    "Please check your configuration and make sure you are talking to the DataHub GMS endpoint."
+                )
+            else:
+                text = await response.text()
+                logger.debug(
+                    f"Unable to connect to {url} with status_code: {response.status}. Response: {text}"
+                )
+                if response.status == 401:
+                    message = f"Unable to connect to {url} - got an authentication error: {text}."
+                else:
+                    message = f"Unable to connect to {url} with status_code: {response.status}."
+                message += "\nPlease check your configuration and make sure you are talking to the DataHub GMS (usually <datahub-gms-host>:8080) or Frontend GMS API (usually <frontend>:9002/api/gms)."
+                raise ConfigurationError(message)
+
+    async def _get_compression(self) -> Optional[str]:
+        """Returns the compression to use for request bodies, if any.
+
+        Compression is only used once the server's config says that it accepts it.
+        Concurrent callers may each fetch the config the first time, which is harmless.
+        """
+        if self._compression is None or self._compression_checked:
+            return self._compression
+        if not self.server_config:
+            try:
+                await self.test_connection()
+            except Exception as e:
+                logger.debug(f"Failed to fetch the DataHub GMS config: {e}")
+        if self._compression is not None and not server_accepts_compression(
+            self.server_config, self._compression
+        ):
+            logger.info(
+                f"DataHub GMS does not accept {self._compression} compressed requests; disabling compression"
+            )
+            self._compression = None
+        self._compression_checked = True
+        return self._compression
+
+    async def emit(
+        self,
+        item: Union[
+            MetadataChangeEvent,
+            MetadataChangeProposal,
+            MetadataChangeProposalWrapper,
+        ],
+        callback: Optional[Callable[[Exception, str], None]] = None,
+    ) -> Tuple[datetime.datetime, datetime.datetime]:
+        start_time = datetime.datetime.now()
+        try:
+            if isinstance(
+                item, (MetadataChangeProposal, MetadataChangeProposalWrapper)
+            ):
+                await self.emit_mcp(item)
+            else:
+                await self.emit_mce(item)
+        except Exception as e:
+            if callback:
+                callback(e, str(e))
+            raise
+        else:
+            if callback:
+                callback(None, "success")  # type: ignore
+            return start_time, datetime.datetime.now()
+
+    async def emit_mce(self, mce: MetadataChangeEvent) -> None:
+        url = f"{self._gms_server}/entities?action=ingest"
+        await self._emit_generic(url, _make_mce_payload(mce))
+
+    async def emit_mcp(
+        self, mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
+    ) -> None:
+        url = f"{self._gms_server}/aspects?action=ingestProposal"
+        await self._emit_generic(url, _make_mcp_payload(mcp))
+
+    async def _emit_generic(self, url: str, payload: bytes) -> None:
+        logger.debug("Attempting to emit to DataHub GMS: POST %s", url)
+
+        compression = (
+            await self._get_compression()
+            if len(payload) >= self._compression_min_size
+            else None
+        )
+        headers = {}
+        body = payload
+        if compression:
+            body = compress_payload([payload], compression)
+            headers["Content-Encoding"] = compression
+
+        can_retry = "POST" in self._retry_methods
+        attempt = 0
+        while True:
+            retry_after: Optional[float] = None
+            response_text: Optional[str] = None
+            try:
+                async with self._get_session().post(
+                    url, data=body, headers=headers
+                ) as response:
+                    if response.status < 400:
+                        return
+                    # Rest.li responds with 415 Unsupported Media Type if it is set
+                    # up to decode compressed bodies, but not this encoding.
+                    if response.status == 415 and compression:
+                        logger.info(
+                            f"DataHub GMS does not support {compression} compressed requests; disabling compression"
+                        )
+                        self._compression = None
+                        return await self._emit_generic(url, payload)
+                    response_text = await response.text()
+                    error: Exception = aiohttp.ClientResponseError(
+                        response.request_info,
+                        response.history,
+                        status=response.status,
+                        message=response.reason or "",
+                    )
+                    retryable = response.status in self._retry_status_codes
+                    if response.status in _RETRY_AFTER_STATUS_CODES:
+                        retry_after = _parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+                retryable = True
+
+            if not retryable or not can_retry or attempt >= self._retry_max_times:
+                if response_text is not None:
+                    raise _make_operational_error(response_text, error) from error
+                raise OperationalError(
+                    "Unable to emit metadata to DataHub GMS", {"message": str(error)}
+                ) from error
+
+            attempt += 1
+            backoff = (
+                retry_after
+                if retry_after is not None
+                else _get_backoff_time(attempt, _RETRY_BACKOFF_FACTOR)
+            )
+            logger.debug(
+                f"Retrying request to {url} in {backoff:.1f}s (attempt {attempt}): {error}"
+            )
+            await asyncio.sleep(backoff)
+
+    def __repr__(self) -> str:
+        token_str = (
+            f" with token: {self._token[:4]}**********{self._token[-4:]}"
+            if self._token
+            else ""
+        )
+        return f"{self.__class__.__name__}: configured to talk to {self._gms_server}{token_str}"
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncDataHubRestEmitter":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+def _get_backoff_time(attempt: int, backoff_factor: float) -> float:
+    # Same formula as urllib3's Retry.get_backoff_time: the first retry happens
+    # immediately, and subsequent retries back off exponentially.
+    if attempt <= 1:
+        return 0
+    return min(_RETRY_BACKOFF_MAX_SEC, backoff_factor * (2 ** (attempt - 1)))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
@@ -3,7 +3,7 @@ import json
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 from datahub.emitter.aspect import ASPECT_MAP, JSON_CONTENT_TYPE, TIMESERIES_ASPECT_MAP
-from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
+from datahub.emitter.serialization_helper import post_json_transform, to_pre_json_obj
 from datahub.metadata.schema_classes import (
     ChangeTypeClass,
     DictWrapper,
@@ -23,9 +23,8 @@ _ENTITY_TYPE_UNSET = "ENTITY_TYPE_UNSET"
 
 
 def _make_generic_aspect(codegen_obj: DictWrapper) -> GenericAspectClass:
-    serialized = json.dumps(pre_json_transform(codegen_obj.to_obj()))
     return GenericAspectClass(
-        value=serialized.encode(),
+        value=json.dumps(to_pre_json_obj(codegen_obj)).encode(),
         contentType=JSON_CONTENT_TYPE,
     )
 
@@ -1,9 +1,33 @@
+import bisect
+import io
 import itertools
 import shlex
-from typing import List, Union
+import zlib
+from typing import Any, Dict, List, Union
 
 import requests
 
+# The zlib wbits values for the request compression formats supported by GMS.
+# Note that HTTP's "deflate" is the zlib format, not raw deflate.
+_COMPRESSION_WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+SUPPORTED_REQUEST_COMPRESSIONS = set(_COMPRESSION_WBITS.keys())
+
+# Level 6 is zlib's default, and is a good tradeoff between speed and size for JSON.
+_COMPRESSION_LEVEL = 6
+
+
+def server_accepts_compression(server_config: Dict[str, Any], compression: str) -> bool:
+    """Whether GMS decodes request bodies with the given Content-Encoding.
+
+    GMS versions that can decode compressed requests list the encodings they
+    accept in their /config response. Older versions pass compressed bodies
+    straight to the JSON decoder, which fails with a 400 or 500 error.
+    """
+    return compression in server_config.get("requestCompression", [])
+
 
 def _format_header(name: str, value: Union[str, bytes]) -> str:
     if name == "Authorization":
@@ -26,3 +50,75 @@ def make_curl_command(
         url,
     ]
     return " ".join(shlex.quote(fragment) for fragment in fragments)
+
+
+def compress_payload(chunks: List[bytes], compression: str) -> bytes:
+    """Compresses the concatenation of chunks.
+
+    The chunks are fed to the compressor one by one, so they are never
+    concatenated. The compressed payload is returned as a single bytes object.
+    """
+
+    compressor = zlib.compressobj(
+        _COMPRESSION_LEVEL, zlib.DEFLATED, _COMPRESSION_WBITS[compression]
+    )
+    compressed = [compressor.compress(chunk) for chunk in chunks]
+    compressed.append(compressor.flush())
+    return b"".join(compressed)
+
+
+class ChunkedRequestBody(io.RawIOBase):
+    """A read-only, seekable file-like view over a list of in-memory byte chunks.
+
+    When passed as a request body, requests sends the chunks without first
+    concatenating them into another copy of the payload, and still sets the
+    Content-Length header. Because the body is seekable, urllib3 can rewind it
+    when retrying a request.
+    """
+
+    def __init__(self, chunks: List[bytes]) -> None:
+        super().__init__()
+        self._chunks = [chunk for chunk in chunks if chunk]
+        self._offsets: List[int] = []
+        size = 0
+        for chunk in self._chunks:
+            self._offsets.append(size)
+            size += len(chunk)
+        self._size = size
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence {whence}")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore[override]
+        if self._pos >= self._size:
+            return 0
+        index = bisect.bisect_right(self._offsets, self._pos) - 1
+        start = self._pos - self._offsets[index]
+        data = self._chunks[index][start : start + len(buffer)]
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
@@ -3,6 +3,7 @@ import functools
 import json
 import logging
 import os
+import threading
 from json.decoder import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
@@ -15,8 +16,14 @@ from datahub.cli.cli_utils import get_system_auth
 from datahub.configuration.common import ConfigurationError, OperationalError
 from datahub.emitter.generic_emitter import Emitter
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.request_helper import make_curl_command
-from datahub.emitter.serialization_helper import pre_json_transform
+from datahub.emitter.request_helper import (
+    SUPPORTED_REQUEST_COMPRESSIONS,
+    ChunkedRequestBody,
+    compress_payload,
+    make_curl_command,
+    server_accepts_compression,
+)
+from datahub.emitter.serialization_helper import pre_json_transform, to_pre_json_obj
 from datahub.ingestion.api.closeable import Closeable
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
@@ -45,6 +52,63 @@ _DEFAULT_RETRY_MAX_TIMES = int(
     os.getenv("DATAHUB_REST_EMITTER_DEFAULT_RETRY_MAX_TIMES", "4")
 )
 
+# The limit is 16mb. We will use a max of 15mb to have some space for overhead.
+_MAX_BATCH_INGEST_PAYLOAD_SIZE = int(
+    os.getenv("DATAHUB_REST_EMITTER_BATCH_MAX_PAYLOAD_SIZE", 15 * 1024 * 1024)
+)
+# Max number of mcps to send in a single batch ingest request.
+_MAX_BATCH_INGEST_PAYLOAD_LENGTH = int(
+    os.getenv("DATAHUB_REST_EMITTER_BATCH_MAX_PAYLOAD_LENGTH", 200)
+)
+# Request bodies smaller than this aren't worth compressing.
+_DEFAULT_COMPRESSION_MIN_SIZE = 1024
+
+
+def _make_mce_payload(mce: MetadataChangeEvent) -> bytes:
+    mce_obj = to_pre_json_obj(mce.proposedSnapshot)
+    snapshot_fqn = (
+        f"com.linkedin.metadata.snapshot.{mce.proposedSnapshot.RECORD_SCHEMA.name}"
+    )
+    system_metadata_obj = {}
+    if mce.systemMetadata is not None:
+        system_metadata_obj = {
+            "lastObserved": mce.systemMetadata.lastObserved,
+            "runId": mce.systemMetadata.runId,
+        }
+    snapshot = {
+        "entity": {"value": {snapshot_fqn: mce_obj}},
+        "systemMetadata": system_metadata_obj,
+    }
+    return json.dumps(snapshot).encode()
+
+
+def _make_mcp_obj(
+    mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
+) -> dict:
+    return pre_json_transform(mcp.to_obj())
+
+
+def _make_mcp_payload(
+    mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
+) -> bytes:
+    return json.dumps({"proposal": _make_mcp_obj(mcp)}).encode()
+
+
+def _make_operational_error(response_text: str, e: Exception) -> OperationalError:
+    try:
+        info: Dict = json.loads(response_text)
+    except JSONDecodeError:
+        # If we can't parse the JSON, just use the original error.
+        return OperationalError(
+            "Unable to emit metadata to DataHub GMS", {"message": str(e)}
+        )
+    logger.debug("Full stack trace from DataHub:\n%s", info.get("stackTrace"))
+    info.pop("stackTrace", None)
+    return OperationalError(
+        f"Unable to emit metadata to DataHub GMS: {info.get('message')}",
+        info,
+    )
+
 
 class DataHubRestEmitter(Closeable, Emitter):
     _gms_server: str
@@ -69,12 +133,33 @@ class DataHubRestEmitter(Closeable, Emitter):
         ca_certificate_path: Optional[str] = None,
         client_certificate_path: Optional[str] = None,
         disable_ssl_verification: bool = False,
+        compression: Optional[str] = None,
+        compression_min_size: Optional[int] = None,
     ):
         if not gms_server:
             raise ConfigurationError("gms server is required")
+        if (
+            compression is not None
+            and compression not in SUPPORTED_REQUEST_COMPRESSIONS
+        ):
+            raise ConfigurationError(
+                f"Unsupported compression {compression}; must be one of {sorted(SUPPORTED_REQUEST_COMPRESSIONS)}"
+            )
         self._gms_server = gms_server
         self._token = token
         self.server_config: Dict[str, Any] = {}
+        # None means that we haven't yet tried the batch ingest endpoint.
+        self._supports_batch_ingest: Optional[bool] = None
+
+        # Set to None if the server turns out to not support compressed requests.
+        self._compression = compression
+        self._compression_checked = False
+        self._compression_lock = threading.Lock()
+        self._compression_min_size = (
+            compression_min_size
+            if compression_min_size is not None
+            else _DEFAULT_COMPRESSION_MIN_SIZE
+        )
 
         self._session = requests.Session()
 
@@ -194,6 +279,30 @@ class DataHubRestEmitter(Closeable, Emitter):
             message += "\nPlease check your configuration and make sure you are talking to the DataHub GMS (usually <datahub-gms-host>:8080) or Frontend GMS API (usually <frontend>:9002/api/gms)."
             raise ConfigurationError(message)
 
+    def _get_compression(self) -> Optional[str]:
+        """Returns the compression to use for request bodies, if any.
+
+        Compression is only used once the server's config says that it accepts it.
+        """
+        if self._compression is None or self._compression_checked:
+            return self._compression
+        with self._compression_lock:
+            if not self._compression_checked:
+                if not self.server_config:
+                    try:
+                        self.test_connection()
+                    except Exception as e:
+                        logger.debug(f"Failed to fetch the DataHub GMS config: {e}")
+                if not server_accepts_compression(
+                    self.server_config, self._compression
+                ):
+                    logger.info(
+                        f"DataHub GMS does not accept {self._compression} compressed requests; disabling compression"
+                    )
+                    self._compression = None
+                self._compression_checked = True
+        return self._compression
+
     def to_graph(self) -> "DataHubGraph":
         from datahub.ingestion.graph.client import DataHubGraph
 
@@ -230,35 +339,79 @@ class DataHubRestEmitter(Closeable, Emitter):
 
     def emit_mce(self, mce: MetadataChangeEvent) -> None:
         url = f"{self._gms_server}/entities?action=ingest"
-
-        raw_mce_obj = mce.proposedSnapshot.to_obj()
-        mce_obj = pre_json_transform(raw_mce_obj)
-        snapshot_fqn = (
-            f"com.linkedin.metadata.snapshot.{mce.proposedSnapshot.RECORD_SCHEMA.name}"
-        )
-        system_metadata_obj = {}
-        if mce.systemMetadata is not None:
-            system_metadata_obj = {
-                "lastObserved": mce.systemMetadata.lastObserved,
-                "runId": mce.systemMetadata.runId,
-            }
-        snapshot = {
-            "entity": {"value": {snapshot_fqn: mce_obj}},
-            "systemMetadata": system_metadata_obj,
-        }
-        payload = json.dumps(snapshot)
-
-        self._emit_generic(url, payload)
+        self._emit_generic(url, _make_mce_payload(mce))
 
     def emit_mcp(
         self, mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
     ) -> None:
         url = f"{self._gms_server}/aspects?action=ingestProposal"
-
-        mcp_obj = pre_json_transform(mcp.to_obj())
-        payload = json.dumps({"proposal": mcp_obj})
-
-        self._emit_generic(url, payload)
+        self._emit_generic(url, _make_mcp_payload(mcp))
+
+    def emit_mcps(
+        self, mcps: List[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]]
+    ) -> int:
+        """Emits a list of mcps using as few requests as possible.
+
+        The mcps are split into chunks that respect both the max payload size and
+        the max number of proposals per request, and each chunk is sent to the
+        batch ingest endpoint. If the server doesn't support batch ingestion, we
+        fall back to emitting each mcp individually.
+
+        Returns the number of requests that were made.
+        """
+
+        if self._supports_batch_ingest is False:
+            for mcp in mcps:
+                self.emit_mcp(mcp)
+            return len(mcps)
+
+        url = f"{self._gms_server}/aspects?action=ingestProposalBatch"
+
+        chunks: List[List[bytes]] = []
+        current_chunk: List[bytes] = []
+        current_chunk_size = 0
+        for mcp in mcps:
+            mcp_obj = json.dumps(_make_mcp_obj(mcp)).encode()
+            mcp_size = len(mcp_obj)
+            if current_chunk and (
+                current_chunk_size + mcp_size > _MAX_BATCH_INGEST_PAYLOAD_SIZE
+                or len(current_chunk) >= _MAX_BATCH_INGEST_PAYLOAD_LENGTH
+            ):
+                chunks.append(current_chunk)
+                current_chunk = []
+                current_chunk_size = 0
+            current_chunk.append(mcp_obj)
+            current_chunk_size += mcp_size
+        if current_chunk:
+            chunks.append(current_chunk)
+
+        requests_made = 0
+        start = 0
+        for chunk in chunks:
+            # Avoid double json encoding of the already-serialized mcps, and
+            # let _emit_generic send the pieces without concatenating them.
+            payload = [b'{"proposals": [']
+            for i, mcp_obj in enumerate(chunk):
+                if i > 0:
+                    payload.append(b", ")
+                payload.append(mcp_obj)
+            payload.append(b"]}")
+            try:
+                self._emit_generic(url, payload)
+            except OperationalError as e:
+                if self._supports_batch_ingest is None and _is_unknown_action_error(
+                    e, "ingestProposalBatch"
+                ):
+                    logger.info(
+                        "DataHub GMS does not support batch ingestion; falling back to emitting mcps individually"
+                    )
+                    self._supports_batch_ingest = False
+                    return requests_made + self.emit_mcps(mcps[start:])
+                raise
+            self._supports_batch_ingest = True
+            requests_made += 1
+            start += len(chunk)
+        return requests_made
 
     @deprecated
     def emit_usage(self, usageStats: UsageAggregation) -> None:
@@ -271,31 +424,47 @@ class DataHubRestEmitter(Closeable, Emitter):
         payload = json.dumps(snapshot)
         self._emit_generic(url, payload)
 
-    def _emit_generic(self, url: str, payload: str) -> None:
-        curl_command = make_curl_command(self._session, "POST", url, payload)
-        logger.debug(
-            "Attempting to emit to DataHub GMS; using curl equivalent to:\n%s",
-            curl_command,
+    def _emit_generic(self, url: str, payload: Union[str, bytes, List[bytes]]) -> None:
+        if isinstance(payload, str):
+            payload = payload.encode()
+        chunks = [payload] if isinstance(payload, bytes) else payload
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Building the curl command is expensive for large payloads.
+            curl_command = make_curl_command(
+                self._session, "POST", url, b"".join(chunks).decode()
+            )
+            logger.debug(
+                "Attempting to emit to DataHub GMS; using curl equivalent to:\n%s",
+                curl_command,
+            )
+
+        headers = {}
+        compression = (
+            self._get_compression()
+            if sum(len(c) for c in chunks) >= self._compression_min_size
+            else None
         )
+        if compression:
+            chunks = [compress_payload(chunks, compression)]
+            headers["Content-Encoding"] = compression
+        body: Union[bytes, ChunkedRequestBody] = (
+            chunks[0] if len(chunks) == 1 else ChunkedRequestBody(chunks)
+        )
+
         try:
-            response = self._session.post(url, data=payload)
+            response = self._session.post(url, data=body, headers=headers)
+            # Rest.li responds with 415 Unsupported Media Type if it is set up to decode
+            # compressed bodies, but not this encoding.
+            if response.status_code == 415 and compression:
+                logger.info(
+                    f"DataHub GMS does not support {compression} compressed requests; disabling compression"
+                )
+                self._compression = None
+                return self._emit_generic(url, payload)
             response.raise_for_status()
         except HTTPError as e:
-            try:
-                info: Dict = response.json()
-                logger.debug(
-                    "Full stack trace from DataHub:\n%s", info.get("stackTrace")
-                )
-                info.pop("stackTrace", None)
-                raise OperationalError(
-                    f"Unable to emit metadata to DataHub GMS: {info.get('message')}",
-                    info,
-                ) from e
-            except JSONDecodeError:
-                # If we can't parse the JSON, just raise the original error.
-                raise OperationalError(
-                    "Unable to emit metadata to DataHub GMS", {"message": str(e)}
-                ) from e
+            raise _make_operational_error(response.text, e) from e
         except RequestException as e:
             raise OperationalError(
                 "Unable to emit metadata to DataHub GMS", {"message": str(e)}
@@ -317,5 +486,11 @@ class DataHubRestEmitter(Closeable, Emitter):
         self._session.close()
 
 
+def _is_unknown_action_error(e: OperationalError, action: str) -> bool:
+    status = e.info.get("status")
+    message = str(e.info.get("message", ""))
+    return status == 404 or (status == 400 and action in message)
+
+
 """This class exists as a pass-through for backwards compatibility"""
 DatahubRestEmitter = DataHubRestEmitter
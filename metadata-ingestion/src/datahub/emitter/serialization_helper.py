@@ -1,5 +1,8 @@
+import os
 from collections import OrderedDict
-from typing import Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from datahub.metadata.schema_classes import DictWrapper
 
 
 def _pre_handle_union_with_aliases(
@@ -111,3 +114,226 @@ def post_json_transform(obj: Any) -> Any:
         to_pattern="com.linkedin.pegasus2avro.",
         pre=False,
     )
+
+
+_PRE_JSON_FROM_PATTERN = "com.linkedin.pegasus2avro."
+_PRE_JSON_TO_PATTERN = "com.linkedin."
+_IDENTITY_SCHEMA_TYPES = {
+    "null",
+    "boolean",
+    "string",
+    "int",
+    "long",
+    "float",
+    "double",
+    "enum",
+    "fixed",
+}
+
+# A converter maps a value from a codegen object to its pre_json_transform'd
+# form. None is used for values that can be passed through unchanged.
+_Converter = Optional[Callable[[Any], Any]]
+_converter_cache: Dict[Tuple[int, bool], _Converter] = {}
+# The avrogen converter shared by all codegen classes. Set on first use.
+_avro_json_converter: Any = None
+
+# to_pre_json_obj() skips the validation that to_obj() does. Set this to also run it,
+# so that invalid objects fail locally instead of being rejected by the server.
+VALIDATE_PRE_JSON_OBJ = os.getenv("DATAHUB_VALIDATE_ASPECTS", "false").lower() == "true"
+
+
+def _rename_union_key(fullname: str) -> str:
+    if fullname.startswith(_PRE_JSON_FROM_PATTERN):
+        return fullname.replace(_PRE_JSON_FROM_PATTERN, _PRE_JSON_TO_PATTERN, 1)
+    return fullname
+
+
+def _fallback_to_json(writers_schema: Any, was_within_array: bool) -> Callable:
+    # For the rare cases that the fast path doesn't handle, e.g. unions that can
+    # only be resolved by validating the datum against each branch, defer to the
+    # avrogen converter and post-process its output.
+    def convert(obj: Any) -> Any:
+        return pre_json_transform(
+            _avro_json_converter._generic_to_json(obj, writers_schema, was_within_array)
+        )
+
+    return convert
+
+
+def _get_converter(writers_schema: Any, within_array: bool = False) -> _Converter:
+    # Schema objects are never freed, so it's safe to key the cache on their id.
+    key = (id(writers_schema), within_array)
+    if key not in _converter_cache:
+        _converter_cache[key] = _make_converter(writers_schema, within_array)
+    return _converter_cache[key]
+
+
+def _make_converter(writers_schema: Any, within_array: bool) -> _Converter:
+    schema_type = writers_schema.type
+    if schema_type in _IDENTITY_SCHEMA_TYPES:
+        return None
+    elif schema_type == "bytes":
+        return lambda obj: obj.decode() if isinstance(obj, bytes) else obj
+    elif schema_type == "array":
+        return _make_array_converter(writers_schema)
+    elif schema_type == "map":
+        return _make_map_converter(writers_schema)
+    elif schema_type == "record":
+        return _make_record_converter(writers_schema)
+    elif schema_type == "union":
+        return _make_union_converter(writers_schema, within_array)
+    return _fallback_to_json(writers_schema, within_array)
+
+
+def _make_array_converter(writers_schema: Any) -> Callable:
+    item_converter: _Converter = None
+    resolved = False
+
+    def convert(obj: Any) -> Any:
+        nonlocal item_converter, resolved
+        if not resolved:
+            item_converter = _get_converter(writers_schema.items, within_array=True)
+            resolved = True
+        if item_converter is None:
+            return list(obj)
+        return [item_converter(item) for item in obj]
+
+    return convert
+
+
+def _make_map_converter(writers_schema: Any) -> Callable:
+    value_converter: _Converter = None
+    resolved = False
+
+    def convert(obj: Any) -> Any:
+        nonlocal value_converter, resolved
+        if not resolved:
+            value_converter = _get_converter(writers_schema.values)
+            resolved = True
+        if value_converter is not None:
+            obj = {key: value_converter(value) for key, value in obj.items()}
+        # Mirror the rules that _json_transform applies to all dicts.
+        if len(obj) == 1:
+            key, value = next(iter(obj.items()))
+            if key.startswith(_PRE_JSON_FROM_PATTERN):
+                return {_rename_union_key(key): value}
+        if "fieldDiscriminator" in obj:
+            field = obj["fieldDiscriminator"]
+            return {field: obj[field]}
+        return {key: value for key, value in obj.items() if value is not None}
+
+    return convert
+
+
+def _make_record_converter(writers_schema: Any) -> Callable:
+    fields: Optional[List[Tuple[str, bool, Any, _Converter]]] = None
+    has_field_discriminator = any(
+        field.name == "fieldDiscriminator" for field in writers_schema.fields
+    )
+
+    def get_fields() -> List[Tuple[str, bool, Any, _Converter]]:
+        # Resolved lazily, since schemas can be recursive.
+        nonlocal fields
+        if fields is None:
+            fields = [
+                (
+                    field.name,
+                    field.has_default,
+                    _avro_json_converter.from_json_object(field.default, field.type)
+                    if field.has_default and field.default is not None
+                    else None,
+                    _get_converter(field.type),
+                )
+                for field in writers_schema.fields
+            ]
+        return fields
+
+    def convert(obj: Any) -> Any:
+        if not isinstance(obj, DictWrapper):
+            return _fallback_to_json(writers_schema, False)(obj)
+
+        inner = obj._inner_dict
+        result = {}
+        for name, has_default, default, field_converter in get_fields():
+            value = inner.get(name, default)
+            if value is None:
+                if has_default and default is None:
+                    continue
+            elif field_converter is not None:
+                value = field_converter(value)
+            result[name] = value
+
+        if has_field_discriminator:
+            field = result["fieldDiscriminator"]
+            return {field: result[field]}
+        return {key: value for key, value in result.items() if value is not None}
+
+    return convert
+
+
+def _make_union_converter(writers_schema: Any, within_array: bool) -> Callable:
+    fallback = _fallback_to_json(writers_schema, within_array)
+
+    non_null_schemas = [s for s in writers_schema.schemas if s.type != "null"]
+    has_null = len(non_null_schemas) < len(writers_schema.schemas)
+    # Same as AvroJsonConverter._is_unambiguous_union.
+    if any(s.type == "enum" for s in writers_schema.schemas):
+        unambiguous = len(writers_schema.schemas) == 2 and has_null
+    else:
+        unambiguous = len(non_null_schemas) <= 1
+    unwrapped = unambiguous and not within_array
+
+    record_schemas = {
+        s.fullname: s for s in non_null_schemas if s.type in {"record", "error"}
+    }
+    single_non_record_schema = (
+        non_null_schemas[0]
+        if len(non_null_schemas) == 1 and non_null_schemas[0].type != "record"
+        else None
+    )
+
+    def convert(obj: Any) -> Any:
+        if obj is None and has_null:
+            return None
+
+        if isinstance(obj, DictWrapper):
+            record_schema = record_schemas.get(type(obj).RECORD_SCHEMA.fullname)
+            if record_schema is None:
+                return fallback(obj)
+            record_converter = _get_converter(record_schema)
+            assert record_converter is not None
+            result = record_converter(obj)
+            if unwrapped:
+                return result
+            return {_rename_union_key(record_schema.fullname.lstrip(".")): result}
+
+        if unwrapped and single_non_record_schema is not None:
+            value_converter = _get_converter(single_non_record_schema)
+            if value_converter is None:
+                return obj
+            return value_converter(obj)
+
+        return fallback(obj)
+
+    return convert
+
+
+def to_pre_json_obj(obj: DictWrapper) -> dict:
+    """Equivalent to pre_json_transform(obj.to_obj()), but much faster.
+
+    to_obj() validates the full object tree and then walks it again to convert
+    it, and pre_json_transform() makes a third pass over the result. This does
+    the conversion in a single pass using per-schema converters, and skips the
+    validation step unless the DATAHUB_VALIDATE_ASPECTS env variable is set.
+    """
+    global _avro_json_converter
+    if _avro_json_converter is None:
+        _avro_json_converter = obj._get_json_converter()
+
+    if VALIDATE_PRE_JSON_OBJ:
+        # Raises the same error that the slow path would.
+        obj.to_obj()
+
+    converter = _get_converter(obj.RECORD_SCHEMA)
+    assert converter is not None
+    return converter(obj)
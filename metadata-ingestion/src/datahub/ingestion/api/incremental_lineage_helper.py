@@ -1,5 +1,6 @@
 import copy
-from typing import Dict, Iterable, Optional
+import itertools
+from typing import Dict, Iterable, List, Optional
 
 from datahub.emitter.mce_builder import datahub_guid, set_aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -14,6 +15,9 @@ from datahub.metadata.schema_classes import (
 )
 from datahub.specific.dataset import DatasetPatchBuilder
 
+# Number of workunits whose lineage in DataHub is fetched with a single request.
+_LINEAGE_PREFETCH_BATCH_SIZE = 100
+
 
 def convert_upstream_lineage_to_patch(
     urn: str,
@@ -111,32 +115,70 @@ def auto_incremental_lineage(
         yield from stream
         return  # early exit
 
-    for wu in stream:
-        lineage_aspect: Optional[UpstreamLineageClass] = wu.get_aspect_of_type(
-            UpstreamLineageClass
+    stream_iter = iter(stream)
+    for batch in iter(
+        lambda: list(itertools.islice(stream_iter, _LINEAGE_PREFETCH_BATCH_SIZE)), []
+    ):
+        prefetched_urns = (
+            _prefetch_lineage_for_read_modify_write(graph, batch)
+            if graph is not None
+            else []
         )
-        urn = wu.get_urn()
-
-        if lineage_aspect:
-            if isinstance(wu.metadata, MetadataChangeEventClass):
-                set_aspect(
-                    wu.metadata, None, UpstreamLineageClass
-                )  # we'll emit upstreamLineage separately below
-                if len(wu.metadata.proposedSnapshot.aspects) > 0:
-                    yield wu
-
-            if lineage_aspect.fineGrainedLineages:
-                if graph is None:
-                    raise ValueError(
-                        "Failed to handle incremental lineage, DataHubGraph is missing. "
-                        "Use `datahub-rest` sink OR provide `datahub-api` config in recipe. "
-                    )
-                yield _lineage_wu_via_read_modify_write(
-                    graph, urn, lineage_aspect, wu.metadata.systemMetadata
+        try:
+            for wu in batch:
+                yield from _process_incremental_lineage_wu(graph, wu)
+        finally:
+            if graph is not None and prefetched_urns:
+                # Don't let later reads see lineage that was fetched for this batch.
+                graph.clear_prefetched_aspects(
+                    prefetched_urns, UpstreamLineageClass.ASPECT_NAME
                 )
-            elif lineage_aspect.upstreams:
-                yield convert_upstream_lineage_to_patch(
-                    urn, lineage_aspect, wu.metadata.systemMetadata
+
+
+def _prefetch_lineage_for_read_modify_write(
+    graph: DataHubGraph, wus: List[MetadataWorkUnit]
+) -> List[str]:
+    urns = []
+    for wu in wus:
+        lineage_aspect = wu.get_aspect_of_type(UpstreamLineageClass)
+        if lineage_aspect and lineage_aspect.fineGrainedLineages:
+            urns.append(wu.get_urn())
+    if urns:
+        graph.prefetch_aspects(urns, [UpstreamLineageClass])
+    return urns
+
+
+def _process_incremental_lineage_wu(
+    graph: Optional[DataHubGraph], wu: MetadataWorkUnit
+) -> Iterable[MetadataWorkUnit]:
+    lineage_aspect: Optional[UpstreamLineageClass] = wu.get_aspect_of_type(
+        UpstreamLineageClass
+    )
+    urn = wu.get_urn()
+
+    if lineage_aspect:
+        if isinstance(wu.metadata, MetadataChangeEventClass):
+            set_aspect(
+                wu.metadata, None, UpstreamLineageClass
+            )  # we'll emit upstreamLineage separately below
+            if len(wu.metadata.proposedSnapshot.aspects) > 0:
+                yield wu
+
+        if lineage_aspect.fineGrainedLineages:
+            if graph is None:
+                raise ValueError(
+                    "Failed to handle incremental lineage, DataHubGraph is missing. "
+                    "Use `datahub-rest` sink OR provide `datahub-api` config in recipe. "
                 )
-        else:
-            yield wu
+            yield _lineage_wu_via_read_modify_write(
+                graph, urn, lineage_aspect, wu.metadata.systemMetadata
+            )
+        elif lineage_aspect.upstreams:
+            if graph is not None:
+                # Lineage that was prefetched for this urn doesn't include the patch.
+                graph.clear_prefetched_aspects([urn], UpstreamLineageClass.ASPECT_NAME)
+            yield convert_upstream_lineage_to_patch(
+                urn, lineage_aspect, wu.metadata.systemMetadata
+            )
+    else:
+        yield wu
@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 
 
 class Transformer:
@@ -15,6 +16,35 @@ class Transformer:
         :return: 0 or more transformed records
         """
 
+    def prefetch(self, workunits: Sequence[MetadataWorkUnit]) -> None:
+        """
+        Called with upcoming workunits before their records are transformed, so that
+        transformers that look up data for each record can fetch it for all of them at once.
+        """
+
+    def wants_prefetch(self) -> bool:
+        """
+        Whether prefetch() does anything for this transformer. The pipeline only buffers
+        workunits into batches for prefetching when at least one transformer does.
+        """
+        return False
+
+    def clear_prefetched(self) -> None:
+        """
+        Called once the workunits passed to the oldest prefetch call that hasn't been
+        cleared yet have been transformed, to drop any data that was prefetched for them
+        but not used. prefetch may be called for the next workunits before then.
+        """
+
+    def is_thread_safe(self) -> bool:
+        """
+        Whether transform() can be called from several threads at once, which is required
+        by the `workunit_processing_threads` pipeline flag. Workunits for the same urn are
+        never transformed concurrently, so state kept per entity is fine, but transformers
+        that share any other state across records must not override this.
+        """
+        return False
+
     @classmethod
     @abstractmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
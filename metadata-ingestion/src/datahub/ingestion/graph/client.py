@@ -1,17 +1,32 @@
+import collections
 import enum
 import functools
+import itertools
 import json
 import logging
 import textwrap
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from json.decoder import JSONDecodeError
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from avro.schema import RecordSchema
 from deprecated import deprecated
 from requests.models import HTTPError
+from typing_extensions import Literal
 
 from datahub.cli.cli_utils import get_url_and_token
 from datahub.configuration.common import ConfigModel, GraphError, OperationalError
@@ -37,11 +52,14 @@ from datahub.metadata.schema_classes import (
     DomainsClass,
     GlobalTagsClass,
     GlossaryTermsClass,
+    MetadataChangeEventClass,
+    MetadataChangeProposalClass,
     OwnershipClass,
     SchemaMetadataClass,
     StatusClass,
     SystemMetadataClass,
     TelemetryClientIdClass,
+    _Aspect,
 )
 from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.urns.urn import Urn, guess_entity_type
@@ -59,6 +77,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_BATCH_GET_SIZE = 100
+_MAX_PREFETCHED_ASPECTS = 10000
+
 
 class DatahubClientConfig(ConfigModel):
     """Configuration class for holding connectivity to datahub gms"""
@@ -72,6 +93,9 @@ class DatahubClientConfig(ConfigModel):
     ca_certificate_path: Optional[str] = None
     client_certificate_path: Optional[str] = None
     disable_ssl_verification: bool = False
+    # Content-Encoding to compress request bodies with. Requires GMS to accept it.
+    compression: Optional[Literal["gzip", "deflate"]] = None
+    compression_min_size: Optional[int] = None
 
 
 # Alias for backwards compatibility.
@@ -106,9 +130,58 @@ def _graphql_entity_type(entity_type: str) -> str:
     return entity_type
 
 
+class _PrefetchingScroll:
+    """Fetches the pages of a scrollAcrossEntities query, one page ahead.
+
+    The next page is requested in the background as soon as a page is returned,
+    so that it is fetched while the caller processes the current one.
+    """
+
+    def __init__(
+        self,
+        graph: "DataHubGraph",
+        graphql_query: str,
+        variables: dict,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        self._graph = graph
+        self._graphql_query = graphql_query
+        self._variables = variables
+        self._executor = executor
+        self._next_page: Optional["Future[dict]"] = executor.submit(
+            self._fetch_page, None
+        )
+
+    def _fetch_page(self, scroll_id: Optional[str]) -> dict:
+        response = self._graph.execute_graphql(
+            self._graphql_query,
+            variables={**self._variables, "scrollId": scroll_id},
+        )
+        return response["scrollAcrossEntities"]
+
+    def next_page(self) -> Optional[List[dict]]:
+        """Returns the entries of the next page, or None if there are no more pages."""
+        if self._next_page is None:
+            return None
+
+        data = self._next_page.result()
+        scroll_id = data["nextScrollId"]
+        if scroll_id:
+            logger.debug(f"Scrolling to next scrollAcrossEntities page: {scroll_id}")
+            self._next_page = self._executor.submit(self._fetch_page, scroll_id)
+        else:
+            self._next_page = None
+        return data["searchResults"]
+
+
 class DataHubGraph(DatahubRestEmitter):
     def __init__(self, config: DatahubClientConfig) -> None:
         self.config = config
+        # Aspects fetched by prefetch_aspects, keyed by (urn, aspect name).
+        self._prefetched_aspects: "collections.OrderedDict[Tuple[str, str], Optional[_Aspect]]" = (
+            collections.OrderedDict()
+        )
+        self._prefetched_aspects_lock = threading.Lock()
         super().__init__(
             gms_server=self.config.server,
             token=self.config.token,
@@ -120,6 +193,8 @@ class DataHubGraph(DatahubRestEmitter):
             ca_certificate_path=self.config.ca_certificate_path,
             client_certificate_path=self.config.client_certificate_path,
             disable_ssl_verification=self.config.disable_ssl_verification,
+            compression=self.config.compression,
+            compression_min_size=self.config.compression_min_size,
         )
         self.test_connection()
 
@@ -202,6 +277,13 @@ class DataHubGraph(DatahubRestEmitter):
                 'Cannot get a timeseries aspect using "get_aspect". Use "get_latest_timeseries_value" instead.'
             )
 
+        if version == 0:
+            with self._prefetched_aspects_lock:
+                if (entity_urn, aspect) in self._prefetched_aspects:
+                    prefetched = self._prefetched_aspects.pop((entity_urn, aspect))
+                    assert prefetched is None or isinstance(prefetched, aspect_type)
+                    return prefetched
+
         url: str = f"{self._gms_server}/aspects/{Urn.url_encode(entity_urn)}?aspect={aspect}&version={version}"
         response = self._session.get(url)
         if response.status_code == 404:
@@ -378,6 +460,174 @@ class DataHubGraph(DatahubRestEmitter):
         response.raise_for_status()
         return response.json()
 
+    def get_entities_raw(
+        self,
+        entity_urns: List[str],
+        aspects: Optional[List[str]] = None,
+        batch_size: int = _DEFAULT_BATCH_GET_SIZE,
+    ) -> Dict[str, Dict]:
+        """Get many entities at once, with one batch get request per batch_size urns.
+
+        :param entity_urns: The urns of the entities
+        :param aspects: The names of the aspects to fetch. If None, all aspects are fetched.
+        :return: A map of urn to the entity, in the same format as get_entity_raw. Entities that
+            were not found are missing from the map.
+        """
+        if aspects is not None:
+            assert aspects, "if provided, aspects must be a non-empty list"
+
+        results: Dict[str, Dict] = {}
+        urns_iter = iter(entity_urns)
+        for batch in iter(lambda: list(itertools.islice(urns_iter, batch_size)), []):
+            # The urns don't fit in a url for large batches, so we tunnel the
+            # GET request through a POST, which rest.li supports for all requests.
+            query = "ids=List(" + ",".join(Urn.url_encode(urn) for urn in batch) + ")"
+            if aspects is not None:
+                query = f"{query}&aspects=List(" + ",".join(aspects) + ")"
+            response_json = self._send_restli_request(
+                "POST",
+                f"{self.config.server}/entitiesV2",
+                data=query,
+                headers={
+                    "X-HTTP-Method-Override": "GET",
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+            )
+            for entity in response_json.get("results", {}).values():
+                results[entity["urn"]] = entity
+        return results
+
+    def get_aspects_for_entities(
+        self,
+        entity_urns: List[str],
+        aspect_types: List[Type[Aspect]],
+        batch_size: int = _DEFAULT_BATCH_GET_SIZE,
+    ) -> Dict[str, Dict[str, Optional[Aspect]]]:
+        """
+        Get multiple aspects for many entities at once, with one batch get request per batch_size urns.
+
+        :param entity_urns: The urns of the entities
+        :param aspect_types: The type classes of the aspects being requested (e.g. datahub.metadata.schema_classes.DatasetProperties)
+        :return: A map of urn to a map of aspect name to aspect value, for every requested urn. The aspect value
+            is None if the aspect was not found.
+        :raises OperationalError: if the HTTP response is not a 200
+        """
+        response_json = self.get_entities_raw(
+            entity_urns,
+            [aspect_type.ASPECT_NAME for aspect_type in aspect_types],
+            batch_size=batch_size,
+        )
+
+        result: Dict[str, Dict[str, Optional[Aspect]]] = {}
+        for urn in entity_urns:
+            entity_aspects = response_json.get(urn, {}).get("aspects", {})
+            result[urn] = {}
+            for aspect_type in aspect_types:
+                aspect_json = entity_aspects.get(aspect_type.ASPECT_NAME)
+                result[urn][aspect_type.ASPECT_NAME] = (
+                    aspect_type.from_obj(post_json_transform(aspect_json)["value"])
+                    if aspect_json
+                    else None
+                )
+        return result
+
+    def prefetch_aspects(
+        self,
+        entity_urns: Iterable[str],
+        aspect_types: List[Type[Aspect]],
+        batch_size: int = _DEFAULT_BATCH_GET_SIZE,
+    ) -> None:
+        """
+        Fetch the latest version of aspects of many entities ahead of time, using batch get requests.
+
+        This is meant for code that calls get_aspect once per entity, such as transformers and
+        the incremental lineage helper. Each prefetched aspect is returned by the next call to
+        get_aspect for the same entity and aspect, and then dropped. Only the most recent
+        prefetched aspects are kept. Aspects that are written through this graph are dropped
+        as well, but writes made by other clients are not detected, so callers should drop
+        the aspects that they did not use with clear_prefetched_aspects once they are done.
+        """
+        with self._prefetched_aspects_lock:
+            urns = [
+                urn
+                for urn in dict.fromkeys(entity_urns)
+                if any(
+                    (urn, aspect_type.ASPECT_NAME) not in self._prefetched_aspects
+                    for aspect_type in aspect_types
+                )
+            ]
+        if not urns:
+            return
+
+        aspects_by_urn = self.get_aspects_for_entities(
+            urns, aspect_types, batch_size=batch_size
+        )
+        with self._prefetched_aspects_lock:
+            for urn, aspects in aspects_by_urn.items():
+                for aspect_name, aspect in aspects.items():
+                    self._prefetched_aspects[(urn, aspect_name)] = aspect
+                    self._prefetched_aspects.move_to_end((urn, aspect_name))
+            while len(self._prefetched_aspects) > _MAX_PREFETCHED_ASPECTS:
+                self._prefetched_aspects.popitem(last=False)
+
+    def clear_prefetched_aspects(
+        self,
+        entity_urns: Optional[Iterable[str]] = None,
+        aspect_name: Optional[str] = None,
+    ) -> None:
+        """
+        Drop prefetched aspects, so that get_aspect fetches them from DataHub again.
+
+        :param entity_urns: The entities whose aspects to drop. If not set, aspects of all entities are dropped.
+        :param aspect_name: The aspect to drop. If not set, all aspects of the entities are dropped.
+        """
+        with self._prefetched_aspects_lock:
+            if entity_urns is None:
+                keys = [
+                    key
+                    for key in self._prefetched_aspects
+                    if aspect_name is None or key[1] == aspect_name
+                ]
+            elif aspect_name is None:
+                urns = set(entity_urns)
+                keys = [key for key in self._prefetched_aspects if key[0] in urns]
+            else:
+                keys = [(urn, aspect_name) for urn in entity_urns]
+            for key in keys:
+                self._prefetched_aspects.pop(key, None)
+
+    def _clear_prefetched_aspects_of_mcp(
+        self, mcp: Union[MetadataChangeProposalClass, MetadataChangeProposalWrapper]
+    ) -> None:
+        if self._prefetched_aspects and mcp.entityUrn:
+            self.clear_prefetched_aspects([mcp.entityUrn], mcp.aspectName)
+
+    def emit_mce(self, mce: MetadataChangeEventClass) -> None:
+        try:
+            super().emit_mce(mce)
+        finally:
+            # Drop prefetched aspects that this write may have made stale.
+            if self._prefetched_aspects:
+                self.clear_prefetched_aspects([mce.proposedSnapshot.urn])
+
+    def emit_mcp(
+        self, mcp: Union[MetadataChangeProposalClass, MetadataChangeProposalWrapper]
+    ) -> None:
+        try:
+            super().emit_mcp(mcp)
+        finally:
+            self._clear_prefetched_aspects_of_mcp(mcp)
+
+    def emit_mcps(
+        self,
+        mcps: List[Union[MetadataChangeProposalClass, MetadataChangeProposalWrapper]],
+    ) -> int:
+        try:
+            return super().emit_mcps(mcps)
+        finally:
+            for mcp in mcps:
+                self._clear_prefetched_aspects_of_mcp(mcp)
+
     @deprecated(
         reason="Use get_aspect for a single aspect or get_entity_semityped for a full entity."
     )
@@ -440,7 +690,28 @@ class DataHubGraph(DatahubRestEmitter):
         """
 
         response_json = self.get_entity_raw(entity_urn)
+        return self._parse_entity_semityped(response_json)
+
+    def get_entities_semityped(
+        self, entity_urns: List[str], batch_size: int = _DEFAULT_BATCH_GET_SIZE
+    ) -> Dict[str, AspectBag]:
+        """Get all non-timeseries aspects for many entities at once (experimental).
+
+        See get_entity_semityped for the format of each entity.
 
+        :param entity_urns: The urns of the entities
+        :returns: A map of urn to aspect bag. Entities that were not found are missing from the map.
+        """
+
+        return {
+            urn: self._parse_entity_semityped(response_json)
+            for urn, response_json in self.get_entities_raw(
+                entity_urns, batch_size=batch_size
+            ).items()
+        }
+
+    @staticmethod
+    def _parse_entity_semityped(response_json: Dict) -> AspectBag:
         # Now, we parse the response into proper aspect objects.
         result: AspectBag = {}
         for aspect_name, aspect_json in response_json.get("aspects", {}).items():
@@ -709,8 +980,22 @@ class DataHubGraph(DatahubRestEmitter):
             yield entity["urn"]
 
     def _scroll_across_entities(
-        self, graphql_query: str, variables_orig: dict
+        self, graphql_query: str, variables_orig: dict, prefetch: bool = True
     ) -> Iterable[dict]:
+        """Yields the entities of all pages of a scrollAcrossEntities query.
+
+        If prefetch is set, the next page is requested while the current one is
+        being processed. In that case, a query for multiple entity types is also
+        split into one scroll per type, and the scrolls are fetched in parallel,
+        which interleaves the entities of the different types.
+        """
+
+        if prefetch:
+            yield from self._scroll_across_entities_with_prefetch(
+                graphql_query, variables_orig
+            )
+            return
+
         variables = variables_orig.copy()
         first_iter = True
         scroll_id: Optional[str] = None
@@ -732,6 +1017,32 @@ class DataHubGraph(DatahubRestEmitter):
                     f"Scrolling to next scrollAcrossEntities page: {scroll_id}"
                 )
 
+    def _scroll_across_entities_with_prefetch(
+        self, graphql_query: str, variables_orig: dict
+    ) -> Iterable[dict]:
+        types: Optional[List[str]] = variables_orig.get("types")
+        if types and len(types) > 1:
+            variables_list = [
+                {**variables_orig, "types": [entity_type]} for entity_type in types
+            ]
+        else:
+            variables_list = [variables_orig]
+
+        with ThreadPoolExecutor(max_workers=len(variables_list)) as executor:
+            scrolls = [
+                _PrefetchingScroll(self, graphql_query, variables, executor)
+                for variables in variables_list
+            ]
+            # Take turns between the scrolls, so that all of them keep a page in flight.
+            while scrolls:
+                for scroll in list(scrolls):
+                    page = scroll.next_page()
+                    if page is None:
+                        scrolls.remove(scroll)
+                        continue
+                    for entry in page:
+                        yield entry["entity"]
+
     def _get_types(self, entity_types: Optional[List[str]]) -> Optional[List[str]]:
         types: Optional[List[str]] = None
         if entity_types is not None:
@@ -879,6 +1190,34 @@ class DataHubGraph(DatahubRestEmitter):
             )
         )
 
+    def soft_delete_entities(
+        self,
+        urns: List[str],
+        run_id: str = "__datahub-graph-client",
+        deletion_timestamp: Optional[int] = None,
+    ) -> None:
+        """Soft-delete multiple entities by urn, using as few requests as possible.
+
+        Args:
+            urns: The urns of the entities to soft-delete.
+        """
+
+        assert all(urns)
+
+        deletion_timestamp = deletion_timestamp or int(time.time() * 1000)
+        self.emit_mcps(
+            [
+                MetadataChangeProposalWrapper(
+                    entityUrn=urn,
+                    aspect=StatusClass(removed=True),
+                    systemMetadata=SystemMetadataClass(
+                        runId=run_id, lastObserved=deletion_timestamp
+                    ),
+                )
+                for urn in urns
+            ]
+        )
+
     def hard_delete_entity(
         self,
         urn: str,
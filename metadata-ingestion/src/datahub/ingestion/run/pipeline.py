@@ -1,3 +1,4 @@
+import collections
 import contextlib
 import itertools
 import logging
@@ -6,8 +7,9 @@ import platform
 import shutil
 import sys
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
 import click
 import humanfriendly
@@ -20,12 +22,18 @@ from datahub.configuration.common import (
     PipelineExecutionError,
 )
 from datahub.ingestion.api.committable import CommitPolicy
-from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnvelope
+from datahub.ingestion.api.common import (
+    EndOfStream,
+    PipelineContext,
+    RecordEnvelope,
+    WorkUnit,
+)
 from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.source import Extractor, Source
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor.extractor_registry import extractor_registry
 from datahub.ingestion.graph.client import DataHubGraph
 from datahub.ingestion.reporting.reporting_provider_registry import (
@@ -43,9 +51,13 @@ from datahub.utilities.global_warning_util import (
     get_global_warnings,
 )
 from datahub.utilities.lossy_collections import LossyDict, LossyList
+from datahub.utilities.partition_executor import PartitionExecutor
 
 logger = logging.getLogger(__name__)
 
+# Transformers are given this many upcoming workunits at a time to prefetch for.
+_TRANSFORMER_PREFETCH_BATCH_SIZE = 1000
+
 
 class LoggingCallback(WriteCallback):
     def __init__(self, name: str = "") -> None:
@@ -108,6 +120,57 @@ class DeadLetterQueueCallback(WriteCallback):
         self.file_sink.close()
 
 
+@dataclass
+class _ProcessedWorkUnit:
+    records: List[RecordEnvelope]
+    error: Optional[Exception]
+
+
+class _TransformerPrefetcher:
+    """
+    Lets transformers prefetch what they need for the upcoming workunits, a batch at a
+    time, before the workunits are processed. A batch is only cleared once all of its
+    workunits have been released, which the pipeline does after writing them, so the
+    prefetched data outlives processing on worker threads.
+    """
+
+    def __init__(self, transformers: List[Transformer]) -> None:
+        self.transformers = transformers
+        # Number of workunits not yet released in each batch, oldest first.
+        self._unreleased: Deque[int] = collections.deque()
+
+    def prefetch(self, workunits: Iterable[WorkUnit]) -> Iterable[WorkUnit]:
+        workunits_iter = iter(workunits)
+        for batch in iter(
+            lambda: list(
+                itertools.islice(workunits_iter, _TRANSFORMER_PREFETCH_BATCH_SIZE)
+            ),
+            [],
+        ):
+            metadata_workunits = [
+                wu for wu in batch if isinstance(wu, MetadataWorkUnit)
+            ]
+            for transformer in self.transformers:
+                transformer.prefetch(metadata_workunits)
+            self._unreleased.append(len(batch))
+            yield from batch
+
+    def release(self) -> None:
+        """Called for each workunit, in the order they were yielded, once it is written."""
+        self._unreleased[0] -= 1
+        if self._unreleased[0] == 0:
+            self._clear_oldest()
+
+    def close(self) -> None:
+        while self._unreleased:
+            self._clear_oldest()
+
+    def _clear_oldest(self) -> None:
+        self._unreleased.popleft()
+        for transformer in self.transformers:
+            transformer.clear_prefetched()
+
+
 class PipelineInitError(Exception):
     pass
 
@@ -252,6 +315,17 @@ class Pipeline:
                 logger.debug(
                     f"Transformer type:{transformer_type},{transformer_class} configured"
                 )
+        if self.config.flags.workunit_processing_threads > 0:
+            unsafe_transformers = [
+                type(transformer).__name__
+                for transformer in self.transformers
+                if not transformer.is_thread_safe()
+            ]
+            if unsafe_transformers:
+                raise ValueError(
+                    "workunit_processing_threads can only be used with thread-safe transformers, "
+                    f"but these are not: {', '.join(unsafe_transformers)}"
+                )
 
     def _configure_reporting(
         self, report_to: Optional[str], no_default_report: bool
@@ -366,6 +440,7 @@ class Pipeline:
             self.final_status = "unknown"
             self._notify_reporters_on_ingestion_start()
             callback = None
+            prefetcher = self._get_transformer_prefetcher()
             try:
                 callback = (
                     LoggingCallback()
@@ -374,46 +449,50 @@ class Pipeline:
                         self.ctx, self.config.failure_log.log_config
                     )
                 )
-                for wu in itertools.islice(
+                workunits: Iterable[WorkUnit] = itertools.islice(
                     self.source.get_workunits(),
                     self.preview_workunits if self.preview_mode else None,
-                ):
-                    try:
-                        if self._time_to_print():
-                            self.pretty_print_summary(currently_running=True)
-                    except Exception as e:
-                        logger.warning(f"Failed to print summary {e}")
-
-                    if not self.dry_run:
-                        self.sink.handle_work_unit_start(wu)
-                    try:
-                        record_envelopes = self.extractor.get_records(wu)
-                        for record_envelope in self.transform(record_envelopes):
-                            if not self.dry_run:
-                                try:
-                                    self.sink.write_record_async(
-                                        record_envelope, callback
-                                    )
-                                except Exception as e:
-                                    # In case the sink's error handling is bad, we still want to report the error.
-                                    self.sink.report.report_failure(
-                                        f"Failed to write record: {e}"
-                                    )
-
-                    except RuntimeError:
-                        raise
-                    except SystemExit:
-                        raise
-                    except Exception as e:
-                        logger.error(
-                            "Failed to process some records. Continuing.",
-                            exc_info=e,
-                        )
-                        # TODO: Transformer errors should cause the pipeline to fail.
-
-                    self.extractor.close()
-                    if not self.dry_run:
-                        self.sink.handle_work_unit_end(wu)
+                )
+                if prefetcher:
+                    workunits = prefetcher.prefetch(workunits)
+                if self.config.flags.workunit_processing_threads > 0:
+                    self._process_workunits_in_parallel(workunits, callback, prefetcher)
+                else:
+                    for wu in workunits:
+                        self._print_summary_if_due()
+
+                        if not self.dry_run:
+                            self.sink.handle_work_unit_start(wu)
+                        try:
+                            record_envelopes = self.extractor.get_records(wu)
+                            for record_envelope in self.transform(record_envelopes):
+                                if not self.dry_run:
+                                    try:
+                                        self.sink.write_record_async(
+                                            record_envelope, callback
+                                        )
+                                    except Exception as e:
+                                        # In case the sink's error handling is bad, we still want to report the error.
+                                        self.sink.report.report_failure(
+                                            f"Failed to write record: {e}"
+                                        )
+
+                        except RuntimeError:
+                            raise
+                        except SystemExit:
+                            raise
+                        except Exception as e:
+                            logger.error(
+                                "Failed to process some records. Continuing.",
+                                exc_info=e,
+                            )
+                            # TODO: Transformer errors should cause the pipeline to fail.
+
+                        self.extractor.close()
+                        if not self.dry_run:
+                            self.sink.handle_work_unit_end(wu)
+                        if prefetcher:
+                            prefetcher.release()
                 self.source.close()
                 # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
                 for record_envelope in self.transform(
@@ -438,6 +517,8 @@ class Pipeline:
                 logger.error("Caught error", exc_info=e)
                 raise
             finally:
+                if prefetcher:
+                    prefetcher.close()
                 clear_global_warnings()
 
                 if callback and hasattr(callback, "close"):
@@ -445,6 +526,120 @@ class Pipeline:
 
                 self._notify_reporters_on_ingestion_completion()
 
+    def _print_summary_if_due(self) -> None:
+        try:
+            if self._time_to_print():
+                self.pretty_print_summary(currently_running=True)
+        except Exception as e:
+            logger.warning(f"Failed to print summary {e}")
+
+    def _process_workunits_in_parallel(
+        self,
+        workunits: Iterable[WorkUnit],
+        callback: WriteCallback,
+        prefetcher: Optional[_TransformerPrefetcher] = None,
+    ) -> None:
+        """
+        Runs the extractor and transformers for the given workunits on a pool of threads.
+        Workunits for the same urn are processed in order. The sink is only called from
+        the calling thread: handle_work_unit_start before a workunit is submitted, and
+        the results are written in the same order the source produced them.
+        """
+        max_pending = self.config.flags.workunit_processing_max_pending
+        pending: Deque[
+            Tuple[WorkUnit, "Future[_ProcessedWorkUnit]"]
+        ] = collections.deque()
+        executor = PartitionExecutor(
+            max_workers=self.config.flags.workunit_processing_threads,
+            max_pending=max_pending,
+        )
+
+        def write_oldest() -> None:
+            self._write_processed_workunit(*pending.popleft(), callback)
+            if prefetcher:
+                prefetcher.release()
+
+        try:
+            for wu in workunits:
+                self._print_summary_if_due()
+
+                if not self.dry_run:
+                    self.sink.handle_work_unit_start(wu)
+                pending.append(
+                    (
+                        wu,
+                        executor.submit(
+                            self._get_workunit_partition_key(wu),
+                            self._extract_and_transform,
+                            wu,
+                        ),
+                    )
+                )
+                # Write out everything that is ready at the head of the queue. If too
+                # many workunits are in flight, block on the oldest one instead.
+                while pending and (pending[0][1].done() or len(pending) >= max_pending):
+                    write_oldest()
+
+            while pending:
+                write_oldest()
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def _get_workunit_partition_key(wu: WorkUnit) -> str:
+        if isinstance(wu, MetadataWorkUnit):
+            try:
+                return wu.get_urn()
+            except Exception:
+                pass
+        return wu.id
+
+    def _extract_and_transform(self, wu: WorkUnit) -> "_ProcessedWorkUnit":
+        records: List[RecordEnvelope] = []
+        try:
+            for record_envelope in self.transform(self.extractor.get_records(wu)):
+                records.append(record_envelope)
+        except Exception as e:
+            return _ProcessedWorkUnit(records=records, error=e)
+        return _ProcessedWorkUnit(records=records, error=None)
+
+    def _write_processed_workunit(
+        self,
+        wu: WorkUnit,
+        future: "Future[_ProcessedWorkUnit]",
+        callback: WriteCallback,
+    ) -> None:
+        processed = future.result()
+        if not self.dry_run:
+            for record_envelope in processed.records:
+                try:
+                    self.sink.write_record_async(record_envelope, callback)
+                except Exception as e:
+                    # In case the sink's error handling is bad, we still want to report the error.
+                    self.sink.report.report_failure(f"Failed to write record: {e}")
+
+        if processed.error is not None:
+            if isinstance(processed.error, RuntimeError):
+                raise processed.error
+            logger.error(
+                "Failed to process some records. Continuing.",
+                exc_info=processed.error,
+            )
+
+        self.extractor.close()
+        if not self.dry_run:
+            self.sink.handle_work_unit_end(wu)
+
+    def _get_transformer_prefetcher(self) -> Optional[_TransformerPrefetcher]:
+        # Workunits are only buffered into batches when some transformer will actually
+        # prefetch for them.
+        transformers = [t for t in self.transformers if t.wants_prefetch()]
+        if self.ctx.graph is None or not transformers:
+            return None
+        return _TransformerPrefetcher(transformers)
+
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
         Transforms the given sequence of records by passing the records through the transformers
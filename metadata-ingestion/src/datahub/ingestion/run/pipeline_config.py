@@ -64,6 +64,26 @@ class FlagsConfig(ConfigModel):
         ),
     )
 
+    workunit_processing_threads: int = Field(
+        default=0,
+        description=(
+            "If set to a positive number, the extractor and transformers are run on a pool of this many threads. "
+            "Workunits for the same urn are always processed in order, and records are still handed to the sink in source order. "
+            "This speeds up I/O-bound processing, like transformers that look up aspects in DataHub with PATCH semantics; "
+            "CPU-bound work is still limited to a single core. "
+            "All transformers must be thread-safe to use this. The built-in transformers are, except for the ones "
+            "that are configured with a callback (`add_dataset_ownership`, `add_dataset_tags` and the like)."
+        ),
+    )
+
+    workunit_processing_max_pending: int = Field(
+        default=1000,
+        description=(
+            "Maximum number of workunits that can be in flight when `workunit_processing_threads` is set. "
+            "Once reached, pulling from the source blocks until earlier workunits have been written to the sink."
+        ),
+    )
+
 
 class PipelineConfig(ConfigModel):
     # Once support for discriminated unions gets merged into Pydantic, we can
@@ -124,7 +144,7 @@ class PipelineConfig(ConfigModel):
     ) -> Optional[DatahubClientConfig]:
         if v is None and "sink" in values and hasattr(values["sink"], "type"):
             sink_type = values["sink"].type
-            if sink_type == "datahub-rest":
+            if sink_type in {"datahub-rest", "datahub-rest-async"}:
                 sink_config = values["sink"].config
                 v = DatahubClientConfig.parse_obj_allow_extras(sink_config)
         return v
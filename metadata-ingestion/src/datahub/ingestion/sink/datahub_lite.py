@@ -1,6 +1,8 @@
 import logging
 import os
-from typing import Union
+from typing import List, Tuple, Union, cast
+
+from pydantic import Field
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope
@@ -17,11 +19,23 @@ logger = logging.getLogger(__name__)
 class DataHubLiteSinkConfig(LiteLocalConfig):
     type: str = "duckdb"
     config: dict = {"file": os.path.expanduser("~/.datahub/lite/datahub.duckdb")}
+    batch_size: int = Field(
+        1000,
+        description="Number of records to buffer before writing them to DataHub Lite in bulk. Set to 1 to write records one at a time.",
+    )
 
 
 class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
-        self.datahub_lite = get_datahub_lite(self.config.dict())
+        self.datahub_lite = get_datahub_lite(self.config.dict(exclude={"batch_size"}))
+        self._buffer: List[
+            Tuple[
+                RecordEnvelope[
+                    Union[MetadataChangeEvent, MetadataChangeProposalWrapper]
+                ],
+                WriteCallback,
+            ]
+        ] = []
 
     def write_record_async(
         self,
@@ -38,9 +52,28 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
         if not isinstance(record, (MetadataChangeEvent, MetadataChangeProposalWrapper)):
             self.report.report_warning(f"datahub-local does not support {type(record)}")
             return
+        supported_envelope = cast(
+            RecordEnvelope[Union[MetadataChangeEvent, MetadataChangeProposalWrapper]],
+            record_envelope,
+        )
+
+        if self.config.batch_size <= 1:
+            self._write_record(supported_envelope, write_callback)
+            return
+
+        self._buffer.append((supported_envelope, write_callback))
+        if len(self._buffer) >= self.config.batch_size:
+            self._flush()
 
+    def _write_record(
+        self,
+        record_envelope: RecordEnvelope[
+            Union[MetadataChangeEvent, MetadataChangeProposalWrapper]
+        ],
+        write_callback: WriteCallback,
+    ) -> None:
         try:
-            self.datahub_lite.write(record)
+            self.datahub_lite.write(record_envelope.record)
             self.report.report_record_written(record_envelope)
         except Exception as e:
             self.report.report_failure(f"{record_envelope.metadata}: {type(e)}: {e}")
@@ -50,6 +83,31 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
             if write_callback:
                 write_callback.on_success(record_envelope, success_metadata={})
 
+    def _flush(self) -> None:
+        buffer, self._buffer = self._buffer, []
+        if not buffer:
+            return
+
+        try:
+            self.datahub_lite.write_batch(
+                record_envelope.record for record_envelope, _ in buffer
+            )
+        except Exception as e:
+            # Retry records individually so that only the bad ones are reported as failures.
+            logger.debug(
+                f"Failed to write a batch of {len(buffer)} records, retrying them one by one",
+                exc_info=e,
+            )
+            for record_envelope, write_callback in buffer:
+                self._write_record(record_envelope, write_callback)
+            return
+
+        for record_envelope, write_callback in buffer:
+            self.report.report_record_written(record_envelope)
+            if write_callback:
+                write_callback.on_success(record_envelope, success_metadata={})
+
     def close(self):
+        self._flush()
         if self.datahub_lite:
             self.datahub_lite.close()
@@ -6,8 +6,8 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import auto
-from threading import BoundedSemaphore
-from typing import Union
+from threading import BoundedSemaphore, Lock
+from typing import List, Optional, Tuple, Union
 
 from datahub.cli.cli_utils import set_env_variables_override_config
 from datahub.configuration.common import (
@@ -16,6 +16,7 @@ from datahub.configuration.common import (
     OperationalError,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.mcp_builder import mcps_from_mce
 from datahub.emitter.rest_emitter import DatahubRestEmitter
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
@@ -25,6 +26,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
     MetadataChangeProposal,
 )
+from datahub.utilities.partition_executor import BatchPartitionExecutor
 from datahub.utilities.server_config_util import set_gms_config
 
 logger = logging.getLogger(__name__)
@@ -33,6 +35,7 @@ logger = logging.getLogger(__name__)
 class SyncOrAsync(ConfigEnum):
     SYNC = auto()
     ASYNC = auto()
+    ASYNC_BATCH = auto()
 
 
 class DatahubRestSinkConfig(DatahubClientConfig):
@@ -42,11 +45,17 @@ class DatahubRestSinkConfig(DatahubClientConfig):
     max_threads: int = 15
     max_pending_requests: int = 1000
 
+    # These only apply in async batch mode.
+    max_per_batch: int = 100
+    max_batch_linger_sec: float = 1.0
+
 
 @dataclass
 class DataHubRestSinkReport(SinkReport):
     gms_version: str = ""
     pending_requests: int = 0
+    async_batches_emitted: int = 0
+    async_batches_failed: int = 0
 
     def compute_stats(self) -> None:
         super().compute_stats()
@@ -86,6 +95,14 @@ class BoundedExecutor:
         self.executor.shutdown(wait)
 
 
+# A record, its write callback, and the mcps that it expands to.
+_BatchItem = Tuple[
+    RecordEnvelope,
+    WriteCallback,
+    List[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+]
+
+
 class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
     emitter: DatahubRestEmitter
     treat_errors_as_warnings: bool = False
@@ -102,6 +119,8 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             ca_certificate_path=self.config.ca_certificate_path,
             client_certificate_path=self.config.client_certificate_path,
             disable_ssl_verification=self.config.disable_ssl_verification,
+            compression=self.config.compression,
+            compression_min_size=self.config.compression_min_size,
         )
         try:
             gms_config = self.emitter.test_connection()
@@ -124,6 +143,17 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             max_workers=self.config.max_threads,
             bound=self.config.max_pending_requests,
         )
+        self.batch_executor: Optional[BatchPartitionExecutor[_BatchItem]] = None
+        # Batches are emitted on the executor's worker threads, which all update the report.
+        self._report_lock = Lock()
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            self.batch_executor = BatchPartitionExecutor(
+                max_workers=self.config.max_threads,
+                max_pending=self.config.max_pending_requests,
+                max_per_batch=self.config.max_per_batch,
+                max_batch_linger=timedelta(seconds=self.config.max_batch_linger_sec),
+                process_batch=self._emit_batch,
+            )
 
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
         if isinstance(workunit, MetadataWorkUnit):
@@ -151,35 +181,83 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
                 self.report.report_record_written(record_envelope)
                 self.report.report_write_latency(end_time - start_time)
                 write_callback.on_success(record_envelope, {})
-            elif isinstance(e, OperationalError):
-                # only OperationalErrors should be ignored
-                # trim exception stacktraces in all cases when reporting
-                if "stackTrace" in e.info:
-                    with contextlib.suppress(Exception):
-                        e.info["stackTrace"] = "\n".join(
-                            e.info["stackTrace"].split("\n")[:3]
+            else:
+                self._report_write_failure(record_envelope, write_callback, e)
+
+    def _report_write_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        e: BaseException,
+    ) -> None:
+        if isinstance(e, OperationalError):
+            # only OperationalErrors should be ignored
+            # trim exception stacktraces in all cases when reporting
+            if "stackTrace" in e.info:
+                with contextlib.suppress(Exception):
+                    e.info["stackTrace"] = "\n".join(
+                        e.info["stackTrace"].split("\n")[:3]
+                    )
+                    e.info["message"] = e.info.get("message", "").split("\n")[0][:200]
+
+            # Include information about the entity that failed.
+            record = record_envelope.record
+            if isinstance(record, MetadataChangeProposalWrapper):
+                entity_id = record.entityUrn
+                e.info["id"] = entity_id
+            elif isinstance(record, MetadataChangeEvent):
+                entity_id = record.proposedSnapshot.urn
+                e.info["id"] = entity_id
+
+            if not self.treat_errors_as_warnings:
+                self.report.report_failure({"error": e.message, "info": e.info})
+            else:
+                self.report.report_warning({"warning": e.message, "info": e.info})
+            write_callback.on_failure(record_envelope, e, e.info)
+        else:
+            self.report.report_failure({"e": e})
+            write_callback.on_failure(record_envelope, Exception(e), {})
+
+    def _emit_batch(self, batch: List[_BatchItem]) -> None:
+        mcps = [mcp for _, _, item_mcps in batch for mcp in item_mcps]
+        try:
+            self.emitter.emit_mcps(mcps)
+        except Exception as e:
+            # The server ingests the proposals of a batch one at a time, so a failed
+            # batch may have been partially written, and we don't know which of the
+            # records caused the failure. Re-send them one by one so that each record
+            # gets its own success or failure callback. This writes the mcps that
+            # already made it a second time, which is safe for the same reason that
+            # the emitter's retries of failed POSTs are: ingesting an unchanged
+            # aspect again does not create a new version of it.
+            logger.debug(
+                f"Failed to emit batch of {len(batch)} records, retrying individually: {e}"
+            )
+            with self._report_lock:
+                self.report.async_batches_failed += 1
+            for record_envelope, write_callback, item_mcps in batch:
+                try:
+                    for mcp in item_mcps:
+                        self.emitter.emit_mcp(mcp)
+                except Exception as item_exc:
+                    with self._report_lock:
+                        self._report_write_failure(
+                            record_envelope, write_callback, item_exc
                         )
-                        e.info["message"] = e.info.get("message", "").split("\n")[0][
-                            :200
-                        ]
-
-                # Include information about the entity that failed.
-                record = record_envelope.record
-                if isinstance(record, MetadataChangeProposalWrapper):
-                    entity_id = record.entityUrn
-                    e.info["id"] = entity_id
-                elif isinstance(record, MetadataChangeEvent):
-                    entity_id = record.proposedSnapshot.urn
-                    e.info["id"] = entity_id
-
-                if not self.treat_errors_as_warnings:
-                    self.report.report_failure({"error": e.message, "info": e.info})
                 else:
-                    self.report.report_warning({"warning": e.message, "info": e.info})
-                write_callback.on_failure(record_envelope, e, e.info)
-            else:
-                self.report.report_failure({"e": e})
-                write_callback.on_failure(record_envelope, Exception(e), {})
+                    with self._report_lock:
+                        self.report.report_record_written(record_envelope)
+                    write_callback.on_success(record_envelope, {})
+        else:
+            with self._report_lock:
+                self.report.async_batches_emitted += 1
+            for record_envelope, write_callback, _ in batch:
+                with self._report_lock:
+                    self.report.report_record_written(record_envelope)
+                write_callback.on_success(record_envelope, {})
+        finally:
+            with self._report_lock:
+                self.report.pending_requests -= len(batch)
 
     def write_record_async(
         self,
@@ -193,7 +271,20 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         write_callback: WriteCallback,
     ) -> None:
         record = record_envelope.record
-        if self.config.mode == SyncOrAsync.ASYNC:
+        if self.batch_executor is not None:
+            mcps: List[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]]
+            if isinstance(record, MetadataChangeEvent):
+                mcps = list(mcps_from_mce(record))
+                partition_key = record.proposedSnapshot.urn
+            else:
+                mcps = [record]
+                partition_key = record.entityUrn or ""
+            with self._report_lock:
+                self.report.pending_requests += 1
+            self.batch_executor.submit(
+                partition_key, (record_envelope, write_callback, mcps)
+            )
+        elif self.config.mode == SyncOrAsync.ASYNC:
             write_future = self.executor.submit(self.emitter.emit, record)
             write_future.add_done_callback(
                 functools.partial(
@@ -210,6 +301,8 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
                 write_callback.on_failure(record_envelope, e, failure_metadata={})
 
     def close(self):
+        if self.batch_executor is not None:
+            self.batch_executor.shutdown(wait=True)
         self.executor.shutdown(wait=True)
 
     def __repr__(self) -> str:
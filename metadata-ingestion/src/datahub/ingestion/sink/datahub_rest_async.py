@@ -0,0 +1,171 @@
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import threading
+from typing import Any, Coroutine, Dict, Set, Type, TypeVar, Union
+
+import pydantic
+
+from datahub.cli.cli_utils import set_env_variables_override_config
+from datahub.configuration.common import ConfigurationError
+from datahub.emitter.async_rest_emitter import AsyncDataHubRestEmitter
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import RecordEnvelope
+from datahub.ingestion.api.sink import WriteCallback
+from datahub.ingestion.graph.client import DatahubClientConfig
+from datahub.ingestion.sink.datahub_rest import DatahubRestSink
+from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
+    MetadataChangeEvent,
+    MetadataChangeProposal,
+)
+from datahub.utilities.server_config_util import set_gms_config
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class DatahubRestAsyncSinkConfig(DatahubClientConfig):
+    max_connections: int = 100
+    max_pending_requests: int = 1000
+    keepalive_timeout_sec: float = 30.0
+
+    @pydantic.root_validator(pre=True)
+    def _reject_thread_pool_options(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        # The datahub-rest options for its thread pool and batching don't apply here,
+        # so don't let recipes that switch sinks keep them around without effect.
+        unsupported = [
+            field
+            for field in [
+                "mode",
+                "max_threads",
+                "max_per_batch",
+                "max_batch_linger_sec",
+            ]
+            if field in values
+        ]
+        if unsupported:
+            raise ValueError(
+                f"The datahub-rest-async sink does not support {', '.join(unsupported)}. "
+                "It always writes asynchronously; use max_connections to limit the number of concurrent requests."
+            )
+        return values
+
+
+class DatahubRestAsyncSink(DatahubRestSink):
+    """A variant of the datahub-rest sink that uses asyncio instead of a thread pool.
+
+    All requests are issued from a single background event loop, so thousands of
+    writes can be in flight without needing a thread per request.
+    """
+
+    config: DatahubRestAsyncSinkConfig  # type: ignore
+    async_emitter: AsyncDataHubRestEmitter
+
+    @classmethod
+    def get_config_class(cls) -> Type[DatahubRestAsyncSinkConfig]:  # type: ignore
+        return DatahubRestAsyncSinkConfig
+
+    def __post_init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="datahub-rest-async", daemon=True
+        )
+        self._loop_thread.start()
+
+        self.async_emitter = AsyncDataHubRestEmitter(
+            self.config.server,
+            self.config.token,
+            connect_timeout_sec=self.config.timeout_sec,  # reuse timeout_sec for connect timeout
+            read_timeout_sec=self.config.timeout_sec,
+            retry_status_codes=self.config.retry_status_codes,
+            retry_max_times=self.config.retry_max_times,
+            extra_headers=self.config.extra_headers,
+            ca_certificate_path=self.config.ca_certificate_path,
+            client_certificate_path=self.config.client_certificate_path,
+            disable_ssl_verification=self.config.disable_ssl_verification,
+            compression=self.config.compression,
+            compression_min_size=self.config.compression_min_size,
+            max_connections=self.config.max_connections,
+            keepalive_timeout_sec=self.config.keepalive_timeout_sec,
+        )
+        try:
+            gms_config = self._run(self.async_emitter.test_connection())
+        except Exception as exc:
+            self._stop_loop()
+            raise ConfigurationError(
+                f"💥 Failed to connect to DataHub@{self.config.server} (token:{'XXX-redacted' if self.config.token else 'empty'}) over REST",
+                exc,
+            )
+
+        self.report.gms_version = (
+            gms_config.get("versions", {})
+            .get("linkedin/datahub", {})
+            .get("version", "")
+        )
+        logger.debug("Setting env variables to override config")
+        set_env_variables_override_config(self.config.server, self.config.token)
+        logger.debug("Setting gms config")
+        set_gms_config(gms_config)
+
+        self._pending_semaphore = threading.BoundedSemaphore(
+            self.config.max_pending_requests
+        )
+        self._pending_futures: Set[concurrent.futures.Future] = set()
+        self._pending_lock = threading.Lock()
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def write_record_async(
+        self,
+        record_envelope: RecordEnvelope[
+            Union[
+                MetadataChangeEvent,
+                MetadataChangeProposal,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+        write_callback: WriteCallback,
+    ) -> None:
+        # Blocks once max_pending_requests writes are in flight.
+        self._pending_semaphore.acquire()
+        self.report.pending_requests += 1
+
+        write_future = asyncio.run_coroutine_threadsafe(
+            self.async_emitter.emit(record_envelope.record), self._loop
+        )
+        with self._pending_lock:
+            self._pending_futures.add(write_future)
+        write_future.add_done_callback(
+            functools.partial(self._async_write_done, record_envelope, write_callback)
+        )
+
+    def _async_write_done(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        future: concurrent.futures.Future,
+    ) -> None:
+        try:
+            self._write_done_callback(record_envelope, write_callback, future)
+        finally:
+            with self._pending_lock:
+                self._pending_futures.discard(future)
+            self._pending_semaphore.release()
+
+    def _stop_loop(self) -> None:
+        self._run(self.async_emitter.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+
+    def close(self) -> None:
+        with self._pending_lock:
+            pending = list(self._pending_futures)
+        concurrent.futures.wait(pending)
+        self._stop_loop()
+
+    def __repr__(self) -> str:
+        return self.async_emitter.__repr__()
@@ -1,9 +1,13 @@
 import json
 import logging
 import pathlib
-from typing import Iterable, Union
+from enum import auto
+from typing import Any, Dict, Iterable, Optional, Union
 
-from datahub.configuration.common import ConfigModel
+from pydantic import Field, validator
+from typing_extensions import Literal
+
+from datahub.configuration.common import ConfigEnum, ConfigModel
 from datahub.emitter.aspect import JSON_CONTENT_TYPE, JSON_PATCH_CONTENT_TYPE
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope
@@ -13,10 +17,16 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
+from datahub.utilities.json_lines import JSONL_EXTENSIONS, JsonLinesWriter
 
 logger = logging.getLogger(__name__)
 
 
+class FileSinkFormat(ConfigEnum):
+    JSON = auto()
+    JSONL = auto()
+
+
 def _to_obj_for_file(
     obj: Union[
         MetadataChangeEvent,
@@ -44,10 +54,33 @@ class FileSinkConfig(ConfigModel):
 
     legacy_nested_json_string: bool = False
 
+    format: FileSinkFormat = Field(
+        FileSinkFormat.JSON,
+        description="Either `json`, which writes a single pretty-printed JSON array, or `jsonl`, which writes one compact JSON record per line. "
+        "`jsonl` files are much smaller and can be read back in constant memory.",
+    )
+    compression: Optional[Literal["gzip", "zstd"]] = Field(
+        None,
+        description="Compress the output with `gzip` or `zstd`. Only supported with the `jsonl` format. zstd requires the `zstandard` package.",
+    )
+
+    @validator("compression")
+    def compression_requires_jsonl(
+        cls, v: Optional[str], values: Dict[str, Any]
+    ) -> Optional[str]:
+        if v is not None and values.get("format") != FileSinkFormat.JSONL:
+            raise ValueError("compression is only supported with the jsonl format")
+        return v
+
 
 class FileSink(Sink[FileSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
         fpath = pathlib.Path(self.config.filename)
+        self.jsonl_writer: Optional[JsonLinesWriter] = None
+        if self.config.format == FileSinkFormat.JSONL:
+            self.jsonl_writer = JsonLinesWriter(fpath, self.config.compression)
+            return
+
         self.file = fpath.open("w")
         self.file.write("[\n")
         self.wrote_something = False
@@ -68,17 +101,24 @@ class FileSink(Sink[FileSinkConfig, SinkReport]):
             record, simplified_structure=not self.config.legacy_nested_json_string
         )
 
-        if self.wrote_something:
-            self.file.write(",\n")
+        if self.jsonl_writer is not None:
+            self.jsonl_writer.write(obj)
+        else:
+            if self.wrote_something:
+                self.file.write(",\n")
 
-        json.dump(obj, self.file, indent=4)
-        self.wrote_something = True
+            json.dump(obj, self.file, indent=4)
+            self.wrote_something = True
 
         self.report.report_record_written(record_envelope)
         if write_callback:
             write_callback.on_success(record_envelope, {})
 
     def close(self):
+        if self.jsonl_writer is not None:
+            self.jsonl_writer.close()
+            return
+
         self.file.write("\n]")
         self.file.close()
 
@@ -96,6 +136,18 @@ def write_metadata_file(
     ],
 ) -> None:
     # This simplified version of the FileSink can be used for testing purposes.
+    # Files with a JSON Lines extension are written in the jsonl format.
+    if file.suffix.lower() in JSONL_EXTENSIONS:
+        writer = JsonLinesWriter(file)
+        try:
+            for record in records:
+                if not isinstance(record, dict):
+                    record = _to_obj_for_file(record)
+                writer.write(record)
+        finally:
+            writer.close()
+        return
+
     with file.open("w") as f:
         f.write("[\n")
         for i, record in enumerate(records):
@@ -284,6 +284,13 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         self.view_definitions: FileBackedDict[str] = FileBackedDict()
 
         self.sql_parser_schema_resolver = self._init_schema_resolver()
+        if self.config.sql_parsing_cache_path:
+            self.report.sql_parsing_cache = (
+                self.sql_parser_schema_resolver.enable_parse_result_cache(
+                    self.config.sql_parsing_cache_path,
+                    max_size_mb=self.config.sql_parsing_cache_max_size_mb,
+                )
+            )
 
         self.add_config_to_report()
         atexit.register(cleanup, config)
@@ -1122,6 +1129,10 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
     def get_report(self) -> BigQueryV2Report:
         return self.report
 
+    def close(self) -> None:
+        self.sql_parser_schema_resolver.close()
+        super().close()
+
     def get_tables_for_dataset(
         self,
         project_id: str,
@@ -36,6 +36,29 @@ class BigQueryUsageConfig(BaseUsageConfig):
         description="Whether to apply view's usage to its base tables. If set to False, uses sql parser and applies usage to views / tables mentioned in the query. If set to True, usage is applied to base tables only.",
     )
 
+    streaming_aggregation: bool = Field(
+        default=False,
+        description="Whether to aggregate usage statistics as audit log events are read, instead of storing all events and aggregating them with a single query at the end. "
+        "This uses much less disk space, and is much faster for projects with many events. Aggregates are kept in memory up to `file_backed_cache_size` table and time bucket pairs, and spilled to disk beyond that.",
+    )
+
+    streaming_aggregation_max_queries: int = Field(
+        default=1000,
+        description="With `streaming_aggregation`, the number of distinct queries whose counts are tracked per table and time bucket, in order to find the top queries. "
+        "Counts are exact for up to twice this many distinct queries, and approximate beyond that. Must be at least `top_n_queries`.",
+    )
+
+    @validator("streaming_aggregation_max_queries")
+    def validate_streaming_aggregation_max_queries(
+        cls, v: int, values: Dict[str, Any]
+    ) -> int:
+        top_n_queries = values.get("top_n_queries")
+        if top_n_queries is not None and v < top_n_queries:
+            raise ValueError(
+                "streaming_aggregation_max_queries must be at least top_n_queries"
+            )
+        return v
+
 
 class BigQueryConnectionConfig(ConfigModel):
     credential: Optional[BigQueryCredential] = Field(
@@ -62,6 +62,10 @@ class BigQueryV2Report(ProfilingSqlReport, IngestionStageReport, BaseTimeWindowR
     lineage_metadata_entries: TopKDict[str, int] = field(default_factory=TopKDict)
     lineage_mem_size: Dict[str, str] = field(default_factory=TopKDict)
     lineage_extraction_sec: Dict[str, float] = field(default_factory=TopKDict)
+    num_lineage_temp_tables_collapsed: TopKDict[str, int] = field(
+        default_factory=int_top_k_dict
+    )
+    lineage_temp_table_collapse_sec: Dict[str, float] = field(default_factory=TopKDict)
     usage_extraction_sec: Dict[str, float] = field(default_factory=TopKDict)
     num_usage_total_log_entries: TopKDict[str, int] = field(
         default_factory=int_top_k_dict
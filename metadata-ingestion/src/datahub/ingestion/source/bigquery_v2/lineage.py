@@ -9,7 +9,9 @@ from typing import (
     Dict,
     FrozenSet,
     Iterable,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -333,6 +335,15 @@ class BigqueryLineageExtractor:
                 memory_footprint.total_size(lineage)
             )
 
+        with PerfTimer() as timer:
+            collapsed_temp_tables = self.collapse_temp_table_lineage(lineage)
+            self.report.num_lineage_temp_tables_collapsed[project_id] = len(
+                collapsed_temp_tables
+            )
+            self.report.lineage_temp_table_collapse_sec[project_id] = round(
+                timer.elapsed_seconds(), 2
+            )
+
         for lineage_key in lineage.keys():
             # For views, we do not use the upstreams obtained by parsing audit logs
             # as they may contain indirectly referenced tables.
@@ -343,7 +354,9 @@ class BigqueryLineageExtractor:
                 continue
 
             yield from self.gen_lineage_workunits_for_table(
-                lineage, BigQueryTableRef.from_string_name(lineage_key)
+                lineage,
+                BigQueryTableRef.from_string_name(lineage_key),
+                collapsed_temp_tables,
             )
 
     def populate_view_lineage_with_sql_parsing(
@@ -388,7 +401,10 @@ class BigqueryLineageExtractor:
             )
 
     def gen_lineage_workunits_for_table(
-        self, lineage: Dict[str, Set[LineageEdge]], table_ref: BigQueryTableRef
+        self,
+        lineage: Dict[str, Set[LineageEdge]],
+        table_ref: BigQueryTableRef,
+        collapsed_temp_tables: Optional[Dict[str, Set[LineageEdge]]] = None,
     ) -> Iterable[MetadataWorkUnit]:
         dataset_urn = self.dataset_urn_builder(table_ref)
 
@@ -396,6 +412,7 @@ class BigqueryLineageExtractor:
             bq_table=table_ref,
             bq_table_urn=dataset_urn,
             lineage_metadata=lineage,
+            collapsed_temp_tables=collapsed_temp_tables,
         )
         if lineage_info:
             yield from self.gen_lineage(dataset_urn, lineage_info)
@@ -756,58 +773,136 @@ class BigqueryLineageExtractor:
         logger.info("Exiting create lineage map function")
         return lineage_map
 
-    def get_upstream_tables(
+    def _is_temp_table_ref(self, table_ref: str) -> bool:
+        return BigQueryTableRef.from_string_name(table_ref).is_temporary_table(
+            [self.config.temp_table_dataset_prefix]
+        )
+
+    def _get_temp_upstream_refs(
+        self, table_ref: str, lineage_metadata: Dict[str, Set[LineageEdge]]
+    ) -> List[str]:
+        return [
+            upstream_lineage.table
+            for upstream_lineage in lineage_metadata[table_ref]
+            if upstream_lineage.table != table_ref
+            and upstream_lineage.table in lineage_metadata
+            and self._is_temp_table_ref(upstream_lineage.table)
+        ]
+
+    def collapse_temp_table_lineage(
+        self, lineage_metadata: Dict[str, Set[LineageEdge]]
+    ) -> Dict[str, Set[LineageEdge]]:
+        """
+        Collapses the upstreams of every temporary table in lineage_metadata, so that they
+        only reference non-temporary tables. The result can be passed to get_upstream_tables,
+        so that long chains of temporary tables are only walked once per run.
+        """
+        collapsed_temp_tables: Dict[str, Set[LineageEdge]] = {}
+        for table_ref in list(lineage_metadata.keys()):
+            if table_ref not in collapsed_temp_tables and self._is_temp_table_ref(
+                table_ref
+            ):
+                self._collapse_temp_table(
+                    table_ref, lineage_metadata, collapsed_temp_tables
+                )
+        return collapsed_temp_tables
+
+    def _collapse_temp_table(
         self,
-        bq_table: BigQueryTableRef,
+        temp_table_ref: str,
         lineage_metadata: Dict[str, Set[LineageEdge]],
-        edges_seen: Optional[Set[LineageEdge]] = None,
-    ) -> Set[LineageEdge]:
-        if edges_seen is None:
-            edges_seen = set()
+        collapsed_temp_tables: Dict[str, Set[LineageEdge]],
+    ) -> None:
+        # Depth-first search, which collapses each temporary table after all the
+        # temporary tables it depends on. If the temporary tables form a cycle, the
+        # edge that closes it is skipped. Since the result then depends on where the
+        # search started, it's only kept for the rest of this search, and not memoized.
+        in_progress: Set[str] = set()
+        partial_results: Dict[str, Set[LineageEdge]] = {}
+        partial_results_skipped: Dict[str, Set[str]] = {}
+        results = collections.ChainMap(partial_results, collapsed_temp_tables)
+
+        # Each entry is (table, its remaining temp upstreams, the tables skipped so far).
+        stack: List[Tuple[str, Iterator[str], Set[str]]] = []
+
+        def push(table_ref: str) -> None:
+            in_progress.add(table_ref)
+            stack.append(
+                (
+                    table_ref,
+                    iter(self._get_temp_upstream_refs(table_ref, lineage_metadata)),
+                    set(),
+                )
+            )
+
+        push(temp_table_ref)
+        while stack:
+            table_ref, temp_upstream_refs, skipped = stack[-1]
+            for temp_upstream_ref in temp_upstream_refs:
+                if temp_upstream_ref in collapsed_temp_tables:
+                    continue
+                elif temp_upstream_ref in partial_results:
+                    # Only the skipped tables that are still being collapsed matter.
+                    skipped.update(
+                        partial_results_skipped[temp_upstream_ref] & in_progress
+                    )
+                elif temp_upstream_ref in in_progress:
+                    skipped.add(temp_upstream_ref)
+                else:
+                    push(temp_upstream_ref)
+                    break
+            else:
+                stack.pop()
+                in_progress.remove(table_ref)
+                skipped &= in_progress
 
+                collapsed = self._collapse_upstreams(
+                    table_ref, lineage_metadata, results
+                )
+                if skipped:
+                    partial_results[table_ref] = collapsed
+                    partial_results_skipped[table_ref] = skipped
+                    stack[-1][2].update(skipped)
+                else:
+                    collapsed_temp_tables[table_ref] = collapsed
+
+    def _collapse_upstreams(
+        self,
+        table_ref: str,
+        lineage_metadata: Dict[str, Set[LineageEdge]],
+        collapsed_temp_tables: Mapping[str, Set[LineageEdge]],
+    ) -> Set[LineageEdge]:
         upstreams: Dict[str, LineageEdge] = {}
-        for upstream_lineage in lineage_metadata[str(bq_table)]:
+        for upstream_lineage in lineage_metadata[table_ref]:
             upstream_table_ref = upstream_lineage.table
-            upstream_table = BigQueryTableRef.from_string_name(upstream_table_ref)
-            if bq_table == upstream_table:
+            if upstream_table_ref == table_ref:
                 # Skip self-references.
                 continue
 
-            if upstream_table.is_temporary_table(
-                [self.config.temp_table_dataset_prefix]
-            ):
-                # making sure we don't process a table twice and not get into a recursive loop
-                if upstream_lineage in edges_seen:
+            if self._is_temp_table_ref(upstream_table_ref):
+                if upstream_table_ref not in collapsed_temp_tables:
+                    # Either the temporary table has no upstreams, or it's part of a cycle.
                     logger.debug(
-                        f"Skipping table {upstream_lineage} because it was seen already"
+                        f"Skipping table {upstream_lineage} because it has no collapsed upstreams"
                     )
                     continue
-                edges_seen.add(upstream_lineage)
-
-                if upstream_table_ref in lineage_metadata:
-                    # `upstream_table` is a temporary table.
-                    # We don't want it in the lineage, but we do want its upstreams.
-                    # When following lineage for a temp table, we need to merge the column lineage.
-
-                    for temp_table_upstream in self.get_upstream_tables(
-                        upstream_table,
-                        lineage_metadata=lineage_metadata,
-                        edges_seen=edges_seen,
-                    ):
-                        ref_temp_table_upstream = temp_table_upstream.table
-
-                        # Replace `bq_table -> upstream_table -> temp_table_upstream`
-                        # with `bq_table -> temp_table_upstream`, merging the column lineage.
-                        collapsed_lineage = _follow_column_lineage(
-                            upstream_lineage, temp_table_upstream
-                        )
 
-                        upstreams[
-                            ref_temp_table_upstream
-                        ] = _merge_lineage_edge_columns(
-                            upstreams.get(ref_temp_table_upstream),
-                            collapsed_lineage,
-                        )
+                # `upstream_table` is a temporary table.
+                # We don't want it in the lineage, but we do want its upstreams.
+                # When following lineage for a temp table, we need to merge the column lineage.
+                for temp_table_upstream in collapsed_temp_tables[upstream_table_ref]:
+                    ref_temp_table_upstream = temp_table_upstream.table
+
+                    # Replace `bq_table -> upstream_table -> temp_table_upstream`
+                    # with `bq_table -> temp_table_upstream`, merging the column lineage.
+                    collapsed_lineage = _follow_column_lineage(
+                        upstream_lineage, temp_table_upstream
+                    )
+
+                    upstreams[ref_temp_table_upstream] = _merge_lineage_edge_columns(
+                        upstreams.get(ref_temp_table_upstream),
+                        collapsed_lineage,
+                    )
             else:
                 upstreams[upstream_table_ref] = _merge_lineage_edge_columns(
                     upstreams.get(upstream_table_ref),
@@ -816,17 +911,42 @@ class BigqueryLineageExtractor:
 
         return set(upstreams.values())
 
+    def get_upstream_tables(
+        self,
+        bq_table: BigQueryTableRef,
+        lineage_metadata: Dict[str, Set[LineageEdge]],
+        collapsed_temp_tables: Optional[Dict[str, Set[LineageEdge]]] = None,
+    ) -> Set[LineageEdge]:
+        if collapsed_temp_tables is None:
+            collapsed_temp_tables = {}
+
+        table_ref = str(bq_table)
+        for temp_upstream_ref in self._get_temp_upstream_refs(
+            table_ref, lineage_metadata
+        ):
+            if temp_upstream_ref not in collapsed_temp_tables:
+                self._collapse_temp_table(
+                    temp_upstream_ref, lineage_metadata, collapsed_temp_tables
+                )
+
+        return self._collapse_upstreams(
+            table_ref, lineage_metadata, collapsed_temp_tables
+        )
+
     def get_lineage_for_table(
         self,
         bq_table: BigQueryTableRef,
         bq_table_urn: str,
         lineage_metadata: Dict[str, Set[LineageEdge]],
+        collapsed_temp_tables: Optional[Dict[str, Set[LineageEdge]]] = None,
     ) -> Optional[UpstreamLineageClass]:
         upstream_list: List[UpstreamClass] = []
         fine_grained_lineages: List[FineGrainedLineageClass] = []
         # Sorting the list of upstream lineage events in order to avoid creating multiple aspects in backend
         # even if the lineage is same but the order is different.
-        for upstream in sorted(self.get_upstream_tables(bq_table, lineage_metadata)):
+        for upstream in sorted(
+            self.get_upstream_tables(bq_table, lineage_metadata, collapsed_temp_tables)
+        ):
             upstream_table = BigQueryTableRef.from_string_name(upstream.table)
             upstream_table_urn = self.dataset_urn_builder(upstream_table)
 
@@ -1,15 +1,17 @@
+import collections
 import hashlib
 import json
 import logging
 import os
 import time
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import (
     Any,
     Callable,
     Collection,
+    Counter,
     Dict,
     Iterable,
     Iterator,
@@ -63,6 +65,7 @@ from datahub.metadata.schema_classes import OperationClass, OperationTypeClass
 from datahub.utilities.bigquery_sql_parser import BigQuerySQLParser
 from datahub.utilities.file_backed_collections import ConnectionWrapper, FileBackedDict
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.stats_collections import HeavyHittersCounter
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -105,13 +108,45 @@ class OperationalDataMeta:
     custom_type: Optional[str] = None
 
 
+@dataclass
+class _UsageAggregate:
+    """Usage statistics of one resource in one time bucket, for streaming aggregation."""
+
+    timestamp: str
+    resource: str
+    query_count: int
+    query_freq: HeavyHittersCounter[str]
+    user_freq: Counter[str] = field(default_factory=collections.Counter)
+    column_freq: Counter[str] = field(default_factory=collections.Counter)
+
+
 class BigQueryUsageState(Closeable):
     read_events: FileBackedDict[ReadEvent]
     query_events: FileBackedDict[QueryEvent]
     column_accesses: FileBackedDict[Tuple[str, str]]
     queries: FileBackedDict[str]
+    # Only used with streaming aggregation.
+    usage_aggregates: FileBackedDict[_UsageAggregate]
+    job_queries: FileBackedDict[Tuple[str, bool]]
+    pending_read_events: FileBackedDict[List[ReadEvent]]
 
     def __init__(self, config: BigQueryV2Config):
+        self.config = config
+        self.streaming_aggregation = config.usage.streaming_aggregation
+        # With streaming aggregation, events are only stored for operational stats.
+        self.store_read_events = not self.streaming_aggregation or (
+            config.usage.include_operational_stats
+            and config.usage.include_read_operational_stats
+        )
+        self.store_query_events = (
+            not self.streaming_aggregation or config.usage.include_operational_stats
+        )
+        # Original read events for queries on views are replaced by read events
+        # generated from parsing the query. See BigQueryUsageExtractor._ingest_events.
+        self.drop_read_events_for_view_queries = (
+            not config.usage.apply_view_usage_to_tables
+        )
+
         self.conn = ConnectionWrapper()
         self.read_events = FileBackedDict[ReadEvent](
             shared_connection=self.conn,
@@ -156,14 +191,109 @@ class BigQueryUsageState(Closeable):
         )
         self.queries = FileBackedDict[str](cache_max_size=config.file_backed_cache_size)
 
+        self.usage_aggregates = FileBackedDict[_UsageAggregate](
+            shared_connection=self.conn,
+            tablename="usage_aggregates",
+            extra_columns={
+                "timestamp": lambda a: a.timestamp,
+                "resource": lambda a: a.resource,
+            },
+            cache_max_size=config.file_backed_cache_size,
+            cache_eviction_batch_size=max(int(config.file_backed_cache_size * 0.9), 1),
+        )
+        # Keyed by job_name. The query (or its hash) and whether it is on a view.
+        self.job_queries = FileBackedDict[Tuple[str, bool]](
+            shared_connection=self.conn,
+            tablename="job_queries",
+            cache_max_size=config.file_backed_cache_size,
+            cache_eviction_batch_size=max(int(config.file_backed_cache_size * 0.9), 1),
+        )
+        # Keyed by job_name. Read events whose query event has not been seen yet.
+        self.pending_read_events = FileBackedDict[List[ReadEvent]](
+            shared_connection=self.conn,
+            tablename="pending_read_events",
+            cache_max_size=config.file_backed_cache_size,
+            cache_eviction_batch_size=max(int(config.file_backed_cache_size * 0.9), 1),
+        )
+
     def close(self) -> None:
         self.read_events.close()
         self.query_events.close()
         self.column_accesses.close()
+        self.usage_aggregates.close()
+        self.job_queries.close()
+        self.pending_read_events.close()
         self.conn.close()
 
         self.queries.close()
 
+    def store_read_event(self, read_event: ReadEvent) -> None:
+        if self.store_read_events:
+            # Use uuid keys to store all entries -- no overwriting
+            key = str(uuid.uuid4())
+            self.read_events[key] = read_event
+            if not self.streaming_aggregation:
+                for field_read in read_event.fieldsRead:
+                    self.column_accesses[str(uuid.uuid4())] = key, field_read
+
+        if self.streaming_aggregation:
+            job_query = (
+                self.job_queries.get(read_event.jobName) if read_event.jobName else None
+            )
+            if job_query is None and read_event.jobName:
+                # Wait for the query event, which usually comes after its read events.
+                pending = self.pending_read_events.get(read_event.jobName, [])
+                pending.append(read_event)
+                self.pending_read_events[read_event.jobName] = pending
+            else:
+                self._aggregate_read_event(read_event, job_query)
+
+    def store_query_event(self, query_event: QueryEvent) -> None:
+        assert query_event.job_name
+        if self.store_query_events:
+            self.query_events[query_event.job_name] = query_event
+
+        if self.streaming_aggregation:
+            job_query = (query_event.query, query_event.query_on_view)
+            self.job_queries[query_event.job_name] = job_query
+            pending = self.pending_read_events.pop(query_event.job_name, [])
+            for read_event in pending:
+                self._aggregate_read_event(read_event, job_query)
+
+    def _aggregate_read_event(
+        self, read_event: ReadEvent, job_query: Optional[Tuple[str, bool]]
+    ) -> None:
+        if (
+            job_query
+            and job_query[1]
+            and not read_event.from_query
+            and self.drop_read_events_for_view_queries
+        ):
+            return
+
+        timestamp = str(
+            get_time_bucket(read_event.timestamp, self.config.bucket_duration)
+        )
+        resource = str(read_event.resource)
+        key = json.dumps([timestamp, resource])
+        aggregate = self.usage_aggregates.get(key)
+        if aggregate is None:
+            aggregate = _UsageAggregate(
+                timestamp=timestamp,
+                resource=resource,
+                query_count=0,
+                query_freq=HeavyHittersCounter(
+                    self.config.usage.streaming_aggregation_max_queries
+                ),
+            )
+
+        aggregate.user_freq[read_event.actor_email] += 1
+        aggregate.column_freq.update(read_event.fieldsRead)
+        if job_query:
+            aggregate.query_count += 1
+            aggregate.query_freq.add(job_query[0])
+        self.usage_aggregates[key] = aggregate
+
     def create_indexes(self) -> None:
         self.read_events.create_indexes()
         self.query_events.create_indexes()
@@ -175,7 +305,9 @@ class BigQueryUsageState(Closeable):
         FROM read_events r
         LEFT JOIN query_events q ON r.name = q.key
         """
-        for read_value, query_value in self.read_events.sql_query_iterator(query):
+        for read_value, query_value in self.read_events.sql_query_iterator(
+            query, refs=[self.query_events]
+        ):
             read_event = self.read_events.deserializer(read_value)
             query_event = (
                 self.query_events.deserializer(query_value) if query_value else None
@@ -255,6 +387,10 @@ class BigQueryUsageState(Closeable):
         column_freq: List[Tuple[str, int]]
 
     def usage_statistics(self, top_n: int) -> Iterator[UsageStatistic]:
+        if self.streaming_aggregation:
+            yield from self._streamed_usage_statistics(top_n)
+            return
+
         query = self.usage_statistics_query(top_n)
         rows = self.read_events.sql_query_iterator(
             query, refs=[self.query_events, self.column_accesses]
@@ -269,6 +405,34 @@ class BigQueryUsageState(Closeable):
                 column_freq=json.loads(row["column_freq"] or "[]"),
             )
 
+    def _streamed_usage_statistics(self, top_n: int) -> Iterator[UsageStatistic]:
+        # Read events whose query event never arrived only count towards user and column usage.
+        for _, pending in self.pending_read_events.items_snapshot():
+            for read_event in pending:
+                self._aggregate_read_event(read_event, None)
+        self.pending_read_events.sql_query("DELETE FROM pending_read_events")
+
+        rows = self.usage_aggregates.sql_query_iterator(
+            "SELECT value FROM usage_aggregates ORDER BY timestamp, resource"
+        )
+        for row in rows:
+            aggregate = self.usage_aggregates.deserializer(row["value"])
+            # Like the inner join in usage_statistics_query.
+            if aggregate.query_count == 0:
+                continue
+            yield self.UsageStatistic(
+                timestamp=aggregate.timestamp,
+                resource=aggregate.resource,
+                query_count=aggregate.query_count,
+                query_freq=aggregate.query_freq.most_common(top_n),
+                user_freq=sorted(
+                    aggregate.user_freq.items(), key=lambda x: (-x[1], x[0])
+                ),
+                column_freq=sorted(
+                    aggregate.column_freq.items(), key=lambda x: (-x[1], x[0])
+                ),
+            )
+
     def delete_original_read_events_for_view_query_events(self) -> None:
         self.read_events.sql_query(
             """
@@ -584,11 +748,7 @@ class BigQueryUsageExtractor:
                 self.report.report_dropped(str(resource))
                 return False
 
-            # Use uuid keys to store all entries -- no overwriting
-            key = str(uuid.uuid4())
-            usage_state.read_events[key] = event.read_event
-            for field_read in event.read_event.fieldsRead:
-                usage_state.column_accesses[str(uuid.uuid4())] = key, field_read
+            usage_state.store_read_event(event.read_event)
             return True
         elif event.query_event and event.query_event.job_name:
             max_query_length = self.config.usage.queries_character_limit
@@ -602,7 +762,7 @@ class BigQueryUsageExtractor:
             else:
                 usage_state.queries[query_hash] = query
                 event.query_event.query = query_hash
-            usage_state.query_events[event.query_event.job_name] = event.query_event
+            usage_state.store_query_event(event.query_event)
             return True
         return False
 
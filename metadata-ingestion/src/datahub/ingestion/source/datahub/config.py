@@ -39,6 +39,16 @@ class DataHubSourceConfig(StatefulIngestionConfigBase):
         description="Number of records to fetch from the database at a time",
     )
 
+    database_query_partitions: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of partitions to split the createdon range of the database into. "
+            "Each partition is read in parallel with its own database connection. "
+            "Make sure the connection pool allows for this many connections."
+        ),
+    )
+
     database_table_name: str = Field(
         default=DEFAULT_DATABASE_TABLE_NAME,
         description="Name of database table containing all versioned aspects",
@@ -49,6 +59,21 @@ class DataHubSourceConfig(StatefulIngestionConfigBase):
         description="Name of kafka topic containing timeseries MCLs",
     )
 
+    kafka_consume_batch_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "If set, consume up to this many messages from kafka at a time, and deserialize "
+            "them in parallel. Offsets are checkpointed once per batch."
+        ),
+    )
+
+    kafka_deserialization_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Number of worker threads to deserialize kafka messages with, if kafka_consume_batch_size is set.",
+    )
+
     # Override from base class to make this enabled by default
     stateful_ingestion: StatefulIngestionConfig = Field(
         default=StatefulIngestionConfig(enabled=True),
@@ -1,3 +1,4 @@
+import itertools
 import logging
 from concurrent import futures
 from typing import Dict, Iterable, List
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 # Should work for at least mysql, mariadb, postgres
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 
+# Number of entities fetched with a single request.
+_ENTITY_BATCH_SIZE = 100
+
 
 class DataHubApiReader:
     def __init__(
@@ -31,19 +35,27 @@ class DataHubApiReader:
             status=RemovedStatusFilter.ALL,
             batch_size=self.config.database_query_batch_size,
         )
-        tasks: List[futures.Future[Iterable[MetadataChangeProposalWrapper]]] = []
+        urns_iter = iter(urns)
+        tasks: List[futures.Future[List[MetadataChangeProposalWrapper]]] = []
         with futures.ThreadPoolExecutor(
             max_workers=self.config.max_workers
         ) as executor:
-            for urn in urns:
-                tasks.append(executor.submit(self._get_aspects_for_urn, urn))
+            for batch in iter(
+                lambda: list(itertools.islice(urns_iter, _ENTITY_BATCH_SIZE)), []
+            ):
+                tasks.append(executor.submit(self._get_aspects_for_urns, batch))
             for task in futures.as_completed(tasks):
                 yield from task.result()
 
-    def _get_aspects_for_urn(self, urn: str) -> Iterable[MetadataChangeProposalWrapper]:
-        aspects: Dict[str, _Aspect] = self.graph.get_entity_semityped(urn)  # type: ignore
-        for aspect in aspects.values():
-            yield MetadataChangeProposalWrapper(
+    def _get_aspects_for_urns(
+        self, urns: List[str]
+    ) -> List[MetadataChangeProposalWrapper]:
+        entities: Dict[str, Dict[str, _Aspect]] = self.graph.get_entities_semityped(urns)  # type: ignore
+        return [
+            MetadataChangeProposalWrapper(
                 entityUrn=urn,
                 aspect=aspect,
             )
+            for urn, aspects in entities.items()
+            for aspect in aspects.values()
+        ]
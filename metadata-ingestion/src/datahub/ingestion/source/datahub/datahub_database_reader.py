@@ -1,10 +1,14 @@
 import json
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Generic, Iterable, List, Optional, Tuple, TypeVar
+from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
 
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine, text
 from sqlalchemy.engine import Row
+from sqlalchemy.sql.elements import TextClause
 from typing_extensions import Protocol
 
 from datahub.emitter.aspect import ASPECT_MAP
@@ -21,6 +25,8 @@ logger = logging.getLogger(__name__)
 # Should work for at least mysql, mariadb, postgres
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 
+_PARTITION_QUEUE_POLL_INTERVAL_SEC = 1
+
 
 class VersionOrderable(Protocol):
     createdon: Any  # Should restrict to only orderable types
@@ -93,22 +99,49 @@ class DataHubDatabaseReader:
         )
 
     @property
-    def query(self) -> str:
-        # May repeat rows for the same date
-        # Offset is generally 0, unless we repeat the same createdon twice
+    def _table_name(self) -> str:
+        return self.engine.dialect.identifier_preparer.quote(
+            self.config.database_table_name
+        )
+
+    @property
+    def _version_filter(self) -> str:
+        return "" if self.config.include_all_versions else "AND version = 0"
 
+    def _get_query(self, after_row: bool, bounded: bool) -> TextClause:
         # Ensures stable order, chronological per (urn, aspect)
         # Relies on createdon order to reflect version order
         # Ordering of entries with the same createdon is handled by VersionOrderer
-        return f"""
+
+        # Pages are read with keyset pagination: each page starts right after the last row
+        # of the previous one, so reads don't slow down when many rows share a createdon.
+        # since_createdon is moved up to the last row's createdon on every page, so the
+        # leading createdon >= condition lets the database seek with its createdon index
+        # rather than walk all the earlier rows again.
+        keyset_filter = """
+            AND (
+                createdon > :last_createdon
+                OR (createdon = :last_createdon AND (
+                    urn > :last_urn
+                    OR (urn = :last_urn AND (
+                        aspect > :last_aspect
+                        OR (aspect = :last_aspect AND version > :last_version)
+                    ))
+                ))
+            )
+        """
+        return text(
+            f"""
             SELECT urn, aspect, metadata, systemmetadata, createdon, version
-            FROM {self.engine.dialect.identifier_preparer.quote(self.config.database_table_name)}
-            WHERE createdon >= %(since_createdon)s
-            {"" if self.config.include_all_versions else "AND version = 0"}
+            FROM {self._table_name}
+            WHERE createdon >= :since_createdon
+            {"AND createdon < :until_createdon" if bounded else ""}
+            {keyset_filter if after_row else ""}
+            {self._version_filter}
             ORDER BY createdon, urn, aspect, version
-            LIMIT %(limit)s
-            OFFSET %(offset)s
+            LIMIT :limit
         """
+        ).columns(createdon=DateTime)
 
     def get_aspects(
         self, from_createdon: datetime, stop_time: datetime
@@ -121,28 +154,137 @@ class DataHubDatabaseReader:
                 yield mcp, row.createdon
 
     def _get_rows(self, from_createdon: datetime, stop_time: datetime) -> Iterable[Row]:
+        if self.config.database_query_partitions > 1:
+            yield from self._get_partitioned_rows(from_createdon, stop_time)
+        else:
+            yield from self._scan_rows(from_createdon, None, stop_time)
+
+    def _scan_rows(
+        self, start: datetime, end: Optional[datetime], stop_time: datetime
+    ) -> Iterable[Row]:
+        """Reads the rows with start <= createdon < end, in order, a page at a time."""
         with self.engine.connect() as conn:
-            ts = from_createdon
-            offset = 0
-            while ts.timestamp() <= stop_time.timestamp():
-                logger.debug(f"Polling database aspects from {ts}")
-                rows = conn.execute(
-                    self.query,
-                    since_createdon=ts.strftime(DATETIME_FORMAT),
-                    limit=self.config.database_query_batch_size,
-                    offset=offset,
+            # Stream results with a server-side cursor, rather than loading the
+            # whole page into memory, on the databases that support it.
+            conn = conn.execution_options(stream_results=True)
+            params: Dict[str, Any] = {
+                "since_createdon": start.strftime(DATETIME_FORMAT),
+                "limit": self.config.database_query_batch_size,
+            }
+            if end is not None:
+                params["until_createdon"] = end.strftime(DATETIME_FORMAT)
+
+            last_row: Optional[Row] = None
+            while True:
+                logger.debug(
+                    f"Polling database aspects from {last_row.createdon if last_row else start}"
+                )
+                if last_row is not None:
+                    last_createdon = last_row.createdon.strftime(DATETIME_FORMAT)
+                    params.update(
+                        since_createdon=last_createdon,
+                        last_createdon=last_createdon,
+                        last_urn=last_row.urn,
+                        last_aspect=last_row.aspect,
+                        last_version=last_row.version,
+                    )
+                query = self._get_query(
+                    after_row=last_row is not None, bounded=end is not None
                 )
-                if not rows.rowcount:
-                    return
 
-                for i, row in enumerate(rows):
+                num_rows = 0
+                for row in conn.execute(query, params):
                     yield row
+                    num_rows += 1
+                    last_row = row
+
+                if (
+                    last_row is None
+                    or num_rows < self.config.database_query_batch_size
+                    or last_row.createdon.timestamp() > stop_time.timestamp()
+                ):
+                    return
+
+    def _get_partition_bounds(self, from_createdon: datetime) -> List[datetime]:
+        """Splits the createdon range to read into partitions of equal duration.
+
+        Returns the start of each partition after the first one.
+        """
+        query = text(
+            f"""
+            SELECT MIN(createdon) AS min_createdon, MAX(createdon) AS max_createdon
+            FROM {self._table_name}
+            WHERE createdon >= :since_createdon
+            {self._version_filter}
+        """
+        ).columns(min_createdon=DateTime, max_createdon=DateTime)
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                query, {"since_createdon": from_createdon.strftime(DATETIME_FORMAT)}
+            ).one()
+
+        if row.min_createdon is None:
+            return []
+
+        num_partitions = self.config.database_query_partitions
+        step = (row.max_createdon - row.min_createdon) / num_partitions
+        bounds = [row.min_createdon + step * i for i in range(1, num_partitions)]
+        return sorted(set(bound for bound in bounds if bound > row.min_createdon))
+
+    def _get_partitioned_rows(
+        self, from_createdon: datetime, stop_time: datetime
+    ) -> Iterable[Row]:
+        """Reads each partition with its own connection, in parallel.
+
+        The partitions cover consecutive createdon ranges, so reading them one
+        after the other returns the rows in the same order as a single scan.
+        Each partition buffers at most one page of rows ahead of the reader.
+        """
+        bounds = self._get_partition_bounds(from_createdon)
+        starts = [from_createdon, *bounds]
+        ends: List[Optional[datetime]] = [*bounds, None]
+        logger.info(f"Reading database aspects in {len(starts)} partitions")
+
+        done = object()
+        stop_event = threading.Event()
+        queues: List["queue.Queue[Any]"] = [
+            queue.Queue(maxsize=self.config.database_query_batch_size) for _ in starts
+        ]
+
+        def _put(q: "queue.Queue[Any]", item: Any) -> bool:
+            while not stop_event.is_set():
+                try:
+                    q.put(item, timeout=_PARTITION_QUEUE_POLL_INTERVAL_SEC)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _read_partition(
+            q: "queue.Queue[Any]", start: datetime, end: Optional[datetime]
+        ) -> None:
+            try:
+                for row in self._scan_rows(start, end, stop_time):
+                    if not _put(q, row):
+                        return
+                _put(q, done)
+            except Exception as e:
+                _put(q, e)
 
-                if ts == row.createdon:
-                    offset += i + 1
-                else:
-                    ts = row.createdon
-                    offset = 0
+        with ThreadPoolExecutor(max_workers=len(starts)) as executor:
+            try:
+                for q, start, end in zip(queues, starts, ends):
+                    executor.submit(_read_partition, q, start, end)
+                for q in queues:
+                    while True:
+                        item = q.get()
+                        if item is done:
+                            break
+                        elif isinstance(item, Exception):
+                            raise item
+                        yield item
+            finally:
+                stop_event.set()
 
     def _parse_row(self, row: Row) -> Optional[MetadataChangeProposalWrapper]:
         try:
@@ -1,15 +1,19 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Tuple, Union
 
 from confluent_kafka import (
     OFFSET_BEGINNING,
     Consumer,
     DeserializingConsumer,
+    KafkaException,
+    Message,
     TopicPartition,
 )
 from confluent_kafka.schema_registry import SchemaRegistryClient
 from confluent_kafka.schema_registry.avro import AvroDeserializer
+from confluent_kafka.serialization import MessageField, SerializationContext
 
 from datahub.configuration.kafka import KafkaConsumerConnectionConfig
 from datahub.ingestion.api.closeable import Closeable
@@ -23,6 +27,8 @@ logger = logging.getLogger(__name__)
 
 KAFKA_GROUP_PREFIX = "datahub_source"
 
+POLL_TIMEOUT_SEC = 10
+
 
 class DataHubKafkaReader(Closeable):
     def __init__(
@@ -38,26 +44,43 @@ class DataHubKafkaReader(Closeable):
         self.group_id = f"{KAFKA_GROUP_PREFIX}-{ctx.pipeline_name}"
 
     def __enter__(self) -> "DataHubKafkaReader":
-        self.consumer = DeserializingConsumer(
-            {
-                "group.id": self.group_id,
-                "bootstrap.servers": self.connection_config.bootstrap,
-                **self.connection_config.consumer_config,
-                "auto.offset.reset": "earliest",
-                "enable.auto.commit": False,
-                "value.deserializer": AvroDeserializer(
-                    schema_registry_client=SchemaRegistryClient(
-                        {"url": self.connection_config.schema_registry_url}
-                    ),
-                    return_record_name=True,
-                ),
-            }
+        self.value_deserializer = AvroDeserializer(
+            schema_registry_client=SchemaRegistryClient(
+                {"url": self.connection_config.schema_registry_url}
+            ),
+            return_record_name=True,
         )
+        consumer_config = {
+            "group.id": self.group_id,
+            "bootstrap.servers": self.connection_config.bootstrap,
+            **self.connection_config.consumer_config,
+            "auto.offset.reset": "earliest",
+            "enable.auto.commit": False,
+        }
+        if self.config.kafka_consume_batch_size:
+            # DeserializingConsumer does not support consume(), so we deserialize ourselves.
+            self.consumer = Consumer(consumer_config)
+        else:
+            self.consumer = DeserializingConsumer(
+                {**consumer_config, "value.deserializer": self.value_deserializer}
+            )
         return self
 
     def get_mcls(
         self, from_offsets: Dict[int, int], stop_time: datetime
     ) -> Iterable[Tuple[MetadataChangeLogClass, PartitionOffset]]:
+        for batch in self.get_mcl_batches(from_offsets, stop_time):
+            yield from batch
+
+    def get_mcl_batches(
+        self, from_offsets: Dict[int, int], stop_time: datetime
+    ) -> Iterable[List[Tuple[MetadataChangeLogClass, PartitionOffset]]]:
+        """Reads MCLs in batches of up to kafka_consume_batch_size messages.
+
+        Without a batch size, each batch contains a single MCL.
+        Messages are returned in the order they were consumed, so the order
+        within each partition is preserved.
+        """
         # Based on https://github.com/confluentinc/confluent-kafka-python/issues/145#issuecomment-284843254
         def on_assign(consumer: Consumer, partitions: List[TopicPartition]) -> None:
             for p in partitions:
@@ -67,7 +90,12 @@ class DataHubKafkaReader(Closeable):
 
         self.consumer.subscribe([self.config.kafka_topic_name], on_assign=on_assign)
         try:
-            yield from self._poll_partition(stop_time)
+            if self.config.kafka_consume_batch_size:
+                yield from self._consume_batches(
+                    self.config.kafka_consume_batch_size, stop_time
+                )
+            else:
+                yield from ([mcl] for mcl in self._poll_partition(stop_time))
         finally:
             self.consumer.unsubscribe()
 
@@ -75,28 +103,84 @@ class DataHubKafkaReader(Closeable):
         self, stop_time: datetime
     ) -> Iterable[Tuple[MetadataChangeLogClass, PartitionOffset]]:
         while True:
-            msg = self.consumer.poll(10)
+            msg = self.consumer.poll(POLL_TIMEOUT_SEC)
             if msg is None:
                 break
 
             try:
                 mcl = MetadataChangeLogClass.from_obj(msg.value(), True)
             except Exception as e:
-                logger.warning(f"Error deserializing MCL: {e}")
-                self.report.num_kafka_parse_errors += 1
-                self.report.kafka_parse_errors.setdefault(str(e), 0)
-                self.report.kafka_parse_errors[str(e)] += 1
+                self._report_parse_error(e)
                 continue
 
-            if mcl.created and mcl.created.time > stop_time.timestamp() * 1000:
-                logger.info(
-                    f"Stopped reading from kafka, reached MCL "
-                    f"with audit stamp {datetime.fromtimestamp(mcl.created.time / 1000)}"
-                )
+            if self._is_after_stop_time(mcl, stop_time):
                 break
 
             # TODO: Consider storing state in kafka instead, via consumer.commit()
             yield mcl, PartitionOffset(partition=msg.partition(), offset=msg.offset())
 
+    def _consume_batches(
+        self, batch_size: int, stop_time: datetime
+    ) -> Iterable[List[Tuple[MetadataChangeLogClass, PartitionOffset]]]:
+        with ThreadPoolExecutor(
+            max_workers=self.config.kafka_deserialization_workers
+        ) as executor:
+            while True:
+                msgs = self.consumer.consume(
+                    num_messages=batch_size, timeout=POLL_TIMEOUT_SEC
+                )
+                if not msgs:
+                    break
+
+                batch: List[Tuple[MetadataChangeLogClass, PartitionOffset]] = []
+                # map() returns the results in the same order as the messages.
+                for msg, mcl in zip(msgs, executor.map(self._deserialize, msgs)):
+                    if isinstance(mcl, Exception):
+                        self._report_parse_error(mcl)
+                        continue
+
+                    if self._is_after_stop_time(mcl, stop_time):
+                        yield batch
+                        return
+
+                    batch.append(
+                        (
+                            mcl,
+                            PartitionOffset(
+                                partition=msg.partition(), offset=msg.offset()
+                            ),
+                        )
+                    )
+                yield batch
+
+    def _deserialize(self, msg: Message) -> Union[MetadataChangeLogClass, Exception]:
+        if msg.error():
+            raise KafkaException(msg.error())
+
+        try:
+            value = self.value_deserializer(
+                msg.value(),
+                SerializationContext(msg.topic(), MessageField.VALUE, msg.headers()),
+            )
+            return MetadataChangeLogClass.from_obj(value, True)
+        except Exception as e:
+            return e
+
+    def _report_parse_error(self, e: Exception) -> None:
+        logger.warning(f"Error deserializing MCL: {e}")
+        self.report.num_kafka_parse_errors += 1
+        self.report.kafka_parse_errors.setdefault(str(e), 0)
+        self.report.kafka_parse_errors[str(e)] += 1
+
+    @staticmethod
+    def _is_after_stop_time(mcl: MetadataChangeLogClass, stop_time: datetime) -> bool:
+        if mcl.created and mcl.created.time > stop_time.timestamp() * 1000:
+            logger.info(
+                f"Stopped reading from kafka, reached MCL "
+                f"with audit stamp {datetime.fromtimestamp(mcl.created.time / 1000)}"
+            )
+            return True
+        return False
+
     def close(self) -> None:
         self.consumer.close()
@@ -21,11 +21,14 @@ from datahub.ingestion.source.datahub.datahub_database_reader import (
 )
 from datahub.ingestion.source.datahub.datahub_kafka_reader import DataHubKafkaReader
 from datahub.ingestion.source.datahub.report import DataHubSourceReport
-from datahub.ingestion.source.datahub.state import StatefulDataHubIngestionHandler
+from datahub.ingestion.source.datahub.state import (
+    PartitionOffset,
+    StatefulDataHubIngestionHandler,
+)
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionSourceBase,
 )
-from datahub.metadata.schema_classes import ChangeTypeClass
+from datahub.metadata.schema_classes import ChangeTypeClass, MetadataChangeLogClass
 
 logger = logging.getLogger(__name__)
 
@@ -114,34 +117,54 @@ class DataHubSource(StatefulIngestionSourceBase):
         with DataHubKafkaReader(
             self.config, self.config.kafka_connection, self.report, self.ctx
         ) as reader:
-            mcls = reader.get_mcls(
+            batches = reader.get_mcl_batches(
                 from_offsets=from_offsets, stop_time=self.report.stop_time
             )
-            for i, (mcl, offset) in enumerate(mcls):
-                mcp = MetadataChangeProposalWrapper.try_from_mcl(mcl)
-                if mcp.changeType == ChangeTypeClass.DELETE:
-                    self.report.num_timeseries_deletions_dropped += 1
-                    logger.debug(
-                        f"Dropping timeseries deletion of {mcp.aspectName} on {mcp.entityUrn}"
-                    )
-                    continue
-
-                if isinstance(mcp, MetadataChangeProposalWrapper):
-                    yield mcp.as_workunit()
-                else:
-                    yield MetadataWorkUnit(
-                        id=f"{mcp.entityUrn}-{mcp.aspectName}-{i}", mcp_raw=mcp
-                    )
-                self.report.num_kafka_aspects_ingested += 1
-
+            i = 0
+            for batch in batches:
+                batch_start = i
+                last_offsets: Dict[int, PartitionOffset] = {}
+                for mcl, offset in batch:
+                    last_offsets[offset.partition] = offset
+                    yield from self._get_kafka_workunit(mcl, i)
+                    i += 1
+
+                # The checkpoint only moves forward once the whole batch has been processed.
                 if (
                     self.config.commit_with_parse_errors
                     or not self.report.num_kafka_parse_errors
                 ):
-                    self.stateful_ingestion_handler.update_checkpoint(
-                        last_offset=offset
-                    )
-                self._commit_progress(i)
+                    for offset in last_offsets.values():
+                        self.stateful_ingestion_handler.update_checkpoint(
+                            last_offset=offset
+                        )
+                # Commit whenever the batch contains a message whose index is a
+                # positive multiple of the interval, like _commit_progress(i) does.
+                interval = self.config.commit_state_interval
+                if (
+                    interval
+                    and (i - 1) // interval > max(batch_start - 1, 0) // interval
+                ):
+                    self._commit_progress()
+
+    def _get_kafka_workunit(
+        self, mcl: MetadataChangeLogClass, i: int
+    ) -> Iterable[MetadataWorkUnit]:
+        mcp = MetadataChangeProposalWrapper.try_from_mcl(mcl)
+        if mcp.changeType == ChangeTypeClass.DELETE:
+            self.report.num_timeseries_deletions_dropped += 1
+            logger.debug(
+                f"Dropping timeseries deletion of {mcp.aspectName} on {mcp.entityUrn}"
+            )
+            return
+
+        if isinstance(mcp, MetadataChangeProposalWrapper):
+            yield mcp.as_workunit()
+        else:
+            yield MetadataWorkUnit(
+                id=f"{mcp.entityUrn}-{mcp.aspectName}-{i}", mcp_raw=mcp
+            )
+        self.report.num_kafka_aspects_ingested += 1
 
     def _get_api_workunits(self) -> Iterable[MetadataWorkUnit]:
         if self.ctx.graph is None:
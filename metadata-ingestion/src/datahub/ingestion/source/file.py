@@ -1,3 +1,5 @@
+import collections
+import concurrent.futures
 import datetime
 import json
 import logging
@@ -7,7 +9,7 @@ from dataclasses import dataclass, field
 from enum import auto
 from functools import partial
 from io import BufferedReader
-from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib import parse
 
 import ijson
@@ -40,6 +42,14 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.schema_classes import UsageAggregationClass
+from datahub.utilities.json_lines import (
+    detect_compression,
+    is_jsonl_file,
+    is_jsonl_footer,
+    iterate_jsonl_file,
+    open_jsonl_file,
+    read_jsonl_footer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +72,10 @@ class FileSourceConfig(ConfigModel):
         ".json",
         description="When providing a folder to use to read files, set this field to control file extensions that you want the source to process. * is a special value that means process every file regardless of extension",
     )
-    read_mode: FileReadMode = FileReadMode.AUTO
+    read_mode: FileReadMode = Field(
+        FileReadMode.AUTO,
+        description="How to read JSON files. JSON Lines files (`.jsonl` or `.ndjson`, optionally gzip or zstd compressed) are always streamed.",
+    )
     aspect: Optional[str] = Field(
         default=None,
         description="Set to an aspect to only read this aspect for ingestion.",
@@ -71,10 +84,18 @@ class FileSourceConfig(ConfigModel):
         default=True,
         description="When enabled, counts total number of records in the file before starting. Used for accurate estimation of completion time. Turn it off if startup time is too high.",
     )
+    max_workers: int = Field(
+        default=1,
+        description="Number of processes used to parse and deserialize files in parallel. "
+        "Uncompressed JSON Lines files are split into chunks, and other files are handled one per process. "
+        "JSON files that are read in streaming mode are still parsed by the main process. "
+        "Records are produced in the same order regardless of this setting.",
+    )
 
     _minsize_for_streaming_mode_in_bytes: int = (
         100 * 1000 * 1000  # Must be at least 100MB before we use streaming mode
     )
+    _parallel_chunk_size_in_bytes: int = 8 * 1000 * 1000
 
     _filename_populates_path_if_present = pydantic_renamed_field(
         "filename", "path", print_warning=False
@@ -211,25 +232,22 @@ class GenericFileSource(TestableSource):
     def get_workunits_internal(
         self,
     ) -> Iterable[MetadataWorkUnit]:
-        for f in self.get_filenames():
-            for i, obj in self.iterate_generic_file(f):
-                id = f"file://{f}:{i}"
-                if isinstance(
-                    obj, (MetadataChangeProposalWrapper, MetadataChangeProposal)
+        for f, i, obj in self._iterate_generic_files(self.get_filenames()):
+            id = f"file://{f}:{i}"
+            if isinstance(obj, (MetadataChangeProposalWrapper, MetadataChangeProposal)):
+                if (
+                    self.config.aspect is not None
+                    and obj.aspectName is not None
+                    and obj.aspectName != self.config.aspect
                 ):
-                    if (
-                        self.config.aspect is not None
-                        and obj.aspectName is not None
-                        and obj.aspectName != self.config.aspect
-                    ):
-                        continue
+                    continue
 
-                    if isinstance(obj, MetadataChangeProposalWrapper):
-                        yield MetadataWorkUnit(id, mcp=obj)
-                    else:
-                        yield MetadataWorkUnit(id, mcp_raw=obj)
+                if isinstance(obj, MetadataChangeProposalWrapper):
+                    yield MetadataWorkUnit(id, mcp=obj)
                 else:
-                    yield MetadataWorkUnit(id, mce=obj)
+                    yield MetadataWorkUnit(id, mcp_raw=obj)
+            else:
+                yield MetadataWorkUnit(id, mce=obj)
 
     def get_report(self):
         return self.report
@@ -242,18 +260,14 @@ class GenericFileSource(TestableSource):
     def _iterate_file(self, path: str) -> Iterable[Tuple[int, Any]]:
         self.report.current_file_name = path
         path_parsed = parse.urlparse(path)
-        if path_parsed.scheme not in ("http", "https"):  # A local file
+        is_local = path_parsed.scheme not in ("http", "https")
+        if is_local and is_jsonl_file(path):
             self.report.current_file_size = os.path.getsize(path)
-            if self.config.read_mode == FileReadMode.AUTO:
-                file_read_mode = (
-                    FileReadMode.BATCH
-                    if self.report.current_file_size
-                    < self.config._minsize_for_streaming_mode_in_bytes
-                    else FileReadMode.STREAM
-                )
-                logger.info(f"Reading file {path} in {file_read_mode} mode")
-            else:
-                file_read_mode = self.config.read_mode
+            yield from self._iterate_jsonl_file(path)
+        elif is_local:
+            self.report.current_file_size = os.path.getsize(path)
+            file_read_mode = self._get_read_mode(path, self.report.current_file_size)
+            logger.info(f"Reading file {path} in {file_read_mode} mode")
 
             if file_read_mode == FileReadMode.BATCH:
                 with open(path, "r") as f:
@@ -310,11 +324,166 @@ class GenericFileSource(TestableSource):
                 yield i, obj
                 self.report.current_file_elements_read += 1
 
+        self._mark_file_completed(path, self.report.current_file_size)
+
+    def _get_read_mode(self, path: str, file_size: int) -> FileReadMode:
+        if self.config.read_mode == FileReadMode.AUTO:
+            return (
+                FileReadMode.BATCH
+                if file_size < self.config._minsize_for_streaming_mode_in_bytes
+                else FileReadMode.STREAM
+            )
+        return self.config.read_mode
+
+    def _mark_file_completed(self, path: str, file_size: int) -> None:
         self.report.files_completed.append(path)
         self.report.num_files_completed += 1
-        self.report.total_bytes_read_completed_files += self.report.current_file_size
+        self.report.total_bytes_read_completed_files += file_size
         self.report.reset_current_file_stats()
 
+    def _iterate_jsonl_file(self, path: str) -> Iterable[Tuple[int, Any]]:
+        compression = detect_compression(path)
+        logger.info(f"Reading JSON Lines file {path}")
+
+        num_records = read_jsonl_footer(path, compression)
+        if num_records is None and self.config.count_all_before_starting:
+            # Files that weren't written by the file sink don't have a footer.
+            count_start_time = datetime.datetime.now()
+            with open_jsonl_file(path, compression) as f:
+                num_records = sum(
+                    1 for line in f if line.strip() and not is_jsonl_footer(line)
+                )
+            self.report.add_count_time(datetime.datetime.now() - count_start_time)
+        self.report.current_file_num_elements = num_records
+
+        self.report.current_file_elements_read = 0
+        with open_jsonl_file(path, compression) as f:
+            parse_start_time = datetime.datetime.now()
+            for line in f:
+                if not line.strip() or is_jsonl_footer(line):
+                    continue
+                obj = json.loads(line)
+                self.report.add_parse_time(datetime.datetime.now() - parse_start_time)
+                yield self.report.current_file_elements_read, obj
+                self.report.current_file_elements_read += 1
+                parse_start_time = datetime.datetime.now()
+
+    def _iterate_generic_files(
+        self, paths: Iterable[str]
+    ) -> Iterator[
+        Tuple[
+            str,
+            int,
+            Union[
+                MetadataChangeEvent,
+                MetadataChangeProposalWrapper,
+                MetadataChangeProposal,
+            ],
+        ]
+    ]:
+        if self.config.max_workers <= 1:
+            for path in paths:
+                for i, item in self.iterate_generic_file(path):
+                    yield path, i, item
+            return
+
+        # Work is submitted in order, with a bounded number of chunks in flight, and
+        # results are consumed in that same order. This keeps the output identical to
+        # sequential reading while bounding memory usage.
+        max_pending = 2 * self.config.max_workers
+        chunks = self._plan_file_chunks(paths)
+        pending: Deque[
+            Tuple[_FileChunk, Optional["concurrent.futures.Future[_ParsedChunk]"]]
+        ] = collections.deque()
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.config.max_workers
+        ) as executor:
+            try:
+                file_index = 0
+                while True:
+                    while len(pending) < max_pending:
+                        next_chunk = next(chunks, None)
+                        if next_chunk is None:
+                            break
+                        pending.append(
+                            (
+                                next_chunk,
+                                executor.submit(_parse_file_chunk, next_chunk)
+                                if next_chunk.in_worker
+                                else None,
+                            )
+                        )
+                    if not pending:
+                        break
+
+                    chunk, future = pending.popleft()
+                    if future is None:
+                        for i, item in self.iterate_generic_file(chunk.path):
+                            yield chunk.path, i, item
+                        continue
+
+                    result = future.result()
+                    if chunk.start == 0:
+                        file_index = 0
+                        self.report.current_file_name = chunk.path
+                        self.report.current_file_size = chunk.file_size
+                        self.report.current_file_num_elements = chunk.num_records
+                        self.report.current_file_elements_read = 0
+                    self.report.add_parse_time(result.parse_time)
+                    self.report.add_deserialize_time(result.deserialize_time)
+                    for i, reason in result.failures:
+                        self.report.report_failure(f"path-{file_index + i}", reason)
+                    for i, item in result.items:
+                        yield chunk.path, file_index + i, item
+                        self.report.current_file_elements_read = file_index + i + 1
+                    file_index += result.num_elements
+
+                    if chunk.end is None or chunk.end >= chunk.file_size:
+                        self._mark_file_completed(chunk.path, chunk.file_size)
+                    else:
+                        self.report.current_file_bytes_read = chunk.end
+            finally:
+                for _, future in pending:
+                    if future is not None:
+                        future.cancel()
+
+    def _plan_file_chunks(self, paths: Iterable[str]) -> Iterator["_FileChunk"]:
+        for path in paths:
+            if parse.urlparse(path).scheme in ("http", "https"):
+                yield _FileChunk(path=path, in_worker=False)
+                continue
+
+            file_size = os.path.getsize(path)
+            if is_jsonl_file(path):
+                compression = detect_compression(path)
+                num_records = read_jsonl_footer(path, compression)
+                if compression is not None:
+                    # Compressed files can't be split, so they're read by a single worker.
+                    yield _FileChunk(
+                        path=path,
+                        file_size=file_size,
+                        num_records=num_records,
+                        is_jsonl=True,
+                        compression=compression,
+                    )
+                    continue
+
+                chunk_size = self.config._parallel_chunk_size_in_bytes
+                for start in range(0, max(file_size, 1), chunk_size):
+                    yield _FileChunk(
+                        path=path,
+                        file_size=file_size,
+                        num_records=num_records,
+                        is_jsonl=True,
+                        start=start,
+                        end=min(start + chunk_size, file_size),
+                    )
+            elif self._get_read_mode(path, file_size) == FileReadMode.BATCH:
+                yield _FileChunk(path=path, file_size=file_size)
+            else:
+                # Files that are too large to load at once are streamed by the main process.
+                yield _FileChunk(path=path, in_worker=False)
+
     def iterate_mce_file(self, path: str) -> Iterator[MetadataChangeEvent]:
         for i, obj in self._iterate_file(path):
             mce: MetadataChangeEvent = MetadataChangeEvent.from_obj(obj)
@@ -410,6 +579,82 @@ def _from_obj_for_file(
         return item
 
 
+@dataclass(frozen=True)
+class _FileChunk:
+    path: str
+    file_size: int = 0
+    num_records: Optional[int] = None
+    in_worker: bool = True
+    is_jsonl: bool = False
+    compression: Optional[str] = None
+    # Byte range of the chunk. A JSON Lines chunk contains all lines that start in this range.
+    start: int = 0
+    end: Optional[int] = None
+
+
+@dataclass
+class _ParsedChunk:
+    # Indexes are relative to the start of the chunk, and count every record in
+    # the chunk, including ones that failed to deserialize or were dropped.
+    items: List[
+        Tuple[
+            int,
+            Union[
+                MetadataChangeEvent,
+                MetadataChangeProposalWrapper,
+                MetadataChangeProposal,
+            ],
+        ]
+    ]
+    failures: List[Tuple[int, str]]
+    num_elements: int
+    parse_time: datetime.timedelta
+    deserialize_time: datetime.timedelta
+
+
+def _parse_file_chunk(chunk: _FileChunk) -> _ParsedChunk:
+    # Runs in a worker process.
+    parse_start_time = datetime.datetime.now()
+    obj_list: Any
+    if chunk.is_jsonl:
+        obj_list = []
+        with open_jsonl_file(chunk.path, chunk.compression) as f:
+            if chunk.start > 0:
+                # Skip the line that started in the previous chunk.
+                f.seek(chunk.start - 1)
+                f.readline()
+            while chunk.end is None or f.tell() < chunk.end:
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip() and not is_jsonl_footer(line):
+                    obj_list.append(json.loads(line))
+    else:
+        with open(chunk.path, "r") as f:
+            obj_list = json.load(f)
+        if not isinstance(obj_list, list):
+            obj_list = [obj_list]
+    parse_time = datetime.datetime.now() - parse_start_time
+
+    deserialize_start_time = datetime.datetime.now()
+    items = []
+    failures = []
+    for i, obj in enumerate(obj_list):
+        try:
+            item = _from_obj_for_file(obj)
+            if item is not None:
+                items.append((i, item))
+        except Exception as e:
+            failures.append((i, str(e)))
+    return _ParsedChunk(
+        items=items,
+        failures=failures,
+        num_elements=len(obj_list),
+        parse_time=parse_time,
+        deserialize_time=datetime.datetime.now() - deserialize_start_time,
+    )
+
+
 def read_metadata_file(
     file: pathlib.Path,
 ) -> Iterable[
@@ -420,8 +665,13 @@ def read_metadata_file(
     ]
 ]:
     # This simplified version of the FileSource can be used for testing purposes.
-    with file.open("r") as f:
-        for obj in json.load(f):
-            item = _from_obj_for_file(obj)
-            if item:
-                yield item
+    objs: Iterable[Any]
+    if is_jsonl_file(file):
+        objs = iterate_jsonl_file(file)
+    else:
+        with file.open("r") as f:
+            objs = json.load(f)
+    for obj in objs:
+        item = _from_obj_for_file(obj)
+        if item:
+            yield item
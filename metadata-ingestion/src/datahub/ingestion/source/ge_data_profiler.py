@@ -1,7 +1,5 @@
 from datahub.utilities._markupsafe_compat import MARKUPSAFE_PATCHED
 
-import collections
-import concurrent.futures
 import contextlib
 import dataclasses
 import functools
@@ -20,6 +18,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -61,6 +60,10 @@ from datahub.metadata.schema_classes import (
     ValueFrequencyClass,
 )
 from datahub.telemetry import stats, telemetry
+from datahub.utilities.bounded_scheduler import (
+    TaskTimeoutError,
+    run_with_bounded_concurrency,
+)
 from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.sqlalchemy_query_combiner import (
     IS_SQLALCHEMY_1_4,
@@ -119,6 +122,10 @@ class GEProfilerRequest:
     pretty_name: str
     batch_kwargs: dict
 
+    def estimated_row_count(self) -> Optional[int]:
+        """The number of rows that profiling this request is expected to scan, if known."""
+        return None
+
 
 def get_column_unique_count_patch(self: SqlAlchemyDataset, column: str) -> int:
     if self.engine.dialect.name.lower() == REDSHIFT:
@@ -249,11 +256,18 @@ def _run_with_query_combiner(
     def inner(
         self: "_SingleDatasetProfiler", *args: P.args, **kwargs: P.kwargs
     ) -> None:
+        if self.is_cancelled():
+            # Don't issue any more queries for a profile that is no longer wanted.
+            raise _ProfilingCancelledError(self.dataset_name)
         return self.query_combiner.run(lambda: method(self, *args, **kwargs))
 
     return inner
 
 
+class _ProfilingCancelledError(Exception):
+    pass
+
+
 @dataclasses.dataclass
 class _SingleColumnSpec:
     column: str
@@ -277,6 +291,8 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
     query_combiner: SQLAlchemyQueryCombiner
 
+    is_cancelled: Callable[[], bool] = lambda: False
+
     def _get_columns_to_profile(self) -> List[str]:
         if not self.config.any_field_level_metrics_enabled():
             return []
@@ -944,7 +960,7 @@ class DatahubGEProfiler:
         platform: Optional[str] = None,
         profiler_args: Optional[Dict] = None,
     ) -> Iterable[Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]]:
-        max_workers = min(max_workers, len(requests))
+        max_workers = max(1, min(max_workers, len(requests)))
         logger.info(
             f"Will profile {len(requests)} table(s) with {max_workers} worker(s) - this may take a while"
         )
@@ -955,32 +971,51 @@ class DatahubGEProfiler:
         ), unittest.mock.patch(
             "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset._get_column_quantiles_bigquery",
             _get_column_quantiles_bigquery_patch,
-        ), concurrent.futures.ThreadPoolExecutor(
-            max_workers=max_workers
-        ) as async_executor, SQLAlchemyQueryCombiner(
+        ), SQLAlchemyQueryCombiner(
             enabled=self.config.query_combiner_enabled,
             catch_exceptions=self.config.catch_exceptions,
             is_single_row_query_method=_is_single_row_query_method,
             serial_execution_fallback_enabled=True,
+            max_queries_per_batch=self.config.query_combiner_max_queries_per_batch,
+            max_combined_query_length=self.config.query_combiner_max_query_length,
         ).activate() as query_combiner:
-            # Submit the profiling requests to the thread pool executor.
-            async_profiles = collections.deque(
-                async_executor.submit(
+            # Requests are only started once there is capacity for them, and
+            # results are yielded as soon as the ordering allows. Requests that
+            # time out stop before their next query, so that none of them is still
+            # running once the query combiner and the patches above are gone.
+            timed_out: Set[int] = set()
+            results = run_with_bounded_concurrency(
+                functools.partial(
                     self._generate_profile_from_request,
                     query_combiner,
-                    request,
                     platform=platform,
                     profiler_args=profiler_args,
-                )
-                for request in requests
+                    is_cancelled_fn=lambda request: id(request) in timed_out,
+                ),
+                requests,
+                max_workers=max_workers,
+                cost_fn=lambda request: request.estimated_row_count() or 0,
+                max_in_flight_cost=self.config.max_in_flight_row_count,
+                ordered=self.config.emit_profiles_in_order,
+                ordering_window=self.config.profiles_ordering_window,
+                timeout=self.config.profile_table_timeout_sec,
+                on_timeout=lambda request: timed_out.add(id(request)),
             )
-
-            # Avoid using as_completed so that the results are yielded in the
-            # same order as the requests.
-            # for async_profile in concurrent.futures.as_completed(async_profiles):
-            while len(async_profiles) > 0:
-                async_profile = async_profiles.popleft()
-                yield async_profile.result()
+            for request, result in results:
+                if isinstance(result, TaskTimeoutError):
+                    logger.warning(
+                        f"Profiling {request.pretty_name} timed out; its profile will be skipped"
+                    )
+                    self.report.num_profiles_timed_out += 1
+                    self.report.report_warning(
+                        request.pretty_name,
+                        f"Profiling timed out after {self.config.profile_table_timeout_sec} seconds",
+                    )
+                    yield request, None
+                elif isinstance(result, Exception):
+                    raise result
+                else:
+                    yield result
 
         total_time_taken = timer.elapsed_seconds()
         logger.info(
@@ -1001,6 +1036,10 @@ class DatahubGEProfiler:
                 )
                 for percentile in percentiles
             }
+            self.report.profiling_time_taken_percentiles_sec = {
+                f"p{percentile}": round(percentile_values[percentile], 3)
+                for percentile in percentiles
+            }
 
         telemetry.telemetry_instance.ping(
             "sql_profiling_summary",
@@ -1022,12 +1061,18 @@ class DatahubGEProfiler:
         request: GEProfilerRequest,
         platform: Optional[str] = None,
         profiler_args: Optional[Dict] = None,
+        is_cancelled_fn: Optional[Callable[[GEProfilerRequest], bool]] = None,
     ) -> Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]:
         return request, self._generate_single_profile(
             query_combiner=query_combiner,
             pretty_name=request.pretty_name,
             platform=platform,
             profiler_args=profiler_args,
+            is_cancelled=(
+                functools.partial(is_cancelled_fn, request)
+                if is_cancelled_fn is not None
+                else None
+            ),
             **request.batch_kwargs,
         )
 
@@ -1051,6 +1096,7 @@ class DatahubGEProfiler:
         custom_sql: Optional[str] = None,
         platform: Optional[str] = None,
         profiler_args: Optional[Dict] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
         **kwargs: Any,
     ) -> Optional[DatasetProfileClass]:
         logger.debug(
@@ -1116,6 +1162,7 @@ class DatahubGEProfiler:
                     self.report,
                     custom_sql,
                     query_combiner,
+                    is_cancelled=is_cancelled or (lambda: False),
                 ).generate_dataset_profile()
 
                 time_taken = timer.elapsed_seconds()
@@ -1127,6 +1174,9 @@ class DatahubGEProfiler:
                     self.total_row_count += profile.rowCount
 
                 return profile
+            except _ProfilingCancelledError:
+                logger.debug(f"Stopped profiling {pretty_name} after it timed out")
+                return None
             except Exception as e:
                 if not self.config.catch_exceptions:
                     raise e
@@ -120,6 +120,21 @@ class GEProfilingConfig(ConfigModel):
         description="Profile tables only if their row count is less then specified count. If set to `null`, no limit on the row count of tables to profile. Supported only in `snowflake` and `BigQuery`",
     )
 
+    skip_unchanged_tables: bool = Field(
+        default=False,
+        description="Whether to skip profiling tables whose row count, size and last modified time are the same "
+        "as when they were last profiled. Requires stateful ingestion to be enabled. "
+        "Supported only in `snowflake`, `BigQuery` and `redshift`.",
+    )
+
+    column_profiling_min_interval_days: Optional[pydantic.PositiveFloat] = Field(
+        default=None,
+        description="If set, tables that have been profiled more recently than these many number of days only "
+        "get their table level stats (row count, size) refreshed from the table metadata, and column level "
+        "profiling is done once the interval has passed. Requires stateful ingestion to be enabled. "
+        "Supported only in `snowflake`, `BigQuery` and `redshift`.",
+    )
+
     profile_table_row_count_estimate_only: bool = Field(
         default=False,
         description="Use an approximate query for row count. This will be much faster but slightly "
@@ -135,12 +150,46 @@ class GEProfilingConfig(ConfigModel):
         description="Number of worker threads to use for profiling. Set to 1 to disable.",
     )
 
+    max_in_flight_row_count: Optional[pydantic.PositiveInt] = Field(
+        default=None,
+        description="If set, limits the total estimated row count of the tables that are profiled at the same time. "
+        "A table that has more rows than this is profiled on its own. Row counts are only known for some sources.",
+    )
+
+    profile_table_timeout_sec: Optional[pydantic.PositiveFloat] = Field(
+        default=None,
+        description="If set, the profile of a table is skipped when profiling it takes longer than this. "
+        "No further queries are started for the table, but a query that is already running is waited for, "
+        "so profiling may take longer than this to finish.",
+    )
+
+    emit_profiles_in_order: bool = Field(
+        default=True,
+        description="Whether to emit profiles in the same order as the tables were scanned. "
+        "If disabled, each profile is emitted as soon as it is ready, so slow tables don't hold back the others.",
+    )
+
+    profiles_ordering_window: Optional[pydantic.PositiveInt] = Field(
+        default=None,
+        description="When emitting profiles in order, the number of tables that can be profiled ahead of the "
+        "oldest table whose profile has not been emitted yet. Defaults to twice max_workers.",
+    )
+
     # The query combiner enables us to combine multiple queries into a single query,
     # reducing the number of round-trips to the database and speeding up profiling.
     query_combiner_enabled: bool = Field(
         default=True,
         description="*This feature is still experimental and can be disabled if it causes issues.* Reduces the total number of queries issued and speeds up profiling by dynamically combining SQL queries where possible.",
     )
+    query_combiner_max_queries_per_batch: pydantic.PositiveInt = Field(
+        default=40,
+        description="The maximum number of queries that are combined into a single query by the query combiner.",
+    )
+    query_combiner_max_query_length: Optional[pydantic.PositiveInt] = Field(
+        default=None,
+        description="If set, the query combiner stops adding queries to a combined query once its SQL would be "
+        "longer than this many characters. Useful for warehouses that reject or are slow to plan long queries.",
+    )
 
     # Hidden option - used for debugging purposes.
     catch_exceptions: bool = Field(default=True, description="")
@@ -105,6 +105,12 @@ class SnowflakeV2Config(
         description="Populates view->view and table->view column lineage using DataHub's sql parser.",
     )
 
+    view_definition_parsing_max_workers: Optional[int] = Field(
+        default=1,
+        description="Number of worker processes used to parse view definitions for view column lineage. "
+        "Set to null to use one per CPU. With 1, view definitions are parsed in the ingestion process.",
+    )
+
     _check_role_grants_removed = pydantic_removed_field("check_role_grants")
     _provision_role_removed = pydantic_removed_field("provision_role")
 
@@ -49,8 +49,9 @@ from datahub.metadata.schema_classes import DatasetLineageTypeClass, UpstreamCla
 from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.sqlglot_lineage import (
     SchemaResolver,
+    SqlParsingRequest,
     SqlParsingResult,
-    sqlglot_lineage,
+    sqlglot_lineage_batch,
 )
 from datahub.utilities.time import ts_millis_to_datetime
 
@@ -60,6 +61,9 @@ EXTERNAL_LINEAGE = "external_lineage"
 TABLE_LINEAGE = "table_lineage"
 VIEW_LINEAGE = "view_lineage"
 
+# Number of view definitions handed to the sql parser at once.
+_VIEW_DEFINITION_BATCH_SIZE = 1000
+
 
 @dataclass(frozen=True)
 class SnowflakeColumnId:
@@ -235,21 +239,22 @@ class SnowflakeLineageExtractor(
                     generate_usage_statistics=False,
                     generate_operations=False,
                 )
-                for view_identifier, view_definition in view_definitions.items():
-                    result = self._run_sql_parser(
-                        view_identifier, view_definition, schema_resolver
+                for batch in self._batch_view_definitions(view_definitions):
+                    parse_results = self._run_sql_parser(
+                        batch, view_definitions, schema_resolver
                     )
-                    if result and result.out_tables:
-                        self.report.num_views_with_upstreams += 1
-                        # This does not yield any workunits but we use
-                        # yield here to execute this method
-                        yield from builder.process_sql_parsing_result(
-                            result=result,
-                            query=view_definition,
-                            is_view_ddl=True,
-                        )
-                    else:
-                        views_failed_parsing.add(view_identifier)
+                    for view_identifier, result in zip(batch, parse_results):
+                        if result and result.out_tables:
+                            self.report.num_views_with_upstreams += 1
+                            # This does not yield any workunits but we use
+                            # yield here to execute this method
+                            yield from builder.process_sql_parsing_result(
+                                result=result,
+                                query=view_definitions[view_identifier],
+                                is_view_ddl=True,
+                            )
+                        else:
+                            views_failed_parsing.add(view_identifier)
 
                 yield from builder.gen_workunits()
                 self.report.view_lineage_parse_secs = timer.elapsed_seconds()
@@ -268,32 +273,72 @@ class SnowflakeLineageExtractor(
             f"Upstream lineage detected for {self.report.num_views_with_upstreams} views.",
         )
 
+    @staticmethod
+    def _batch_view_definitions(
+        view_definitions: MutableMapping[str, str]
+    ) -> Iterable[List[str]]:
+        # view_definitions may be file-backed, so only hold one batch of
+        # identifiers in memory at a time.
+        batch: List[str] = []
+        for view_identifier in view_definitions:
+            batch.append(view_identifier)
+            if len(batch) >= _VIEW_DEFINITION_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     def _run_sql_parser(
-        self, dataset_identifier: str, query: str, schema_resolver: SchemaResolver
-    ) -> Optional[SqlParsingResult]:
-        try:
-            database, schema, _view = dataset_identifier.split(".")
-        except ValueError:
-            logger.warning(f"Invalid view identifier: {dataset_identifier}")
-            return None
-        raw_lineage = sqlglot_lineage(
-            query,
+        self,
+        dataset_identifiers: List[str],
+        view_definitions: MutableMapping[str, str],
+        schema_resolver: SchemaResolver,
+    ) -> List[Optional[SqlParsingResult]]:
+        """Parses a batch of view definitions, returning results in input order."""
+        requests: List[SqlParsingRequest] = []
+        request_index: Dict[str, int] = {}
+        for dataset_identifier in dataset_identifiers:
+            try:
+                database, schema, _view = dataset_identifier.split(".")
+            except ValueError:
+                logger.warning(f"Invalid view identifier: {dataset_identifier}")
+                continue
+            request_index[dataset_identifier] = len(requests)
+            requests.append(
+                SqlParsingRequest(
+                    view_definitions[dataset_identifier],
+                    default_db=database,
+                    default_schema=schema,
+                )
+            )
+
+        raw_lineages = sqlglot_lineage_batch(
+            requests,
             schema_resolver=schema_resolver,
-            default_db=database,
-            default_schema=schema,
+            max_workers=self.config.view_definition_parsing_max_workers,
+            report=self.report.view_definition_parsing,
         )
-        if raw_lineage.debug_info.table_error:
-            logger.debug(
-                f"Failed to parse lineage for view {dataset_identifier}: "
-                f"{raw_lineage.debug_info.table_error}"
-            )
-            self.report.num_view_definitions_failed_parsing += 1
-            return None
-        elif raw_lineage.debug_info.column_error:
-            self.report.num_view_definitions_failed_column_parsing += 1
-        else:
-            self.report.num_view_definitions_parsed += 1
-        return raw_lineage
+
+        results: List[Optional[SqlParsingResult]] = []
+        for dataset_identifier in dataset_identifiers:
+            if dataset_identifier not in request_index:
+                results.append(None)
+                continue
+            raw_lineage = raw_lineages[request_index[dataset_identifier]]
+            if raw_lineage.debug_info.table_error:
+                logger.debug(
+                    f"Failed to parse lineage for view {dataset_identifier}: "
+                    f"{raw_lineage.debug_info.table_error}"
+                )
+                self.report.num_view_definitions_failed_parsing += 1
+                results.append(None)
+                continue
+            elif raw_lineage.debug_info.column_error:
+                self.report.num_view_definitions_failed_column_parsing += 1
+            else:
+                self.report.num_view_definitions_parsed += 1
+            results.append(raw_lineage)
+        return results
 
     def _create_upstream_lineage_workunit(
         self,
@@ -10,6 +10,7 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
 )
 from datahub.ingestion.source_report.ingestion_stage import IngestionStageReport
 from datahub.ingestion.source_report.time_window import BaseTimeWindowReport
+from datahub.utilities.sqlglot_lineage import SqlParsingBatchReport
 
 
 @dataclass
@@ -118,6 +119,9 @@ class SnowflakeV2Report(
     num_view_definitions_parsed: int = 0
     num_view_definitions_failed_parsing: int = 0
     num_view_definitions_failed_column_parsing: int = 0
+    view_definition_parsing: SqlParsingBatchReport = field(
+        default_factory=SqlParsingBatchReport
+    )
 
     def report_entity_scanned(self, name: str, ent_type: str = "table") -> None:
         """
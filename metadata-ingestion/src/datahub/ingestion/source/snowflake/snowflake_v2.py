@@ -307,6 +307,13 @@ class SnowflakeV2Source(
         self.add_config_to_report()
 
         self.sql_parser_schema_resolver = self._init_schema_resolver()
+        if self.config.sql_parsing_cache_path:
+            self.report.sql_parsing_cache = (
+                self.sql_parser_schema_resolver.enable_parse_result_cache(
+                    self.config.sql_parsing_cache_path,
+                    max_size_mb=self.config.sql_parsing_cache_max_size_mb,
+                )
+            )
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "Source":
@@ -97,6 +97,7 @@ from datahub.utilities.registries.domain_registry import DomainRegistry
 from datahub.utilities.sqlalchemy_query_combiner import SQLAlchemyQueryCombinerReport
 from datahub.utilities.sqlglot_lineage import (
     SchemaResolver,
+    SqlParsingCacheReport,
     SqlParsingResult,
     sqlglot_lineage,
     view_definition_lineage_helper,
@@ -121,6 +122,9 @@ class SQLSourceReport(StaleEntityRemovalSourceReport):
     filtered: LossyList[str] = field(default_factory=LossyList)
 
     query_combiner: Optional[SQLAlchemyQueryCombinerReport] = None
+    num_profiles_timed_out: int = 0
+    profiling_time_taken_percentiles_sec: Dict[str, float] = field(default_factory=dict)
+    sql_parsing_cache: Optional[SqlParsingCacheReport] = None
 
     num_view_definitions_parsed: int = 0
     num_view_definitions_failed_parsing: int = 0
@@ -342,6 +346,13 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             platform_instance=self.config.platform_instance,
             env=self.config.env,
         )
+        if self.config.sql_parsing_cache_path:
+            self.report.sql_parsing_cache = (
+                self.schema_resolver.enable_parse_result_cache(
+                    self.config.sql_parsing_cache_path,
+                    max_size_mb=self.config.sql_parsing_cache_max_size_mb,
+                )
+            )
         self._view_definition_cache: MutableMapping[str, str]
         if self.config.use_file_backed_cache:
             self._view_definition_cache = FileBackedDict[str]()
@@ -1254,3 +1265,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
 
     def get_report(self):
         return self.report
+
+    def close(self) -> None:
+        self.schema_resolver.close()
+        super().close()
@@ -39,15 +39,51 @@ class DetailedProfilerReportMixin:
         default_factory=int_top_k_dict
     )
 
+    profiling_skipped_unchanged: TopKDict[str, int] = field(
+        default_factory=int_top_k_dict
+    )
+    profiling_table_level_only_recently_profiled: TopKDict[str, int] = field(
+        default_factory=int_top_k_dict
+    )
+
 
 class ProfilingSqlReport(DetailedProfilerReportMixin, SQLSourceReport):
     pass
 
 
+# Used to estimate the row count of tables for which only the size is known.
+_ESTIMATED_ROW_SIZE_BYTES = 100
+
+
+def get_table_fingerprint(table: Union[BaseTable, BaseView]) -> Optional[str]:
+    """
+    Returns a fingerprint of the table's row count, size and last modified time,
+    which changes whenever any of them changes. Returns None if none of them are known.
+    """
+    if (
+        table.rows_count is None
+        and table.size_in_bytes is None
+        and table.last_altered is None
+    ):
+        return None
+    last_altered = (
+        int(table.last_altered.timestamp() * 1000) if table.last_altered else None
+    )
+    return f"{table.rows_count}:{table.size_in_bytes}:{last_altered}"
+
+
 @dataclass
 class TableProfilerRequest(GEProfilerRequest):
     table: Union[BaseTable, BaseView]
     profile_table_level_only: bool = False
+    table_fingerprint: Optional[str] = None
+
+    def estimated_row_count(self) -> Optional[int]:
+        if self.table.rows_count is not None:
+            return self.table.rows_count
+        if self.table.size_in_bytes is not None:
+            return self.table.size_in_bytes // _ESTIMATED_ROW_SIZE_BYTES
+        return None
 
 
 logger = logging.getLogger(__name__)
@@ -123,9 +159,12 @@ class GenericProfiler:
 
             # We don't add to the profiler state if we only do table level profiling as it always happens
             if self.state_handler:
-                self.state_handler.add_to_state(
-                    dataset_urn, int(datetime.now().timestamp() * 1000)
-                )
+                profile_time_millis = int(datetime.now().timestamp() * 1000)
+                self.state_handler.add_to_state(dataset_urn, profile_time_millis)
+                if not request.profile_table_level_only:
+                    self.state_handler.add_column_profile_to_state(
+                        dataset_urn, profile_time_millis, request.table_fingerprint
+                    )
             yield MetadataChangeProposalWrapper(
                 entityUrn=dataset_urn, aspect=profile
             ).as_workunit()
@@ -166,6 +205,23 @@ class GenericProfiler:
         if table.column_count == 0:
             skip_profiling = True
 
+        table_fingerprint = get_table_fingerprint(table)
+        if not skip_profiling and not profile_table_level_only and self.state_handler:
+            dataset_urn = self.dataset_urn_builder(dataset_name)
+            if (
+                self.config.profiling.skip_unchanged_tables
+                and table_fingerprint is not None
+                and table_fingerprint
+                == self.state_handler.get_last_table_fingerprint(dataset_urn)
+            ):
+                skip_profiling = True
+                self.report.profiling_skipped_unchanged[f"{db_name}.{schema_name}"] += 1
+            elif self.is_column_profile_recent(dataset_urn):
+                profile_table_level_only = True
+                self.report.profiling_table_level_only_recently_profiled[
+                    f"{db_name}.{schema_name}"
+                ] += 1
+
         if skip_profiling:
             if self.config.profiling.report_dropped_profiles:
                 self.report.report_dropped(f"profile of {dataset_name}")
@@ -177,9 +233,20 @@ class GenericProfiler:
             batch_kwargs=self.get_batch_kwargs(table, schema_name, db_name),
             table=table,
             profile_table_level_only=profile_table_level_only,
+            table_fingerprint=table_fingerprint,
         )
         return profile_request
 
+    def is_column_profile_recent(self, dataset_urn: str) -> bool:
+        min_interval_days = self.config.profiling.column_profiling_min_interval_days
+        if min_interval_days is None or not self.state_handler:
+            return False
+
+        last_column_profiled = self.state_handler.get_last_column_profiled(dataset_urn)
+        return last_column_profiled is not None and datetime.fromtimestamp(
+            last_column_profiled / 1000, timezone.utc
+        ) > datetime.now(timezone.utc) - timedelta(min_interval_days)
+
     def get_batch_kwargs(
         self, table: BaseTable, schema_name: str, db_name: str
     ) -> dict:
@@ -241,6 +308,15 @@ class GenericProfiler:
             if last_profiled:
                 # If profiling state exists we have to carry over to the new state
                 self.state_handler.add_to_state(dataset_urn, last_profiled)
+            last_column_profiled = self.state_handler.get_last_column_profiled(
+                dataset_urn
+            )
+            if last_column_profiled:
+                self.state_handler.add_column_profile_to_state(
+                    dataset_urn,
+                    last_column_profiled,
+                    self.state_handler.get_last_table_fingerprint(dataset_urn),
+                )
 
         threshold_time: Optional[datetime] = (
             datetime.fromtimestamp(last_profiled / 1000, timezone.utc)
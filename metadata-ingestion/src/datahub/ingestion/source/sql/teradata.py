@@ -37,7 +37,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     BytesTypeClass,
     TimeTypeClass,
 )
-from datahub.utilities.sqlglot_lineage import SchemaResolver, sqlglot_lineage
+from datahub.utilities.sqlglot_lineage import sqlglot_lineage
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -145,13 +145,6 @@ class TeradataSource(TwoTierSQLAlchemySource):
             generate_operations=self.config.usage.include_operational_stats,
         )
 
-        self.schema_resolver = SchemaResolver(
-            platform=self.platform,
-            platform_instance=self.config.platform_instance,
-            graph=None,
-            env=self.config.env,
-        )
-
     @classmethod
     def create(cls, config_dict, ctx):
         config = TeradataConfig.parse_obj(config_dict)
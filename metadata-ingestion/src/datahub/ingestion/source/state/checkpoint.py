@@ -5,9 +5,10 @@ import functools
 import json
 import logging
 import pickle
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable, Generic, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, Type, TypeVar
 
 import pydantic
 
@@ -21,6 +22,10 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_STATE_SIZE = 2**22  # 4MB
 
+# Much faster to compress than bz2 at level 9, and used together with a compact
+# representation of the state (see CheckpointStateBase._to_compact_dict).
+COMPACT_STATE_SERDE = "base85-zlib-json"
+
 
 class CheckpointStateBase(ConfigModel):
     """
@@ -57,6 +62,10 @@ class CheckpointStateBase(ConfigModel):
             )
         elif self.serde == "base85-bz2-json":
             encoded_bytes = CheckpointStateBase._to_bytes_base85_json(self, compressor)
+        elif self.serde == COMPACT_STATE_SERDE:
+            encoded_bytes = base64.b85encode(
+                zlib.compress(json.dumps(self._to_compact_dict()).encode("utf-8"), 9)
+            )
         else:
             raise ValueError(f"Unknown serde: {self.serde}")
 
@@ -77,6 +86,13 @@ class CheckpointStateBase(ConfigModel):
     ) -> bytes:
         return base64.b85encode(compressor(CheckpointStateBase._to_bytes_utf8(model)))
 
+    def _to_compact_dict(self) -> Dict[str, Any]:
+        """
+        The representation of the state that is used by the compact serde. The state must be able
+        to parse it back, e.g. with a root validator.
+        """
+        return json.loads(CheckpointStateBase._to_bytes_utf8(self))
+
     def prepare_for_commit(self) -> None:
         """
         Perform any pre-commit steps, such as deduplication, custom-compression across data etc.
@@ -127,6 +143,10 @@ class Checkpoint(Generic[StateType]):
                         functools.partial(bz2.decompress),
                         state_class,
                     )
+                elif checkpoint_aspect.state.serde == COMPACT_STATE_SERDE:
+                    state_obj = Checkpoint._from_base85_json_bytes(
+                        checkpoint_aspect, zlib.decompress, state_class
+                    )
                 else:
                     raise ValueError(f"Unknown serde: {checkpoint_aspect.state.serde}")
             except Exception as e:
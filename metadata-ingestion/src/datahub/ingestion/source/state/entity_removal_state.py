@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, List, Tuple, Type
+from typing import Any, Dict, Iterable, List, Tuple, Type, Union
 
 import pydantic
 
@@ -54,6 +54,53 @@ def pydantic_state_migrator(mapping: Dict[str, str]) -> classmethod:
     return pydantic.root_validator(pre=True, allow_reuse=True)(_validate_field_rename)
 
 
+def _common_prefix_length(a: str, b: str) -> int:
+    # Binary search on slice comparisons, which is much faster than comparing
+    # the strings one character at a time in Python.
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def encode_sorted_urns(urns: Iterable[str]) -> List[Union[int, str]]:
+    """
+    Front-codes the sorted urns as a flat list of [prefix_length, suffix, ...] pairs, where
+    prefix_length is the number of leading characters shared with the previous urn.
+    Urns from a single source tend to share long prefixes, so this is much smaller than
+    the plain list, and compresses better too.
+    """
+    encoded: List[Union[int, str]] = []
+    previous = ""
+    for urn in sorted(urns):
+        prefix_length = _common_prefix_length(previous, urn)
+        encoded.append(prefix_length)
+        encoded.append(urn[prefix_length:])
+        previous = urn
+    return encoded
+
+
+def decode_sorted_urns(encoded: List[Union[int, str]]) -> List[str]:
+    if len(encoded) % 2:
+        raise ValueError(
+            "Front-coded urns must be a list of [prefix_length, suffix] pairs"
+        )
+
+    urns: List[str] = []
+    previous = ""
+    for i in range(0, len(encoded), 2):
+        prefix_length, suffix = encoded[i], encoded[i + 1]
+        if not isinstance(prefix_length, int) or not isinstance(suffix, str):
+            raise ValueError(f"Invalid front-coded urn at position {i}")
+        previous = previous[:prefix_length] + suffix
+        urns.append(previous)
+    return urns
+
+
 class GenericCheckpointState(CheckpointStateBase):
     urns: List[str] = pydantic.Field(default_factory=list)
 
@@ -78,11 +125,25 @@ class GenericCheckpointState(CheckpointStateBase):
         }
     )
 
+    @pydantic.root_validator(pre=True, allow_reuse=True)
+    def _decode_compact_urns(cls, values: dict) -> dict:
+        # The compact serde stores the urns sorted and front-coded.
+        if "encoded_urns" in values:
+            values["urns"] = values.get("urns", []) + decode_sorted_urns(
+                values.pop("encoded_urns")
+            )
+        return values
+
     def __init__(self, **data: Any):  # type: ignore
         super().__init__(**data)
         self.urns = deduplicate_list(self.urns)
         self._urns_set = set(self.urns)
 
+    def _to_compact_dict(self) -> Dict[str, Any]:
+        compact = super()._to_compact_dict()
+        compact["encoded_urns"] = encode_sorted_urns(compact.pop("urns"))
+        return compact
+
     def add_checkpoint_urn(self, type: str, urn: str) -> None:
         """
         Adds an urn into the list used for tracking the type.
@@ -107,7 +168,9 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: an iterable to the set of urns present in this checkpoint state but not in the other_checkpoint.
         """
 
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        # The urns are already deduplicated, so we can stream through them and probe
+        # the other state's set, instead of materializing the difference.
+        diff = (urn for urn in self.urns if urn not in other_checkpoint_state._urns_set)
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         # TODO: Deprecate the `type` parameter and remove it.
@@ -127,9 +190,13 @@ class GenericCheckpointState(CheckpointStateBase):
         :param old_checkpoint_state: the old checkpoint state to compute the relative change percent against.
         :return: (1-|intersection(self, old_checkpoint_state)| / |old_checkpoint_state|) * 100.0
         """
-        return compute_percent_entities_changed(
-            new_entities=self.urns, old_entities=old_checkpoint_state.urns
+        old_count = len(old_checkpoint_state.urns)
+        if not old_count:
+            return 0.0
+        overlap_count = sum(
+            1 for urn in old_checkpoint_state.urns if urn in self._urns_set
         )
+        return (1 - overlap_count / old_count) * 100.0
 
 
 def compute_percent_entities_changed(
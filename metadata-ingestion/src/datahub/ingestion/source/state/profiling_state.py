@@ -8,9 +8,18 @@ from datahub.ingestion.source.state.checkpoint import CheckpointStateBase
 class ProfilingCheckpointState(CheckpointStateBase):
     """
     Base class for representing the checkpoint state for all profiling based sources.
-    Stores the last successful profiling time per urn.
+    Stores the last successful profiling time per urn, and the time and table
+    fingerprint of its last column level profile.
     Subclasses can define additional state as appropriate.
     """
 
     # Last profiled stores urn, last_profiled timestamp millis in a dict
     last_profiled: Dict[str, pydantic.PositiveInt]
+    # Last column profiled stores urn, timestamp millis of the last profile that
+    # included column level stats in a dict
+    last_column_profiled: Dict[str, pydantic.PositiveInt] = pydantic.Field(
+        default_factory=dict
+    )
+    # Table fingerprints stores urn, fingerprint of the table's row count, size and
+    # last modified time at its last column level profile in a dict
+    table_fingerprints: Dict[str, str] = pydantic.Field(default_factory=dict)
@@ -107,6 +107,25 @@ class ProfilingHandler(StatefulIngestionUsecaseHandlerBase[ProfilingCheckpointSt
         if cur_state:
             cur_state.last_profiled[urn] = profile_time_millis
 
+    def add_column_profile_to_state(
+        self,
+        urn: str,
+        profile_time_millis: pydantic.PositiveInt,
+        table_fingerprint: Optional[str] = None,
+    ) -> None:
+        """Records a profile that included column level stats.
+
+        Table level only profiles must not be recorded here, or they would hide
+        that the table's column level stats are out of date.
+        """
+        cur_state = self.get_current_state()
+        if cur_state:
+            cur_state.last_column_profiled[urn] = profile_time_millis
+            if table_fingerprint is not None:
+                cur_state.table_fingerprints[urn] = table_fingerprint
+            else:
+                cur_state.table_fingerprints.pop(urn, None)
+
     def get_last_state(self) -> Optional[ProfilingCheckpointState]:
         if not self.is_checkpointing_enabled() or self._ignore_old_state():
             return None
@@ -124,3 +143,17 @@ class ProfilingHandler(StatefulIngestionUsecaseHandlerBase[ProfilingCheckpointSt
             return state.last_profiled.get(urn)
 
         return None
+
+    def get_last_column_profiled(self, urn: str) -> Optional[pydantic.PositiveInt]:
+        state = self.get_last_state()
+        if state:
+            return state.last_column_profiled.get(urn)
+
+        return None
+
+    def get_last_table_fingerprint(self, urn: str) -> Optional[str]:
+        state = self.get_last_state()
+        if state:
+            return state.table_fingerprints.get(urn)
+
+        return None
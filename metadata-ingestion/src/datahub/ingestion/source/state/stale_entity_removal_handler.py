@@ -10,7 +10,7 @@ from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
 from datahub.ingestion.api.source_helpers import auto_stale_entity_removal
 from datahub.ingestion.api.workunit import MetadataWorkUnit
-from datahub.ingestion.source.state.checkpoint import Checkpoint
+from datahub.ingestion.source.state.checkpoint import COMPACT_STATE_SERDE, Checkpoint
 from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfig,
@@ -43,6 +43,10 @@ class StatefulStaleMetadataRemovalConfig(StatefulIngestionConfig):
         ge=0.0,
         hidden_from_docs=True,
     )
+    compact_state: bool = pydantic.Field(
+        default=False,
+        description="Stores the state as sorted, front-coded urns compressed with zlib, which is much smaller and faster to write for sources with many entities. Note that older versions of the ingestion framework cannot read state that was written in this format.",
+    )
 
 
 @dataclass
@@ -168,11 +172,14 @@ class StaleEntityRemovalHandler(
         if self.is_checkpointing_enabled() and not self._ignore_new_state():
             assert self.stateful_ingestion_config is not None
             assert self.pipeline_name is not None
+            state = self.state_type_class()
+            if self.stateful_ingestion_config.compact_state:
+                state.serde = COMPACT_STATE_SERDE
             return Checkpoint(
                 job_name=self.job_id,
                 pipeline_name=self.pipeline_name,
                 run_id=self.run_id,
-                state=self.state_type_class(),
+                state=state,
             )
         return None
 
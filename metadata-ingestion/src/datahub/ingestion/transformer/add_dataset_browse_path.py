@@ -35,6 +35,9 @@ class AddDatasetBrowsePathTransformer(DatasetBrowsePathsTransformer):
         config = AddDatasetBrowsePathConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def is_thread_safe(self) -> bool:
+        return True
+
     @staticmethod
     def _merge_with_server_browse_paths(
         graph: DataHubGraph, urn: str, mce_browse_paths: Optional[BrowsePathsClass]
@@ -138,6 +138,9 @@ class SimpleAddDatasetOwnership(AddDatasetOwnership):
         config = SimpleDatasetOwnershipConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def is_thread_safe(self) -> bool:
+        return True
+
 
 class PatternDatasetOwnershipConfig(DatasetOwnershipBaseConfig):
     owner_pattern: KeyValuePattern = KeyValuePattern.all()
@@ -185,3 +188,6 @@ class PatternAddDatasetOwnership(AddDatasetOwnership):
     ) -> "PatternAddDatasetOwnership":
         config = PatternDatasetOwnershipConfig.parse_obj(config_dict)
         return cls(config, ctx)
+
+    def is_thread_safe(self) -> bool:
+        return True
@@ -146,3 +146,6 @@ class SimpleAddDatasetProperties(AddDatasetProperties):
     ) -> "SimpleAddDatasetProperties":
         config = SimpleAddDatasetPropertiesConfig.parse_obj(config_dict)
         return cls(config, ctx)
+
+    def is_thread_safe(self) -> bool:
+        return True
@@ -144,3 +144,6 @@ class PatternAddDatasetSchemaTags(AddDatasetSchemaTags):
     ) -> "PatternAddDatasetSchemaTags":
         config = PatternDatasetTagsConfig.parse_obj(config_dict)
         return cls(config, ctx)
+
+    def is_thread_safe(self) -> bool:
+        return True
@@ -155,3 +155,6 @@ class PatternAddDatasetSchemaTerms(AddDatasetSchemaTerms):
     ) -> "PatternAddDatasetSchemaTerms":
         config = PatternDatasetTermsConfig.parse_obj(config_dict)
         return cls(config, ctx)
+
+    def is_thread_safe(self) -> bool:
+        return True
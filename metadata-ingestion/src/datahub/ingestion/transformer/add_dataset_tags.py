@@ -73,6 +73,9 @@ class SimpleAddDatasetTags(AddDatasetTags):
         config = SimpleDatasetTagConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def is_thread_safe(self) -> bool:
+        return True
+
 
 class PatternDatasetTagsConfig(TransformerSemanticsConfigModel):
     tag_pattern: KeyValuePattern = KeyValuePattern.all()
@@ -96,3 +99,6 @@ class PatternAddDatasetTags(AddDatasetTags):
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "PatternAddDatasetTags":
         config = PatternDatasetTagsConfig.parse_obj(config_dict)
         return cls(config, ctx)
+
+    def is_thread_safe(self) -> bool:
+        return True
@@ -121,6 +121,9 @@ class SimpleAddDatasetTerms(AddDatasetTerms):
         config = SimpleDatasetTermsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def is_thread_safe(self) -> bool:
+        return True
+
 
 class PatternDatasetTermsConfig(TransformerSemanticsConfigModel):
     term_pattern: KeyValuePattern = KeyValuePattern.all()
@@ -147,3 +150,6 @@ class PatternAddDatasetTerms(AddDatasetTerms):
     ) -> "PatternAddDatasetTerms":
         config = PatternDatasetTermsConfig.parse_obj(config_dict)
         return cls(config, ctx)
+
+    def is_thread_safe(self) -> bool:
+        return True
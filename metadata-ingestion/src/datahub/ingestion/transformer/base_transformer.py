@@ -1,13 +1,16 @@
+import collections
 import logging
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Union
 
 import datahub.emitter.mce_builder as builder
+from datahub.configuration.common import TransformerSemantics
 from datahub.emitter.aspect import ASPECT_MAP
 from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import ControlRecord, EndOfStream, RecordEnvelope
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.metadata.schema_classes import (
     MetadataChangeEventClass,
     MetadataChangeProposalClass,
@@ -16,6 +19,10 @@ from datahub.utilities.urns.urn import Urn, guess_entity_type
 
 log = logging.getLogger(__name__)
 
+# Aspects that transformers merge with are prefetched this many entities at a time, which
+# keeps them well within the graph's cache of prefetched aspects.
+_SERVER_ASPECT_PREFETCH_BATCH_SIZE = 1000
+
 
 class LegacyMCETransformer(Transformer, metaclass=ABCMeta):
     @abstractmethod
@@ -53,6 +60,8 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
 
     def __init__(self):
         self.entity_map: Dict[str, Dict[str, Any]] = {}
+        # Urns prefetched for each batch that hasn't been cleared yet, oldest first.
+        self._prefetched_urns: Deque[List[str]] = collections.deque()
         mixedin = False
         for mixin in [LegacyMCETransformer, SingleAspectTransformer]:
             mixedin = mixedin or isinstance(self, mixin)
@@ -108,6 +117,77 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
     def _mark_processed(self, entity_urn: str) -> None:
         self.entity_map[entity_urn] = {"processed": True}
 
+    def wants_prefetch(self) -> bool:
+        # With PATCH semantics, transformers merge their aspect with the one in DataHub,
+        # which would otherwise be fetched with one request per entity.
+        ctx = getattr(self, "ctx", None)
+        config = getattr(self, "config", None)
+        return (
+            isinstance(self, SingleAspectTransformer)
+            and ctx is not None
+            and ctx.graph is not None
+            and getattr(config, "semantics", None) == TransformerSemantics.PATCH
+            and self.aspect_name() in ASPECT_MAP
+        )
+
+    def _prefetch_server_aspects(self, entity_urns: List[str]) -> List[str]:
+        if not entity_urns or not self.wants_prefetch():
+            return []
+
+        assert isinstance(self, SingleAspectTransformer)
+        graph = getattr(self, "ctx").graph
+        graph.prefetch_aspects(entity_urns, [ASPECT_MAP[self.aspect_name()]])
+        return entity_urns
+
+    def _clear_server_aspects(self, entity_urns: List[str]) -> None:
+        ctx = getattr(self, "ctx", None)
+        if entity_urns and ctx is not None and ctx.graph is not None:
+            assert isinstance(self, SingleAspectTransformer)
+            ctx.graph.clear_prefetched_aspects(entity_urns, self.aspect_name())
+
+    def _has_aspect_to_transform(
+        self,
+        record: Union[
+            MetadataChangeEventClass,
+            MetadataChangeProposalWrapper,
+            MetadataChangeProposalClass,
+            Any,
+        ],
+    ) -> bool:
+        assert isinstance(self, SingleAspectTransformer)
+        if isinstance(record, MetadataChangeEventClass):
+            aspect_type = ASPECT_MAP.get(self.aspect_name())
+            return (
+                aspect_type is not None
+                and builder.can_add_aspect(record, aspect_type)
+                and builder.get_aspect_if_available(record, aspect_type) is not None
+            )
+        elif isinstance(
+            record, (MetadataChangeProposalWrapper, MetadataChangeProposalClass)
+        ):
+            return record.aspectName == self.aspect_name()
+        return False
+
+    def prefetch(self, workunits: Sequence[MetadataWorkUnit]) -> None:
+        if not self.wants_prefetch():
+            return
+        self._prefetched_urns.append(
+            self._prefetch_server_aspects(
+                list(
+                    dict.fromkeys(
+                        wu.get_urn()
+                        for wu in workunits
+                        if self._should_process(wu.metadata)
+                        and self._has_aspect_to_transform(wu.metadata)
+                    )
+                )
+            )
+        )
+
+    def clear_prefetched(self) -> None:
+        if self._prefetched_urns:
+            self._clear_server_aspects(self._prefetched_urns.popleft())
+
     def _transform_or_record_mce(
         self,
         envelope: RecordEnvelope[MetadataChangeEventClass],
@@ -201,41 +281,54 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 self, SingleAspectTransformer
             ):
                 # walk through state and call transform for any unprocessed entities
-                for urn, state in self.entity_map.items():
-                    if "seen" in state:
-                        # call transform on this entity_urn
-                        last_seen_mcp = state["seen"].get("mcp")
-                        last_seen_mce_system_metadata = state["seen"].get("mce")
+                urns = list(self.entity_map)
+                for i in range(0, len(urns), _SERVER_ASPECT_PREFETCH_BATCH_SIZE):
+                    batch = urns[i : i + _SERVER_ASPECT_PREFETCH_BATCH_SIZE]
+                    prefetched_urns = self._prefetch_server_aspects(
+                        [urn for urn in batch if "seen" in self.entity_map[urn]]
+                    )
+                    try:
+                        yield from self._transform_unprocessed(batch, envelope)
+                    finally:
+                        self._clear_server_aspects(prefetched_urns)
+            yield envelope
 
-                        transformed_aspect = self.transform_aspect(
-                            entity_urn=urn,
-                            aspect_name=self.aspect_name(),
-                            aspect=last_seen_mcp.aspect
+    def _transform_unprocessed(
+        self, urns: List[str], envelope: RecordEnvelope
+    ) -> Iterable[RecordEnvelope]:
+        assert isinstance(self, SingleAspectTransformer)
+        for urn in urns:
+            state = self.entity_map[urn]
+            if "seen" in state:
+                # call transform on this entity_urn
+                last_seen_mcp = state["seen"].get("mcp")
+                last_seen_mce_system_metadata = state["seen"].get("mce")
+
+                transformed_aspect = self.transform_aspect(
+                    entity_urn=urn,
+                    aspect_name=self.aspect_name(),
+                    aspect=last_seen_mcp.aspect
+                    if last_seen_mcp and last_seen_mcp.aspectName == self.aspect_name()
+                    else None,
+                )
+                if transformed_aspect:
+                    # for end of stream records, we modify the workunit-id
+                    structured_urn = Urn.create_from_string(urn)
+                    simple_name = "-".join(structured_urn.get_entity_id())
+                    record_metadata = envelope.metadata.copy()
+                    record_metadata.update(
+                        {"workunit_id": f"txform-{simple_name}-{self.aspect_name()}"}
+                    )
+                    yield RecordEnvelope(
+                        record=MetadataChangeProposalWrapper(
+                            entityUrn=urn,
+                            entityType=structured_urn.get_type(),
+                            systemMetadata=last_seen_mcp.systemMetadata
                             if last_seen_mcp
-                            and last_seen_mcp.aspectName == self.aspect_name()
-                            else None,
-                        )
-                        if transformed_aspect:
-                            # for end of stream records, we modify the workunit-id
-                            structured_urn = Urn.create_from_string(urn)
-                            simple_name = "-".join(structured_urn.get_entity_id())
-                            record_metadata = envelope.metadata.copy()
-                            record_metadata.update(
-                                {
-                                    "workunit_id": f"txform-{simple_name}-{self.aspect_name()}"
-                                }
-                            )
-                            yield RecordEnvelope(
-                                record=MetadataChangeProposalWrapper(
-                                    entityUrn=urn,
-                                    entityType=structured_urn.get_type(),
-                                    systemMetadata=last_seen_mcp.systemMetadata
-                                    if last_seen_mcp
-                                    else last_seen_mce_system_metadata,
-                                    aspectName=self.aspect_name(),
-                                    aspect=transformed_aspect,
-                                ),
-                                metadata=record_metadata,
-                            )
-                    self._mark_processed(urn)
-            yield envelope
+                            else last_seen_mce_system_metadata,
+                            aspectName=self.aspect_name(),
+                            aspect=transformed_aspect,
+                        ),
+                        metadata=record_metadata,
+                    )
+            self._mark_processed(urn)
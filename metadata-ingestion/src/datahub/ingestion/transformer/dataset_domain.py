@@ -137,6 +137,9 @@ class SimpleAddDatasetDomain(AddDatasetDomain):
         config = SimpleDatasetDomainSemanticsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def is_thread_safe(self) -> bool:
+        return True
+
 
 class PatternAddDatasetDomain(AddDatasetDomain):
     """Transformer that adds a specified set of domains to each dataset."""
@@ -165,3 +168,6 @@ class PatternAddDatasetDomain(AddDatasetDomain):
     ) -> "PatternAddDatasetDomain":
         config = PatternDatasetDomainSemanticsConfig.parse_obj(config_dict)
         return cls(config, ctx)
+
+    def is_thread_safe(self) -> bool:
+        return True
@@ -32,6 +32,9 @@ class ExtractDatasetTags(DatasetTagsTransformer):
         config = ExtractDatasetTagsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def is_thread_safe(self) -> bool:
+        return True
+
     def _get_tags_to_add(self, entity_urn: str) -> List[TagAssociationClass]:
         if self.config.extract_tags_from == ExtractTagsOption.URN:
             urn = DatasetUrn.create_from_string(entity_urn)
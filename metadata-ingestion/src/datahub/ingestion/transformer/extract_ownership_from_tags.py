@@ -51,6 +51,9 @@ class ExtractOwnersFromTagsTransformer(DatasetTagsTransformer):
         config = ExtractOwnersFromTagsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def is_thread_safe(self) -> bool:
+        return True
+
     def get_owner_urn(self, owner_str: str) -> str:
         if self.config.email_domain is not None:
             return owner_str + "@" + self.config.email_domain
@@ -27,6 +27,9 @@ class MarkDatasetStatus(DatasetStatusTransformer):
         config = MarkDatasetStatusConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def is_thread_safe(self) -> bool:
+        return True
+
     def transform_aspect(
         self, entity_urn: str, aspect_name: str, aspect: Optional[builder.Aspect]
     ) -> Optional[builder.Aspect]:
@@ -26,6 +26,9 @@ class SimpleRemoveDatasetOwnership(DatasetOwnershipTransformer):
         config = ClearDatasetOwnershipConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def is_thread_safe(self) -> bool:
+        return True
+
     def transform_aspect(
         self, entity_urn: str, aspect_name: str, aspect: Optional[Aspect]
     ) -> Optional[Aspect]:
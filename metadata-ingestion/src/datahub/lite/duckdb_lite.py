@@ -1,15 +1,30 @@
+import contextlib
 import json
 import logging
 import pathlib
+import re
 import time
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from collections import defaultdict
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import duckdb
 
 from datahub.emitter.aspect import ASPECT_MAP
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.mcp_builder import mcps_from_mce
-from datahub.emitter.serialization_helper import post_json_transform
+from datahub.emitter.serialization_helper import post_json_transform, to_pre_json_obj
 from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
 from datahub.lite.lite_local import (
     AutoComplete,
@@ -38,6 +53,153 @@ from datahub.utilities.urns.urn import Urn
 
 logger = logging.getLogger(__name__)
 
+# Buffered edges are written out once this many (src_id, relnship) pairs have accumulated.
+_EDGE_BUFFER_MAX_SIZE = 100_000
+
+
+def _json_batch_query(columns: Dict[str, Any]) -> str:
+    """Returns a query that unpacks a batch of rows passed in as a single JSON parameter.
+
+    The parameter must be a JSON object mapping each column name to a list of values.
+    Binding a single string is much faster than binding every value individually.
+    """
+    schema = json.dumps({name: [column_type] for name, column_type in columns.items()})
+    projection = ", ".join(f"unnest(batch.{name}) AS {name}" for name in columns)
+    return f"SELECT {projection} FROM (SELECT from_json(?, '{schema}') AS batch)"
+
+
+_ASPECT_KEY_COLUMNS = {"urn": "VARCHAR", "aspect_name": "VARCHAR"}
+_ASPECT_COLUMNS = {
+    "urn": "VARCHAR",
+    "aspect_name": "VARCHAR",
+    "version": "BIGINT",
+    "metadata": "VARCHAR",
+    "system_metadata": "VARCHAR",
+    "createdon": "BIGINT",
+}
+_ASPECT_UPDATE_COLUMNS = {
+    "urn": "VARCHAR",
+    "aspect_name": "VARCHAR",
+    "metadata": "VARCHAR",
+    "system_metadata": "VARCHAR",
+}
+_EDGE_COLUMNS = {
+    "src_id": "VARCHAR",
+    "relnship": "VARCHAR",
+    "dst_id": "VARCHAR",
+    "dst_label": "VARCHAR",
+    "replace": "BOOLEAN",
+}
+_SEARCH_TOKEN_COLUMNS = {
+    "urn": "VARCHAR",
+    "aspect_name": "VARCHAR",
+    "tokens": ["VARCHAR"],
+}
+
+# Tokens of the urn itself are indexed under this pseudo aspect name.
+_URN_SEARCH_ASPECT = "urn"
+# Only string values stored under these keys (at any depth) are indexed for free text search.
+_SEARCHABLE_FIELDS = {
+    "name",
+    "title",
+    "description",
+    "qualifiedName",
+    "fieldPath",
+    "displayName",
+    "fullName",
+    "definition",
+}
+_SEARCH_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+# These occur in every urn, so they are useless for search.
+_SEARCH_STOP_TOKENS = {"urn", "li"}
+# Each query token matches at most this many indexed tokens that it is a prefix of.
+_SEARCH_MAX_PREFIX_EXPANSIONS = 100
+# Query tokens with fewer postings than this are looked up in full. This matches
+# DuckDB's default index_scan_max_count, above which it scans the table anyway.
+_SEARCH_CANDIDATE_LIMIT = 2048
+_SEARCH_SNIPPET_BATCH_SIZE = 10_000
+_SEARCH_REBUILD_BATCH_SIZE = 10_000
+_MAX_INDEXED_IN_VALUES = 16
+
+
+def _tokenize(text: str) -> Set[str]:
+    return {
+        token
+        for token in _SEARCH_TOKEN_PATTERN.findall(text.lower())
+        if token not in _SEARCH_STOP_TOKENS
+    }
+
+
+def _get_search_tokens(aspect_json: Any, tokens: Optional[Set[str]] = None) -> Set[str]:
+    """Collects the tokens of all searchable fields in an aspect's JSON."""
+    if tokens is None:
+        tokens = set()
+    if isinstance(aspect_json, dict):
+        for key, value in aspect_json.items():
+            if isinstance(value, str):
+                if key == "fieldPath":
+                    # Drop the [version=2.0].[type=struct] annotations of v2 field paths.
+                    value = re.sub(r"\[[^\]]*\]", " ", value)
+                if key in _SEARCHABLE_FIELDS:
+                    tokens.update(_tokenize(value))
+            else:
+                _get_search_tokens(value, tokens)
+    elif isinstance(aspect_json, list):
+        for item in aspect_json:
+            _get_search_tokens(item, tokens)
+    return tokens
+
+
+def _in_filter(table: str, column: str, values: List[str]) -> Tuple[str, List[Any]]:
+    """Returns a condition that matches rows whose column is any of the values, and its parameters.
+
+    DuckDB only uses an index if the condition on it is the only predicate on the table,
+    so short lists of values select the matching row ids first. Other predicates should
+    come after this condition. Longer lists are passed in as a single JSON parameter.
+    """
+    if len(values) <= _MAX_INDEXED_IN_VALUES:
+        return (
+            f"rowid IN (SELECT rowid FROM {table} WHERE {column} IN ({','.join('?' for _ in values)}))",
+            values,
+        )
+    return (
+        f"{column} IN (SELECT unnest(from_json(?, '[\"VARCHAR\"]')))",
+        [json.dumps(values)],
+    )
+
+
+class _SearchableAspect(NamedTuple):
+    urn: str
+    aspect_name: str
+    aspect_json: Any
+    # Whether the index may contain an older version of this aspect.
+    replace: bool
+
+
+class _EdgeBuffer:
+    """Collects add_edge calls so that they can be written with a few set-based statements."""
+
+    def __init__(self) -> None:
+        # (src_id, relnship) -> (replace existing edges, {dst_id: dst_label})
+        self.edges: Dict[Tuple[str, str], Tuple[bool, Dict[str, Optional[str]]]] = {}
+
+    def add(
+        self,
+        src_id: str,
+        relnship: str,
+        dst_id: str,
+        dst_label: Optional[str],
+        remove_existing: bool,
+    ) -> None:
+        key = (src_id, relnship)
+        if remove_existing:
+            self.edges[key] = (True, {dst_id: dst_label})
+        else:
+            self.edges.setdefault(key, (False, {}))[1][dst_id] = dst_label
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
 
 class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     @classmethod
@@ -52,8 +214,20 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         self.duckdb_client = duckdb.connect(
             str(fpath), read_only=config.read_only, config=config.options
         )
+        self._edge_buffer: Optional[_EdgeBuffer] = None
+        # Set once aspects have been written, so that close() rebuilds the edges.
+        self._edges_stale = False
         if not config.read_only:
             self._init_db()
+        # Databases created by older versions may not have a search index yet.
+        self._has_search_index = self._table_exists("metadata_search_token")
+
+    def _table_exists(self, table_name: str) -> bool:
+        row = self.duckdb_client.execute(
+            "SELECT count(*) FROM information_schema.tables WHERE table_name = ?",
+            [table_name],
+        ).fetchone()
+        return bool(row and row[0])
 
     def _init_db(self):
         self.duckdb_client.execute(
@@ -70,6 +244,45 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         self.duckdb_client.execute(
             "CREATE UNIQUE INDEX IF NOT EXISTS edge_idx ON metadata_edge_v2 (src_id, relnship, dst_id)"
         )
+        # The composite indexes above are not used for lookups on a prefix of their columns.
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS aspect_urn_idx ON metadata_aspect_v2 (urn)"
+        )
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS edge_src_idx ON metadata_edge_v2 (src_id)"
+        )
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS edge_dst_idx ON metadata_edge_v2 (dst_id)"
+        )
+
+        # An inverted index for free text search: one row per (token, urn, aspect),
+        # plus the vocabulary of all tokens for expanding prefixes. The vocabulary
+        # only shrinks on reindex, so it may contain tokens without any matches.
+        needs_search_index = not self._table_exists("metadata_search_token")
+        self.duckdb_client.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_search_token "
+            "(token VARCHAR, urn VARCHAR, aspect_name VARCHAR)"
+        )
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS search_token_idx ON metadata_search_token (token)"
+        )
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS search_token_urn_idx ON metadata_search_token (urn)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_search_vocab (token VARCHAR)"
+        )
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS search_vocab_idx ON metadata_search_vocab (token)"
+        )
+        if needs_search_index:
+            self.duckdb_client.begin()
+            try:
+                self._rebuild_search_index()
+            except Exception:
+                self.duckdb_client.rollback()
+                raise
+            self.duckdb_client.commit()
 
     def location(self) -> str:
         return self.config.file
@@ -98,15 +311,20 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         if not writeables:
             return
 
+        self._edges_stale = True
         # TODO use `with` for transaction
         self.duckdb_client.begin()
         for writeable in writeables:
             needs_write = False
             try:
                 writeable_dict = writeable.to_obj(simplified_structure=True)
+                assert writeable.entityUrn
+                urn_filter, params = _in_filter(
+                    "metadata_aspect_v2", "urn", [writeable.entityUrn]
+                )
                 exists = self.duckdb_client.execute(
-                    "SELECT metadata, system_metadata FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ? AND version = 0",
-                    [writeable.entityUrn, writeable.aspectName],
+                    f"SELECT metadata, system_metadata FROM metadata_aspect_v2 WHERE {urn_filter} AND aspect_name = ? AND version = 0",
+                    [*params, writeable.aspectName],
                 )
                 max_row = exists.fetchone()
                 if max_row is None:
@@ -187,6 +405,17 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                                 writeable.aspectName,
                             ],
                         )
+                    assert writeable.entityUrn and writeable.aspectName
+                    self._index_for_search(
+                        [
+                            _SearchableAspect(
+                                writeable.entityUrn,
+                                writeable.aspectName,
+                                writeable_dict["aspect"]["json"],
+                                replace=max_row is not None,
+                            )
+                        ]
+                    )
                 else:
                     # this is a dup, we still want to update the lastObserved timestamp
                     if not system_metadata:
@@ -220,6 +449,299 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
 
         self.duckdb_client.commit()
 
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        writeables: List[MetadataChangeProposalWrapper] = []
+        for record in records:
+            if isinstance(record, MetadataChangeProposalWrapper):
+                writeables.append(record)
+            elif isinstance(record, MetadataChangeEventClass):
+                writeables.extend(mcps_from_mce(record))
+            else:
+                raise ValueError(
+                    f"DuckDBCatalog only supports MCEs and MCPs, not {type(record)}"
+                )
+
+        # Every write of an aspect can create a new version, so a batch that contains
+        # the same aspect more than once is split into rounds that each contain it once.
+        rounds: List[Dict[Tuple[str, str], MetadataChangeProposalWrapper]] = []
+        for writeable in writeables:
+            if (
+                not writeable.entityUrn
+                or not writeable.aspectName
+                or not writeable.aspect
+            ):
+                logger.error(f"Failed to write {writeable}: missing urn or aspect")
+                continue
+            key = (writeable.entityUrn, writeable.aspectName)
+            for writeables_by_key in rounds:
+                if key not in writeables_by_key:
+                    writeables_by_key[key] = writeable
+                    break
+            else:
+                rounds.append({key: writeable})
+
+        if not rounds:
+            return
+
+        # Edges are not derived here, since close() rebuilds all of them anyway.
+        self._edges_stale = True
+        self.duckdb_client.begin()
+        try:
+            for writeables_by_key in rounds:
+                self._write_aspects(list(writeables_by_key.values()))
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
+        self.duckdb_client.commit()
+
+    def _write_aspects(self, writeables: List[MetadataChangeProposalWrapper]) -> None:
+        """Upserts a batch of aspects, which must not contain the same aspect twice.
+
+        Follows the same versioning rules as write(), but looks up the existing
+        aspects and writes the new ones with a constant number of statements.
+        Changed aspects are also indexed for search.
+        """
+        keys = json.dumps(
+            {
+                "urn": [writeable.entityUrn for writeable in writeables],
+                "aspect_name": [writeable.aspectName for writeable in writeables],
+            }
+        )
+        existing: Dict[Tuple[str, str], Tuple[str, str]] = {
+            (urn, aspect_name): (metadata, system_metadata)
+            for urn, aspect_name, metadata, system_metadata in self.duckdb_client.execute(
+                "SELECT a.urn, a.aspect_name, a.metadata, a.system_metadata FROM metadata_aspect_v2 a "
+                f"JOIN ({_json_batch_query(_ASPECT_KEY_COLUMNS)}) k "
+                "ON a.urn = k.urn AND a.aspect_name = k.aspect_name WHERE a.version = 0",
+                [keys],
+            ).fetchall()
+        }
+        existing_system_metadata = {
+            key: json.loads(system_metadata)
+            for key, (_, system_metadata) in existing.items()
+        }
+        max_versions: Dict[Tuple[str, str], int] = {}
+        if any(
+            system_metadata.get("properties", {}).get("sysVersion") is None
+            for system_metadata in existing_system_metadata.values()
+        ):
+            max_versions = {
+                (urn, aspect_name): max_version
+                for urn, aspect_name, max_version in self.duckdb_client.execute(
+                    "SELECT a.urn, a.aspect_name, max(a.version) FROM metadata_aspect_v2 a "
+                    f"JOIN ({_json_batch_query(_ASPECT_KEY_COLUMNS)}) k "
+                    "ON a.urn = k.urn AND a.aspect_name = k.aspect_name GROUP BY a.urn, a.aspect_name",
+                    [keys],
+                ).fetchall()
+            }
+
+        inserts: Dict[str, List[Any]] = {name: [] for name in _ASPECT_COLUMNS}
+        updates: Dict[str, List[Any]] = {name: [] for name in _ASPECT_UPDATE_COLUMNS}
+        searchables: List[_SearchableAspect] = []
+        current_time = int(time.time() * 1000.0)
+        for writeable in writeables:
+            assert writeable.entityUrn and writeable.aspectName and writeable.aspect
+            key = (writeable.entityUrn, writeable.aspectName)
+            aspect_json = to_pre_json_obj(writeable.aspect)
+
+            created_on = current_time
+            if writeable.systemMetadata is None:
+                writeable.systemMetadata = SystemMetadataClass(
+                    lastObserved=created_on, properties={}
+                )
+            elif writeable.systemMetadata.lastObserved:
+                created_on = writeable.systemMetadata.lastObserved
+            else:
+                writeable.systemMetadata.lastObserved = created_on
+
+            if key not in existing:
+                new_version = 1
+                needs_write = True
+            else:
+                system_metadata = existing_system_metadata[key]
+                real_version = system_metadata.get("properties", {}).get("sysVersion")
+                if real_version is None:
+                    real_version = max_versions[key]
+                needs_write = aspect_json != json.loads(existing[key][0])
+                new_version = real_version + 1 if needs_write else real_version
+
+            if needs_write:
+                system_metadata = writeable.systemMetadata.to_obj()
+                system_metadata["properties"] = {
+                    **(system_metadata.get("properties") or {}),
+                    "sysVersion": new_version,
+                }
+                metadata_str = json.dumps(aspect_json)
+                system_metadata_str = json.dumps(system_metadata)
+                for version in [new_version] if key in existing else [new_version, 0]:
+                    for name, value in zip(
+                        _ASPECT_COLUMNS,
+                        [
+                            writeable.entityUrn,
+                            writeable.aspectName,
+                            version,
+                            metadata_str,
+                            system_metadata_str,
+                            created_on,
+                        ],
+                    ):
+                        inserts[name].append(value)
+                if key in existing:
+                    # we update the existing v0 row
+                    for name, value in zip(
+                        _ASPECT_UPDATE_COLUMNS,
+                        [
+                            writeable.entityUrn,
+                            writeable.aspectName,
+                            metadata_str,
+                            system_metadata_str,
+                        ],
+                    ):
+                        updates[name].append(value)
+                searchables.append(
+                    _SearchableAspect(
+                        writeable.entityUrn,
+                        writeable.aspectName,
+                        aspect_json,
+                        replace=key in existing,
+                    )
+                )
+            else:
+                # this is a dup, we still want to update the lastObserved timestamp
+                system_metadata = existing_system_metadata[key] or {}
+                system_metadata["lastObserved"] = writeable.systemMetadata.lastObserved
+                for name, value in zip(
+                    _ASPECT_UPDATE_COLUMNS,
+                    [
+                        writeable.entityUrn,
+                        writeable.aspectName,
+                        existing[key][0],
+                        json.dumps(system_metadata),
+                    ],
+                ):
+                    updates[name].append(value)
+
+        if inserts["urn"]:
+            self.duckdb_client.execute(
+                f"INSERT INTO metadata_aspect_v2 {_json_batch_query(_ASPECT_COLUMNS)}",
+                [json.dumps(inserts)],
+            )
+        if updates["urn"]:
+            self.duckdb_client.execute(
+                "UPDATE metadata_aspect_v2 SET metadata = u.metadata, system_metadata = u.system_metadata "
+                f"FROM ({_json_batch_query(_ASPECT_UPDATE_COLUMNS)}) u "
+                "WHERE metadata_aspect_v2.urn = u.urn AND metadata_aspect_v2.aspect_name = u.aspect_name "
+                "AND metadata_aspect_v2.version = 0",
+                [json.dumps(updates)],
+            )
+        self._index_for_search(searchables)
+
+    def _index_for_search(
+        self, aspects: Iterable[_SearchableAspect], rebuild: bool = False
+    ) -> None:
+        """Indexes aspects for free text search. The caller is responsible for committing.
+
+        The tokens of each urn are only indexed once, since they never change. When
+        rebuilding, the index is assumed to contain none of the given urns.
+        """
+        batch: Dict[str, List[Any]] = {name: [] for name in _SEARCH_TOKEN_COLUMNS}
+        replaced_urns_by_aspect: Dict[str, List[str]] = defaultdict(list)
+        vocab: Set[str] = set()
+
+        def add_tokens(urn: str, aspect_name: str, tokens: Set[str]) -> None:
+            if tokens:
+                batch["urn"].append(urn)
+                batch["aspect_name"].append(aspect_name)
+                batch["tokens"].append(list(tokens))
+                vocab.update(tokens)
+
+        urns: Set[str] = set()
+        for aspect in aspects:
+            urns.add(aspect.urn)
+            if aspect.replace:
+                replaced_urns_by_aspect[aspect.aspect_name].append(aspect.urn)
+            add_tokens(
+                aspect.urn, aspect.aspect_name, _get_search_tokens(aspect.aspect_json)
+            )
+        if not rebuild and urns:
+            urn_filter, params = _in_filter("metadata_search_token", "urn", list(urns))
+            for urn, aspect_name in self.duckdb_client.execute(
+                f"SELECT DISTINCT urn, aspect_name FROM metadata_search_token WHERE {urn_filter}",
+                params,
+            ).fetchall():
+                if aspect_name == _URN_SEARCH_ASPECT:
+                    urns.discard(urn)
+        for urn in urns:
+            add_tokens(urn, _URN_SEARCH_ASPECT, _tokenize(urn))
+
+        for aspect_name, replaced_urns in replaced_urns_by_aspect.items():
+            urn_filter, params = _in_filter(
+                "metadata_search_token", "urn", replaced_urns
+            )
+            self.duckdb_client.execute(
+                f"DELETE FROM metadata_search_token WHERE {urn_filter} AND aspect_name = ?",
+                [*params, aspect_name],
+            )
+        if batch["urn"]:
+            self.duckdb_client.execute(
+                "INSERT INTO metadata_search_token SELECT unnest(tokens), urn, aspect_name "
+                f"FROM ({_json_batch_query(_SEARCH_TOKEN_COLUMNS)})",
+                [json.dumps(batch)],
+            )
+            token_filter, params = _in_filter(
+                "metadata_search_vocab", "token", list(vocab)
+            )
+            vocab.difference_update(
+                r[0]
+                for r in self.duckdb_client.execute(
+                    f"SELECT token FROM metadata_search_vocab WHERE {token_filter}",
+                    params,
+                ).fetchall()
+            )
+            if vocab:
+                self.duckdb_client.execute(
+                    "INSERT INTO metadata_search_vocab "
+                    "SELECT unnest(from_json(?, '[\"VARCHAR\"]'))",
+                    [json.dumps(list(vocab))],
+                )
+
+    def _rebuild_search_index(self) -> None:
+        """Rebuilds the search index from scratch. The caller is responsible for committing."""
+        self.duckdb_client.execute("DELETE FROM metadata_search_token")
+        self.duckdb_client.execute("DELETE FROM metadata_search_vocab")
+
+        # Read through a separate cursor, so that the results can be streamed while indexing.
+        cursor = self.duckdb_client.cursor()
+        try:
+            cursor.execute(
+                "SELECT urn, aspect_name, metadata FROM metadata_aspect_v2 WHERE version = 0 ORDER BY urn"
+            )
+            aspects: List[_SearchableAspect] = []
+            while True:
+                rows = cursor.fetchmany(_SEARCH_REBUILD_BATCH_SIZE)
+                # Batches must not split an urn, so that its urn tokens are indexed exactly once.
+                if aspects and (not rows or rows[0][0] != aspects[-1].urn):
+                    self._index_for_search(aspects, rebuild=True)
+                    aspects = []
+                if not rows:
+                    break
+                aspects.extend(
+                    _SearchableAspect(
+                        urn, aspect_name, json.loads(metadata), replace=False
+                    )
+                    for urn, aspect_name, metadata in rows
+                )
+        finally:
+            cursor.close()
+
     def list_ids(self) -> Iterable[str]:
         self.duckdb_client.execute("SELECT distinct(urn) from metadata_aspect_v2")
         for row in self.duckdb_client.fetchall():
@@ -233,7 +755,8 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         as_of: Optional[int] = None,
         details: Optional[bool] = False,
     ) -> Optional[Dict[str, Union[str, dict, _Aspect]]]:
-        base_query = "SELECT urn, aspect_name, metadata, system_metadata from metadata_aspect_v2 WHERE urn = ?"
+        urn_filter, params = _in_filter("metadata_aspect_v2", "urn", [id])
+        base_query = f"SELECT urn, aspect_name, metadata, system_metadata from metadata_aspect_v2 WHERE {urn_filter}"
         if aspects:
             base_query += (
                 " AND aspect_name IN (" + ",".join([f"'{x}'" for x in aspects]) + ")"
@@ -243,7 +766,7 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         else:
             base_query += " AND version = 0"
 
-        self.duckdb_client.execute(base_query, [id])
+        self.duckdb_client.execute(base_query, params)
         results = self.duckdb_client.fetchall()
         result_map: Dict[str, Union[str, dict, _Aspect]] = {}
         for r in results:
@@ -273,7 +796,9 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         aspects: List[str] = [],
         snippet: bool = True,
     ) -> Iterable[Searchable]:
-        if flavor == SearchFlavor.FREE_TEXT:
+        if flavor == SearchFlavor.FREE_TEXT and self._has_search_index:
+            yield from self._search_free_text(query, aspects, snippet)
+        elif flavor == SearchFlavor.FREE_TEXT:
             base_query = f"SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE '%{query}%' UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 where metadata->>'$.name' ILIKE '%{query}%'"
             for r in self.duckdb_client.execute(base_query).fetchall():
                 yield Searchable(
@@ -288,6 +813,102 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         else:
             raise Exception(f"Unhandled search flavor {flavor}")
 
+    def _search_free_text(
+        self, query: str, aspects: List[str], snippet: bool
+    ) -> Iterable[Searchable]:
+        """Finds the entities that match every token of the query, using the search index.
+
+        Each query token also matches the indexed tokens it is a prefix of.
+        """
+        token_groups: List[List[str]] = []
+        for query_token in _tokenize(query):
+            tokens = [
+                r[0]
+                for r in self.duckdb_client.execute(
+                    "SELECT token FROM metadata_search_vocab WHERE starts_with(token, ?) ORDER BY token LIMIT ?",
+                    [query_token, _SEARCH_MAX_PREFIX_EXPANSIONS],
+                ).fetchall()
+            ]
+            if not tokens:
+                return
+            token_groups.append(tokens)
+        if not token_groups:
+            return
+
+        # Fetching all postings of a common token is slow, so every query token is probed
+        # first. Tokens with many postings are then only checked against the candidates
+        # matched by the most selective one.
+        probes = [
+            self._get_search_postings(tokens, limit=_SEARCH_CANDIDATE_LIMIT)
+            for tokens in token_groups
+        ]
+        # urn -> names of the aspects that matched
+        matches: Optional[Dict[str, Set[str]]] = None
+        for tokens, postings in sorted(
+            zip(token_groups, probes), key=lambda group: len(group[1])
+        ):
+            if len(postings) >= _SEARCH_CANDIDATE_LIMIT:
+                postings = self._get_search_postings(
+                    tokens, urns=list(matches) if matches is not None else None
+                )
+            token_matches: Dict[str, Set[str]] = defaultdict(set)
+            for urn, aspect_name in postings:
+                # Filtering on the aspect name in the query would stop DuckDB from using the token index.
+                if aspects and aspect_name not in aspects:
+                    continue
+                if matches is None or urn in matches:
+                    token_matches[urn].add(aspect_name)
+            if matches is not None:
+                for urn, aspect_names in token_matches.items():
+                    aspect_names.update(matches[urn])
+            matches = token_matches
+            if not matches:
+                return
+        assert matches is not None
+
+        urns = sorted(matches)
+        for i in range(0, len(urns), _SEARCH_SNIPPET_BATCH_SIZE):
+            urn_batch = urns[i : i + _SEARCH_SNIPPET_BATCH_SIZE]
+            snippets: Dict[Tuple[str, str], str] = {}
+            if snippet:
+                urn_filter, params = _in_filter("metadata_aspect_v2", "urn", urn_batch)
+                snippets = {
+                    (urn, aspect_name): metadata
+                    for urn, aspect_name, metadata in self.duckdb_client.execute(
+                        "SELECT urn, aspect_name, metadata FROM metadata_aspect_v2 "
+                        f"WHERE {urn_filter} AND version = 0",
+                        params,
+                    ).fetchall()
+                }
+            for urn in urn_batch:
+                for aspect_name in sorted(matches[urn]):
+                    yield Searchable(
+                        id=urn,
+                        aspect=aspect_name,
+                        snippet=snippets.get((urn, aspect_name)),
+                    )
+
+    def _get_search_postings(
+        self,
+        tokens: List[str],
+        urns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Any, ...]]:
+        """Returns the (urn, aspect name) pairs indexed under any of the given tokens."""
+        conditions = [f"token IN ({','.join('?' for _ in tokens)})"]
+        params: List[Any] = [*tokens]
+        if urns is not None:
+            urn_filter, urn_params = _in_filter("metadata_search_token", "urn", urns)
+            conditions.insert(0, urn_filter)
+            params[:0] = urn_params
+        query = (
+            "SELECT urn, aspect_name FROM metadata_search_token "
+            f"WHERE {' AND '.join(conditions)}"
+        )
+        if limit is not None:
+            query += f" LIMIT {limit}"
+        return self.duckdb_client.execute(query, params).fetchall()
+
     def remove_edge(self, src: str, relnship: str) -> None:
         try:
             self.duckdb_client.execute(
@@ -310,6 +931,12 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         src_id = str(src)
         dst_id = str(dst)
         logger.debug(f"Add edge {src_id},{dst_id},{relnship},{dst_label}")
+        if self._edge_buffer is not None:
+            self._edge_buffer.add(src_id, relnship, dst_id, dst_label, remove_existing)
+            if len(self._edge_buffer) >= _EDGE_BUFFER_MAX_SIZE:
+                self._flush_edges()
+            return
+
         try:
             query = "SELECT * FROM metadata_edge_v2 WHERE src_id = ? AND relnship = ?"
             params = [src_id, relnship]
@@ -360,6 +987,58 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
 
         self.duckdb_client.commit()
 
+    @contextlib.contextmanager
+    def _buffered_edges(self) -> Iterator[None]:
+        """Buffers add_edge calls and writes them out when the block exits.
+
+        The caller is responsible for committing.
+        """
+        self._edge_buffer = _EdgeBuffer()
+        try:
+            yield
+            self._flush_edges()
+        finally:
+            self._edge_buffer = None
+
+    def _flush_edges(self) -> None:
+        assert self._edge_buffer is not None
+        if not self._edge_buffer:
+            return
+
+        batch: Dict[str, List[Any]] = {name: [] for name in _EDGE_COLUMNS}
+        for (src_id, relnship), (replace, dsts) in self._edge_buffer.edges.items():
+            for dst_id, dst_label in dsts.items():
+                batch["src_id"].append(src_id)
+                batch["relnship"].append(relnship)
+                batch["dst_id"].append(dst_id)
+                batch["dst_label"].append(dst_label)
+                batch["replace"].append(replace)
+        self._edge_buffer.edges.clear()
+
+        self.duckdb_client.execute(
+            f"CREATE OR REPLACE TEMP TABLE edge_batch AS {_json_batch_query(_EDGE_COLUMNS)}",
+            [json.dumps(batch)],
+        )
+        # DuckDB rejects re-inserting a key of the unique index that was deleted in the
+        # same transaction, so edges that already exist are updated in place instead.
+        self.duckdb_client.execute(
+            "DELETE FROM metadata_edge_v2 USING edge_batch "
+            "WHERE metadata_edge_v2.src_id = edge_batch.src_id AND metadata_edge_v2.relnship = edge_batch.relnship "
+            "AND edge_batch.replace AND metadata_edge_v2.dst_id <> edge_batch.dst_id"
+        )
+        self.duckdb_client.execute(
+            "UPDATE metadata_edge_v2 SET dst_label = edge_batch.dst_label FROM edge_batch "
+            "WHERE metadata_edge_v2.src_id = edge_batch.src_id AND metadata_edge_v2.relnship = edge_batch.relnship "
+            "AND metadata_edge_v2.dst_id = edge_batch.dst_id "
+            "AND metadata_edge_v2.dst_label IS DISTINCT FROM edge_batch.dst_label"
+        )
+        self.duckdb_client.execute(
+            "INSERT INTO metadata_edge_v2 SELECT src_id, relnship, dst_id, dst_label FROM edge_batch "
+            "WHERE NOT EXISTS (SELECT 1 FROM metadata_edge_v2 e WHERE e.src_id = edge_batch.src_id "
+            "AND e.relnship = edge_batch.relnship AND e.dst_id = edge_batch.dst_id)"
+        )
+        self.duckdb_client.execute("DROP TABLE edge_batch")
+
     def ls(self, path: str) -> List[Browseable]:
         def get_id_for_name(
             name: str,
@@ -462,14 +1141,27 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             ]
 
     def reindex(self) -> None:
+        self._reindex(search=True)
+
+    def _reindex(self, search: bool) -> None:
+        # Committed separately, since the rebuild re-inserts most of the same keys.
         self.duckdb_client.execute("DELETE FROM metadata_edge_v2")
+        self.duckdb_client.begin()
+        try:
+            if search:
+                self._rebuild_search_index()
+            with self._buffered_edges():
+                for urn_aspect_dict in self.get_all_entities(typed=True):
+                    for urn, aspect_map in urn_aspect_dict.items():
+                        for aspect_name, aspect_value in aspect_map.items():
+                            assert isinstance(aspect_value, _Aspect)
+                            self.post_update_hook(urn, aspect_name, aspect_value)
+                        self.global_post_update_hook(urn, aspect_map)  # type: ignore
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
         self.duckdb_client.commit()
-        for urn_aspect_dict in self.get_all_entities(typed=True):
-            for urn, aspect_map in urn_aspect_dict.items():
-                for aspect_name, aspect_value in aspect_map.items():
-                    assert isinstance(aspect_value, _Aspect)
-                    self.post_update_hook(urn, aspect_name, aspect_value)
-                self.global_post_update_hook(urn, aspect_map)  # type: ignore
+        self._edges_stale = False
 
     def get_all_entities(
         self, typed: bool = False
@@ -528,7 +1220,9 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             yield mcp
 
     def close(self) -> None:
-        self.reindex()
+        # The search index is maintained on every write, so only the edges need rebuilding.
+        if self._edges_stale:
+            self._reindex(search=False)
         self.duckdb_client.close()
 
     def get_category_from_platform(self, data_platform_urn: DataPlatformUrn) -> Urn:
@@ -70,6 +70,19 @@ class DataHubLiteLocal(Generic[LiteConfig], Closeable, metaclass=ABCMeta):
     ) -> None:
         pass
 
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        """Writes many records at once. Implementations can override this with a faster bulk path."""
+        for record in records:
+            self.write(record)
+
     @abstractmethod
     def list_ids(self) -> Iterable[str]:
         pass
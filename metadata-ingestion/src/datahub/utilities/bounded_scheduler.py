@@ -0,0 +1,238 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class TaskTimeoutError(TimeoutError):
+    """Returned in place of the result of a task that ran for longer than its timeout."""
+
+
+@dataclass
+class _Task(Generic[_T]):
+    index: int
+    item: _T
+    cost: float
+    deadline: Optional[float]
+
+
+def run_with_bounded_concurrency(
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: int,
+    cost_fn: Optional[Callable[[_T], float]] = None,
+    max_in_flight_cost: Optional[float] = None,
+    ordered: bool = True,
+    ordering_window: Optional[int] = None,
+    timeout: Optional[float] = None,
+    on_timeout: Optional[Callable[[_T], None]] = None,
+) -> Iterator[Tuple[_T, Union[_R, Exception]]]:
+    """Runs fn on each item in a thread pool, and yields (item, result) pairs.
+
+    Items are read from the iterable lazily, and only submitted once there is
+    capacity for them, so that only a bounded number of tasks and results are kept
+    in memory at once. If fn raises an exception, it is returned in place of the result.
+
+    If ordered is set, results are yielded in the same order as the items, and at
+    most ordering_window tasks (2 * max_workers by default) are started ahead of the
+    oldest task that has not been yielded yet. Otherwise, results are yielded as soon
+    as the tasks finish.
+
+    If max_in_flight_cost is set, new tasks are held back while the total cost_fn of
+    the running tasks would go above it. A task that costs more than the limit on its
+    own still runs, but only once nothing else is running.
+
+    Tasks that run for longer than timeout seconds get a TaskTimeoutError as their
+    result, and on_timeout is called with their item. Python threads cannot be
+    interrupted, so the task keeps its worker thread until it finishes, and its actual
+    result is discarded. on_timeout should make the task stop early, because the
+    iterator waits for all of its tasks to finish before it is exhausted or closed.
+    This way, the task doesn't outlive any context that the caller set up for it.
+    If the caller stops iterating early, the tasks that have not started yet are
+    cancelled.
+    """
+
+    scheduler = _BoundedScheduler(
+        fn,
+        items,
+        max_workers=max_workers,
+        cost_fn=cost_fn,
+        max_in_flight_cost=max_in_flight_cost,
+        ordering_window=(
+            (2 * max_workers if ordering_window is None else ordering_window)
+            if ordered
+            else None
+        ),
+        timeout=timeout,
+        on_timeout=on_timeout,
+    )
+    return scheduler.run()
+
+
+class _BoundedScheduler(Generic[_T, _R]):
+    def __init__(
+        self,
+        fn: Callable[[_T], _R],
+        items: Iterable[_T],
+        max_workers: int,
+        cost_fn: Optional[Callable[[_T], float]],
+        max_in_flight_cost: Optional[float],
+        ordering_window: Optional[int],
+        timeout: Optional[float],
+        on_timeout: Optional[Callable[[_T], None]] = None,
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+        if ordering_window is not None and ordering_window <= 0:
+            raise ValueError("ordering_window must be > 0")
+
+        self.fn = fn
+        self.max_workers = max_workers
+        self.cost_fn = cost_fn
+        self.max_in_flight_cost = max_in_flight_cost
+        self.ordering_window = ordering_window
+        self.timeout = timeout
+        self.on_timeout = on_timeout
+
+        self._items = iter(items)
+        self._next_task: Optional[_Task[_T]] = None
+        self._items_exhausted = False
+        self._num_submitted = 0
+
+        self._running: Dict["Future[_R]", _Task[_T]] = {}
+        self._running_cost = 0.0
+        # Tasks that timed out, but are still occupying a worker thread.
+        self._abandoned: Set["Future[_R]"] = set()
+        # Results that are waiting for the results before them, if ordered.
+        self._completed: Dict[int, Tuple[_T, Union[_R, Exception]]] = {}
+        self._next_index_to_yield = 0
+
+    def run(self) -> Iterator[Tuple[_T, Union[_R, Exception]]]:
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while True:
+                self._submit_tasks(executor)
+                if self.ordering_window is not None:
+                    yield from self._pop_ordered_results()
+                    # Yielding may have made room for more tasks.
+                    if self._can_submit_next_task():
+                        continue
+
+                if self._peek_next_task() is None and self._abandoned.issuperset(
+                    self._running
+                ):
+                    break
+
+                for task, result in self._wait_for_results():
+                    if self.ordering_window is not None:
+                        self._completed[task.index] = (task.item, result)
+                    else:
+                        yield task.item, result
+        finally:
+            for future in self._running:
+                future.cancel()
+            # Abandoned tasks are waited for as well, so that none of them is still
+            # running once the caller moves on.
+            executor.shutdown(wait=True)
+
+    def _peek_next_task(self) -> Optional[_Task[_T]]:
+        if self._next_task is None and not self._items_exhausted:
+            try:
+                item = next(self._items)
+            except StopIteration:
+                self._items_exhausted = True
+            else:
+                cost = self.cost_fn(item) if self.cost_fn else 0.0
+                self._next_task = _Task(self._num_submitted, item, cost, None)
+        return self._next_task
+
+    def _can_submit_next_task(self) -> bool:
+        task = self._peek_next_task()
+        if task is None or len(self._running) >= self.max_workers:
+            return False
+        if (
+            self.ordering_window is not None
+            and task.index - self._next_index_to_yield >= self.ordering_window
+        ):
+            return False
+        if self.max_in_flight_cost is not None and self._running:
+            return self._running_cost + task.cost <= self.max_in_flight_cost
+        return True
+
+    def _submit_tasks(self, executor: ThreadPoolExecutor) -> None:
+        while self._can_submit_next_task():
+            task = self._next_task
+            assert task is not None
+            if self.timeout is not None:
+                task.deadline = time.monotonic() + self.timeout
+            self._running[executor.submit(self.fn, task.item)] = task
+            self._running_cost += task.cost
+            self._num_submitted += 1
+            self._next_task = None
+
+    def _pop_ordered_results(self) -> Iterator[Tuple[_T, Union[_R, Exception]]]:
+        while self._next_index_to_yield in self._completed:
+            yield self._completed.pop(self._next_index_to_yield)
+            self._next_index_to_yield += 1
+
+    def _wait_for_results(self) -> List[Tuple[_Task[_T], Union[_R, Exception]]]:
+        deadlines = [
+            task.deadline
+            for future, task in self._running.items()
+            if task.deadline is not None and future not in self._abandoned
+        ]
+        done, _ = wait(
+            list(self._running.keys()),
+            timeout=max(0.0, min(deadlines) - time.monotonic()) if deadlines else None,
+            return_when=FIRST_COMPLETED,
+        )
+
+        results: List[Tuple[_Task[_T], Union[_R, Exception]]] = []
+        for future in done:
+            task = self._running.pop(future)
+            self._running_cost -= task.cost
+            if future in self._abandoned:
+                self._abandoned.remove(future)
+                continue
+            try:
+                results.append((task, future.result()))
+            except Exception as e:
+                results.append((task, e))
+
+        now = time.monotonic()
+        for future, task in self._running.items():
+            if (
+                task.deadline is not None
+                and task.deadline <= now
+                and future not in self._abandoned
+            ):
+                self._abandoned.add(future)
+                if self.on_timeout is not None:
+                    self.on_timeout(task.item)
+                results.append(
+                    (
+                        task,
+                        TaskTimeoutError(
+                            f"Task timed out after {self.timeout} seconds"
+                        ),
+                    )
+                )
+        return results
@@ -1,4 +1,5 @@
 import collections
+import contextlib
 import gzip
 import logging
 import pathlib
@@ -14,8 +15,10 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
+    Mapping,
     MutableMapping,
     Optional,
     OrderedDict,
@@ -34,6 +37,20 @@ _DEFAULT_FILE_NAME = "sqlite.db"
 _DEFAULT_TABLE_NAME = "data"
 _DEFAULT_MEMORY_CACHE_MAX_SIZE = 2000
 _DEFAULT_MEMORY_CACHE_EVICTION_BATCH_SIZE = 200
+# Keep the number of bound parameters per statement below SQLite's default limit of 999.
+_BULK_QUERY_BATCH_SIZE = 500
+_BULK_WRITE_BATCH_SIZE = 10_000
+
+# These settings are optimized for performance.
+# See https://www.sqlite.org/pragma.html for more information.
+# Because we're only using these dbs to offload data from memory, we don't need
+# to worry about data integrity too much.
+_DEFAULT_PRAGMAS: Dict[str, Union[int, str]] = {
+    "locking_mode": "EXCLUSIVE",
+    "synchronous": "OFF",
+    "journal_mode": "MEMORY",
+    "journal_size_limit": 100 * 1024 * 1024,  # 100MB
+}
 
 # https://docs.python.org/3/library/sqlite3.html#sqlite-and-python-types
 # Datetimes get converted to strings
@@ -59,26 +76,46 @@ class ConnectionWrapper:
 
     _temp_directory: Optional[str]
 
-    def __init__(self, filename: Optional[pathlib.Path] = None):
+    def __init__(
+        self,
+        filename: Optional[pathlib.Path] = None,
+        pragmas: Optional[Dict[str, Union[int, str]]] = None,
+        read_only: bool = False,
+    ):
+        """
+        Args:
+            filename: The database file. Defaults to a file in a new temporary directory.
+            pragmas: Overrides for the default SQLite pragmas, e.g.
+                `{"journal_mode": "WAL", "mmap_size": 2**30, "page_size": 16384}`.
+            read_only: Open an existing database file in read-only mode. Many processes
+                can read the same file at once, as long as none of them writes to it.
+        """
         self._temp_directory = None
 
         # Warning: If filename is provided, the file will not be automatically cleaned up.
         if not filename:
+            assert not read_only, "read_only requires an existing database file"
             self._temp_directory = tempfile.mkdtemp()
             filename = pathlib.Path(self._temp_directory) / _DEFAULT_FILE_NAME
 
-        self.conn = sqlite3.connect(filename, isolation_level=None)
+        if read_only:
+            self.conn = sqlite3.connect(
+                f"{pathlib.Path(filename).absolute().as_uri()}?mode=ro",
+                uri=True,
+                isolation_level=None,
+            )
+        else:
+            self.conn = sqlite3.connect(filename, isolation_level=None)
         self.conn.row_factory = sqlite3.Row
         self.filename = filename
 
-        # These settings are optimized for performance.
-        # See https://www.sqlite.org/pragma.html for more information.
-        # Because we're only using these dbs to offload data from memory, we don't need
-        # to worry about data integrity too much.
-        self.conn.execute('PRAGMA locking_mode = "EXCLUSIVE"')
-        self.conn.execute('PRAGMA synchronous = "OFF"')
-        self.conn.execute('PRAGMA journal_mode = "MEMORY"')
-        self.conn.execute(f"PRAGMA journal_size_limit = {100 * 1024 * 1024}")  # 100MB
+        all_pragmas = {**_DEFAULT_PRAGMAS, **(pragmas or {})}
+        # The page size can't be changed once the journal mode is WAL.
+        for name in sorted(all_pragmas, key=lambda name: name != "page_size"):
+            value = all_pragmas[name]
+            if isinstance(value, str):
+                value = f'"{value}"'
+            self.conn.execute(f"PRAGMA {name} = {value}")
 
     @property
     def allow_table_name_reuse(self) -> bool:
@@ -99,6 +136,20 @@ class ConnectionWrapper:
     ) -> sqlite3.Cursor:
         return self.conn.executemany(sql, parameters)
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Runs the enclosed statements in a single transaction, unless one is already open."""
+        if self.conn.in_transaction:
+            yield
+            return
+        self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
     def close(self) -> None:
         self.conn.close()
         if self._temp_directory:
@@ -167,6 +218,8 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
     cache_eviction_batch_size: int = _DEFAULT_MEMORY_CACHE_EVICTION_BATCH_SIZE
     delay_index_creation: bool = False
     should_compress_value: bool = False
+    # Overrides for the default SQLite pragmas. Ignored if shared_connection is set.
+    pragmas: Optional[Dict[str, Union[int, str]]] = None
 
     _conn: ConnectionWrapper = field(init=False, repr=False)
     indexes_created: bool = field(init=False, default=False)
@@ -188,7 +241,7 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         if self.shared_connection:
             self._conn = self.shared_connection
         else:
-            self._conn = ConnectionWrapper()
+            self._conn = ConnectionWrapper(pragmas=self.pragmas)
 
         # We keep a small cache in memory to avoid having to serialize/deserialize
         # data from the database too often. We use an OrderedDict to build
@@ -218,9 +271,10 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         if self.indexes_created:
             return
         # The key column will automatically be indexed, but we need indexes for the extra columns.
+        if_not_exists = "IF NOT EXISTS" if self._conn.allow_table_name_reuse else ""
         for column_name in self.extra_columns.keys():
             self._conn.execute(
-                f"CREATE INDEX {self.tablename}_{column_name} ON {self.tablename} ({column_name})"
+                f"CREATE INDEX {if_not_exists} {self.tablename}_{column_name} ON {self.tablename} ({column_name})"
             )
         self.indexes_created = True
 
@@ -239,12 +293,24 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         for _ in range(num_items_to_prune):
             key, (value, dirty) = self._active_object_cache.popitem(last=False)
             if dirty:
-                values = [key, self.serializer(value)]
-                for column_serializer in self.extra_columns.values():
-                    values.append(column_serializer(value))
-                items_to_write.append(tuple(values))
+                items_to_write.append(self._serialize_row(key, value))
 
         if items_to_write:
+            self._write_rows(items_to_write)
+
+    def _serialize_row(self, key: str, value: _VT) -> Tuple[SqliteValue, ...]:
+        return (
+            key,
+            self.serializer(value),
+            *[
+                column_serializer(value)
+                for column_serializer in self.extra_columns.values()
+            ],
+        )
+
+    def _write_rows(self, rows: List[Tuple[SqliteValue, ...]]) -> None:
+        # In autocommit mode, executemany would commit after every row.
+        with self._conn.transaction():
             self._conn.executemany(
                 f"""INSERT OR REPLACE INTO {self.tablename} (
                     key,
@@ -252,7 +318,7 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
                     {''.join(f', {column_name}' for column_name in self.extra_columns.keys())}
                 )
                 VALUES ({', '.join(['?'] *(2 + len(self.extra_columns)))})""",
-                items_to_write,
+                rows,
             )
 
     def flush(self) -> None:
@@ -274,6 +340,55 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         self._add_to_cache(key, deserialized_result, False)
         return deserialized_result
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, _VT]:
+        """
+        Look up many keys at once, using one query per batch of keys.
+
+        Keys that don't exist are left out of the result. Unlike `__getitem__`, the values
+        that are read from the database are not added to the cache, so modifications to
+        them are not persisted unless they are written back.
+        """
+        result: Dict[str, _VT] = {}
+        missing_keys: List[str] = []
+        for key in keys:
+            if key in self._active_object_cache:
+                result[key] = self._active_object_cache[key][0]
+            else:
+                missing_keys.append(key)
+
+        for i in range(0, len(missing_keys), _BULK_QUERY_BATCH_SIZE):
+            batch = missing_keys[i : i + _BULK_QUERY_BATCH_SIZE]
+            cursor = self._conn.execute(
+                f"SELECT key, value FROM {self.tablename} WHERE key IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for row in cursor:
+                result[row[0]] = self.deserializer(row[1])
+        return result
+
+    def update_many(
+        self, items: Union[Mapping[str, _VT], Iterable[Tuple[str, _VT]]]
+    ) -> None:
+        """
+        Write many items at once, bypassing the cache.
+
+        This is much faster than setting the items one by one when there are more items
+        than fit in the cache, since each item is serialized and written exactly once.
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+
+        rows: List[Tuple[SqliteValue, ...]] = []
+        for key, value in items:
+            # The cached value, dirty or not, is outdated now.
+            self._active_object_cache.pop(key, None)
+            rows.append(self._serialize_row(key, value))
+            if len(rows) >= _BULK_WRITE_BATCH_SIZE:
+                self._write_rows(rows)
+                rows = []
+        if rows:
+            self._write_rows(rows)
+
     def __setitem__(self, key: str, value: _VT) -> None:
         self._add_to_cache(key, value, True)
 
@@ -327,6 +442,46 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         for row in cursor:
             yield row[0], self.deserializer(row[1])
 
+    def copy_to_file(self, filename: pathlib.Path) -> None:
+        """
+        Write a snapshot of the whole underlying database to a new file.
+
+        This flushes the cache first. It's useful for sharing the data with other
+        processes, which can't open the original file while this one holds its lock.
+        """
+        self.flush()
+        target = sqlite3.connect(filename)
+        try:
+            self._conn.conn.backup(target)
+        finally:
+            target.close()
+
+    def items_in_range(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Iterator[Tuple[str, _VT]]:
+        """
+        Return a snapshot of the items whose keys are in the range [start, end), ordered by key.
+
+        Flushes the cache, and then uses the primary key index for the range scan.
+        """
+        self.flush()
+        conditions = []
+        params = []
+        if start is not None:
+            conditions.append("key >= ?")
+            params.append(start)
+        if end is not None:
+            conditions.append("key < ?")
+            params.append(end)
+        sql = f"SELECT key, value FROM {self.tablename}"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += " ORDER BY key"
+
+        cursor = self._conn.execute(sql, params)
+        for row in cursor:
+            yield row[0], self.deserializer(row[1])
+
     def __len__(self) -> int:
         cursor = self._conn.execute(
             # Binding a list of values in SQLite: https://stackoverflow.com/a/1310001/5004662.
@@ -0,0 +1,174 @@
+import gzip
+import io
+import json
+import os
+import pathlib
+import zlib
+from typing import Any, Iterator, Optional, Union
+
+from datahub.configuration.common import ConfigurationError
+
+# The format of the JSON Lines metadata files that the file sink writes and the
+# file source reads.
+#
+# The last line of a JSON Lines file written by the file sink is a footer of the
+# form {"datahubFileFooter": {"numRecords": 123}}. Readers use it to get an exact
+# record count without scanning the whole file. In compressed files, the footer
+# is written as its own gzip member / zstd frame so that it can be decoded from
+# the tail of the file alone.
+JSONL_FOOTER_KEY = "datahubFileFooter"
+
+JSONL_EXTENSIONS = {".jsonl", ".ndjson"}
+
+GZIP_MAGIC = b"\x1f\x8b\x08"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+_GZIP_COMPRESSION_LEVEL = 6
+
+# The JSON Lines footer is tiny, so it's always within the last few KB of the file.
+_JSONL_FOOTER_MAX_SIZE = 4096
+
+
+def import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ConfigurationError(
+            "zstd compression requires the zstandard package. Install it with `pip install zstandard`."
+        ) from e
+    return zstandard
+
+
+def _make_compressobj(compression: str) -> Any:
+    if compression == "gzip":
+        return zlib.compressobj(
+            _GZIP_COMPRESSION_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+    else:
+        assert compression == "zstd"
+        return import_zstandard().ZstdCompressor().compressobj()
+
+
+class JsonLinesWriter:
+    """Writes records as newline-delimited JSON, optionally compressed.
+
+    Records are serialized compactly and written out as they come in, so memory
+    usage doesn't grow with the number of records. A footer with the record
+    count is appended on close.
+    """
+
+    def __init__(self, path: pathlib.Path, compression: Optional[str] = None):
+        self._compressobj = _make_compressobj(compression) if compression else None
+        self._compression = compression
+        self._file = path.open("wb")
+        self.num_records = 0
+
+    def _write(self, data: bytes) -> None:
+        if self._compressobj is not None:
+            data = self._compressobj.compress(data)
+        self._file.write(data)
+
+    def write(self, obj: Any) -> None:
+        self._write(json.dumps(obj).encode() + b"\n")
+        self.num_records += 1
+
+    def close(self) -> None:
+        footer = json.dumps(
+            {JSONL_FOOTER_KEY: {"numRecords": self.num_records}}
+        ).encode()
+        if self._compression and self._compressobj is not None:
+            self._file.write(self._compressobj.flush())
+            footer_compressobj = _make_compressobj(self._compression)
+            self._file.write(
+                footer_compressobj.compress(footer + b"\n") + footer_compressobj.flush()
+            )
+        else:
+            self._file.write(footer + b"\n")
+        self._file.close()
+
+
+def detect_compression(path: Union[str, pathlib.Path]) -> Optional[str]:
+    with open(path, "rb") as f:
+        magic = f.read(len(ZSTD_MAGIC))
+    if magic.startswith(GZIP_MAGIC):
+        return "gzip"
+    elif magic.startswith(ZSTD_MAGIC):
+        return "zstd"
+    return None
+
+
+def is_jsonl_file(path: Union[str, pathlib.Path]) -> bool:
+    # We only ever write JSON Lines files compressed, so any compressed file is
+    # assumed to be one. Otherwise, rely on the extension or the footer.
+    return (
+        pathlib.Path(path).suffix.lower() in JSONL_EXTENSIONS
+        or detect_compression(path) is not None
+        or read_jsonl_footer(path, None) is not None
+    )
+
+
+def is_jsonl_footer(line: bytes) -> bool:
+    # Cheap check so that we don't need to fully parse every line twice.
+    return line.lstrip().startswith(b'{"%s"' % JSONL_FOOTER_KEY.encode())
+
+
+def open_jsonl_file(
+    path: Union[str, pathlib.Path], compression: Optional[str]
+) -> io.BufferedIOBase:
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    elif compression == "zstd":
+        zstandard = import_zstandard()
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(
+                open(path, "rb"), read_across_frames=True
+            )
+        )
+    return open(path, "rb")
+
+
+def iterate_jsonl_file(path: Union[str, pathlib.Path]) -> Iterator[Any]:
+    """Yields the records of a JSON Lines file, which may be compressed."""
+    with open_jsonl_file(path, detect_compression(path)) as f:
+        for line in f:
+            if line.strip() and not is_jsonl_footer(line):
+                yield json.loads(line)
+
+
+def _decompress_footer(data: bytes, compression: Optional[str]) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(data)
+    elif compression == "zstd":
+        return import_zstandard().ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+def read_jsonl_footer(
+    path: Union[str, pathlib.Path], compression: Optional[str]
+) -> Optional[int]:
+    """Returns the record count from the footer of a JSON Lines file, if it has one."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - _JSONL_FOOTER_MAX_SIZE))
+        tail = f.read()
+
+    footer: Optional[bytes] = None
+    if compression is None:
+        footer = tail.rstrip().rsplit(b"\n", 1)[-1]
+    else:
+        # The footer is in the last gzip member / zstd frame, so try decoding
+        # from each occurrence of the magic bytes, starting from the end.
+        magic = GZIP_MAGIC if compression == "gzip" else ZSTD_MAGIC
+        start = tail.rfind(magic)
+        while start >= 0 and footer is None:
+            try:
+                footer = _decompress_footer(tail[start:], compression)
+            except Exception:
+                start = tail.rfind(magic, 0, start)
+
+    if footer is None or not is_jsonl_footer(footer):
+        return None
+    try:
+        return int(json.loads(footer)[JSONL_FOOTER_KEY]["numRecords"])
+    except (ValueError, KeyError, TypeError):
+        return None
@@ -0,0 +1,176 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Generic, List, Optional, TypeVar
+
+from datahub.ingestion.api.closeable import Closeable
+
+logger = logging.getLogger(__name__)
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+
+class PartitionExecutor(Closeable):
+    """A thread pool that preserves submission order within each key.
+
+    Tasks that share a key are always executed one after another, in the order
+    in which they were submitted. Tasks with different keys may run concurrently.
+    This is done by routing each key to a fixed single-threaded "lane".
+
+    Calls to submit() block once max_pending tasks are queued or running,
+    which applies backpressure to the producer.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+        if max_pending <= 0:
+            raise ValueError("max_pending must be > 0")
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+
+        self._lanes: List[ThreadPoolExecutor] = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"partition-{i}")
+            for i in range(max_workers)
+        ]
+        self._semaphore = threading.BoundedSemaphore(max_pending)
+
+    def submit(
+        self,
+        key: str,
+        fn: Callable[..., _R],
+        *args: Any,
+        **kwargs: Any,
+    ) -> "Future[_R]":
+        """See concurrent.futures.Executor#submit, with an additional ordering key."""
+
+        lane = self._lanes[hash(key) % self.max_workers]
+
+        self._semaphore.acquire()
+        try:
+            future = lane.submit(fn, *args, **kwargs)
+        except Exception:
+            self._semaphore.release()
+            raise
+        future.add_done_callback(lambda _: self._semaphore.release())
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        for lane in self._lanes:
+            lane.shutdown(wait=wait)
+
+    def close(self) -> None:
+        self.shutdown(wait=True)
+
+
+class BatchPartitionExecutor(Closeable, Generic[_T]):
+    """Like PartitionExecutor, but groups submitted items into batches.
+
+    Items are buffered per lane and handed to process_batch once max_per_batch
+    items have accumulated, or once the oldest buffered item has waited for
+    max_batch_linger. Items with the same key always go to the same lane, and
+    a lane processes its batches one at a time, so per-key ordering is kept.
+
+    Calls to submit() block once max_pending items are buffered or being
+    processed. process_batch is responsible for reporting per-item results;
+    any exception it raises is logged and otherwise ignored.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        max_per_batch: int,
+        process_batch: Callable[[List[_T]], None],
+        max_batch_linger: timedelta = timedelta(seconds=1),
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+        if max_pending <= 0:
+            raise ValueError("max_pending must be > 0")
+        if max_per_batch <= 0:
+            raise ValueError("max_per_batch must be > 0")
+
+        self.max_per_batch = max_per_batch
+        self.process_batch = process_batch
+        self.max_batch_linger = max_batch_linger
+
+        self._lanes: List[ThreadPoolExecutor] = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"batch-partition-{i}")
+            for i in range(max_workers)
+        ]
+        self._semaphore = threading.BoundedSemaphore(max_pending)
+
+        self._lock = threading.Lock()
+        self._buffers: List[List[_T]] = [[] for _ in range(max_workers)]
+        self._buffer_started_at: List[Optional[float]] = [None] * max_workers
+
+        self._shutdown = threading.Event()
+        self._linger_thread = threading.Thread(
+            target=self._linger_loop, name="batch-linger", daemon=True
+        )
+        self._linger_thread.start()
+
+    def submit(self, key: str, item: _T) -> None:
+        if self._shutdown.is_set():
+            raise RuntimeError("cannot submit after shutdown")
+
+        lane = hash(key) % len(self._lanes)
+
+        self._semaphore.acquire()
+        with self._lock:
+            buffer = self._buffers[lane]
+            if not buffer:
+                self._buffer_started_at[lane] = time.monotonic()
+            buffer.append(item)
+            if len(buffer) >= self.max_per_batch:
+                self._dispatch(lane)
+
+    def flush(self) -> None:
+        """Dispatches all buffered items, without waiting for them to be processed."""
+        with self._lock:
+            for lane in range(len(self._buffers)):
+                self._dispatch(lane)
+
+    def _dispatch(self, lane: int) -> None:
+        # Must be called while holding self._lock.
+        batch = self._buffers[lane]
+        if not batch:
+            return
+        self._buffers[lane] = []
+        self._buffer_started_at[lane] = None
+
+        self._lanes[lane].submit(self._process, batch)
+
+    def _process(self, batch: List[_T]) -> None:
+        try:
+            self.process_batch(batch)
+        except Exception as e:
+            logger.error(f"Failed to process batch of {len(batch)} items", exc_info=e)
+        finally:
+            for _ in batch:
+                self._semaphore.release()
+
+    def _linger_loop(self) -> None:
+        linger = self.max_batch_linger.total_seconds()
+        poll_interval = max(min(linger / 2, 1.0), 0.01)
+        while not self._shutdown.wait(poll_interval):
+            now = time.monotonic()
+            with self._lock:
+                for lane, started_at in enumerate(self._buffer_started_at):
+                    if started_at is not None and now - started_at >= linger:
+                        self._dispatch(lane)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._shutdown.set()
+        self._linger_thread.join()
+        self.flush()
+        for lane in self._lanes:
+            lane.shutdown(wait=wait)
+
+    def close(self) -> None:
+        self.shutdown(wait=True)
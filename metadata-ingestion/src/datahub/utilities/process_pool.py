@@ -0,0 +1,230 @@
+import collections
+import contextlib
+import logging
+import multiprocessing
+import pickle
+import threading
+import traceback
+from multiprocessing.connection import Connection, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import psutil
+
+from datahub.ingestion.api.closeable import Closeable
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_WORKER_SHUTDOWN_TIMEOUT_SEC = 5
+
+
+class WorkerProcessError(Exception):
+    """Raised when a worker process exits without returning a result."""
+
+
+def _worker_main(
+    conn: Connection,
+    fn: Callable[[_T], _R],
+    max_tasks: Optional[int],
+    max_rss_growth: Optional[int],
+) -> None:
+    process = psutil.Process()
+    baseline_rss = process.memory_info().rss
+    num_tasks = 0
+    while True:
+        try:
+            should_stop, item = conn.recv()
+        except EOFError:
+            should_stop = True
+        if should_stop:
+            return
+
+        result: Any
+        try:
+            result = fn(item)
+        except Exception as e:
+            try:
+                pickle.dumps(e)
+                result = e
+            except Exception:
+                result = RuntimeError(traceback.format_exc())
+
+        num_tasks += 1
+        retire = (max_tasks is not None and num_tasks >= max_tasks) or (
+            max_rss_growth is not None
+            and process.memory_info().rss - baseline_rss > max_rss_growth
+        )
+        conn.send((result, retire))
+        if retire:
+            return
+
+
+class _Worker:
+    def __init__(
+        self,
+        fn: Callable[[Any], Any],
+        max_tasks: Optional[int],
+        max_rss_growth: Optional[int],
+    ) -> None:
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_worker_main,
+            args=(child_conn, fn, max_tasks, max_rss_growth),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def submit(self, item: Any) -> None:
+        self.conn.send((False, item))
+
+    def stop(self) -> None:
+        # Workers that were forked later hold copies of this end of the pipe, so
+        # closing it would not be enough to make the worker see EOF.
+        with contextlib.suppress(OSError):
+            self.conn.send((True, None))
+        self.conn.close()
+        self.process.join(timeout=_WORKER_SHUTDOWN_TIMEOUT_SEC)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+
+
+class RecyclingProcessPool(Closeable, Generic[_T, _R]):
+    """A pool of long-lived worker processes that all run the same function.
+
+    This is meant for isolating code that leaks memory, without paying the cost
+    of starting a new process for every call. Each worker is replaced once it has
+    run max_tasks_per_worker tasks, or once its RSS has grown by more than
+    max_worker_rss_growth bytes since it started. Growth is measured instead of the
+    absolute RSS, since forked workers start out sharing the parent's memory.
+
+    Workers are started lazily, and each one runs a single task at a time. If a
+    worker dies while running a task, that task fails with a WorkerProcessError
+    and the worker is replaced. The pool can be shared between threads, but
+    calls are processed one batch at a time.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[_T], _R],
+        max_workers: int,
+        max_tasks_per_worker: Optional[int] = None,
+        max_worker_rss_growth: Optional[int] = None,
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+
+        self.fn = fn
+        self.max_workers = max_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_rss_growth = max_worker_rss_growth
+
+        self._idle_workers: List[_Worker] = []
+        self._num_workers_started = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def num_workers_started(self) -> int:
+        """The number of worker processes started so far, including replacements."""
+        return self._num_workers_started
+
+    def apply(self, item: _T) -> _R:
+        """Runs fn(item) in a worker process."""
+        result = self.map_with_exceptions([item])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def map(self, items: Iterable[_T]) -> List[_R]:
+        """Runs fn on all items in parallel, and returns the results in input order.
+
+        Raises the exception of the first failed item, after all items have run.
+        """
+        results = self.map_with_exceptions(items)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results  # type: ignore
+
+    def map_with_exceptions(self, items: Iterable[_T]) -> List[Union[_R, Exception]]:
+        """Like map(), but returns the exception of each failed item in its place."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit tasks to a closed pool")
+            return self._run(list(items))
+
+    def _start_worker(self) -> _Worker:
+        self._num_workers_started += 1
+        return _Worker(self.fn, self.max_tasks_per_worker, self.max_worker_rss_growth)
+
+    def _run(self, items: List[_T]) -> List[Union[_R, Exception]]:
+        results: List[Union[_R, Exception]] = [None] * len(items)  # type: ignore
+        pending: Deque[int] = collections.deque(range(len(items)))
+        busy: Dict[Connection, Tuple[_Worker, int]] = {}
+
+        while pending or busy:
+            while pending and len(busy) < self.max_workers:
+                worker = (
+                    self._idle_workers.pop()
+                    if self._idle_workers
+                    else self._start_worker()
+                )
+                index = pending.popleft()
+                try:
+                    worker.submit(items[index])
+                except OSError:
+                    # The worker died while it was idle, so the task can be retried.
+                    worker.stop()
+                    pending.appendleft(index)
+                    continue
+                except Exception as e:
+                    # The item could not be pickled.
+                    results[index] = e
+                    self._idle_workers.append(worker)
+                    continue
+                busy[worker.conn] = (worker, index)
+
+            for conn in wait(list(busy.keys())):
+                assert isinstance(conn, Connection)
+                worker, index = busy.pop(conn)
+                try:
+                    value, retire = conn.recv()
+                except EOFError:
+                    worker.stop()
+                    results[index] = WorkerProcessError(
+                        f"Worker process exited with code {worker.process.exitcode}"
+                    )
+                    continue
+
+                results[index] = value
+                if retire:
+                    logger.debug(
+                        f"Replacing worker process {worker.process.pid} after it hit its task or memory limit"
+                    )
+                    worker.stop()
+                else:
+                    self._idle_workers.append(worker)
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            for worker in self._idle_workers:
+                worker.stop()
+            self._idle_workers = []
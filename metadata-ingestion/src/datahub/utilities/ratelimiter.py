@@ -54,3 +54,36 @@ class RateLimiter(AbstractContextManager):
     @property
     def _timespan(self) -> float:
         return self.calls[-1] - self.calls[0]
+
+
+class ConcurrentRateLimiter(AbstractContextManager):
+    """Rate limits an operation that runs on several threads at once.
+
+    RateLimiter only records a call once it finishes, so callers that enter
+    concurrently can all get in before any of their calls are counted. This
+    one reserves a time slot for each call under a lock before it starts, and
+    spaces the slots evenly so that at most max_calls start in any period.
+    """
+
+    def __init__(self, max_calls: int, period: float = 1.0) -> None:
+        if period <= 0:
+            raise ValueError("Rate limiting period should be > 0")
+        if max_calls <= 0:
+            raise ValueError("Rate limiting number of calls should be > 0")
+
+        self.interval = period / max_calls
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ConcurrentRateLimiter":
+        with self._lock:
+            slot = max(time.monotonic(), self._next_slot)
+            self._next_slot = slot + self.interval
+
+        sleeptime = slot - time.monotonic()
+        if sleeptime > 0:
+            time.sleep(sleeptime)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        pass
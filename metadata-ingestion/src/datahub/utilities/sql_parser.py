@@ -1,14 +1,25 @@
+import atexit
 import logging
 import multiprocessing
+import os
+import threading
 import traceback
-from multiprocessing import Process, Queue
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
+from datahub.utilities.process_pool import RecyclingProcessPool
 from datahub.utilities.sql_lineage_parser_impl import SqlLineageSQLParserImpl
-from datahub.utilities.sql_parser_base import SQLParser
+from datahub.utilities.sql_parser_base import SQLParser, SqlParserException
 
 logger = logging.getLogger(__name__)
 
+# sqllineage leaks memory, so parser workers are replaced periodically.
+_PARSER_POOL_MAX_WORKERS = min(4, os.cpu_count() or 1)
+_PARSER_POOL_MAX_TASKS_PER_WORKER = 1000
+_PARSER_POOL_MAX_WORKER_RSS_GROWTH = 500 * 1024 * 1024  # 500MB
+
+_parser_pool: Optional[RecyclingProcessPool] = None
+_parser_pool_lock = threading.Lock()
+
 
 def sql_lineage_parser_impl_func_wrapper(
     queue: Optional[multiprocessing.Queue], sql_query: str, use_raw_names: bool = False
@@ -42,6 +53,30 @@ def sql_lineage_parser_impl_func_wrapper(
         return (tables, columns, exception_details)
 
 
+def _parse_in_worker(
+    args: Tuple[str, bool]
+) -> Tuple[List[str], List[str], Optional[str]]:
+    return_tuple = sql_lineage_parser_impl_func_wrapper(None, *args)
+    assert return_tuple is not None
+    tables, columns, exception_details = return_tuple
+    # Only send back the traceback, since the exception itself may not be picklable.
+    return tables, columns, exception_details[1] if exception_details else None
+
+
+def _get_parser_pool() -> RecyclingProcessPool:
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is None:
+            _parser_pool = RecyclingProcessPool(
+                _parse_in_worker,
+                max_workers=_PARSER_POOL_MAX_WORKERS,
+                max_tasks_per_worker=_PARSER_POOL_MAX_TASKS_PER_WORKER,
+                max_worker_rss_growth=_PARSER_POOL_MAX_WORKER_RSS_GROWTH,
+            )
+            atexit.register(_parser_pool.close)
+        return _parser_pool
+
+
 class SqlLineageSQLParser(SQLParser):
     def __init__(
         self,
@@ -73,16 +108,37 @@ class SqlLineageSQLParser(SQLParser):
         # memory leaks from sqllineage module used by SqlLineageSQLParserImpl. This will help
         # shield our sources like lookml & redash, that need to parse a large number of SQL statements,
         # from causing significant memory leaks in the datahub cli during ingestion.
-        queue: multiprocessing.Queue = Queue()
-        process: multiprocessing.Process = Process(
-            target=sql_lineage_parser_impl_func_wrapper,
-            args=(queue, sql_query, use_raw_names),
-        )
-        process.start()
-        tables, columns, exception_details = queue.get(block=True)
-        if exception_details is not None:
-            raise exception_details[0](f"Sub-process exception: {exception_details[1]}")
-        return tables, columns
+        # The worker processes are reused across queries, and recycled before they leak too much.
+        result = SqlLineageSQLParser.get_tables_columns_batch(
+            [sql_query], use_raw_names
+        )[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    @staticmethod
+    def get_tables_columns_batch(
+        sql_queries: Sequence[str], use_raw_names: bool = False
+    ) -> List[Union[Tuple[List[str], List[str]], Exception]]:
+        """
+        Parses the queries in parallel in separate processes.
+
+        Returns the tables and columns of each query in input order, or the exception
+        raised while parsing it.
+        """
+        results: List[Union[Tuple[List[str], List[str]], Exception]] = []
+        for result in _get_parser_pool().map_with_exceptions(
+            [(sql_query, use_raw_names) for sql_query in sql_queries]
+        ):
+            if isinstance(result, Exception):
+                results.append(result)
+                continue
+            tables, columns, exc_msg = result
+            if exc_msg is not None:
+                results.append(SqlParserException(f"Sub-process exception: {exc_msg}"))
+            else:
+                results.append((tables, columns))
+        return results
 
     def get_tables(self) -> List[str]:
         return self.tables
@@ -7,7 +7,18 @@ import random
 import string
 import threading
 import unittest.mock
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 import greenlet
 import sqlalchemy
@@ -18,6 +29,7 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.orm.exc import MultipleResultsFound, NoResultFound
 
 from datahub.ingestion.api.report import Report
+from datahub.utilities.perf_timer import PerfTimer
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -29,6 +41,10 @@ IS_SQLALCHEMY_1_4 = version.parse(SQLALCHEMY_VERSION) >= version.parse("1.4.0")
 
 MAX_QUERIES_TO_COMBINE_AT_ONCE = 40
 
+# Lower bounds of the buckets of the report's histograms.
+_BATCH_SIZE_BUCKETS: Sequence[float] = [1, 2, 5, 10, 20, 50, 100]
+_LATENCY_BUCKETS_SEC: Sequence[float] = [0, 0.1, 0.5, 1, 5, 10, 30, 60]
+
 
 # We need to make sure that only one query combiner attempts to patch
 # the SQLAlchemy execute method at a time so that they don't interfere.
@@ -112,6 +128,22 @@ class _QueryFuture:
     exc: Optional[Exception] = None
 
 
+def _get_bucket(value: float, buckets: Sequence[float]) -> str:
+    for lower, upper in zip(buckets, buckets[1:]):
+        if value < upper:
+            return f"{lower}-{upper}"
+    return f"{buckets[-1]}+"
+
+
+def _get_query_froms(query: Any) -> Tuple[str, ...]:
+    try:
+        # get_final_froms() was added in SQLAlchemy 1.4.23, and deprecates .froms.
+        froms = query.get_final_froms()
+    except AttributeError:
+        froms = getattr(query, "froms", [])
+    return tuple(sorted(str(from_) for from_ in froms))
+
+
 def get_query_columns(query: Any) -> List[Any]:
     try:
         # inner_columns will be more accurate if the column names are unnamed,
@@ -128,8 +160,26 @@ class SQLAlchemyQueryCombinerReport(Report):
 
     combined_queries_issued: int = 0
     queries_combined: int = 0
+    # Number of queries per combined query -> count
+    combined_query_sizes: Dict[str, int] = dataclasses.field(default_factory=dict)
+    # Seconds taken per combined query -> count
+    combined_query_latencies_sec: Dict[str, int] = dataclasses.field(
+        default_factory=dict
+    )
 
     query_exceptions: int = 0
+    combined_queries_split: int = 0
+
+    def report_combined_query(self, num_queries: int, seconds: float) -> None:
+        self.combined_queries_issued += 1
+        size_bucket = _get_bucket(num_queries, _BATCH_SIZE_BUCKETS)
+        self.combined_query_sizes[size_bucket] = (
+            self.combined_query_sizes.get(size_bucket, 0) + 1
+        )
+        latency_bucket = _get_bucket(seconds, _LATENCY_BUCKETS_SEC)
+        self.combined_query_latencies_sec[latency_bucket] = (
+            self.combined_query_latencies_sec.get(latency_bucket, 0) + 1
+        )
 
 
 @dataclasses.dataclass
@@ -138,6 +188,12 @@ class SQLAlchemyQueryCombiner:
     This class adds support for dynamically combining multiple SQL queries into
     a single query. Specifically, it can combine queries which each return a
     single row. It uses greenlets to manage the execution lifecycle of the queries.
+
+    Each combined query only includes queries that select from the same tables,
+    and is limited to max_queries_per_batch queries and, if set, roughly
+    max_combined_query_length characters of SQL. If a combined query fails, and
+    the serial execution fallback is enabled, it is split in two halves which are
+    retried separately, down to single queries.
     """
 
     enabled: bool
@@ -145,6 +201,9 @@ class SQLAlchemyQueryCombiner:
     is_single_row_query_method: Callable[[Any], bool]
     serial_execution_fallback_enabled: bool
 
+    max_queries_per_batch: int = MAX_QUERIES_TO_COMBINE_AT_ONCE
+    max_combined_query_length: Optional[int] = None
+
     # The Python GIL ensures that modifications to the report's counters
     # are safe.
     report: SQLAlchemyQueryCombinerReport = dataclasses.field(
@@ -295,75 +354,116 @@ class SQLAlchemyQueryCombiner:
             # If not enabled, run immediately.
             method()
 
-    def _execute_queue(self, main_greenlet: greenlet.greenlet) -> None:
+    def _get_next_batch(
+        self, main_greenlet: greenlet.greenlet
+    ) -> Dict[str, _QueryFuture]:
         full_queue = self._get_queue(main_greenlet)
-
         pending_queue = {k: v for k, v in full_queue.items() if not v.done}
+        if not pending_queue:
+            return {}
+
+        # Combine the oldest pending query with other queries on the same tables.
+        froms = _get_query_froms(next(iter(pending_queue.values())).query)
+        batch: Dict[str, _QueryFuture] = {}
+        total_length = 0
+        for query_id, query_future in pending_queue.items():
+            if len(batch) >= self.max_queries_per_batch:
+                break
+            if _get_query_froms(query_future.query) != froms:
+                continue
+            if self.max_combined_query_length is not None:
+                length = len(str(query_future.query.compile(query_future.conn)))
+                if batch and total_length + length > self.max_combined_query_length:
+                    break
+                total_length += length
+            batch[query_id] = query_future
+        return batch
 
-        pending_queue = dict(
-            itertools.islice(pending_queue.items(), MAX_QUERIES_TO_COMBINE_AT_ONCE)
-        )
+    def _execute_queue(self, main_greenlet: greenlet.greenlet) -> None:
+        batch = self._get_next_batch(main_greenlet)
+        if batch:
+            self._execute_batch(batch)
 
-        if pending_queue:
-            queue_item = next(iter(pending_queue.values()))
-
-            # Actually combine these queries together. We do this by (1) putting
-            # each query into its own CTE, (2) selecting all the columns we need
-            # and (3) extracting the results once the query finishes.
-
-            ctes = {
-                k: query_future.query.cte(k)
-                for k, query_future in pending_queue.items()
-            }
-
-            combined_cols = itertools.chain(
-                *[
-                    [
-                        col  # .label(self._generate_sql_safe_identifier())
-                        for col in get_query_columns(cte)
-                    ]
-                    for _, cte in ctes.items()
-                ]
+    def _execute_batch(self, batch: Dict[str, _QueryFuture]) -> None:
+        try:
+            self._execute_combined_query(batch)
+        except Exception as e:
+            if not self.serial_execution_fallback_enabled:
+                raise e
+            self.report.query_exceptions += 1
+            if len(batch) == 1:
+                logger.warning(
+                    "Failed to execute query using combiner, will execute it directly."
+                )
+                logger.debug("Failed to execute query using combiner", exc_info=e)
+                self._execute_queries_serially(batch)
+                return
+
+            logger.warning(
+                f"Failed to execute combined query of {len(batch)} queries, will retry in two halves."
             )
-            combined_query = sqlalchemy.select(combined_cols)
-            for cte in ctes.values():
-                combined_query.append_from(cte)
+            logger.debug("Failed to execute combined query", exc_info=e)
+            self.report.combined_queries_split += 1
+            items = list(batch.items())
+            self._execute_batch(dict(items[: len(items) // 2]))
+            self._execute_batch(dict(items[len(items) // 2 :]))
+
+    def _execute_combined_query(self, batch: Dict[str, _QueryFuture]) -> None:
+        queue_item = next(iter(batch.values()))
+
+        # Actually combine these queries together. We do this by (1) putting
+        # each query into its own CTE, (2) selecting all the columns we need
+        # and (3) extracting the results once the query finishes.
+
+        ctes = {k: query_future.query.cte(k) for k, query_future in batch.items()}
+
+        combined_cols = itertools.chain(
+            *[
+                [
+                    col  # .label(self._generate_sql_safe_identifier())
+                    for col in get_query_columns(cte)
+                ]
+                for _, cte in ctes.items()
+            ]
+        )
+        combined_query = sqlalchemy.select(combined_cols)
+        for cte in ctes.values():
+            combined_query.append_from(cte)
 
-            logger.debug(f"Executing combined query: {str(combined_query)}")
-            self.report.combined_queries_issued += 1
+        logger.debug(f"Executing combined query: {str(combined_query)}")
+        with PerfTimer() as timer:
             sa_res = _sa_execute_underlying_method(queue_item.conn, combined_query)
 
             # Fetch the results and ensure that exactly one row is returned.
             results = sa_res.fetchall()
-            assert len(results) == 1
-            row = results[0]
-
-            # Extract the results into a result for each query.
-            index = 0
-            for _, query_future in pending_queue.items():
-                query = query_future.query
-                if IS_SQLALCHEMY_1_4:
-                    # On 1.4, it prints a warning if we don't call subquery.
-                    query = query.subquery()  # type: ignore
-                cols = query.columns
-
-                data = {}
-                for col in cols:
-                    data[col.name] = row[index]
-                    index += 1
-
-                res = _ResultProxyFake([_RowProxyFake(data)])
-
-                query_future.res = res
-                query_future.done = True
-
-            # Verify that we consumed all the columns.
-            assert index == len(row)
-
-    def _execute_queue_fallback(self, main_greenlet: greenlet.greenlet) -> None:
-        full_queue = self._get_queue(main_greenlet)
-
-        for _, query_future in full_queue.items():
+        self.report.report_combined_query(len(batch), timer.elapsed_seconds())
+        assert len(results) == 1
+        row = results[0]
+
+        # Extract the results into a result for each query.
+        index = 0
+        for _, query_future in batch.items():
+            query = query_future.query
+            if IS_SQLALCHEMY_1_4:
+                # On 1.4, it prints a warning if we don't call subquery.
+                query = query.subquery()  # type: ignore
+            cols = query.columns
+
+            data = {}
+            for col in cols:
+                data[col.name] = row[index]
+                index += 1
+
+            res = _ResultProxyFake([_RowProxyFake(data)])
+
+            query_future.res = res
+            query_future.done = True
+
+        # Verify that we consumed all the columns.
+        assert index == len(row)
+
+    def _execute_queries_serially(self, batch: Dict[str, _QueryFuture]) -> None:
+        for _, query_future in batch.items():
             if query_future.done:
                 continue
 
@@ -396,17 +496,7 @@ class SQLAlchemyQueryCombiner:
         pool = self._get_greenlet_pool(main_greenlet)
 
         while pool:
-            try:
-                self._execute_queue(main_greenlet)
-            except Exception as e:
-                if not self.serial_execution_fallback_enabled:
-                    raise e
-                logger.warning(
-                    "Failed to execute queue using combiner, will fallback to execute one by one."
-                )
-                logger.debug("Failed to execute queue using combiner", exc_info=e)
-                self.report.query_exceptions += 1
-                self._execute_queue_fallback(main_greenlet)
+            self._execute_queue(main_greenlet)
 
             for let in list(pool):
                 if let.dead:
@@ -1,11 +1,34 @@
+import concurrent.futures
 import contextlib
+import copy
+import dataclasses
 import enum
 import functools
+import hashlib
 import itertools
+import json
 import logging
+import math
+import os
 import pathlib
+import pickle
+import sqlite3
+import tempfile
+import time
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pydantic.dataclasses
 import sqlglot
@@ -14,16 +37,20 @@ import sqlglot.lineage
 import sqlglot.optimizer.annotate_types
 import sqlglot.optimizer.optimizer
 import sqlglot.optimizer.qualify
+import sqlglot.tokens
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
+from datahub import __version__
 from datahub.configuration.pydantic_migration_helpers import PYDANTIC_VERSION_2
 from datahub.emitter.mce_builder import (
     DEFAULT_ENV,
     make_dataset_urn_with_platform_instance,
 )
 from datahub.ingestion.api.closeable import Closeable
+from datahub.ingestion.api.report import Report
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.graph.filters import RemovedStatusFilter
 from datahub.ingestion.source.bigquery_v2.bigquery_audit import BigqueryTableIdentifier
 from datahub.metadata.schema_classes import (
     ArrayTypeClass,
@@ -37,6 +64,8 @@ from datahub.metadata.schema_classes import (
     TimeTypeClass,
 )
 from datahub.utilities.file_backed_collections import ConnectionWrapper, FileBackedDict
+from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.urns.dataset_urn import DatasetUrn
 
 logger = logging.getLogger(__name__)
@@ -47,6 +76,11 @@ Urn = str
 SchemaInfo = Dict[str, str]
 
 SQL_PARSE_RESULT_CACHE_SIZE = 1000
+# The number of tables whose schemas are fetched from DataHub in a single request.
+_SCHEMA_PREFETCH_BATCH_SIZE = 500
+# Prefetching relies on the search index, which can lag behind. Tables that it
+# doesn't find are only cached as missing for this long.
+_SCHEMA_PREFETCH_MISS_TTL_SEC = 300
 
 
 RULES_BEFORE_TYPE_ANNOTATION: tuple = tuple(
@@ -239,6 +273,8 @@ class SqlParsingDebugInfo(_ParserBaseModel):
     table_error: Optional[Exception] = None
     column_error: Optional[Exception] = None
 
+    parse_time_sec: float = 0.0
+
     @property
     def error(self) -> Optional[Exception]:
         return self.table_error or self.column_error
@@ -334,7 +370,9 @@ class SchemaResolver(Closeable):
         platform_instance: Optional[str] = None,
         env: str = DEFAULT_ENV,
         graph: Optional[DataHubGraph] = None,
+        negative_cache_ttl_sec: Optional[float] = None,
         _cache_filename: Optional[pathlib.Path] = None,
+        _cache_read_only: bool = False,
     ):
         # TODO handle platforms when prefixed with urn:li:dataPlatform:
         self.platform = platform
@@ -342,15 +380,39 @@ class SchemaResolver(Closeable):
         self.env = env
 
         self.graph = graph
+        # Tables without a schema in DataHub are cached too. If set, they are
+        # looked up in DataHub again once this many seconds have passed.
+        self.negative_cache_ttl_sec = negative_cache_ttl_sec
+        self._negative_cache_expiry: Dict[str, float] = {}
 
         # Init cache, potentially restoring from a previous run.
         shared_conn = None
         if _cache_filename:
-            shared_conn = ConnectionWrapper(filename=_cache_filename)
+            shared_conn = ConnectionWrapper(
+                filename=_cache_filename, read_only=_cache_read_only
+            )
         self._schema_cache: FileBackedDict[Optional[SchemaInfo]] = FileBackedDict(
             shared_connection=shared_conn,
         )
 
+        # The urns looked up since _track_resolved_urns() was entered, if it was.
+        self._resolved_urns: Optional[Set[str]] = None
+
+        self.parse_result_cache: Optional["SqlParsingResultCache"] = None
+
+    def enable_parse_result_cache(
+        self, filename: Union[str, pathlib.Path], max_size_mb: int
+    ) -> "SqlParsingCacheReport":
+        """Persists the results of sqlglot_lineage calls that use this resolver.
+
+        See SqlParsingResultCache for details. The cache is written out when the
+        resolver is closed.
+        """
+        self.parse_result_cache = SqlParsingResultCache(
+            filename=pathlib.Path(filename), max_size_bytes=max_size_mb * 1024 * 1024
+        )
+        return self.parse_result_cache.report
+
     def get_urns(self) -> Set[str]:
         return set(self._schema_cache.keys())
 
@@ -397,8 +459,23 @@ class SchemaResolver(Closeable):
 
         return urn_lower, None
 
+    @contextlib.contextmanager
+    def _track_resolved_urns(self) -> Iterator[Set[str]]:
+        """Collects the urns of all tables looked up within the context."""
+        outer_resolved_urns = self._resolved_urns
+        self._resolved_urns = set()
+        try:
+            yield self._resolved_urns
+        finally:
+            if outer_resolved_urns is not None:
+                outer_resolved_urns.update(self._resolved_urns)
+            self._resolved_urns = outer_resolved_urns
+
     def _resolve_schema_info(self, urn: str) -> Optional[SchemaInfo]:
-        if urn in self._schema_cache:
+        if self._resolved_urns is not None:
+            self._resolved_urns.add(urn)
+
+        if self._is_cached(urn):
             return self._schema_cache[urn]
 
         # TODO: For bigquery partitioned tables, add the pseudo-column _PARTITIONTIME
@@ -413,6 +490,67 @@ class SchemaResolver(Closeable):
         self._save_to_cache(urn, None)
         return None
 
+    def _is_cached(self, urn: str) -> bool:
+        if urn not in self._schema_cache:
+            return False
+        expiry = self._negative_cache_expiry.get(urn)
+        return expiry is None or time.monotonic() < expiry
+
+    def prefetch_urns(self, urns: Iterable[str]) -> None:
+        """Fetches the schemas of any of the given tables that aren't cached yet.
+
+        The schemas are fetched from DataHub in bulk, instead of making one call
+        per table when they are resolved. Tables that don't have a schema are
+        cached as such, but they are looked up one by one again once
+        _SCHEMA_PREFETCH_MISS_TTL_SEC has passed.
+        """
+        if not self.graph:
+            return
+
+        missing_urns = sorted({urn for urn in urns if not self._is_cached(urn)})
+        for i in range(0, len(missing_urns), _SCHEMA_PREFETCH_BATCH_SIZE):
+            batch = missing_urns[i : i + _SCHEMA_PREFETCH_BATCH_SIZE]
+            try:
+                schemas = dict(
+                    self.graph._bulk_fetch_schema_info_by_filter(
+                        # Match get_aspect, which also returns soft-deleted schemas.
+                        status=RemovedStatusFilter.ALL,
+                        batch_size=len(batch),
+                        extraFilters=[
+                            {"field": "urn", "values": batch, "condition": "EQUAL"}
+                        ],
+                    )
+                )
+            except Exception as e:
+                # These tables will be fetched one by one when they're resolved.
+                logger.warning(
+                    f"Failed to prefetch the schemas of {len(batch)} tables: {e}"
+                )
+                continue
+
+            for urn in batch:
+                if urn in schemas:
+                    self.add_graphql_schema_metadata(urn, schemas[urn])
+                else:
+                    self._save_to_cache(urn, None)
+                    self._negative_cache_expiry[urn] = min(
+                        self._negative_cache_expiry.get(urn, math.inf),
+                        time.monotonic() + _SCHEMA_PREFETCH_MISS_TTL_SEC,
+                    )
+        logger.debug(f"Prefetched the schemas of {len(missing_urns)} tables")
+
+    def prefetch_schemas_for_queries(
+        self, requests: Iterable["SqlParsingRequest"]
+    ) -> None:
+        """Prefetches the schemas of all tables referenced by the given statements.
+
+        See prefetch_urns. Statements that fail to parse are skipped.
+        """
+        if not self.graph:
+            return
+
+        _parse_and_prefetch_schemas(requests, self)
+
     def add_schema_metadata(
         self, urn: str, schema_metadata: SchemaMetadataClass
     ) -> None:
@@ -430,6 +568,12 @@ class SchemaResolver(Closeable):
 
     def _save_to_cache(self, urn: str, schema_info: Optional[SchemaInfo]) -> None:
         self._schema_cache[urn] = schema_info
+        if schema_info is None and self.negative_cache_ttl_sec is not None:
+            self._negative_cache_expiry[urn] = (
+                time.monotonic() + self.negative_cache_ttl_sec
+            )
+        else:
+            self._negative_cache_expiry.pop(urn, None)
 
     def _fetch_schema_info(self, graph: DataHubGraph, urn: str) -> Optional[SchemaInfo]:
         aspect = graph.get_aspect(urn, SchemaMetadataClass)
@@ -473,6 +617,8 @@ class SchemaResolver(Closeable):
         }
 
     def close(self) -> None:
+        if self.parse_result_cache:
+            self.parse_result_cache.close()
         self._schema_cache.close()
 
 
@@ -970,34 +1116,118 @@ def _get_dialect(platform: str) -> str:
         return platform
 
 
-def _sqlglot_lineage_inner(
-    sql: sqlglot.exp.ExpOrStr,
-    schema_resolver: SchemaResolver,
-    default_db: Optional[str] = None,
-    default_schema: Optional[str] = None,
-) -> SqlParsingResult:
-    dialect = _get_dialect(schema_resolver.platform)
+_STRING_TOKEN_TYPES = {
+    sqlglot.tokens.TokenType.STRING,
+    sqlglot.tokens.TokenType.RAW_STRING,
+    sqlglot.tokens.TokenType.NATIONAL_STRING,
+    sqlglot.tokens.TokenType.BIT_STRING,
+    sqlglot.tokens.TokenType.BYTE_STRING,
+    sqlglot.tokens.TokenType.HEX_STRING,
+    sqlglot.tokens.TokenType.HEREDOC_STRING,
+}
+
+# String literals that follow one of these tokens are values being compared or
+# returned, rather than e.g. table names passed to IDENTIFIER() or a stage path.
+_VALUE_CONTEXT_TOKEN_TYPES = {
+    sqlglot.tokens.TokenType.EQ,
+    sqlglot.tokens.TokenType.NEQ,
+    sqlglot.tokens.TokenType.NULLSAFE_EQ,
+    sqlglot.tokens.TokenType.LT,
+    sqlglot.tokens.TokenType.LTE,
+    sqlglot.tokens.TokenType.GT,
+    sqlglot.tokens.TokenType.GTE,
+    sqlglot.tokens.TokenType.LIKE,
+    sqlglot.tokens.TokenType.ILIKE,
+    sqlglot.tokens.TokenType.BETWEEN,
+    sqlglot.tokens.TokenType.AND,
+    sqlglot.tokens.TokenType.THEN,
+    sqlglot.tokens.TokenType.ELSE,
+}
+
+
+def _normalize_query_tokens(tokens: List[sqlglot.tokens.Token]) -> Iterable[str]:
+    # For each open parenthesis, whether it holds a VALUES row or an IN list.
+    paren_is_value_list: List[bool] = []
+    last_closed_value_list = False
+    prev_type: Optional[sqlglot.tokens.TokenType] = None
+    for token in tokens:
+        token_type = token.token_type
+        if token_type == sqlglot.tokens.TokenType.NUMBER:
+            yield "?"
+        elif token_type in _STRING_TOKEN_TYPES:
+            is_compared = prev_type in _VALUE_CONTEXT_TOKEN_TYPES
+            is_listed = bool(paren_is_value_list) and paren_is_value_list[-1]
+            if is_compared or is_listed:
+                yield "?"
+            else:
+                # Quote it so it can't collide with an identifier or keyword.
+                yield repr(token.text)
+        elif token_type == sqlglot.tokens.TokenType.IDENTIFIER:
+            # Keep quoted identifiers distinct from unquoted ones.
+            yield f'"{token.text}"'
+        else:
+            yield token.text
+
+        if token_type == sqlglot.tokens.TokenType.L_PAREN:
+            paren_is_value_list.append(
+                prev_type
+                in (sqlglot.tokens.TokenType.VALUES, sqlglot.tokens.TokenType.IN)
+                # The next row of a multi-row VALUES clause.
+                or (
+                    prev_type == sqlglot.tokens.TokenType.COMMA
+                    and last_closed_value_list
+                )
+            )
+        elif token_type == sqlglot.tokens.TokenType.R_PAREN:
+            last_closed_value_list = (
+                paren_is_value_list.pop() if paren_is_value_list else False
+            )
+        elif token_type != sqlglot.tokens.TokenType.COMMA:
+            last_closed_value_list = False
+        prev_type = token_type
+
+
+def get_query_fingerprint(sql: str, platform: str) -> str:
+    """Returns a hash of the statement that ignores whitespace, comments and values.
+
+    Numbers, and string literals that are compared against or listed in VALUES or
+    IN, are replaced by placeholders. Other string literals are kept, since they can
+    name tables, e.g. Snowflake's IDENTIFIER('db.schema.t') or a COPY INTO stage.
+    Statements with the same fingerprint therefore generate the same lineage.
+    """
+    dialect = sqlglot.Dialect.get_or_raise(_get_dialect(platform))()
+    try:
+        tokens = dialect.tokenize(sql)
+    except sqlglot.errors.TokenError:
+        normalized = sql
+    else:
+        normalized = " ".join(_normalize_query_tokens(tokens))
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def _normalize_default_db_and_schema(
+    dialect: str, default_db: Optional[str], default_schema: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
     if dialect == "snowflake":
         # in snowflake, table identifiers must be uppercased to match sqlglot's behavior.
         if default_db:
             default_db = default_db.upper()
         if default_schema:
             default_schema = default_schema.upper()
+    return default_db, default_schema
 
-    logger.debug("Parsing lineage from sql statement: %s", sql)
-    statement = _parse_statement(sql, dialect=dialect)
-
-    original_statement = statement.copy()
-    # logger.debug(
-    #     "Formatted sql statement: %s",
-    #     original_statement.sql(pretty=True, dialect=dialect),
-    # )
 
+def _qualify_tables(
+    statement: sqlglot.Expression,
+    dialect: str,
+    default_db: Optional[str],
+    default_schema: Optional[str],
+) -> sqlglot.Expression:
     # Make sure the tables are resolved with the default db / schema.
     # This only works for Unionable statements. For other types of statements,
     # we have to do it manually afterwards, but that's slightly lower accuracy
     # because of CTEs.
-    statement = sqlglot.optimizer.qualify.qualify(
+    return sqlglot.optimizer.qualify.qualify(
         statement,
         dialect=dialect,
         # sqlglot calls the db -> schema -> table hierarchy "catalog", "db", "table".
@@ -1010,6 +1240,54 @@ def _sqlglot_lineage_inner(
         identify=False,
     )
 
+
+def _get_table_urn_candidates(
+    statement: sqlglot.Expression,
+    request: "SqlParsingRequest",
+    schema_resolver: SchemaResolver,
+) -> Set[str]:
+    """Returns the urns that resolving the tables of the statement would look up."""
+    dialect = _get_dialect(schema_resolver.platform)
+    default_db, default_schema = _normalize_default_db_and_schema(
+        dialect, request.default_db, request.default_schema
+    )
+    # Qualifying modifies the statement, which is parsed for lineage later on.
+    statement = _qualify_tables(statement.copy(), dialect, default_db, default_schema)
+    tables, modified = _table_level_lineage(statement, dialect=dialect)
+
+    urns: Set[str] = set()
+    for table in tables | modified:
+        qualified_table = table.qualified(
+            dialect=dialect, default_db=default_db, default_schema=default_schema
+        )
+        # See SchemaResolver.resolve_table.
+        urns.add(schema_resolver.get_urn_for_table(qualified_table))
+        urns.add(schema_resolver.get_urn_for_table(qualified_table, lower=True))
+    return urns
+
+
+def _sqlglot_lineage_inner(
+    sql: sqlglot.exp.ExpOrStr,
+    schema_resolver: SchemaResolver,
+    default_db: Optional[str] = None,
+    default_schema: Optional[str] = None,
+) -> SqlParsingResult:
+    dialect = _get_dialect(schema_resolver.platform)
+    default_db, default_schema = _normalize_default_db_and_schema(
+        dialect, default_db, default_schema
+    )
+
+    logger.debug("Parsing lineage from sql statement: %s", sql)
+    statement = _parse_statement(sql, dialect=dialect)
+
+    original_statement = statement.copy()
+    # logger.debug(
+    #     "Formatted sql statement: %s",
+    #     original_statement.sql(pretty=True, dialect=dialect),
+    # )
+
+    statement = _qualify_tables(statement, dialect, default_db, default_schema)
+
     # Generate table-level lineage.
     tables, modified = _table_level_lineage(statement, dialect=dialect)
 
@@ -1160,15 +1438,528 @@ def sqlglot_lineage(
         table_error or column_error are set, then the parsing failed and the
         other fields may be incomplete.
     """
-    try:
-        return _sqlglot_lineage_inner(
-            sql=sql,
-            schema_resolver=schema_resolver,
-            default_db=default_db,
-            default_schema=default_schema,
+    if schema_resolver.parse_result_cache:
+        return schema_resolver.parse_result_cache.parse(
+            SqlParsingRequest(sql, default_db, default_schema), schema_resolver
         )
-    except Exception as e:
-        return SqlParsingResult.make_from_error(e)
+    return _sqlglot_lineage_uncached(sql, schema_resolver, default_db, default_schema)
+
+
+def _sqlglot_lineage_uncached(
+    sql: sqlglot.exp.ExpOrStr,
+    schema_resolver: SchemaResolver,
+    default_db: Optional[str] = None,
+    default_schema: Optional[str] = None,
+) -> SqlParsingResult:
+    with PerfTimer() as timer:
+        try:
+            result = _sqlglot_lineage_inner(
+                sql=sql,
+                schema_resolver=schema_resolver,
+                default_db=default_db,
+                default_schema=default_schema,
+            )
+        except Exception as e:
+            result = SqlParsingResult.make_from_error(e)
+    result.debug_info.parse_time_sec = timer.elapsed_seconds()
+    return result
+
+
+class SqlParsingRequest(NamedTuple):
+    sql: str
+    default_db: Optional[str] = None
+    default_schema: Optional[str] = None
+
+
+class _ParsedStatement(NamedTuple):
+    # None if the statement failed to parse.
+    statement: Optional[sqlglot.Expression]
+    parse_time_sec: float
+
+
+def _parse_and_prefetch_schemas(
+    requests: Iterable[SqlParsingRequest], schema_resolver: SchemaResolver
+) -> List[_ParsedStatement]:
+    """Parses the statements, and prefetches the schemas of the tables they reference.
+
+    The parsed statements are returned, so that they can be used to generate
+    lineage without parsing them again.
+    """
+    dialect = _get_dialect(schema_resolver.platform)
+    parsed_statements: List[_ParsedStatement] = []
+    urns: Set[str] = set()
+    for request in requests:
+        statement: Optional[sqlglot.Expression] = None
+        try:
+            with PerfTimer() as timer:
+                statement = _parse_statement(request.sql, dialect=dialect)
+            if schema_resolver.graph:
+                urns.update(
+                    _get_table_urn_candidates(statement, request, schema_resolver)
+                )
+        except Exception as e:
+            logger.debug(f"Failed to extract tables from {request.sql}: {e}")
+        parsed_statements.append(_ParsedStatement(statement, timer.elapsed_seconds()))
+    schema_resolver.prefetch_urns(urns)
+    return parsed_statements
+
+
+@dataclasses.dataclass
+class SqlParsingBatchReport(Report):
+    num_statements: int = 0
+    num_table_errors: int = 0
+    num_column_errors: int = 0
+    # Statements that referenced tables whose schemas were not cached yet, and
+    # so had to be parsed again after fetching those schemas.
+    num_statements_reparsed: int = 0
+
+    parse_time_sec: float = 0.0
+    max_statement_parse_time_sec: float = 0.0
+    wall_time_sec: float = 0.0
+
+    errors: LossyList[str] = dataclasses.field(default_factory=LossyList)
+
+    def _record(self, request: SqlParsingRequest, result: SqlParsingResult) -> None:
+        debug_info = result.debug_info
+        self.num_statements += 1
+        if debug_info.table_error:
+            self.num_table_errors += 1
+            self.errors.append(f"{debug_info.table_error} in: {request.sql[:200]}")
+        elif debug_info.column_error:
+            self.num_column_errors += 1
+        self.parse_time_sec += debug_info.parse_time_sec
+        self.max_statement_parse_time_sec = max(
+            self.max_statement_parse_time_sec, debug_info.parse_time_sec
+        )
+
+
+def _with_picklable_errors(result: SqlParsingResult) -> SqlParsingResult:
+    """Returns the result, with any errors that can't be pickled converted to strings."""
+    replacements: Dict[str, Exception] = {}
+    for field in ("table_error", "column_error"):
+        error = getattr(result.debug_info, field)
+        if error is not None:
+            try:
+                pickle.loads(pickle.dumps(error))
+            except Exception:
+                replacements[field] = SqlUnderstandingError(
+                    f"{type(error).__name__}: {error}"
+                )
+    if not replacements:
+        return result
+
+    result = copy.copy(result)
+    result.debug_info = copy.copy(result.debug_info)
+    for field, error in replacements.items():
+        setattr(result.debug_info, field, error)
+    return result
+
+
+@dataclasses.dataclass
+class SqlParsingCacheReport(Report):
+    num_hits: int = 0
+    num_misses: int = 0
+    # Cached results that were discarded because the schema of one of the tables
+    # they reference has changed since they were cached.
+    num_stale: int = 0
+    num_evicted: int = 0
+    hit_rate: Optional[float] = None
+
+    disabled_reason: Optional[str] = None
+
+    def compute_stats(self) -> None:
+        num_lookups = self.num_hits + self.num_misses + self.num_stale
+        if num_lookups:
+            self.hit_rate = round(self.num_hits / num_lookups, 4)
+
+
+class _CachedParseResult(NamedTuple):
+    # The tables that were looked up while parsing, and a hash of their schemas.
+    resolved_urns: List[str]
+    schema_hash: str
+    result_pickle: bytes
+    last_used: int
+
+
+_PARSE_RESULT_CACHE_TABLE = "sql_parsing_results"
+# Results are never reused across versions, since the parser may have changed.
+_PARSE_RESULT_CACHE_VERSION = f"{__version__}/{sqlglot.__version__}"
+
+
+class SqlParsingResultCache(Closeable):
+    """A persistent cache of sqlglot_lineage results, which is reused across runs.
+
+    Statements are keyed by their fingerprint, so statements that only differ in
+    their literal values, whitespace or comments share a single entry. Each entry
+    also records which tables were looked up while parsing the statement, along
+    with a hash of their schemas. If any of those schemas have changed since, the
+    entry is stale and the statement is parsed again.
+
+    When the cache is closed, the least recently used entries are evicted until
+    the total size of the cached results is below max_size_bytes.
+
+    Only one process can use the cache file at a time. If it is locked by another
+    process or can't be opened, the cache is disabled and every lookup is a miss.
+    """
+
+    def __init__(
+        self,
+        filename: pathlib.Path,
+        max_size_bytes: int,
+        report: Optional[SqlParsingCacheReport] = None,
+    ):
+        self.max_size_bytes = max_size_bytes
+        self.report = report or SqlParsingCacheReport()
+
+        self._conn: Optional[ConnectionWrapper] = None
+        self._results: Optional[FileBackedDict[_CachedParseResult]] = None
+        try:
+            self._conn = ConnectionWrapper(
+                filename=filename,
+                # Unlike most of our SQLite files, this one needs to survive crashes.
+                pragmas={"journal_mode": "WAL", "synchronous": "NORMAL"},
+            )
+            self._results = FileBackedDict[_CachedParseResult](
+                shared_connection=self._conn,
+                tablename=_PARSE_RESULT_CACHE_TABLE,
+                extra_columns={
+                    "last_used": lambda entry: entry.last_used,
+                    "size": lambda entry: len(entry.result_pickle),
+                },
+            )
+            # Take the exclusive lock right away, instead of on the first write.
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.warning(f"Disabling the SQL parsing cache at {filename}: {e}")
+            self.report.disabled_reason = str(e)
+            if self._conn:
+                self._conn.close()
+            self._conn = None
+            self._results = None
+
+    @staticmethod
+    def _make_key(request: SqlParsingRequest, schema_resolver: SchemaResolver) -> str:
+        key_parts = [
+            _PARSE_RESULT_CACHE_VERSION,
+            schema_resolver.platform,
+            schema_resolver.platform_instance,
+            schema_resolver.env,
+            request.default_db,
+            request.default_schema,
+            get_query_fingerprint(request.sql, schema_resolver.platform),
+        ]
+        return hashlib.sha256(json.dumps(key_parts).encode()).hexdigest()
+
+    @staticmethod
+    def _hash_schemas(schema_resolver: SchemaResolver, urns: Iterable[str]) -> str:
+        schemas = [
+            (urn, schema_resolver._resolve_schema_info(urn)) for urn in sorted(urns)
+        ]
+        return hashlib.sha256(json.dumps(schemas, sort_keys=True).encode()).hexdigest()
+
+    def get(
+        self, request: SqlParsingRequest, schema_resolver: SchemaResolver
+    ) -> Optional[SqlParsingResult]:
+        """Returns the cached result for the statement, if there is a fresh one."""
+        if self._results is None:
+            self.report.num_misses += 1
+            return None
+
+        with PerfTimer() as timer:
+            key = self._make_key(request, schema_resolver)
+            try:
+                entry = self._results.get(key)
+                result = pickle.loads(entry.result_pickle) if entry else None
+            except Exception as e:
+                logger.debug(f"Failed to load a cached SQL parsing result: {e}")
+                entry = result = None
+
+            if entry is None or result is None:
+                self.report.num_misses += 1
+                return None
+            if entry.schema_hash != self._hash_schemas(
+                schema_resolver, entry.resolved_urns
+            ):
+                self.report.num_stale += 1
+                return None
+
+            self._results[key] = entry._replace(last_used=int(time.time()))
+        self.report.num_hits += 1
+        result.debug_info.parse_time_sec = timer.elapsed_seconds()
+        return result
+
+    def put(
+        self,
+        request: SqlParsingRequest,
+        schema_resolver: SchemaResolver,
+        result: SqlParsingResult,
+        resolved_urns: Iterable[str],
+    ) -> None:
+        """Caches the result of parsing the statement.
+
+        The resolved_urns are the tables that were looked up while parsing it.
+        """
+        if self._results is None:
+            return
+
+        resolved_urns = sorted(resolved_urns)
+        self._results[self._make_key(request, schema_resolver)] = _CachedParseResult(
+            resolved_urns=resolved_urns,
+            schema_hash=self._hash_schemas(schema_resolver, resolved_urns),
+            result_pickle=pickle.dumps(_with_picklable_errors(result)),
+            last_used=int(time.time()),
+        )
+
+    def parse(
+        self,
+        request: SqlParsingRequest,
+        schema_resolver: SchemaResolver,
+        statement: Optional[sqlglot.Expression] = None,
+    ) -> SqlParsingResult:
+        """Returns the cached result for the statement, or parses and caches it.
+
+        If the statement was already parsed, it can be passed in to avoid parsing it again.
+        """
+        result = self.get(request, schema_resolver)
+        if result is None:
+            result = self.parse_uncached(request, schema_resolver, statement)
+        return result
+
+    def parse_uncached(
+        self,
+        request: SqlParsingRequest,
+        schema_resolver: SchemaResolver,
+        statement: Optional[sqlglot.Expression] = None,
+    ) -> SqlParsingResult:
+        with schema_resolver._track_resolved_urns() as resolved_urns:
+            result = _sqlglot_lineage_uncached(
+                request.sql if statement is None else statement,
+                schema_resolver,
+                default_db=request.default_db,
+                default_schema=request.default_schema,
+            )
+        self.put(request, schema_resolver, result, resolved_urns)
+        return result
+
+    def _evict(self) -> None:
+        assert self._results is not None and self._conn is not None
+        self._results.flush()
+        cursor = self._conn.execute(
+            f"""DELETE FROM {_PARSE_RESULT_CACHE_TABLE} WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY last_used DESC, key) AS total_size
+                    FROM {_PARSE_RESULT_CACHE_TABLE}
+                )
+                WHERE total_size > ?
+            )""",
+            (self.max_size_bytes,),
+        )
+        self.report.num_evicted += cursor.rowcount
+
+    def close(self) -> None:
+        if self._results is None or self._conn is None:
+            return
+        try:
+            self._evict()
+        finally:
+            self._results.close()
+            self._conn.close()
+            self._results = None
+            self._conn = None
+
+
+class _SchemaResolverSnapshot(SchemaResolver):
+    """A read-only copy of another resolver's cache, for use in worker processes.
+
+    Instead of fetching schemas that are missing from the cache, it records their
+    urns, so that the parent process can fetch them.
+    """
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs, _cache_read_only=True)
+        self.missing_urns: Set[str] = set()
+
+    def _save_to_cache(self, urn: str, schema_info: Optional[SchemaInfo]) -> None:
+        assert schema_info is None, "The schema cache snapshot is read-only"
+        self.missing_urns.add(urn)
+
+
+_batch_worker_schema_resolver: Optional[_SchemaResolverSnapshot] = None
+
+
+def _init_batch_worker(
+    platform: str,
+    platform_instance: Optional[str],
+    env: str,
+    cache_filename: pathlib.Path,
+) -> None:
+    global _batch_worker_schema_resolver
+    _batch_worker_schema_resolver = _SchemaResolverSnapshot(
+        platform=platform,
+        platform_instance=platform_instance,
+        env=env,
+        _cache_filename=cache_filename,
+    )
+
+
+def _parse_in_batch_worker(
+    request: SqlParsingRequest,
+) -> Tuple[SqlParsingResult, Set[str], Set[str]]:
+    schema_resolver = _batch_worker_schema_resolver
+    assert schema_resolver is not None
+    schema_resolver.missing_urns = set()
+
+    with schema_resolver._track_resolved_urns() as resolved_urns:
+        result = _sqlglot_lineage_uncached(
+            request.sql,
+            schema_resolver,
+            default_db=request.default_db,
+            default_schema=request.default_schema,
+        )
+
+    # The result is sent back to the parent process, so the errors must be picklable.
+    return _with_picklable_errors(result), schema_resolver.missing_urns, resolved_urns
+
+
+def _parse_in_worker_processes(
+    requests: Sequence[SqlParsingRequest],
+    schema_resolver: SchemaResolver,
+    max_workers: int,
+    report: SqlParsingBatchReport,
+) -> List[SqlParsingResult]:
+    if not requests:
+        return []
+
+    cache = schema_resolver.parse_result_cache
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_filename = pathlib.Path(temp_dir) / "schema_cache.db"
+        schema_resolver._schema_cache.copy_to_file(cache_filename)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(
+                schema_resolver.platform,
+                schema_resolver.platform_instance,
+                schema_resolver.env,
+                cache_filename,
+            ),
+        ) as executor:
+            worker_results = list(
+                executor.map(
+                    _parse_in_batch_worker,
+                    requests,
+                    chunksize=max(1, min(100, len(requests) // (4 * max_workers))),
+                )
+            )
+
+    # Fetch the tables that were missing from the snapshot in bulk, instead of
+    # one at a time while going through the results.
+    schema_resolver.prefetch_urns(
+        urn for _, missing_urns, _ in worker_results for urn in missing_urns
+    )
+
+    results: List[SqlParsingResult] = []
+    for request, (result, missing_urns, resolved_urns) in zip(requests, worker_results):
+        # Resolve all of them, so that misses are cached like they
+        # would be when parsing in this process.
+        newly_resolved = [
+            schema_resolver._resolve_schema_info(urn) for urn in sorted(missing_urns)
+        ]
+        if any(newly_resolved):
+            report.num_statements_reparsed += 1
+            if cache:
+                result = cache.parse_uncached(request, schema_resolver)
+            else:
+                result = sqlglot_lineage(
+                    request.sql,
+                    schema_resolver,
+                    default_db=request.default_db,
+                    default_schema=request.default_schema,
+                )
+        elif cache:
+            cache.put(request, schema_resolver, result, resolved_urns)
+        results.append(result)
+    return results
+
+
+def sqlglot_lineage_batch(
+    requests: Sequence[SqlParsingRequest],
+    schema_resolver: SchemaResolver,
+    max_workers: Optional[int] = None,
+    report: Optional[SqlParsingBatchReport] = None,
+) -> List[SqlParsingResult]:
+    """Parse many SQL statements in parallel, using a pool of worker processes.
+
+    This is equivalent to calling sqlglot_lineage on each statement, but spreads
+    the CPU-bound parsing across processes. The workers read table schemas from a
+    read-only snapshot of the schema_resolver's cache. Statements that reference
+    tables which aren't in the snapshot are parsed again in this process, after
+    resolving those tables with the schema_resolver as usual.
+
+    If the schema_resolver has a parse result cache, it is checked before sending
+    statements to the workers, and their results are added to it.
+
+    Args:
+        requests: The statements to parse, each with its own default db and schema.
+        schema_resolver: The schema resolver to use for resolving table schemas.
+        max_workers: The number of worker processes. Defaults to the number of CPUs.
+            With a single worker, the statements are parsed in this process.
+        report: If provided, timing and error counts are added to it.
+
+    Returns:
+        The SqlParsingResult of each statement, in the same order as the requests.
+        The time it took to parse each statement is in debug_info.parse_time_sec.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(requests))
+    report = report or SqlParsingBatchReport()
+
+    results: List[SqlParsingResult] = []
+    with PerfTimer() as timer:
+        if max_workers <= 1:
+            cache = schema_resolver.parse_result_cache
+            parsed_statements = _parse_and_prefetch_schemas(requests, schema_resolver)
+            for request, (statement, parse_time_sec) in zip(
+                requests, parsed_statements
+            ):
+                if cache:
+                    result = cache.parse(request, schema_resolver, statement)
+                else:
+                    result = _sqlglot_lineage_uncached(
+                        request.sql if statement is None else statement,
+                        schema_resolver,
+                        default_db=request.default_db,
+                        default_schema=request.default_schema,
+                    )
+                result.debug_info.parse_time_sec += parse_time_sec
+                results.append(result)
+                report._record(request, result)
+        else:
+            cache = schema_resolver.parse_result_cache
+            cached_results = [
+                cache.get(request, schema_resolver) if cache else None
+                for request in requests
+            ]
+            worker_results = iter(
+                _parse_in_worker_processes(
+                    [
+                        request
+                        for request, cached_result in zip(requests, cached_results)
+                        if cached_result is None
+                    ],
+                    schema_resolver,
+                    max_workers=max_workers,
+                    report=report,
+                )
+            )
+            for request, cached_result in zip(requests, cached_results):
+                result = cached_result or next(worker_results)
+                results.append(result)
+                report._record(request, result)
+    report.wall_time_sec += timer.elapsed_seconds()
+    return results
 
 
 def detach_ctes(
@@ -1,4 +1,15 @@
-from typing import Any, Callable, DefaultDict, Dict, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Protocol
 
@@ -54,3 +65,51 @@ class TopKDict(DefaultDict[_KT, _VT]):
 
 def int_top_k_dict() -> TopKDict[str, int]:
     return TopKDict(int)
+
+
+_HT = TypeVar("_HT", bound=Comparable)
+
+
+class HeavyHittersCounter(Generic[_HT]):
+    """Approximate counts of the most frequent keys, in bounded memory.
+
+    This is a batched variant of the Space-Saving algorithm. Up to 2 * capacity keys
+    are counted exactly. Once there are more, only the capacity keys with the highest
+    counts are kept, and keys that are seen later start from the highest count that
+    was dropped. Counts can therefore be overestimated, but never underestimated.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+
+        self.capacity = capacity
+        self._counts: Dict[_HT, int] = {}
+        self._dropped_count = 0
+
+    @property
+    def is_exact(self) -> bool:
+        return self._dropped_count == 0
+
+    def add(self, key: _HT, count: int = 1) -> None:
+        if key in self._counts:
+            self._counts[key] += count
+        else:
+            self._counts[key] = self._dropped_count + count
+            if len(self._counts) > 2 * self.capacity:
+                self._prune()
+
+    def _prune(self) -> None:
+        ranked = self.most_common()
+        self._dropped_count = max(
+            self._dropped_count, *(count for _, count in ranked[self.capacity :])
+        )
+        self._counts = dict(ranked[: self.capacity])
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[_HT, int]]:
+        """Returns the n keys with the highest counts, breaking ties by key."""
+        ranked = sorted(self._counts.items(), key=lambda item: (-item[1], item[0]))
+        return ranked if n is None else ranked[:n]
+
+    def __len__(self) -> int:
+        return len(self._counts)
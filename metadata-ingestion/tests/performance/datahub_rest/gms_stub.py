@@ -0,0 +1,63 @@
+import asyncio
+import threading
+from typing import Optional
+
+from aiohttp import web
+
+
+class GmsStubServer:
+    """A minimal stand-in for DataHub GMS that accepts ingest requests.
+
+    Every ingest request sleeps for `latency_sec` before responding, which
+    approximates the round trip to a real GMS instance.
+    """
+
+    def __init__(self, latency_sec: float = 0.02, port: int = 0) -> None:
+        self.latency_sec = latency_sec
+        self.port = port
+        self.requests_received = 0
+
+        self._loop = asyncio.new_event_loop()
+        self._thread: Optional[threading.Thread] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://localhost:{self.port}"
+
+    async def _handle_config(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"noCode": "true", "versions": {"linkedin/datahub": {"version": "stub"}}}
+        )
+
+    async def _handle_ingest(self, request: web.Request) -> web.Response:
+        await request.read()
+        self.requests_received += 1
+        await asyncio.sleep(self.latency_sec)
+        return web.json_response({"value": "ok"})
+
+    async def _start(self) -> None:
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_get("/config", self._handle_config)
+        app.router.add_post("/aspects", self._handle_ingest)
+        app.router.add_post("/entities", self._handle_ingest)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "localhost", self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore
+
+    def __enter__(self) -> "GmsStubServer":
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        assert self._runner is not None
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        assert self._thread is not None
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,77 @@
+import logging
+from typing import Dict, Type
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import NoopWriteCallback, Sink
+from datahub.ingestion.sink.datahub_rest import DatahubRestSink
+from datahub.ingestion.sink.datahub_rest_async import DatahubRestAsyncSink
+from datahub.metadata.schema_classes import StatusClass
+from datahub.utilities.perf_timer import PerfTimer
+from tests.performance.datahub_rest.gms_stub import GmsStubServer
+
+NUM_RECORDS = 20_000
+GMS_LATENCY_SEC = 0.02
+
+
+def run_sink(sink_class: Type[Sink], config: Dict, num_records: int) -> float:
+    ctx = PipelineContext(run_id="perf-test")
+    sink = sink_class.create(config, ctx)
+    callback = NoopWriteCallback()
+
+    with PerfTimer() as timer:
+        for i in range(num_records):
+            mcp = MetadataChangeProposalWrapper(
+                entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:perf,table{i},PROD)",
+                aspect=StatusClass(removed=False),
+            )
+            sink.write_record_async(
+                RecordEnvelope(mcp, metadata={"workunit_id": str(i)}), callback
+            )
+        sink.close()
+        elapsed = timer.elapsed_seconds()
+
+    report = sink.get_report()
+    assert report.total_records_written == num_records, report.as_string()
+    assert not report.failures, report.as_string()
+    return elapsed
+
+
+def run_test() -> None:
+    with GmsStubServer(latency_sec=GMS_LATENCY_SEC) as gms:
+        print(f"Stub GMS running at {gms.url} with {GMS_LATENCY_SEC}s latency")
+
+        for name, sink_class, config in [
+            (
+                "datahub-rest (threaded, 15 threads)",
+                DatahubRestSink,
+                {"server": gms.url, "max_threads": 15},
+            ),
+            (
+                "datahub-rest (threaded, 100 threads)",
+                DatahubRestSink,
+                {"server": gms.url, "max_threads": 100},
+            ),
+            (
+                "datahub-rest-async (100 connections)",
+                DatahubRestAsyncSink,
+                {"server": gms.url, "max_connections": 100},
+            ),
+            (
+                "datahub-rest-async (500 connections)",
+                DatahubRestAsyncSink,
+                {"server": gms.url, "max_connections": 500},
+            ),
+        ]:
+            elapsed = run_sink(sink_class, config, NUM_RECORDS)
+            print(
+                f"{name}: {NUM_RECORDS} records in {elapsed:.2f} seconds "
+                f"({NUM_RECORDS / elapsed:.0f} records/sec)"
+            )
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    run_test()
@@ -0,0 +1,95 @@
+import json
+import pickle
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from datahub.utilities.file_backed_collections import FileBackedDict
+from datahub.utilities.perf_timer import PerfTimer
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore
+
+NUM_KEYS = 10_000_000
+BATCH_SIZE = 100_000
+NUM_LOOKUPS = 100_000
+
+Serde = Tuple[Callable[[Any], Any], Callable[[Any], Any]]
+
+
+def make_value(i: int) -> Dict[str, Any]:
+    return {"query_count": i, "users": [f"user_{i % 100}"], "last_seen": 1_690_000_000}
+
+
+def report(name: str, num_ops: int, timer: PerfTimer) -> None:
+    elapsed = timer.elapsed_seconds()
+    print(f"{name:<50} {elapsed:8.2f} s {num_ops / elapsed:12,.0f} ops/s")
+
+
+def run_benchmark(
+    name: str,
+    num_keys: int,
+    serde: Serde,
+    pragmas: Optional[Dict[str, Union[int, str]]] = None,
+    bulk: bool = True,
+) -> None:
+    serializer, deserializer = serde
+    cache = FileBackedDict[Dict[str, Any]](
+        serializer=serializer, deserializer=deserializer, pragmas=pragmas
+    )
+    keys = [f"key_{i:09}" for i in range(num_keys)]
+    lookup_keys = keys[:: max(1, num_keys // NUM_LOOKUPS)]
+
+    with PerfTimer() as timer:
+        if bulk:
+            for start in range(0, num_keys, BATCH_SIZE):
+                cache.update_many(
+                    (keys[i], make_value(i))
+                    for i in range(start, min(start + BATCH_SIZE, num_keys))
+                )
+        else:
+            for i, key in enumerate(keys):
+                cache[key] = make_value(i)
+            cache.flush()
+    report(f"{name}: write", num_keys, timer)
+
+    with PerfTimer() as timer:
+        if bulk:
+            values: List[Any] = list(cache.get_many(lookup_keys).values())
+        else:
+            values = [cache[key] for key in lookup_keys]
+    assert len(values) == len(lookup_keys)
+    report(f"{name}: random reads", len(lookup_keys), timer)
+
+    with PerfTimer() as timer:
+        num_read = sum(1 for _ in cache.items_in_range(keys[0], keys[num_keys // 10]))
+    report(f"{name}: range scan", num_read, timer)
+
+    cache.close()
+
+
+def run_test(num_keys: int) -> None:
+    serdes: Dict[str, Serde] = {
+        "pickle": (pickle.dumps, pickle.loads),
+        "json": (json.dumps, json.loads),
+    }
+    if msgpack is not None:
+        serdes["msgpack"] = (msgpack.packb, msgpack.unpackb)
+    else:
+        print("msgpack is not installed, skipping it")
+
+    print(f"Benchmarking FileBackedDict with {num_keys:,} keys")
+    run_benchmark("one at a time", num_keys, serdes["pickle"], bulk=False)
+    for serde_name, serde in serdes.items():
+        run_benchmark(f"bulk, {serde_name}", num_keys, serde)
+    run_benchmark(
+        "bulk, pickle, WAL + mmap + 16k pages",
+        num_keys,
+        serdes["pickle"],
+        pragmas={"journal_mode": "WAL", "mmap_size": 2**30, "page_size": 16384},
+    )
+
+
+if __name__ == "__main__":
+    run_test(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_KEYS)
@@ -0,0 +1,77 @@
+import logging
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+from datahub.ingestion.graph.client import DatahubClientConfig, DataHubGraph
+from datahub.utilities.perf_timer import PerfTimer
+
+NUM_PAGES = 50
+PAGE_SIZE = 1000
+GMS_LATENCY_SEC = 0.05
+PROCESSING_TIME_PER_PAGE_SEC = 0.05
+
+
+def mock_execute_graphql(query: str, variables: Dict) -> Dict:
+    """Stands in for the scrollAcrossEntities endpoint, with a fixed latency per page.
+
+    There are NUM_PAGES pages per entity type.
+    """
+    time.sleep(GMS_LATENCY_SEC)
+    page = int(variables["scrollId"] or 0)
+    types: List[str] = variables["types"]
+    prefix = "-".join(types)
+    return {
+        "scrollAcrossEntities": {
+            "nextScrollId": (
+                str(page + 1) if page + 1 < NUM_PAGES * len(types) else None
+            ),
+            "searchResults": [
+                {"entity": {"urn": f"urn:li:dataset:{prefix}-{page}-{i}"}}
+                for i in range(PAGE_SIZE)
+            ],
+        }
+    }
+
+
+def run_scroll(graph: DataHubGraph, entity_types: List[str], prefetch: bool) -> float:
+    variables = {
+        "types": [entity_type.upper() for entity_type in entity_types],
+        "query": "*",
+        "orFilters": [],
+        "batchSize": PAGE_SIZE,
+    }
+    with PerfTimer() as timer:
+        num_urns = 0
+        for _ in graph._scroll_across_entities("", variables, prefetch=prefetch):
+            num_urns += 1
+            if num_urns % PAGE_SIZE == 0:
+                # Simulates the caller processing a page.
+                time.sleep(PROCESSING_TIME_PER_PAGE_SEC)
+        elapsed = timer.elapsed_seconds()
+
+    assert num_urns == NUM_PAGES * PAGE_SIZE * len(entity_types)
+    return elapsed
+
+
+def run_test() -> None:
+    with patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection"):
+        graph = DataHubGraph(DatahubClientConfig())
+
+    with patch.object(graph, "execute_graphql", side_effect=mock_execute_graphql):
+        for entity_types in [["dataset"], ["dataset", "chart", "dashboard"]]:
+            num_urns = NUM_PAGES * PAGE_SIZE * len(entity_types)
+            for prefetch in [False, True]:
+                elapsed = run_scroll(graph, entity_types, prefetch)
+                print(
+                    f"{len(entity_types)} entity type(s), prefetch={prefetch}: "
+                    f"{num_urns} urns in {elapsed:.2f} seconds "
+                    f"({num_urns / elapsed:.0f} urns/sec)"
+                )
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    run_test()
@@ -0,0 +1,114 @@
+import json
+import logging
+import time
+from typing import Iterable, List
+
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.source import Source, SourceReport
+from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.run.pipeline import Pipeline
+from datahub.metadata.schema_classes import DatasetPropertiesClass
+from datahub.utilities.perf_timer import PerfTimer
+
+NUM_WORKUNITS = 2000
+LOOKUP_LATENCY_SEC = 0.005
+CPU_WORK_ITERATIONS = 200
+
+
+class ManyDatasetsSource(Source):
+    def __init__(self, ctx: PipelineContext):
+        super().__init__(ctx)
+        self.report = SourceReport()
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Source":
+        return cls(ctx)
+
+    def get_workunits(self) -> Iterable[MetadataWorkUnit]:
+        for i in range(NUM_WORKUNITS):
+            yield MetadataChangeProposalWrapper(
+                entityUrn=make_dataset_urn("perf", f"table_{i}"),
+                aspect=DatasetPropertiesClass(description=f"Table {i}"),
+            ).as_workunit()
+
+    def get_report(self) -> SourceReport:
+        return self.report
+
+
+class LookupTransformer(Transformer):
+    """Stands in for a transformer that looks up each entity in DataHub or another
+    external system, with a fixed latency per lookup."""
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
+        return cls()
+
+    def is_thread_safe(self) -> bool:
+        return True
+
+    def transform(
+        self, record_envelopes: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        for record_envelope in record_envelopes:
+            if isinstance(record_envelope.record, MetadataChangeProposalWrapper):
+                time.sleep(LOOKUP_LATENCY_SEC)
+            yield record_envelope
+
+
+class CpuBoundTransformer(Transformer):
+    """Stands in for a transformer that only does pure Python work on each record."""
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
+        return cls()
+
+    def is_thread_safe(self) -> bool:
+        return True
+
+    def transform(
+        self, record_envelopes: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        for record_envelope in record_envelopes:
+            if isinstance(record_envelope.record, MetadataChangeProposalWrapper):
+                for _ in range(CPU_WORK_ITERATIONS):
+                    json.dumps(record_envelope.record.to_obj())
+            yield record_envelope
+
+
+def run_pipeline(transformer_type: str, threads: int) -> float:
+    pipeline = Pipeline.create(
+        {
+            "source": {"type": f"{__name__}.ManyDatasetsSource"},
+            "transformers": [{"type": f"{__name__}.{transformer_type}"}],
+            "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+            "run_id": "workunit_processing_perf",
+            "flags": {"workunit_processing_threads": threads},
+        }
+    )
+    with PerfTimer() as timer:
+        pipeline.run()
+        elapsed = timer.elapsed_seconds()
+    pipeline.raise_from_status()
+    return elapsed
+
+
+def run_test() -> None:
+    thread_counts: List[int] = [0, 4, 16]
+    for transformer_type in ["LookupTransformer", "CpuBoundTransformer"]:
+        for threads in thread_counts:
+            elapsed = run_pipeline(transformer_type, threads)
+            print(
+                f"{transformer_type}, workunit_processing_threads={threads}: "
+                f"{NUM_WORKUNITS} workunits in {elapsed:.2f} seconds "
+                f"({NUM_WORKUNITS / elapsed:.0f} workunits/sec)"
+            )
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    run_test()
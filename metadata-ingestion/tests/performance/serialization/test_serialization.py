@@ -0,0 +1,94 @@
+import json
+from typing import Callable
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.rest_emitter import _make_mcp_payload
+from datahub.emitter.serialization_helper import pre_json_transform, to_pre_json_obj
+from datahub.metadata.schema_classes import (
+    AuditStampClass,
+    GlobalTagsClass,
+    GlossaryTermAssociationClass,
+    GlossaryTermsClass,
+    MySqlDDLClass,
+    NumberTypeClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+    SchemaMetadataClass,
+    StringTypeClass,
+    TagAssociationClass,
+)
+from datahub.utilities.perf_timer import PerfTimer
+
+NUM_FIELDS = 1000
+NUM_ITERATIONS = 20
+
+
+def make_schema_metadata(num_fields: int) -> SchemaMetadataClass:
+    fields = []
+    for i in range(num_fields):
+        fields.append(
+            SchemaFieldClass(
+                fieldPath=f"struct_{i // 10}.column_{i}",
+                type=SchemaFieldDataTypeClass(
+                    type=NumberTypeClass() if i % 3 == 0 else StringTypeClass()
+                ),
+                nativeDataType="NUMBER(38,0)" if i % 3 == 0 else "VARCHAR(16777216)",
+                description=f"Description of column {i}, which is long-ish.",
+                nullable=i % 2 == 0,
+                globalTags=GlobalTagsClass(
+                    tags=[TagAssociationClass(tag="urn:li:tag:pii")]
+                )
+                if i % 10 == 0
+                else None,
+                glossaryTerms=GlossaryTermsClass(
+                    terms=[GlossaryTermAssociationClass(urn="urn:li:glossaryTerm:id")],
+                    auditStamp=AuditStampClass(time=0, actor="urn:li:corpuser:datahub"),
+                )
+                if i % 25 == 0
+                else None,
+            )
+        )
+
+    return SchemaMetadataClass(
+        schemaName="db.schema.table",
+        platform="urn:li:dataPlatform:snowflake",
+        version=0,
+        hash="",
+        platformSchema=MySqlDDLClass(tableSchema=""),
+        fields=fields,
+    )
+
+
+def time_it(name: str, fn: Callable[[], object]) -> float:
+    fn()  # warm up
+    with PerfTimer() as timer:
+        for _ in range(NUM_ITERATIONS):
+            fn()
+        per_call_ms = timer.elapsed_seconds() * 1000 / NUM_ITERATIONS
+    print(f"{name:<45} {per_call_ms:8.2f} ms")
+    return per_call_ms
+
+
+def run_test() -> None:
+    schema_metadata = make_schema_metadata(NUM_FIELDS)
+    print(f"Serializing SchemaMetadata with {NUM_FIELDS} fields")
+
+    slow = time_it(
+        "aspect: json.dumps(pre_json_transform(to_obj()))",
+        lambda: json.dumps(pre_json_transform(schema_metadata.to_obj())),
+    )
+    fast = time_it(
+        "aspect: json.dumps(to_pre_json_obj())",
+        lambda: json.dumps(to_pre_json_obj(schema_metadata)),
+    )
+    print(f"Speedup: {slow / fast:.1f}x")
+
+    mcp = MetadataChangeProposalWrapper(
+        entityUrn="urn:li:dataset:(urn:li:dataPlatform:snowflake,db.schema.table,PROD)",
+        aspect=schema_metadata,
+    )
+    time_it("mcp payload", lambda: _make_mcp_payload(mcp))
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,63 @@
+import multiprocessing
+import sys
+from typing import List
+
+from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.sql_parser import (
+    SqlLineageSQLParser,
+    sql_lineage_parser_impl_func_wrapper,
+)
+
+NUM_QUERIES = 1000
+
+
+def make_queries(num_queries: int) -> List[str]:
+    return [
+        f"""
+        SELECT o.order_id, o.amount_{i}, c.name, c.region
+        FROM sales.orders_{i % 50} o
+        JOIN sales.customers c ON o.customer_id = c.id
+        WHERE o.created_at > '2023-01-01'
+        """
+        for i in range(num_queries)
+    ]
+
+
+def parse_with_process_per_query(query: str) -> None:
+    # This is how SqlLineageSQLParser used to isolate sqllineage.
+    queue: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=sql_lineage_parser_impl_func_wrapper, args=(queue, query)
+    )
+    process.start()
+    queue.get(block=True)
+    process.join()
+
+
+def report(name: str, num_queries: int, timer: PerfTimer) -> None:
+    elapsed = timer.elapsed_seconds()
+    print(f"{name:<30} {elapsed:8.2f} s {num_queries / elapsed:10.1f} queries/s")
+
+
+def run_test(num_queries: int) -> None:
+    queries = make_queries(num_queries)
+    print(f"Parsing {num_queries} queries with sqllineage")
+
+    with PerfTimer() as timer:
+        for query in queries:
+            parse_with_process_per_query(query)
+    report("process per query", num_queries, timer)
+
+    with PerfTimer() as timer:
+        for query in queries:
+            SqlLineageSQLParser(query, use_external_process=True)
+    report("worker pool, one at a time", num_queries, timer)
+
+    with PerfTimer() as timer:
+        results = SqlLineageSQLParser.get_tables_columns_batch(queries)
+    assert not any(isinstance(result, Exception) for result in results)
+    report("worker pool, batched", num_queries, timer)
+
+
+if __name__ == "__main__":
+    run_test(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_QUERIES)
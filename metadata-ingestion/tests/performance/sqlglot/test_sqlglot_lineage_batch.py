@@ -0,0 +1,77 @@
+import os
+import sys
+from typing import List
+
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.sqlglot_lineage import (
+    SchemaResolver,
+    SqlParsingBatchReport,
+    SqlParsingRequest,
+    _sqlglot_lineage_uncached,
+    sqlglot_lineage_batch,
+)
+
+NUM_STATEMENTS = 2000
+NUM_TABLES = 100
+NUM_COLUMNS = 20
+
+
+def make_schema_resolver() -> SchemaResolver:
+    schema_resolver = SchemaResolver(platform="snowflake")
+    for i in range(NUM_TABLES):
+        schema_resolver.add_raw_schema_info(
+            make_dataset_urn("snowflake", f"db.schema.table_{i}"),
+            {f"col_{j}": "VARCHAR" for j in range(NUM_COLUMNS)},
+        )
+    return schema_resolver
+
+
+def make_requests(num_statements: int) -> List[SqlParsingRequest]:
+    return [
+        SqlParsingRequest(
+            f"""
+            INSERT INTO table_{i % NUM_TABLES}
+            SELECT a.col_0, a.col_1, b.col_2, sum(b.col_3) AS col_3
+            FROM table_{(i + 1) % NUM_TABLES} a
+            JOIN (SELECT col_0, col_2, col_3 FROM table_{(i + 2) % NUM_TABLES}) b
+              ON a.col_0 = b.col_0
+            WHERE a.col_4 > {i}
+            GROUP BY a.col_0, a.col_1, b.col_2
+            """,
+            default_db="db",
+            default_schema="schema",
+        )
+        for i in range(num_statements)
+    ]
+
+
+def run_test(num_statements: int) -> None:
+    requests = make_requests(num_statements)
+    print(f"Parsing {num_statements} statements, {os.cpu_count()} CPUs")
+
+    schema_resolver = make_schema_resolver()
+    with PerfTimer() as timer:
+        for request in requests:
+            _sqlglot_lineage_uncached(
+                request.sql,
+                schema_resolver,
+                default_db=request.default_db,
+                default_schema=request.default_schema,
+            )
+    print(f"{'one at a time':<20} {num_statements / timer.elapsed_seconds():8.1f}/s")
+
+    for max_workers in [2, 4, 8]:
+        report = SqlParsingBatchReport()
+        sqlglot_lineage_batch(
+            requests, schema_resolver, max_workers=max_workers, report=report
+        )
+        print(
+            f"{f'{max_workers} workers':<20} {num_statements / report.wall_time_sec:8.1f}/s"
+            f" (max statement {report.max_statement_parse_time_sec * 1000:.0f} ms,"
+            f" {report.num_table_errors} errors)"
+        )
+
+
+if __name__ == "__main__":
+    run_test(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_STATEMENTS)
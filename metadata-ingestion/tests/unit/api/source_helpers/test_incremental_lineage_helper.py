@@ -259,3 +259,30 @@ def test_incremental_column_lineage_more_upstreams_in_gms_aspect(
     mce_helpers.check_golden_file(
         pytestconfig=pytestconfig, output_path=test_file, golden_path=golden_file
     )
+
+
+def test_incremental_lineage_clears_prefetched_lineage() -> None:
+    mock_graph = MagicMock()
+    mock_graph.get_aspect.return_value = None
+    urns = [make_dataset_urn(platform, f"dataset{i}") for i in range(3)]
+
+    processed_wus = list(
+        auto_incremental_lineage(
+            graph=mock_graph,
+            incremental_lineage=True,
+            stream=[
+                MetadataChangeProposalWrapper(
+                    entityUrn=urn, aspect=base_cll_aspect()
+                ).as_workunit()
+                for urn in urns
+            ],
+        )
+    )
+
+    assert len(processed_wus) == 3
+    mock_graph.prefetch_aspects.assert_called_once_with(
+        urns, [models.UpstreamLineageClass]
+    )
+    mock_graph.clear_prefetched_aspects.assert_called_once_with(
+        urns, models.UpstreamLineageClass.ASPECT_NAME
+    )
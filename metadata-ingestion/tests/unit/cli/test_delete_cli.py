@@ -0,0 +1,126 @@
+import pathlib
+import threading
+import time
+from typing import List
+from unittest import mock
+
+from datahub.cli.delete_cli import _delete_urns, _peek
+from datahub.ingestion.graph.client import DataHubGraph
+
+
+def _make_urns(count: int) -> List[str]:
+    return [
+        f"urn:li:dataset:(urn:li:dataPlatform:hive,table_{i},PROD)"
+        for i in range(count)
+    ]
+
+
+def test_peek() -> None:
+    urns = _make_urns(5)
+    preview, has_more, all_urns = _peek(iter(urns), 3)
+    assert preview == urns[:3]
+    assert has_more
+    assert list(all_urns) == urns
+
+    preview, has_more, all_urns = _peek(iter(urns), 5)
+    assert preview == urns
+    assert not has_more
+    assert list(all_urns) == urns
+
+
+def test_soft_delete_in_batches(tmp_path: pathlib.Path) -> None:
+    graph = mock.create_autospec(DataHubGraph, instance=True)
+    urns = _make_urns(250)
+    progress_file = tmp_path / "progress.txt"
+
+    result = _delete_urns(
+        graph=graph,
+        urns=iter(urns),
+        soft=True,
+        dry_run=False,
+        aspect_name=None,
+        start_time=None,
+        end_time=None,
+        workers=2,
+        rate_limit=None,
+        progress_file=str(progress_file),
+    )
+
+    assert result.num_entities == 250
+    batches = [
+        call.kwargs["urns"] for call in graph.soft_delete_entities.call_args_list
+    ]
+    assert sorted(len(batch) for batch in batches) == [50, 100, 100]
+    assert sorted(urn for batch in batches for urn in batch) == sorted(urns)
+    graph.soft_delete_entity.assert_not_called()
+    assert sorted(progress_file.read_text().splitlines()) == sorted(urns)
+
+
+def test_hard_delete_concurrently() -> None:
+    graph = mock.create_autospec(DataHubGraph, instance=True)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def hard_delete_entity(urn: str) -> tuple:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return 1, 0
+
+    graph.hard_delete_entity.side_effect = hard_delete_entity
+
+    result = _delete_urns(
+        graph=graph,
+        urns=_make_urns(20),
+        soft=False,
+        dry_run=False,
+        aspect_name=None,
+        start_time=None,
+        end_time=None,
+        workers=4,
+        rate_limit=None,
+    )
+
+    assert result.num_entities == 20
+    assert result.num_records == 20
+    assert graph.hard_delete_entity.call_count == 20
+    assert 1 < max_running <= 4
+
+
+def test_rate_limit_with_workers() -> None:
+    graph = mock.create_autospec(DataHubGraph, instance=True)
+    lock = threading.Lock()
+    call_times: List[float] = []
+
+    def hard_delete_entity(urn: str) -> tuple:
+        with lock:
+            call_times.append(time.monotonic())
+        time.sleep(0.05)
+        return 1, 0
+
+    graph.hard_delete_entity.side_effect = hard_delete_entity
+
+    rate_limit = 20
+    result = _delete_urns(
+        graph=graph,
+        urns=_make_urns(30),
+        soft=False,
+        dry_run=False,
+        aspect_name=None,
+        start_time=None,
+        end_time=None,
+        workers=8,
+        rate_limit=rate_limit,
+    )
+
+    assert result.num_entities == 30
+    # No one second window has more than rate_limit deletes, even though
+    # several workers are deleting at once.
+    call_times.sort()
+    for i in range(len(call_times) - rate_limit):
+        assert call_times[i + rate_limit] - call_times[i] >= 1 - 0.01
@@ -1,11 +1,14 @@
+from typing import Dict, Optional
 from unittest.mock import Mock, patch
 
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.graph.client import (
     DatahubClientConfig,
     DataHubGraph,
     _graphql_entity_type,
 )
-from datahub.metadata.schema_classes import CorpUserEditableInfoClass
+from datahub.metadata.schema_classes import CorpUserEditableInfoClass, CorpUserInfoClass
+from datahub.utilities.urns.urn import Urn
 
 
 @patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
@@ -43,3 +46,125 @@ def test_graphql_entity_types():
     assert _graphql_entity_type("glossaryTerm") == "GLOSSARY_TERM"
 
     assert _graphql_entity_type("dataHubExecutionRequest") == "EXECUTION_REQUEST"
+
+
+def _make_scroll_response(entity_type: str, scroll_id: Optional[str]) -> Dict:
+    # Three pages of two entities per entity type.
+    page = int(scroll_id) if scroll_id else 0
+    return {
+        "scrollAcrossEntities": {
+            "nextScrollId": str(page + 1) if page < 2 else None,
+            "searchResults": [
+                {"entity": {"urn": f"urn:li:{entity_type.lower()}:{page}-{i}"}}
+                for i in range(2)
+            ],
+        }
+    }
+
+
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_get_urns_by_filter_prefetch(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig())
+
+    def execute_graphql(query: str, variables: Dict) -> Dict:
+        (entity_type,) = variables["types"]
+        return _make_scroll_response(entity_type, variables["scrollId"])
+
+    with patch.object(graph, "execute_graphql", side_effect=execute_graphql) as mock:
+        urns = list(graph.get_urns_by_filter(entity_types=["dataset"]))
+        assert urns == [
+            f"urn:li:dataset:{page}-{i}" for page in range(3) for i in range(2)
+        ]
+        assert mock.call_count == 3
+
+        # Each entity type is scrolled separately.
+        mock.reset_mock()
+        urns = list(graph.get_urns_by_filter(entity_types=["dataset", "chart"]))
+        assert sorted(urns) == sorted(
+            f"urn:li:{entity_type}:{page}-{i}"
+            for entity_type in ["dataset", "chart"]
+            for page in range(3)
+            for i in range(2)
+        )
+        assert mock.call_count == 6
+
+
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_prefetch_aspects(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig())
+    urns = [f"urn:li:corpuser:user{i}" for i in range(5)]
+
+    def batch_get(method: str, url: str, data: str, headers: Dict) -> Dict:
+        assert method == "POST"
+        assert headers["X-HTTP-Method-Override"] == "GET"
+        batch_urns = [urn for urn in urns if Urn.url_encode(urn) in data.split("&")[0]]
+        return {
+            "results": {
+                urn: {
+                    "urn": urn,
+                    "aspects": {
+                        "corpUserEditableInfo": {
+                            "name": "corpUserEditableInfo",
+                            "value": {"displayName": urn},
+                        }
+                    }
+                    # The last user has no editable info.
+                    if urn != urns[-1] else {},
+                }
+                for urn in batch_urns
+            }
+        }
+
+    with patch.object(
+        graph, "_send_restli_request", side_effect=batch_get
+    ) as mock_request:
+        graph.prefetch_aspects(urns, [CorpUserEditableInfoClass], batch_size=2)
+        assert mock_request.call_count == 3
+
+        # Already prefetched aspects are not fetched again.
+        graph.prefetch_aspects(urns[:2], [CorpUserEditableInfoClass])
+        assert mock_request.call_count == 3
+
+    with patch("requests.Session.get") as mock_get:
+        for urn in urns[:-1]:
+            aspect = graph.get_aspect(urn, CorpUserEditableInfoClass)
+            assert aspect is not None
+            assert aspect.displayName == urn
+        assert graph.get_aspect(urns[-1], CorpUserEditableInfoClass) is None
+        mock_get.assert_not_called()
+
+        # Prefetched aspects are only returned once.
+        mock_get.return_value.status_code = 404
+        assert graph.get_aspect(urns[0], CorpUserEditableInfoClass) is None
+        mock_get.assert_called_once()
+
+
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_prefetched_aspects_are_dropped_on_write(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig())
+    urns = [f"urn:li:corpuser:user{i}" for i in range(3)]
+    for urn in urns:
+        for aspect in ["corpUserEditableInfo", "corpUserInfo"]:
+            graph._prefetched_aspects[(urn, aspect)] = None
+
+    with patch.object(graph, "_emit_generic"):
+        graph.emit_mcp(
+            MetadataChangeProposalWrapper(
+                entityUrn=urns[0],
+                aspect=CorpUserEditableInfoClass(displayName="user0"),
+            )
+        )
+    assert (urns[0], "corpUserEditableInfo") not in graph._prefetched_aspects
+    assert (urns[0], "corpUserInfo") in graph._prefetched_aspects
+
+    graph.clear_prefetched_aspects([urns[1]])
+    assert not any(urn == urns[1] for urn, _ in graph._prefetched_aspects)
+
+    graph.clear_prefetched_aspects(aspect_name=CorpUserInfoClass.ASPECT_NAME)
+    assert list(graph._prefetched_aspects) == [(urns[2], "corpUserEditableInfo")]
+
+    graph.clear_prefetched_aspects()
+    assert not graph._prefetched_aspects
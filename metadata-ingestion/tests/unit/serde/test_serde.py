@@ -2,6 +2,7 @@ import io
 import json
 import pathlib
 import shutil
+from typing import Optional, Tuple
 from unittest.mock import patch
 
 import fastavro
@@ -11,12 +12,25 @@ from freezegun import freeze_time
 
 import datahub.metadata.schema_classes as models
 from datahub.cli.json_file import check_mce_file
-from datahub.emitter import mce_builder
-from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
+from datahub.emitter import mce_builder, serialization_helper
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.serialization_helper import (
+    post_json_transform,
+    pre_json_transform,
+    to_pre_json_obj,
+)
+from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.run.pipeline import Pipeline
-from datahub.ingestion.source.file import FileSourceConfig, GenericFileSource
+from datahub.ingestion.sink.file import FileSinkConfig, write_metadata_file
+from datahub.ingestion.source.file import (
+    FileSourceConfig,
+    FileSourceReport,
+    GenericFileSource,
+    read_metadata_file,
+)
 from datahub.metadata.schema_classes import MetadataChangeEventClass
 from datahub.metadata.schemas import getMetadataChangeEventSchema
+from datahub.utilities.json_lines import JsonLinesWriter
 from tests.test_helpers import mce_helpers
 from tests.test_helpers.click_helpers import run_datahub_cmd
 from tests.test_helpers.type_helpers import PytestConfig
@@ -63,6 +77,146 @@ def test_serde_to_json(
     )
 
 
+@freeze_time(FROZEN_TIME)
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_serde_to_jsonl(
+    pytestconfig: PytestConfig, tmp_path: pathlib.Path, compression: Optional[str]
+) -> None:
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    golden_file = pytestconfig.rootpath / "tests/unit/serde/test_serde_large.json"
+    jsonl_file = tmp_path / "output.jsonl"
+    output_file = tmp_path / "output.json"
+
+    pipeline = Pipeline.create(
+        {
+            "source": {"type": "file", "config": {"path": str(golden_file)}},
+            "sink": {
+                "type": "file",
+                "config": {
+                    "filename": str(jsonl_file),
+                    "format": "jsonl",
+                    "compression": compression,
+                },
+            },
+            "run_id": "serde_test",
+        }
+    )
+    pipeline.run()
+    pipeline.raise_from_status()
+    num_records = len(json.loads(golden_file.read_text()))
+
+    # The JSON Lines file can be read back without knowing how it was written,
+    # and the record count comes from the footer rather than a counting pass.
+    source = GenericFileSource(
+        ctx=PipelineContext(run_id="serde_test"),
+        config=FileSourceConfig(path=str(jsonl_file)),
+    )
+    records = []
+    for _, obj in source._iterate_file(str(jsonl_file)):
+        assert source.report.current_file_num_elements == num_records
+        records.append(obj)
+    assert len(records) == num_records
+    assert source.report.total_count_time_in_seconds == 0
+
+    pipeline = Pipeline.create(
+        {
+            "source": {"type": "file", "config": {"path": str(jsonl_file)}},
+            "sink": {"type": "file", "config": {"filename": str(output_file)}},
+            "run_id": "serde_test",
+        }
+    )
+    pipeline.run()
+    pipeline.raise_from_status()
+
+    mce_helpers.check_golden_file(
+        pytestconfig,
+        output_path=f"{output_file}",
+        golden_path=golden_file,
+    )
+
+
+def test_read_jsonl_without_footer(tmp_path: pathlib.Path) -> None:
+    records = list(
+        read_metadata_file(pathlib.Path("tests/unit/serde/test_serde_large.json"))
+    )
+    jsonl_file = tmp_path / "output.ndjson"
+    with jsonl_file.open("w") as f:
+        for record in records:
+            f.write(json.dumps(record.to_obj()) + "\n\n")
+
+    source = GenericFileSource(
+        ctx=PipelineContext(run_id="serde_test"),
+        config=FileSourceConfig(path=str(jsonl_file)),
+    )
+    assert len(list(source.iterate_generic_file(str(jsonl_file)))) == len(records)
+    assert not source.report.failures
+
+
+def test_file_source_parallel(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> None:
+    # Split JSON Lines files into many small chunks.
+    monkeypatch.setattr(FileSourceConfig, "_parallel_chunk_size_in_bytes", 2000)
+
+    records = list(
+        read_metadata_file(pathlib.Path("tests/unit/serde/test_serde_large.json"))
+    )
+    shutil.copy("tests/unit/serde/test_serde_large.json", tmp_path / "a.json")
+    for name, compression in [("b.json", None), ("c.json", "gzip")]:
+        writer = JsonLinesWriter(tmp_path / name, compression)
+        for record in records:
+            writer.write(record.to_obj())
+        writer.close()
+    (tmp_path / "d.json").write_text("[{}]")
+
+    def read_workunits(max_workers: int) -> Tuple[list, FileSourceReport]:
+        source = GenericFileSource(
+            ctx=PipelineContext(run_id="serde_test"),
+            config=FileSourceConfig(path=str(tmp_path), max_workers=max_workers),
+        )
+        workunits = [(wu.id, wu.metadata) for wu in source.get_workunits_internal()]
+        return workunits, source.get_report()
+
+    workunits, report = read_workunits(max_workers=1)
+    parallel_workunits, parallel_report = read_workunits(max_workers=2)
+
+    assert len(workunits) == 3 * len(records)
+    assert parallel_workunits == workunits
+    assert sorted(parallel_report.files_completed) == sorted(report.files_completed)
+    assert parallel_report.total_bytes_read_completed_files == (
+        report.total_bytes_read_completed_files
+    )
+    assert dict(parallel_report.failures) == dict(report.failures)
+    assert len(report.failures) == 1
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_metadata_file_helpers_jsonl(
+    tmp_path: pathlib.Path, compression: Optional[str]
+) -> None:
+    records = list(
+        read_metadata_file(pathlib.Path("tests/unit/serde/test_serde_large.json"))
+    )
+
+    jsonl_file = tmp_path / "output.jsonl"
+    if compression is None:
+        write_metadata_file(jsonl_file, records)
+    else:
+        writer = JsonLinesWriter(jsonl_file, compression)
+        for record in records:
+            writer.write(record.to_obj())
+        writer.close()
+
+    assert list(read_metadata_file(jsonl_file)) == records
+
+
+def test_file_sink_compression_requires_jsonl() -> None:
+    with pytest.raises(ValueError, match="jsonl"):
+        FileSinkConfig.parse_obj({"filename": "output.json", "compression": "gzip"})
+
+
 @pytest.mark.parametrize(
     "json_filename",
     [
@@ -189,8 +343,8 @@ def test_field_discriminator() -> None:
     assert redo == cost_object
 
 
-def test_type_error() -> None:
-    dataflow = models.DataFlowSnapshotClass(
+def _make_invalid_dataflow() -> models.DataFlowSnapshotClass:
+    return models.DataFlowSnapshotClass(
         urn=mce_builder.make_data_flow_urn(
             orchestrator="argo", flow_id="42", cluster="DEV"
         ),
@@ -205,9 +359,28 @@ def test_type_error() -> None:
         ],
     )
 
+
+def test_type_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    dataflow = _make_invalid_dataflow()
+
     with pytest.raises(avrojson.AvroTypeException):
         dataflow.to_obj()
 
+    monkeypatch.setattr(serialization_helper, "VALIDATE_PRE_JSON_OBJ", True)
+    with pytest.raises(avrojson.AvroTypeException):
+        to_pre_json_obj(dataflow)
+
+
+def test_type_error_not_validated_by_default() -> None:
+    # Validation is off unless DATAHUB_VALIDATE_ASPECTS is set, so the fast path
+    # serializes the invalid value as is.
+    assert not serialization_helper.VALIDATE_PRE_JSON_OBJ
+
+    obj = to_pre_json_obj(_make_invalid_dataflow())
+    assert obj["aspects"][0]["com.linkedin.datajob.DataFlowInfo"][
+        "customProperties"
+    ] == {"x": 1}
+
 
 def test_null_hiding() -> None:
     schemaField = models.SchemaFieldClass(
@@ -352,6 +525,7 @@ def test_write_optional_empty_dict() -> None:
 def test_json_transforms(model, ref_server_obj):
     server_obj = pre_json_transform(model.to_obj())
     assert server_obj == ref_server_obj
+    assert to_pre_json_obj(model) == server_obj
 
     post_obj = post_json_transform(server_obj)
 
@@ -359,6 +533,30 @@ def test_json_transforms(model, ref_server_obj):
     assert recovered == model
 
 
+@pytest.mark.parametrize(
+    "json_filename",
+    [
+        "tests/unit/serde/test_serde_large.json",
+        "tests/unit/serde/test_serde_chart_snapshot.json",
+        "tests/unit/serde/test_serde_profile.json",
+        "tests/unit/serde/test_serde_backwards_compat.json",
+    ],
+)
+def test_to_pre_json_obj(pytestconfig: PytestConfig, json_filename: str) -> None:
+    # The fast path must produce exactly the same output as the slow path,
+    # including key order.
+    for item in read_metadata_file(pytestconfig.rootpath / json_filename):
+        if isinstance(item, MetadataChangeEventClass):
+            model: models.DictWrapper = item.proposedSnapshot
+        elif isinstance(item, MetadataChangeProposalWrapper) and item.aspect:
+            model = item.aspect
+        else:
+            model = item
+
+        expected = pre_json_transform(model.to_obj())
+        assert json.dumps(to_pre_json_obj(model)) == json.dumps(expected)
+
+
 def test_unions_with_aliases_assumptions():
     # We have special handling for unions with aliases in our json serialization helpers.
     # Specifically, we assume that cost is the only instance of a union with alias.
@@ -1,11 +1,30 @@
 import pathlib
+from typing import Any, Iterable, List, Optional, Tuple
+from unittest import mock
 
 import pytest
 
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.metadata.schema_classes import (
+    OtherSchemaClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+    SchemaMetadataClass,
+    StringTypeClass,
+)
 from datahub.testing.check_sql_parser_result import assert_sql_result
 from datahub.utilities.sqlglot_lineage import (
     _UPDATE_ARGS_NOT_SUPPORTED_BY_SELECT,
+    SchemaResolver,
+    SqlParsingBatchReport,
+    SqlParsingCacheReport,
+    SqlParsingRequest,
+    SqlParsingResultCache,
+    _parse_statement,
     detach_ctes,
+    get_query_fingerprint,
+    sqlglot_lineage,
+    sqlglot_lineage_batch,
 )
 
 RESOURCE_DIR = pathlib.Path(__file__).parent / "goldens"
@@ -1023,3 +1042,302 @@ UPDATE accounts SET (contact_first_name, contact_last_name) =
         },
         expected_file=RESOURCE_DIR / "test_postgres_complex_update.json",
     )
+
+
+def _make_mock_graph(urns_with_schema: List[str]) -> mock.MagicMock:
+    def get_aspect(urn: str, aspect_type: type) -> Optional[SchemaMetadataClass]:
+        if urn not in urns_with_schema:
+            return None
+        return SchemaMetadataClass(
+            schemaName=urn,
+            platform="urn:li:dataPlatform:postgres",
+            version=0,
+            hash="",
+            platformSchema=OtherSchemaClass(rawSchema=""),
+            fields=[
+                SchemaFieldClass(
+                    fieldPath=field,
+                    type=SchemaFieldDataTypeClass(type=StringTypeClass()),
+                    nativeDataType="VARCHAR",
+                )
+                for field in ["id", "name"]
+            ],
+        )
+
+    def bulk_fetch_schema_info(
+        extraFilters: List[dict], **kwargs: Any
+    ) -> Iterable[Tuple[str, dict]]:
+        (urn_filter,) = extraFilters
+        for urn in urn_filter["values"]:
+            if urn in urns_with_schema:
+                yield urn, {
+                    "fields": [
+                        {"fieldPath": field, "nativeDataType": "VARCHAR"}
+                        for field in ["id", "name"]
+                    ]
+                }
+
+    graph = mock.MagicMock()
+    graph.get_aspect.side_effect = get_aspect
+    graph._bulk_fetch_schema_info_by_filter.side_effect = bulk_fetch_schema_info
+    return graph
+
+
+def test_sqlglot_lineage_batch_matches_sqlglot_lineage():
+    orders_urn = make_dataset_urn("postgres", "db.public.orders")
+    customers_urn = make_dataset_urn("postgres", "db.public.customers")
+
+    def make_schema_resolver() -> SchemaResolver:
+        # Only the customers table is missing from the cache, and exists in DataHub.
+        graph = _make_mock_graph([customers_urn])
+        schema_resolver = SchemaResolver(platform="postgres", graph=graph)
+        schema_resolver.add_raw_schema_info(
+            orders_urn, {"id": "INTEGER", "customer_id": "INTEGER", "amount": "INTEGER"}
+        )
+        return schema_resolver
+
+    requests = [
+        SqlParsingRequest("SELECT id, amount FROM orders", "db", "public"),
+        SqlParsingRequest("SELECT * FROM db.public.orders WHERE amount > 10"),
+        SqlParsingRequest("SELECT FROM WHERE"),
+        SqlParsingRequest(
+            "INSERT INTO report SELECT c.name, sum(o.amount) AS total FROM orders o "
+            "JOIN customers c ON o.customer_id = c.id GROUP BY c.name",
+            "db",
+            "public",
+        ),
+        SqlParsingRequest("SELECT * FROM public.unknown_table", "db"),
+    ]
+
+    report = SqlParsingBatchReport()
+    schema_resolver = make_schema_resolver()
+    results = sqlglot_lineage_batch(
+        requests, schema_resolver, max_workers=2, report=report
+    )
+    serial_schema_resolver = make_schema_resolver()
+    expected = [
+        sqlglot_lineage(request.sql, serial_schema_resolver, *request[1:])
+        for request in requests
+    ]
+
+    assert [result.json() for result in results] == [
+        result.json() for result in expected
+    ]
+    assert [str(result.debug_info.error) for result in results] == [
+        str(result.debug_info.error) for result in expected
+    ]
+    assert results[3].column_lineage and len(results[3].column_lineage) == 2
+    assert report.num_statements == 5
+    assert report.num_table_errors == 1
+    # Only the statement that needed the customers schema had to be parsed again.
+    assert report.num_statements_reparsed == 1
+    assert all(result.debug_info.parse_time_sec > 0 for result in results)
+    # The missing schemas were fetched in bulk.
+    graph = schema_resolver.graph
+    assert isinstance(graph, mock.MagicMock)
+    assert not graph.get_aspect.called
+    assert graph._bulk_fetch_schema_info_by_filter.call_count == 1
+
+
+def test_schema_resolver_prefetch() -> None:
+    customers_urn = make_dataset_urn("postgres", "db.public.customers")
+    graph = _make_mock_graph([customers_urn])
+    schema_resolver = SchemaResolver(
+        platform="postgres", graph=graph, negative_cache_ttl_sec=3600
+    )
+
+    schema_resolver.prefetch_schemas_for_queries(
+        [
+            SqlParsingRequest(
+                'SELECT c.name FROM customers c JOIN "Orders" o ON c.id = o.id',
+                "db",
+                "public",
+            ),
+            SqlParsingRequest("SELECT FROM WHERE"),
+        ]
+    )
+    # Both the original and the lowercased urns are fetched in a single call.
+    ((_, kwargs),) = graph._bulk_fetch_schema_info_by_filter.call_args_list
+    assert kwargs["extraFilters"][0]["values"] == [
+        make_dataset_urn("postgres", "db.public.Orders"),
+        customers_urn,
+        make_dataset_urn("postgres", "db.public.orders"),
+    ]
+
+    result = sqlglot_lineage(
+        'SELECT c.name FROM customers c JOIN "Orders" o ON c.id = o.id',
+        schema_resolver,
+        "db",
+        "public",
+    )
+    assert result.debug_info.table_schemas_resolved == 1
+    assert not graph.get_aspect.called
+
+    # Tables without a schema are looked up again once their cache entry expires.
+    orders_urn = make_dataset_urn("postgres", "db.public.orders")
+    schema_resolver.prefetch_urns([orders_urn])
+    assert graph._bulk_fetch_schema_info_by_filter.call_count == 1
+    schema_resolver.negative_cache_ttl_sec = 0
+    schema_resolver._save_to_cache(orders_urn, None)
+    assert schema_resolver._resolve_schema_info(orders_urn) is None
+    graph.get_aspect.assert_called_once_with(orders_urn, SchemaMetadataClass)
+
+
+def test_schema_resolver_prefetch_misses_expire() -> None:
+    customers_urn = make_dataset_urn("postgres", "db.public.customers")
+    graph = _make_mock_graph([customers_urn])
+    # Without a TTL, tables that are missing when resolved stay cached as such.
+    schema_resolver = SchemaResolver(platform="postgres", graph=graph)
+
+    # The search index may not have caught up with tables that were just created.
+    with mock.patch(
+        "datahub.utilities.sqlglot_lineage._SCHEMA_PREFETCH_MISS_TTL_SEC", 0
+    ):
+        schema_resolver.prefetch_urns([customers_urn, "urn:li:dataset:new"])
+    assert schema_resolver._resolve_schema_info(customers_urn)
+    assert not graph.get_aspect.called
+
+    assert schema_resolver._resolve_schema_info("urn:li:dataset:new") is None
+    assert schema_resolver._resolve_schema_info("urn:li:dataset:new") is None
+    graph.get_aspect.assert_called_once_with("urn:li:dataset:new", SchemaMetadataClass)
+
+
+def test_sqlglot_lineage_batch_parses_once() -> None:
+    customers_urn = make_dataset_urn("postgres", "db.public.customers")
+    requests = [
+        SqlParsingRequest("SELECT id, name FROM customers", "db", "public"),
+        SqlParsingRequest(
+            "INSERT INTO report SELECT c.name FROM customers c JOIN orders o "
+            "ON o.customer_id = c.id",
+            "db",
+            "public",
+        ),
+    ]
+
+    schema_resolver = SchemaResolver(
+        platform="postgres", graph=_make_mock_graph([customers_urn])
+    )
+    with mock.patch(
+        "datahub.utilities.sqlglot_lineage._parse_statement", wraps=_parse_statement
+    ) as mock_parse_statement:
+        results = sqlglot_lineage_batch(requests, schema_resolver, max_workers=1)
+
+    # The statements that were parsed to prefetch schemas are reused.
+    parsed_sql = [
+        call.args[0]
+        for call in mock_parse_statement.call_args_list
+        if isinstance(call.args[0], str)
+    ]
+    assert parsed_sql == [request.sql for request in requests]
+
+    serial_schema_resolver = SchemaResolver(
+        platform="postgres", graph=_make_mock_graph([customers_urn])
+    )
+    expected = [
+        sqlglot_lineage(request.sql, serial_schema_resolver, *request[1:])
+        for request in requests
+    ]
+    assert [result.json() for result in results] == [
+        result.json() for result in expected
+    ]
+    assert results[1].debug_info.table_schemas_resolved == 1
+
+
+def test_query_fingerprint():
+    fingerprint = get_query_fingerprint(
+        "SELECT a FROM t WHERE b = 'x' AND c > 1.5", "postgres"
+    )
+    assert fingerprint == get_query_fingerprint(
+        "SELECT a\n  FROM t -- comment\n  WHERE b = 'yz' AND c > 2", "postgres"
+    )
+    assert fingerprint != get_query_fingerprint(
+        "SELECT a FROM t2 WHERE b = 'x' AND c > 1.5", "postgres"
+    )
+    assert get_query_fingerprint("SELECT a FROM t", "postgres") != (
+        get_query_fingerprint('SELECT "a" FROM t', "postgres")
+    )
+    assert get_query_fingerprint(
+        "INSERT INTO t VALUES (1, 'a'), (2, 'b')", "postgres"
+    ) == get_query_fingerprint("INSERT INTO t VALUES (3, 'c'), (4, 'd')", "postgres")
+    assert get_query_fingerprint(
+        "SELECT a FROM t WHERE b IN ('x', 'y')", "postgres"
+    ) == get_query_fingerprint("SELECT a FROM t WHERE b IN ('z')", "postgres")
+
+
+def test_query_fingerprint_keeps_table_names_in_strings():
+    # These string literals name the tables involved, so they affect the lineage.
+    assert get_query_fingerprint(
+        "SELECT * FROM IDENTIFIER('db.schema.t1')", "snowflake"
+    ) != get_query_fingerprint("SELECT * FROM IDENTIFIER('db.schema.t2')", "snowflake")
+    assert get_query_fingerprint(
+        "COPY INTO t FROM '@stage/path1'", "snowflake"
+    ) != get_query_fingerprint("COPY INTO t FROM '@stage/path2'", "snowflake")
+    assert get_query_fingerprint(
+        "SELECT * FROM IDENTIFIER('t')", "snowflake"
+    ) != get_query_fingerprint("SELECT * FROM IDENTIFIER(t)", "snowflake")
+
+
+def test_sql_parsing_result_cache(tmp_path: pathlib.Path) -> None:
+    cache_path = tmp_path / "sql_parsing_cache.db"
+    orders_urn = make_dataset_urn("postgres", "db.public.orders")
+    sql = "SELECT id, amount * {} AS total FROM orders WHERE amount > {}"
+
+    def make_schema_resolver(
+        columns: List[str], max_size_mb: int = 1
+    ) -> Tuple[SchemaResolver, SqlParsingCacheReport]:
+        schema_resolver = SchemaResolver(platform="postgres")
+        schema_resolver.add_raw_schema_info(
+            orders_urn, {column: "INTEGER" for column in columns}
+        )
+        report = schema_resolver.enable_parse_result_cache(
+            cache_path, max_size_mb=max_size_mb
+        )
+        return schema_resolver, report
+
+    schema_resolver, report = make_schema_resolver(["id", "amount"])
+    expected = sqlglot_lineage(sql.format(2, 10), schema_resolver, "db", "public")
+    assert expected.column_lineage
+    # Only the literals are different.
+    result = sqlglot_lineage(sql.format(3, 20), schema_resolver, "db", "public")
+    assert result.json() == expected.json()
+    assert (report.num_hits, report.num_misses) == (1, 1)
+
+    # The file can only be used by one process at a time.
+    locked_cache = SqlParsingResultCache(cache_path, max_size_bytes=2**20)
+    assert locked_cache.report.disabled_reason
+    locked_cache.close()
+    schema_resolver.close()
+
+    # The results are reused in the next run.
+    schema_resolver, report = make_schema_resolver(["id", "amount"])
+    result = sqlglot_lineage(sql.format(4, 30), schema_resolver, "db", "public")
+    assert result.json() == expected.json()
+    assert (report.num_hits, report.num_misses) == (1, 0)
+    schema_resolver.close()
+
+    # Unless the schema of a table they reference has changed.
+    schema_resolver, report = make_schema_resolver(["id", "amount", "name"])
+    result = sqlglot_lineage(sql.format(4, 30), schema_resolver, "db", "public")
+    assert result.json() == expected.json()
+    assert (report.num_hits, report.num_misses, report.num_stale) == (0, 0, 1)
+    schema_resolver.close()
+
+    # Everything is evicted when the cache is too small for anything.
+    schema_resolver, report = make_schema_resolver(["id", "amount", "name"], 0)
+    sqlglot_lineage(sql.format(4, 30), schema_resolver, "db", "public")
+    schema_resolver.close()
+    assert report.num_hits == 1
+    assert report.num_evicted == 1
+
+    # Batches are checked against the cache before they are sent to the workers.
+    requests = [
+        SqlParsingRequest(sql.format(4, 30), "db", "public"),
+        SqlParsingRequest("SELECT name FROM orders", "db", "public"),
+    ]
+    for expected_hits in [0, 2]:
+        schema_resolver, report = make_schema_resolver(["id", "amount", "name"])
+        results = sqlglot_lineage_batch(requests, schema_resolver, max_workers=2)
+        schema_resolver.close()
+        assert results[0].json() == expected.json()
+        assert report.num_hits == expected_hits
+        assert report.num_misses == 2 - expected_hits
@@ -5,7 +5,11 @@ import pydantic
 import pytest
 
 from datahub.emitter.mce_builder import make_dataset_urn
-from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.checkpoint import (
+    COMPACT_STATE_SERDE,
+    Checkpoint,
+    CheckpointStateBase,
+)
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
@@ -141,7 +145,7 @@ def test_serde_idempotence(state_obj):
 
 def test_supported_encodings():
     """
-    Tests utf-8 and base85-bz2-json encodings
+    Tests utf-8, base85-bz2-json and base85-zlib-json encodings
     """
     test_state = BaseTimeWindowCheckpointState(
         version="1.0", begin_timestamp_millis=1, end_timestamp_millis=100
@@ -155,6 +159,34 @@ def test_supported_encodings():
     test_state.serde = "base85-bz2-json"
     test_serde_idempotence(test_state)
 
+    # 3. Test the compact encoding
+    test_state.serde = COMPACT_STATE_SERDE
+    test_serde_idempotence(test_state)
+
+
+def test_compact_encoding() -> None:
+    urns = [
+        make_dataset_urn("snowflake", f"db{i % 3}.schema{i % 7}.table_{i}", "prod")
+        for i in range(1000)
+    ]
+    state = BaseSQLAlchemyCheckpointState(urns=urns)
+    compact_state = BaseSQLAlchemyCheckpointState(urns=urns, serde=COMPACT_STATE_SERDE)
+
+    payload = compact_state.to_bytes()
+    assert len(payload) < len(state.to_bytes())
+
+    checkpoint = _assert_checkpoint_deserialization(
+        IngestionCheckpointStateClass(
+            formatVersion="1.0", serde=COMPACT_STATE_SERDE, payload=payload
+        ),
+        # The urns come back in sorted order.
+        BaseSQLAlchemyCheckpointState(urns=sorted(urns), serde=COMPACT_STATE_SERDE),
+    )
+    assert (
+        list(checkpoint.state.get_urns_not_in(type="*", other_checkpoint_state=state))
+        == []
+    )
+
 
 def test_base85_upgrade_pickle_to_json():
     """Verify that base85 (pickle) encoding is transitioned to base85-bz2-json."""
@@ -173,7 +205,7 @@ def test_base85_upgrade_pickle_to_json():
 
 @pytest.mark.parametrize(
     "serde",
-    ["utf-8", "base85-bz2-json"],
+    ["utf-8", "base85-bz2-json", COMPACT_STATE_SERDE],
 )
 def test_state_forward_compatibility(serde: str) -> None:
     class PrevState(CheckpointStateBase):
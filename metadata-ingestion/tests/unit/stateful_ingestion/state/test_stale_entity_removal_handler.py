@@ -3,7 +3,10 @@ from typing import Dict, List, Tuple
 import pytest
 
 from datahub.ingestion.source.state.entity_removal_state import (
+    GenericCheckpointState,
     compute_percent_entities_changed,
+    decode_sorted_urns,
+    encode_sorted_urns,
 )
 
 EntList = List[str]
@@ -46,3 +49,42 @@ def test_change_percent(
         new_entities=new_entities, old_entities=old_entities
     )
     assert actual_percent_change == expected_percent_change
+
+
+@pytest.mark.parametrize(
+    "new_entities, old_entities, expected_percent_change",
+    new_old_ent_tests.values(),
+    ids=new_old_ent_tests.keys(),
+)
+def test_state_change_percent(
+    new_entities: EntList, old_entities: EntList, expected_percent_change: float
+) -> None:
+    new_state = GenericCheckpointState(urns=new_entities)
+    old_state = GenericCheckpointState(urns=old_entities)
+    assert new_state.get_percent_entities_changed(old_state) == expected_percent_change
+    assert sorted(
+        old_state.get_urns_not_in(type="*", other_checkpoint_state=new_state)
+    ) == sorted(set(old_entities) - set(new_entities))
+
+
+def test_front_coded_urns() -> None:
+    urns = [
+        "urn:li:dataset:(urn:li:dataPlatform:mysql,db.b,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:mysql,db.a,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:mysql,db.ab,PROD)",
+        "urn:li:container:abc",
+        "",
+    ]
+    encoded = encode_sorted_urns(urns)
+    assert encoded[:6] == [
+        0,
+        "",
+        0,
+        "urn:li:container:abc",
+        7,
+        "dataset:(urn:li:dataPlatform:mysql,db.a,PROD)",
+    ]
+    assert decode_sorted_urns(encoded) == sorted(urns)
+
+    with pytest.raises(ValueError):
+        decode_sorted_urns([0])
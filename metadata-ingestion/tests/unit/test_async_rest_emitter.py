@@ -0,0 +1,176 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+from unittest.mock import patch
+
+import pydantic
+import pytest
+from aiohttp import web
+
+import datahub.metadata.schema_classes as models
+from datahub.configuration.common import OperationalError
+from datahub.emitter.async_rest_emitter import AsyncDataHubRestEmitter
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.sink.datahub_rest_async import DatahubRestAsyncSinkConfig
+
+_T = TypeVar("_T")
+
+_MCP = MetadataChangeProposalWrapper(
+    entityUrn="urn:li:dataset:(urn:li:dataPlatform:foo,bar,PROD)",
+    aspect=models.StatusClass(removed=True),
+)
+
+
+class _FakeGms:
+    def __init__(self) -> None:
+        self.requests: List[Dict[str, Any]] = []
+        self.content_encodings: List[Optional[str]] = []
+        self.responses: List[web.Response] = []
+        self.config: Dict[str, Any] = {
+            "noCode": "true",
+            "requestCompression": ["gzip", "deflate"],
+        }
+
+    async def handle_config(self, request: web.Request) -> web.Response:
+        return web.json_response(self.config)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        # aiohttp transparently decompresses request bodies.
+        self.requests.append(json.loads(await request.text()))
+        self.content_encodings.append(request.headers.get("Content-Encoding"))
+        if self.responses:
+            return self.responses.pop(0)
+        return web.json_response({"value": "ok"})
+
+
+def _run_against_fake_gms(gms: _FakeGms, fn: Callable[[str], Awaitable[_T]]) -> _T:
+    # Use a private event loop rather than asyncio.run(), so that we don't
+    # clobber the main thread's default loop for other tests.
+    async def _main() -> _T:
+        app = web.Application()
+        app.router.add_post("/aspects", gms.handle)
+        app.router.add_get("/config", gms.handle_config)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "localhost", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        try:
+            return await fn(f"http://localhost:{port}")
+        finally:
+            await runner.cleanup()
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(_main())
+    finally:
+        loop.close()
+
+
+def test_async_emitter_emit_mcp() -> None:
+    gms = _FakeGms()
+
+    async def _emit(url: str) -> None:
+        async with AsyncDataHubRestEmitter(url) as emitter:
+            await emitter.emit(_MCP)
+
+    _run_against_fake_gms(gms, _emit)
+
+    assert gms.requests == [
+        {
+            "proposal": {
+                "entityType": "dataset",
+                "entityUrn": "urn:li:dataset:(urn:li:dataPlatform:foo,bar,PROD)",
+                "changeType": "UPSERT",
+                "aspectName": "status",
+                "aspect": {
+                    "value": '{"removed": true}',
+                    "contentType": "application/json",
+                },
+            }
+        }
+    ]
+
+
+def test_async_emitter_retries() -> None:
+    gms = _FakeGms()
+    gms.responses = [
+        web.json_response({"message": "unavailable"}, status=503),
+        web.json_response({"message": "unavailable"}, status=503),
+    ]
+
+    async def _emit(url: str) -> None:
+        async with AsyncDataHubRestEmitter(url, retry_max_times=2) as emitter:
+            await emitter.emit_mcp(_MCP)
+
+    # Don't actually wait between retries.
+    with patch(
+        "datahub.emitter.async_rest_emitter._get_backoff_time", return_value=0
+    ) as mock_get_backoff_time:
+        _run_against_fake_gms(gms, _emit)
+
+    assert len(gms.requests) == 3
+    assert [call.args[0] for call in mock_get_backoff_time.call_args_list] == [1, 2]
+
+
+def test_async_emitter_raises_operational_error() -> None:
+    gms = _FakeGms()
+    gms.responses = [
+        web.json_response(
+            {"message": "bad aspect", "stackTrace": "...", "status": 422},
+            status=422,
+        ),
+    ]
+
+    async def _emit(url: str) -> None:
+        async with AsyncDataHubRestEmitter(url) as emitter:
+            await emitter.emit_mcp(_MCP)
+
+    with pytest.raises(OperationalError) as excinfo:
+        _run_against_fake_gms(gms, _emit)
+
+    assert excinfo.value.info == {"message": "bad aspect", "status": 422}
+    assert len(gms.requests) == 1
+
+
+def test_async_emitter_compression() -> None:
+    gms = _FakeGms()
+    gms.responses = [web.json_response({"status": 415}, status=415)]
+
+    async def _emit(url: str) -> None:
+        async with AsyncDataHubRestEmitter(
+            url, compression="deflate", compression_min_size=0
+        ) as emitter:
+            await emitter.emit_mcp(_MCP)
+            await emitter.emit_mcp(_MCP)
+
+    _run_against_fake_gms(gms, _emit)
+
+    # The server doesn't accept compressed requests, so we fall back to identity.
+    assert gms.content_encodings == ["deflate", None, None]
+    assert gms.requests[0] == gms.requests[1] == gms.requests[2]
+
+
+def test_async_emitter_compression_old_server() -> None:
+    gms = _FakeGms()
+    # Older GMS versions don't advertise compression support, and fail to
+    # decode compressed requests.
+    gms.config = {"noCode": "true"}
+
+    async def _emit(url: str) -> None:
+        async with AsyncDataHubRestEmitter(
+            url, compression="gzip", compression_min_size=0
+        ) as emitter:
+            await emitter.emit_mcp(_MCP)
+            await emitter.emit_mcp(_MCP)
+
+    _run_against_fake_gms(gms, _emit)
+
+    assert gms.content_encodings == [None, None]
+
+
+def test_async_sink_rejects_thread_pool_options() -> None:
+    with pytest.raises(pydantic.ValidationError, match="max_threads"):
+        DatahubRestAsyncSinkConfig.parse_obj(
+            {"server": "http://localhost:8080", "max_threads": 10}
+        )
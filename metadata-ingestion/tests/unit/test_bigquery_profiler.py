@@ -1,4 +1,9 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from unittest import mock
+
+import pytest
+from freezegun import freeze_time
 
 from datahub.ingestion.source.bigquery_v2.bigquery_config import BigQueryV2Config
 from datahub.ingestion.source.bigquery_v2.bigquery_report import BigQueryV2Report
@@ -8,6 +13,14 @@ from datahub.ingestion.source.bigquery_v2.bigquery_schema import (
     PartitionInfo,
 )
 from datahub.ingestion.source.bigquery_v2.profiler import BigqueryProfiler
+from datahub.ingestion.source.sql.sql_generic_profiler import get_table_fingerprint
+from datahub.ingestion.source.state.checkpoint import Checkpoint
+from datahub.ingestion.source.state.profiling_state import ProfilingCheckpointState
+from datahub.ingestion.source.state.profiling_state_handler import ProfilingHandler
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+)
 
 
 def test_not_generate_partition_profiler_query_if_not_partitioned_sharded_table():
@@ -210,3 +223,187 @@ def test_generate_sharded_table_profiler_query():
 
     assert "20200101" == query[0]
     assert query[1] is None
+
+
+@pytest.mark.parametrize(
+    "rows_count, last_profiled_days_ago, expected",
+    [
+        # Unchanged since the last profile.
+        (1, 10, None),
+        # Changed, and the last profile is old.
+        (2, 10, "full"),
+        # Changed, but the last profile is recent.
+        (2, 0.5, "table_level"),
+    ],
+)
+def test_skip_unchanged_tables(
+    rows_count: int, last_profiled_days_ago: float, expected: Optional[str]
+) -> None:
+    old_table = BigqueryTable(
+        name="test_table",
+        comment=None,
+        rows_count=1,
+        size_in_bytes=1,
+        last_altered=None,
+        created=None,
+    )
+    table = BigqueryTable(
+        name="test_table",
+        comment=None,
+        rows_count=rows_count,
+        size_in_bytes=1,
+        last_altered=None,
+        created=None,
+    )
+    last_profiled = datetime.now(timezone.utc) - timedelta(last_profiled_days_ago)
+    state_handler = mock.create_autospec(ProfilingHandler, instance=True)
+    state_handler.get_last_profiled.return_value = int(last_profiled.timestamp() * 1000)
+    state_handler.get_last_column_profiled.return_value = int(
+        last_profiled.timestamp() * 1000
+    )
+    state_handler.get_last_table_fingerprint.return_value = get_table_fingerprint(
+        old_table
+    )
+
+    config = BigQueryV2Config.parse_obj(
+        {
+            "profiling": {
+                "enabled": True,
+                "skip_unchanged_tables": True,
+                "column_profiling_min_interval_days": 1,
+            }
+        }
+    )
+    report = BigQueryV2Report()
+    profiler = BigqueryProfiler(
+        config=config, report=report, state_handler=state_handler
+    )
+    request = profiler.get_profile_request(table, "test_dataset", "test_project")
+
+    if expected is None:
+        assert request is None
+        assert report.profiling_skipped_unchanged == {"test_project.test_dataset": 1}
+    else:
+        assert request is not None
+        assert request.profile_table_level_only == (expected == "table_level")
+        assert request.table_fingerprint == get_table_fingerprint(table)
+    # The previous state is carried over either way.
+    dataset_urn = "urn:li:dataset:(urn:li:dataPlatform:bigquery,test_project.test_dataset.test_table,PROD)"
+    state_handler.add_to_state.assert_called_once_with(
+        dataset_urn, int(last_profiled.timestamp() * 1000)
+    )
+    state_handler.add_column_profile_to_state.assert_called_once_with(
+        dataset_urn,
+        int(last_profiled.timestamp() * 1000),
+        get_table_fingerprint(old_table),
+    )
+
+
+def _make_profiling_state_handler(
+    last_state: Optional[ProfilingCheckpointState],
+) -> Tuple[ProfilingHandler, ProfilingCheckpointState]:
+    current_state = ProfilingCheckpointState(last_profiled={})
+    source = mock.MagicMock()
+    source.state_provider.is_stateful_ingestion_configured.return_value = True
+    source.state_provider.get_current_checkpoint.return_value = Checkpoint(
+        job_name="profiling",
+        pipeline_name="test",
+        run_id="test",
+        state=current_state,
+    )
+    source.state_provider.get_last_checkpoint.return_value = (
+        Checkpoint(
+            job_name="profiling",
+            pipeline_name="test",
+            run_id="test",
+            state=last_state,
+        )
+        if last_state
+        else None
+    )
+    config = mock.MagicMock()
+    config.stateful_ingestion = None
+    handler = ProfilingHandler(
+        source=source, config=config, pipeline_name="test", run_id="test"
+    )
+    return handler, current_state
+
+
+def test_column_profiles_refresh_across_runs() -> None:
+    def make_table(rows_count: int) -> BigqueryTable:
+        return BigqueryTable(
+            name="test_table",
+            comment=None,
+            rows_count=rows_count,
+            size_in_bytes=1,
+            last_altered=None,
+            created=None,
+            column_count=1,
+        )
+
+    config = BigQueryV2Config.parse_obj(
+        {
+            "profiling": {
+                "enabled": True,
+                "skip_unchanged_tables": True,
+                "column_profiling_min_interval_days": 1,
+            }
+        }
+    )
+
+    def run(
+        table: BigqueryTable, last_state: Optional[ProfilingCheckpointState]
+    ) -> Tuple[Optional[str], ProfilingCheckpointState]:
+        """Runs the profiler once, and returns the kind of profile and the new state."""
+        state_handler, current_state = _make_profiling_state_handler(last_state)
+        profiler = BigqueryProfiler(
+            config=config, report=BigQueryV2Report(), state_handler=state_handler
+        )
+        ge_profiler = mock.MagicMock()
+        ge_profiler.generate_profiles.side_effect = lambda requests, *args: [
+            (
+                request,
+                DatasetProfileClass(
+                    timestampMillis=0,
+                    columnCount=1,
+                    fieldProfiles=[DatasetFieldProfileClass(fieldPath="col")],
+                ),
+            )
+            for request in requests
+        ]
+        profiler.get_profiler_instance = mock.MagicMock(return_value=ge_profiler)  # type: ignore
+
+        request = profiler.get_profile_request(table, "test_dataset", "test_project")
+        if request is None:
+            return None, current_state
+        (workunit,) = profiler.generate_profile_workunits(
+            [request], max_workers=1, platform="bigquery"
+        )
+        profile = workunit.get_aspect_of_type(DatasetProfileClass)
+        assert profile is not None
+        return ("column" if profile.fieldProfiles else "table_level"), current_state
+
+    with freeze_time("2023-01-01") as frozen_time:
+        kind, state = run(make_table(1), None)
+        assert kind == "column"
+
+        # The table changed, but its columns were profiled recently.
+        frozen_time.tick(timedelta(hours=1))
+        kind, state = run(make_table(2), state)
+        assert kind == "table_level"
+
+        # The table level profile kept the time and fingerprint of the column
+        # profile, so the column stats come back once the interval has passed.
+        frozen_time.tick(timedelta(days=2))
+        kind, state = run(make_table(2), state)
+        assert kind == "column"
+
+        # Nothing changed since the last column profile.
+        frozen_time.tick(timedelta(days=2))
+        kind, state = run(make_table(2), state)
+        assert kind is None
+
+        # The skipped run kept the state, so the next change is profiled again.
+        frozen_time.tick(timedelta(days=2))
+        kind, state = run(make_table(3), state)
+        assert kind == "column"
@@ -3,7 +3,7 @@ import logging
 import os
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Set, cast
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -550,6 +550,78 @@ def test_upstream_table_generation_with_temporary_table_with_multiple_temp_upstr
     assert sorted_list[1].table == str(e)
 
 
+@patch.object(BigQueryV2Config, "get_bigquery_client")
+def test_upstream_table_generation_with_collapsed_temp_table_chain(
+    get_bq_client_mock,
+):
+    def table_ref(dataset: str, table: str) -> str:
+        return str(
+            BigQueryTableRef(
+                BigqueryTableIdentifier(
+                    project_id="test-project", dataset=dataset, table=table
+                )
+            )
+        )
+
+    a = table_ref("test-dataset", "a")
+    b = table_ref("test-dataset", "b")
+    c = table_ref("test-dataset", "c")
+    temp_tables = [table_ref("_temp-dataset", f"t{i}") for i in range(1000)]
+
+    def edge(table: str, out_column: str, in_column: str) -> LineageEdge:
+        return LineageEdge(
+            table=table,
+            auditStamp=datetime.now(),
+            column_mapping=frozenset(
+                [LineageEdgeColumnMapping(out_column, frozenset([in_column]))]
+            ),
+        )
+
+    # a -> t0 -> t1 -> ... -> t999 -> c, where every temp table also reads from b,
+    # and t999 loops back to t0.
+    lineage_metadata: Dict[str, Set[LineageEdge]] = {
+        a: {edge(temp_tables[0], "a_col", "col")},
+        b: {edge(temp_tables[0], "b_col", "col")},
+    }
+    for temp_table, next_temp_table in zip(temp_tables, temp_tables[1:]):
+        lineage_metadata[temp_table] = {
+            edge(next_temp_table, "col", "col"),
+            edge(b, "col", "b_col"),
+        }
+    lineage_metadata[temp_tables[-1]] = {
+        edge(c, "col", "c_col"),
+        edge(temp_tables[0], "col", "col"),
+    }
+
+    config = BigQueryV2Config.parse_obj({"project_id": "test-project"})
+    source = BigqueryV2Source(config=config, ctx=PipelineContext(run_id="test"))
+    collapsed_temp_tables = source.lineage_extractor.collapse_temp_table_lineage(
+        lineage_metadata
+    )
+    assert set(collapsed_temp_tables.keys()) == set(temp_tables)
+
+    expected_upstreams = {
+        edge(b, "a_col", "b_col"),
+        edge(c, "a_col", "c_col"),
+    }
+    # The result is the same with or without the precomputed temp table lineage.
+    for upstreams in [
+        source.lineage_extractor.get_upstream_tables(
+            BigQueryTableRef.from_string_name(a),
+            lineage_metadata,
+            collapsed_temp_tables,
+        ),
+        source.lineage_extractor.get_upstream_tables(
+            BigQueryTableRef.from_string_name(a), lineage_metadata
+        ),
+    ]:
+        assert {
+            (upstream.table, upstream.column_mapping) for upstream in upstreams
+        } == {
+            (upstream.table, upstream.column_mapping) for upstream in expected_upstreams
+        }
+
+
 @patch.object(BigQuerySchemaApi, "get_tables_for_dataset")
 @patch.object(BigQueryV2Config, "get_bigquery_client")
 def test_table_processing_logic(get_bq_client_mock, data_dictionary_mock):
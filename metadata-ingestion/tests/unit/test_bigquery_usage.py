@@ -1,3 +1,4 @@
+import copy
 import logging
 import random
 from datetime import datetime, timedelta, timezone
@@ -957,6 +958,63 @@ def test_operational_stats(
     )
 
 
+@pytest.mark.parametrize("apply_view_usage_to_tables", [True, False])
+def test_streaming_aggregation(
+    config: BigQueryV2Config, apply_view_usage_to_tables: bool
+) -> None:
+    config.usage.apply_view_usage_to_tables = apply_view_usage_to_tables
+    queries = [
+        query_table_1_a(TS_1, ACTOR_1),
+        query_table_1_a(TS_1, ACTOR_2),
+        query_table_1_b(TS_1, ACTOR_1),
+        query_tables_1_and_2(TS_1, ACTOR_1),
+        query_view_1(TS_1, ACTOR_1),
+        query_view_1_and_table_1(TS_1, ACTOR_2),
+        query_table_1_a(TS_2, ACTOR_1),
+        query_table_2(TS_2, ACTOR_2),
+        query_view_1(TS_2, ACTOR_2),
+    ]
+    events = list(
+        generate_events(
+            queries,
+            [PROJECT_1, PROJECT_2],
+            TABLE_TO_PROJECT,
+            config=config,
+            proabability_of_project_mismatch=0.5,
+        )
+    )
+    # Read events can come before or after their query event.
+    random.Random(0).shuffle(events)
+
+    def get_usage_statistics(streaming_aggregation: bool) -> list:
+        config.usage.streaming_aggregation = streaming_aggregation
+        usage_extractor = BigQueryUsageExtractor(
+            config,
+            BigQueryV2Report(),
+            lambda ref: make_dataset_urn("bigquery", str(ref.table_identifier)),
+        )
+        workunits = usage_extractor._get_workunits_internal(
+            # Query events are modified in place.
+            copy.deepcopy(events),
+            TABLE_REFS.values(),
+        )
+        return [
+            wu.metadata.aspect.to_obj()
+            for wu in workunits
+            if isinstance(wu.metadata, MetadataChangeProposalWrapper)
+            and isinstance(wu.metadata.aspect, DatasetUsageStatisticsClass)
+        ]
+
+    expected = get_usage_statistics(streaming_aggregation=False)
+    assert expected
+    # The batch query does not limit the number of top queries.
+    for usage_statistics in expected:
+        usage_statistics["topSqlQueries"] = usage_statistics["topSqlQueries"][
+            : config.usage.top_n_queries
+        ]
+    assert get_usage_statistics(streaming_aggregation=True) == expected
+
+
 def test_get_tables_from_query(usage_extractor):
     assert usage_extractor.get_tables_from_query(
         PROJECT_1, "SELECT * FROM project-1.database_1.view_1"
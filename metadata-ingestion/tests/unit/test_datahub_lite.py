@@ -0,0 +1,248 @@
+import json
+import pathlib
+from typing import Any, List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from datahub.emitter.mce_builder import (
+    make_container_urn,
+    make_data_platform_urn,
+    make_dataset_urn,
+)
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.lite.duckdb_lite import DuckDBLite
+from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
+from datahub.lite.lite_local import SearchFlavor
+from datahub.metadata.schema_classes import (
+    ContainerClass,
+    ContainerPropertiesClass,
+    DatasetPropertiesClass,
+    OtherSchemaClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+    SchemaMetadataClass,
+    StatusClass,
+    StringTypeClass,
+    SubTypesClass,
+    SystemMetadataClass,
+)
+
+pytest.importorskip("duckdb")
+
+
+def _make_mcps(run: int) -> List[MetadataChangeProposalWrapper]:
+    container_urn = make_container_urn("my_container")
+    mcps = [
+        MetadataChangeProposalWrapper(
+            entityUrn=container_urn,
+            aspect=ContainerPropertiesClass(name="my container"),
+        ),
+        MetadataChangeProposalWrapper(
+            entityUrn=container_urn,
+            aspect=SubTypesClass(typeNames=["Database"]),
+        ),
+    ]
+    for i in range(5):
+        dataset_urn = make_dataset_urn("hive", f"db.table_{i}")
+        mcps += [
+            MetadataChangeProposalWrapper(
+                entityUrn=dataset_urn,
+                aspect=DatasetPropertiesClass(name=f"table_{i}_v{run if i < 2 else 0}"),
+            ),
+            MetadataChangeProposalWrapper(
+                entityUrn=dataset_urn, aspect=ContainerClass(container=container_urn)
+            ),
+            MetadataChangeProposalWrapper(
+                entityUrn=dataset_urn, aspect=StatusClass(removed=False)
+            ),
+        ]
+    # The same aspect more than once in a single batch.
+    mcps.append(
+        MetadataChangeProposalWrapper(
+            entityUrn=make_dataset_urn("hive", "db.table_0"),
+            aspect=StatusClass(removed=True),
+        )
+    )
+    for mcp in mcps:
+        mcp.systemMetadata = SystemMetadataClass(lastObserved=1000 + run, runId="test")
+    return mcps
+
+
+def _dump(lite: DuckDBLite) -> Tuple[list, list]:
+    aspects = lite.duckdb_client.execute(
+        "SELECT urn, aspect_name, version, metadata, system_metadata, createdon "
+        "FROM metadata_aspect_v2 ORDER BY urn, aspect_name, version"
+    ).fetchall()
+    edges = lite.duckdb_client.execute(
+        "SELECT * FROM metadata_edge_v2 ORDER BY src_id, relnship, dst_id"
+    ).fetchall()
+    return aspects, edges
+
+
+def test_write_batch_matches_write(tmp_path: pathlib.Path) -> None:
+    def open_lites() -> Tuple[DuckDBLite, DuckDBLite]:
+        return (
+            DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "one_by_one.duckdb"))),
+            DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "batch.duckdb"))),
+        )
+
+    # The second run changes some aspects and leaves the rest untouched.
+    for run in range(2):
+        lite, batch_lite = open_lites()
+        for mcp in _make_mcps(run):
+            lite.write(mcp)
+        batch_lite.write_batch(_make_mcps(run))
+        if run == 0:
+            # Reopening checkpoints the data, which DuckDB treats differently when updating it.
+            lite.close()
+            batch_lite.close()
+
+    # write_batch leaves the edges to close(), so only the aspects match so far.
+    assert _dump(batch_lite)[0] == _dump(lite)[0]
+    search_index_query = "SELECT * FROM metadata_search_token ORDER BY ALL"
+    assert (
+        batch_lite.duckdb_client.execute(search_index_query).fetchall()
+        == lite.duckdb_client.execute(search_index_query).fetchall()
+    )
+
+    lite.reindex()
+    batch_lite.reindex()
+    aspects, edges = _dump(batch_lite)
+    assert (aspects, edges) == _dump(lite)
+    assert (
+        make_dataset_urn("hive", "db.table_0"),
+        "name",
+        "table_0_v1",
+        None,
+    ) in edges
+
+    lite.close()
+    batch_lite.close()
+
+
+def test_close_rebuilds_edges_only_after_writes(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "edges.duckdb")
+    lite = DuckDBLite(DuckDBLiteConfig(file=path))
+    lite.write_batch(_make_mcps(0))
+    lite.close()
+
+    lite = DuckDBLite(DuckDBLiteConfig(file=path))
+    _, edges = _dump(lite)
+    assert (
+        make_dataset_urn("hive", "db.table_0"),
+        "name",
+        "table_0_v0",
+        None,
+    ) in edges
+    with patch.object(lite, "_reindex") as reindex:
+        lite.close()
+    reindex.assert_not_called()
+
+
+def _make_mcp(**kwargs: Any) -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(
+        systemMetadata=SystemMetadataClass(lastObserved=1000, runId="test"), **kwargs
+    )
+
+
+def _search(
+    lite: DuckDBLite, query: str, **kwargs: Any
+) -> List[Tuple[str, Optional[str]]]:
+    return [
+        (searchable.id, searchable.aspect)
+        for searchable in lite.search(query, SearchFlavor.FREE_TEXT, **kwargs)
+    ]
+
+
+def test_free_text_search(tmp_path: pathlib.Path) -> None:
+    lite = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "search.duckdb")))
+    orders_urn = make_dataset_urn("hive", "sales.orders")
+    customers_urn = make_dataset_urn("hive", "sales.customers")
+    lite.write(
+        _make_mcp(
+            entityUrn=orders_urn,
+            aspect=DatasetPropertiesClass(
+                name="Orders", description="All orders placed by customers"
+            ),
+        )
+    )
+    lite.write_batch(
+        [
+            _make_mcp(
+                entityUrn=customers_urn,
+                aspect=DatasetPropertiesClass(name="Customers"),
+            ),
+            _make_mcp(
+                entityUrn=customers_urn,
+                aspect=SchemaMetadataClass(
+                    schemaName="customers",
+                    platform=make_data_platform_urn("hive"),
+                    version=0,
+                    hash="",
+                    platformSchema=OtherSchemaClass(rawSchema=""),
+                    fields=[
+                        SchemaFieldClass(
+                            fieldPath="[version=2.0].[type=struct].address.[type=string].zip_code",
+                            type=SchemaFieldDataTypeClass(type=StringTypeClass()),
+                            nativeDataType="string",
+                        )
+                    ],
+                ),
+            ),
+        ]
+    )
+
+    # Names, descriptions and urns are matched by token prefix.
+    assert _search(lite, "ORDER") == [
+        (orders_urn, "datasetProperties"),
+        (orders_urn, "urn"),
+    ]
+    assert _search(lite, "custom") == [
+        (customers_urn, "datasetProperties"),
+        (customers_urn, "urn"),
+        (orders_urn, "datasetProperties"),
+    ]
+    assert _search(lite, "zip_code") == [(customers_urn, "schemaMetadata")]
+    assert _search(lite, "version") == []
+    # Every query token has to match.
+    assert _search(lite, "sales placed") == [
+        (orders_urn, "datasetProperties"),
+        (orders_urn, "urn"),
+    ]
+    assert _search(lite, "custom", aspects=["datasetProperties"]) == [
+        (customers_urn, "datasetProperties"),
+        (orders_urn, "datasetProperties"),
+    ]
+    snippets = [
+        searchable.snippet
+        for searchable in lite.search("order", SearchFlavor.FREE_TEXT)
+    ]
+    assert snippets[1] is None
+    assert snippets[0] and json.loads(snippets[0])["name"] == "Orders"
+
+    # The index is updated when an aspect changes.
+    lite.write(
+        _make_mcp(entityUrn=orders_urn, aspect=DatasetPropertiesClass(name="Purchases"))
+    )
+    assert _search(lite, "placed") == []
+    assert _search(lite, "purchase") == [(orders_urn, "datasetProperties")]
+
+    index = lite.duckdb_client.execute(
+        "SELECT * FROM metadata_search_token ORDER BY ALL"
+    ).fetchall()
+    lite.reindex()
+    assert (
+        lite.duckdb_client.execute(
+            "SELECT * FROM metadata_search_token ORDER BY ALL"
+        ).fetchall()
+        == index
+    )
+
+    # Databases created without a search index get one when they are opened.
+    lite.duckdb_client.execute("DROP TABLE metadata_search_token")
+    lite.duckdb_client.execute("DROP TABLE metadata_search_vocab")
+    lite.close()
+    lite = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "search.duckdb")))
+    assert _search(lite, "purchase") == [(orders_urn, "datasetProperties")]
+    lite.close()
@@ -1,11 +1,48 @@
+import pathlib
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Tuple
+from unittest import mock
 
 import pytest
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    event,
+)
+from sqlalchemy.engine import Engine
 
+from datahub.configuration.kafka import KafkaConsumerConnectionConfig
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.datahub.config import (
+    DEFAULT_DATABASE_TABLE_NAME,
+    DataHubSourceConfig,
+)
 from datahub.ingestion.source.datahub.datahub_database_reader import (
+    DATETIME_FORMAT,
+    DataHubDatabaseReader,
     VersionOrderable,
     VersionOrderer,
 )
+from datahub.ingestion.source.datahub.datahub_kafka_reader import DataHubKafkaReader
+from datahub.ingestion.source.datahub.datahub_source import DataHubSource
+from datahub.ingestion.source.datahub.report import DataHubSourceReport
+from datahub.ingestion.source.datahub.state import PartitionOffset
+from datahub.ingestion.source.sql.sql_config import SQLAlchemyConnectionConfig
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionConfig,
+)
+from datahub.metadata.schema_classes import (
+    AuditStampClass,
+    ChangeTypeClass,
+    MetadataChangeLogClass,
+)
 
 
 @dataclass
@@ -49,3 +86,193 @@ def test_version_orderer_disabled(rows):
     orderer = VersionOrderer[MockRow](enabled=False)
     ordered_rows = list(orderer(rows))
     assert ordered_rows == rows
+
+
+def _make_database_reader(
+    tmp_path: pathlib.Path, partitions: int
+) -> Tuple[DataHubDatabaseReader, DataHubSourceReport, Engine, List[dict]]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'datahub.db'}")
+    table = Table(
+        DEFAULT_DATABASE_TABLE_NAME,
+        MetaData(),
+        Column("urn", String),
+        Column("aspect", String),
+        Column("version", Integer),
+        Column("metadata", String),
+        Column("systemmetadata", String),
+        Column("createdon", DateTime),
+    )
+    table.create(engine)
+
+    start = datetime(2023, 1, 1)
+    rows = [
+        dict(
+            urn=make_dataset_urn("hive", f"table_{i}"),
+            aspect=aspect,
+            version=version,
+            metadata='{"removed": false}' if aspect == "status" else "{}",
+            systemmetadata=None,
+            # Many rows share the same createdon, which has to be handled across pages.
+            createdon=start + timedelta(minutes=i // 10),
+        )
+        for i in range(50)
+        for aspect in ["status", "notAnAspect"]
+        for version in [0, 1]
+    ]
+    with engine.begin() as conn:
+        conn.execute(table.insert(), rows)
+
+    connection_config = SQLAlchemyConnectionConfig(
+        host_port="", scheme="", sqlalchemy_uri=str(engine.url)
+    )
+    config = DataHubSourceConfig(
+        database_connection=connection_config,
+        include_all_versions=True,
+        database_query_batch_size=3,
+        database_query_partitions=partitions,
+    )
+    report = DataHubSourceReport()
+    reader = DataHubDatabaseReader(config, connection_config, report)
+    return reader, report, engine, rows
+
+
+@pytest.mark.parametrize("partitions", [1, 3])
+def test_database_reader_pagination(tmp_path: pathlib.Path, partitions: int) -> None:
+    reader, report, _, rows = _make_database_reader(tmp_path, partitions)
+    start = datetime(2023, 1, 1)
+
+    read_rows = list(reader._get_rows(start, datetime.now()))
+
+    def key(row: Any) -> tuple:
+        return row["createdon"], row["urn"], row["aspect"], row["version"]
+
+    assert [key(row) for row in read_rows] == sorted(key(row) for row in rows)
+
+    mcps = list(reader.get_aspects(start + timedelta(minutes=4), datetime.now()))
+    assert len(mcps) == 10 * 2
+    assert report.num_database_parse_errors == 10 * 2
+
+
+def test_database_reader_pagination_advances_since_createdon(
+    tmp_path: pathlib.Path,
+) -> None:
+    reader, _, _, rows = _make_database_reader(tmp_path, partitions=1)
+    start = datetime(2023, 1, 1)
+
+    bound_params: List[dict] = []
+
+    @event.listens_for(reader.engine, "before_execute")
+    def _record_params(conn, clauseelement, multiparams, params, options):  # type: ignore
+        bound_params.append(dict(multiparams[0] if multiparams else params))
+
+    read_rows = list(reader._get_rows(start, datetime.now()))
+    assert len(read_rows) == len(rows)
+
+    # Every page after the first starts its createdon range at the previous
+    # page's last row, rather than at the start of the scan.
+    assert len(bound_params) > 2
+    assert bound_params[0]["since_createdon"] == start.strftime(DATETIME_FORMAT)
+    for page in bound_params[1:]:
+        assert page["since_createdon"] == page["last_createdon"]
+    since = [page["since_createdon"] for page in bound_params]
+    assert since == sorted(since)
+    assert since[-1] > since[0]
+
+
+def _make_kafka_message(partition: int, offset: int, value: Any) -> mock.MagicMock:
+    msg = mock.MagicMock()
+    msg.error.return_value = None
+    msg.partition.return_value = partition
+    msg.offset.return_value = offset
+    msg.value.return_value = value
+    return msg
+
+
+def test_kafka_reader_batches() -> None:
+    def make_mcl(i: int, time: int) -> dict:
+        return MetadataChangeLogClass(
+            entityType="dataset",
+            changeType=ChangeTypeClass.UPSERT,
+            entityUrn=make_dataset_urn("hive", f"table_{i}"),
+            created=AuditStampClass(time=time, actor="urn:li:corpuser:datahub"),
+        ).to_obj(tuples=True)
+
+    stop_time = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    before_stop = int(stop_time.timestamp() * 1000) - 1
+    config = DataHubSourceConfig(
+        kafka_connection=KafkaConsumerConnectionConfig(),
+        kafka_consume_batch_size=3,
+    )
+    report = DataHubSourceReport()
+    reader = DataHubKafkaReader(
+        config,
+        config.kafka_connection,  # type: ignore
+        report,
+        PipelineContext(run_id="test", pipeline_name="test"),
+    )
+    reader.value_deserializer = lambda value, ctx: value
+    reader.consumer = mock.MagicMock()
+    reader.consumer.consume.side_effect = [
+        [
+            _make_kafka_message(0, 10, make_mcl(0, before_stop)),
+            _make_kafka_message(1, 20, make_mcl(1, before_stop)),
+            _make_kafka_message(0, 11, {"not": "an mcl"}),
+        ],
+        [
+            _make_kafka_message(0, 12, make_mcl(2, before_stop)),
+            _make_kafka_message(1, 21, make_mcl(3, before_stop + 2)),
+            _make_kafka_message(1, 22, make_mcl(4, before_stop)),
+        ],
+    ]
+
+    batches = list(reader.get_mcl_batches(from_offsets={}, stop_time=stop_time))
+    assert [
+        [(mcl.entityUrn, offset) for mcl, offset in batch] for batch in batches
+    ] == [
+        [
+            (make_dataset_urn("hive", "table_0"), PartitionOffset(0, 10)),
+            (make_dataset_urn("hive", "table_1"), PartitionOffset(1, 20)),
+        ],
+        [(make_dataset_urn("hive", "table_2"), PartitionOffset(0, 12))],
+    ]
+    assert report.num_kafka_parse_errors == 1
+    reader.consumer.unsubscribe.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "batch_size,expected_commits",
+    [
+        # Commits after the messages at index 5 and 10, as without batching.
+        (1, 2),
+        (3, 2),
+        (5, 2),
+        (6, 2),
+        # Both indices are in the same batch.
+        (12, 1),
+    ],
+)
+def test_kafka_commit_state_interval(batch_size: int, expected_commits: int) -> None:
+    config = DataHubSourceConfig(
+        kafka_connection=KafkaConsumerConnectionConfig(),
+        commit_state_interval=5,
+        stateful_ingestion=StatefulIngestionConfig(enabled=False),
+    )
+    source = DataHubSource(config, PipelineContext(run_id="test", pipeline_name="test"))
+    source.stateful_ingestion_handler = mock.MagicMock()
+    offsets = [PartitionOffset(0, offset) for offset in range(12)]
+    batches = [
+        [(mock.MagicMock(), offset) for offset in offsets[start : start + batch_size]]
+        for start in range(0, len(offsets), batch_size)
+    ]
+
+    with mock.patch(
+        "datahub.ingestion.source.datahub.datahub_source.DataHubKafkaReader"
+    ) as mock_reader, mock.patch.object(source, "_get_kafka_workunit", return_value=[]):
+        mock_reader.return_value.__enter__.return_value.get_mcl_batches.return_value = (
+            batches
+        )
+        list(source._get_kafka_workunits(from_offsets={}))
+
+    handler = source.stateful_ingestion_handler
+    assert handler.commit_checkpoint.call_count == expected_commits
+    handler.update_checkpoint.assert_called_with(last_offset=offsets[-1])
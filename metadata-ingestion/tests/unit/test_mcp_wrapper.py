@@ -33,3 +33,24 @@ def test_mcpw_from_obj():
 
     assert isinstance(mcpw2, MetadataChangeProposalWrapper)
     assert mcpw == mcpw2
+
+
+def test_mcpw_make_mcp_after_modifying_aspect():
+    aspect = models.DomainsClass(domains=["urn:li:domain:health"])
+    mcpw = MetadataChangeProposalWrapper(
+        entityUrn="urn:li:dataset:(urn:li:dataPlatform:bigquery,harshal-playground-306419.test_schema.excess_deaths_derived,PROD)",
+        aspect=aspect,
+    )
+
+    serialized = mcpw.make_mcp().aspect
+    assert serialized is not None
+    assert serialized.value == b'{"domains": ["urn:li:domain:health"]}'
+
+    # Aspects are often modified in place, e.g. by transformers.
+    aspect.domains.append("urn:li:domain:finance")
+    serialized = mcpw.make_mcp().aspect
+    assert serialized is not None
+    assert (
+        serialized.value
+        == b'{"domains": ["urn:li:domain:health", "urn:li:domain:finance"]}'
+    )
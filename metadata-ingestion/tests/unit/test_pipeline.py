@@ -1,5 +1,8 @@
+import itertools
 import pathlib
-from typing import Any, Iterable, List, Optional, cast
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, cast
 from unittest.mock import patch
 
 import pytest
@@ -11,12 +14,13 @@ from datahub.ingestion.api.common import RecordEnvelope
 from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.transform import Transformer
 from datahub.ingestion.api.workunit import MetadataWorkUnit
-from datahub.ingestion.run.pipeline import Pipeline, PipelineContext
+from datahub.ingestion.run.pipeline import Pipeline, PipelineContext, PipelineInitError
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import SystemMetadata
 from datahub.metadata.schema_classes import (
     DatasetPropertiesClass,
     DatasetSnapshotClass,
     MetadataChangeEventClass,
+    OwnershipClass,
     StatusClass,
 )
 from tests.test_helpers.click_helpers import run_datahub_cmd
@@ -204,6 +208,278 @@ class TestPipeline(object):
         assert len(sink_report.received_records) == 1
         assert expected_mce == sink_report.received_records[0].record
 
+    @freeze_time(FROZEN_TIME)
+    def test_run_with_parallel_workunit_processing(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyWorkUnits"
+                },
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.AddStatusRemovedTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "flags": {
+                    "workunit_processing_threads": 4,
+                    "workunit_processing_max_pending": 3,
+                },
+            }
+        )
+        sink_report: RecordingSinkReport = cast(
+            RecordingSinkReport, pipeline.sink.get_report()
+        )
+        # received_records is a class-level list, so it's shared across tests.
+        sink_report.received_records = []
+
+        # The sink must be told about a workunit before it is extracted.
+        started_workunit_ids: List[str] = []
+        get_records = pipeline.extractor.get_records
+
+        def get_records_after_start(wu: MetadataWorkUnit) -> Iterable[RecordEnvelope]:
+            assert wu.id in started_workunit_ids
+            return get_records(wu)
+
+        with patch.object(
+            pipeline.sink,
+            "handle_work_unit_start",
+            side_effect=lambda wu: started_workunit_ids.append(wu.id),
+        ), patch.object(
+            pipeline.extractor, "get_records", side_effect=get_records_after_start
+        ):
+            pipeline.run()
+        pipeline.raise_from_status()
+
+        # Records must reach the sink in the order the source produced them.
+        source = cast(FakeSourceWithManyWorkUnits, pipeline.source)
+        assert started_workunit_ids == [wu.id for wu in source.work_units]
+        assert len(sink_report.received_records) == len(source.work_units)
+        for wu, received in zip(source.work_units, sink_report.received_records):
+            assert received.metadata["workunit_id"] == wu.id
+            assert isinstance(received.record, MetadataChangeEventClass)
+            assert (
+                get_status_removed_aspect() in received.record.proposedSnapshot.aspects
+            )
+
+    @freeze_time(FROZEN_TIME)
+    def test_run_prefetches_for_transformers_in_batches(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyWorkUnits"
+                },
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.AddStatusRemovedTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+            }
+        )
+        events: List[Any] = []
+        get_records = pipeline.extractor.get_records
+
+        def get_records_and_record(wu: MetadataWorkUnit) -> Iterable[RecordEnvelope]:
+            events.append(wu.id)
+            return get_records(wu)
+
+        transformer = pipeline.transformers[0]
+        with patch(
+            "datahub.ingestion.run.pipeline._TRANSFORMER_PREFETCH_BATCH_SIZE", 8
+        ), patch.object(pipeline.ctx, "graph"), patch.object(
+            transformer, "wants_prefetch", return_value=True
+        ), patch.object(
+            transformer,
+            "prefetch",
+            side_effect=lambda wus: events.append(("prefetch", [wu.id for wu in wus])),
+        ), patch.object(
+            transformer,
+            "clear_prefetched",
+            side_effect=lambda: events.append("clear"),
+        ), patch.object(
+            pipeline.extractor, "get_records", side_effect=get_records_and_record
+        ):
+            pipeline.run()
+        pipeline.raise_from_status()
+
+        # Each batch of workunits is prefetched for before any of them is processed,
+        # and cleared once all of them have been.
+        ids = [f"workunit-{i}" for i in range(20)]
+        expected_events: List[Any] = []
+        for batch in [ids[0:8], ids[8:16], ids[16:20]]:
+            expected_events += [("prefetch", batch), *batch, "clear"]
+        assert events == expected_events
+
+    def test_parallel_workunit_processing_keeps_prefetched_batches_until_written(
+        self,
+    ):
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyEntities"
+                },
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.AddStatusRemovedTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "flags": {"workunit_processing_threads": 4},
+            }
+        )
+        lock = threading.Lock()
+        num_cleared = 0
+        # Workunit id -> number of batches cleared by the time it was processed.
+        cleared_when_processed: Dict[str, int] = {}
+        get_records = pipeline.extractor.get_records
+
+        def clear_prefetched() -> None:
+            nonlocal num_cleared
+            with lock:
+                num_cleared += 1
+
+        def get_records_slowly(wu: MetadataWorkUnit) -> Iterable[RecordEnvelope]:
+            # Give the main thread time to move on to the next batch.
+            time.sleep(0.05)
+            with lock:
+                cleared_when_processed[wu.id] = num_cleared
+            return get_records(wu)
+
+        transformer = pipeline.transformers[0]
+        with patch(
+            "datahub.ingestion.run.pipeline._TRANSFORMER_PREFETCH_BATCH_SIZE", 8
+        ), patch.object(pipeline.ctx, "graph"), patch.object(
+            transformer, "wants_prefetch", return_value=True
+        ), patch.object(
+            transformer, "prefetch"
+        ), patch.object(
+            transformer, "clear_prefetched", side_effect=clear_prefetched
+        ), patch.object(
+            pipeline.extractor, "get_records", side_effect=get_records_slowly
+        ):
+            pipeline.run()
+        pipeline.raise_from_status()
+
+        # No batch is cleared while the worker threads are still processing it.
+        assert num_cleared == 3
+        for i in range(20):
+            assert cleared_when_processed[f"workunit-{i}"] <= i // 8
+
+    @freeze_time(FROZEN_TIME)
+    def test_run_does_not_buffer_workunits_without_graph(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyWorkUnits"
+                },
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.AddStatusRemovedTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+            }
+        )
+        assert pipeline.ctx.graph is None
+
+        transformer = pipeline.transformers[0]
+        with patch.object(
+            transformer, "wants_prefetch", return_value=True
+        ), patch.object(transformer, "prefetch") as prefetch, patch(
+            "datahub.ingestion.run.pipeline.itertools.islice",
+            wraps=itertools.islice,
+        ) as islice:
+            pipeline.run()
+        pipeline.raise_from_status()
+
+        prefetch.assert_not_called()
+        # Only the preview limit is applied; nothing is sliced into batches.
+        assert islice.call_count == 1
+
+    def test_parallel_workunit_processing_requires_thread_safe_transformers(self):
+        with pytest.raises(PipelineInitError, match="AddDatasetTags"):
+            Pipeline.create(
+                {
+                    "source": {"type": "tests.unit.test_pipeline.FakeSource"},
+                    "transformers": [
+                        {
+                            "type": "simple_add_dataset_ownership",
+                            "config": {"owner_urns": ["urn:li:corpuser:foo"]},
+                        },
+                        {
+                            "type": "add_dataset_tags",
+                            "config": {
+                                "get_tags_to_add": "tests.unit.test_transform_dataset.dummy_tag_resolver_method"
+                            },
+                        },
+                    ],
+                    "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                    "flags": {"workunit_processing_threads": 4},
+                }
+            )
+
+    @freeze_time(FROZEN_TIME)
+    def test_parallel_workunit_processing_runs_transformers_concurrently(self):
+        num_threads = 4
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyEntities"
+                },
+                "transformers": [
+                    {
+                        "type": "simple_add_dataset_ownership",
+                        "config": {"owner_urns": ["urn:li:corpuser:foo"]},
+                    }
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "flags": {"workunit_processing_threads": num_threads},
+            }
+        )
+        sink_report: RecordingSinkReport = cast(
+            RecordingSinkReport, pipeline.sink.get_report()
+        )
+        sink_report.received_records = []
+
+        # Each transformation waits, up to a timeout, until another one is running
+        # alongside it. This works however the entities are split across lanes, and
+        # the peak would stay at 1 if the workunits were processed one at a time.
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+        overlapped = threading.Event()
+        transformer = pipeline.transformers[0]
+        transform_aspect = transformer.transform_aspect  # type: ignore
+
+        def transform_aspect_concurrently(*args: Any, **kwargs: Any) -> Any:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+                if running > 1:
+                    overlapped.set()
+            try:
+                overlapped.wait(timeout=5)
+                return transform_aspect(*args, **kwargs)
+            finally:
+                with lock:
+                    running -= 1
+
+        with patch.object(
+            transformer, "transform_aspect", side_effect=transform_aspect_concurrently
+        ):
+            pipeline.run()
+        pipeline.raise_from_status()
+
+        source = cast(FakeSourceWithManyEntities, pipeline.source)
+        assert peak > 1
+        assert len(sink_report.received_records) == len(source.work_units)
+        for wu, received in zip(source.work_units, sink_report.received_records):
+            assert received.metadata["workunit_id"] == wu.id
+            assert isinstance(received.record, MetadataChangeEventClass)
+            assert any(
+                isinstance(aspect, OwnershipClass)
+                for aspect in received.record.proposedSnapshot.aspects
+            )
+
     @freeze_time(FROZEN_TIME)
     def test_run_including_registered_transformation(self):
         # This is not testing functionality, but just the transformer registration system.
@@ -367,6 +643,9 @@ class AddStatusRemovedTransformer(Transformer):
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
         return cls()
 
+    def is_thread_safe(self) -> bool:
+        return True
+
     def transform(
         self, record_envelopes: Iterable[RecordEnvelope]
     ) -> Iterable[RecordEnvelope]:
@@ -404,6 +683,28 @@ class FakeSource(Source):
         pass
 
 
+class FakeSourceWithManyWorkUnits(FakeSource):
+    def __init__(self, ctx: PipelineContext):
+        super().__init__(ctx)
+        self.work_units = [
+            MetadataWorkUnit(id=f"workunit-{i}", mce=get_initial_mce())
+            for i in range(20)
+        ]
+
+
+class FakeSourceWithManyEntities(FakeSource):
+    def __init__(self, ctx: PipelineContext):
+        super().__init__(ctx)
+        self.work_units = []
+        for i in range(20):
+            mce = get_initial_mce()
+            mce.proposedSnapshot.urn = (
+                f"urn:li:dataset:(urn:li:dataPlatform:test_platform,test-{i},PROD)"
+            )
+            mce.proposedSnapshot.aspects.append(OwnershipClass(owners=[]))
+            self.work_units.append(MetadataWorkUnit(id=f"workunit-{i}", mce=mce))
+
+
 class FakeSourceWithWarnings(FakeSource):
     def __init__(self, ctx: PipelineContext):
         super().__init__(ctx)
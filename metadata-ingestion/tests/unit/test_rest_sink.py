@@ -1,11 +1,19 @@
+import gzip
+import http.server
 import json
+import threading
+from typing import Any, List
 
 import pytest
 import requests
 
 import datahub.metadata.schema_classes as models
+from datahub.emitter import rest_emitter
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import NoopWriteCallback
+from datahub.ingestion.sink.datahub_rest import DatahubRestSink
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -259,3 +267,239 @@ def test_datahub_rest_emitter(requests_mock, record, path, snapshot):
 
     emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
     emitter.emit(record)
+
+
+def _make_status_mcp(i: int) -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(
+        entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:foo,bar{i},PROD)",
+        aspect=models.StatusClass(removed=False),
+    )
+
+
+def _request_json(request: Any) -> Any:
+    body = request.body
+    if hasattr(body, "read"):
+        # File-like request bodies are passed through to requests_mock as-is.
+        body.seek(0)
+        body = body.read()
+    if request.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
+def test_datahub_rest_emitter_batch(requests_mock, monkeypatch):
+    monkeypatch.setattr(rest_emitter, "_MAX_BATCH_INGEST_PAYLOAD_LENGTH", 2)
+
+    batch_requests = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch"
+    )
+
+    mcps = [_make_status_mcp(i) for i in range(5)]
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    assert emitter.emit_mcps(mcps) == 3
+
+    assert batch_requests.call_count == 3
+    proposals = [
+        proposal
+        for request in batch_requests.request_history
+        for proposal in _request_json(request)["proposals"]
+    ]
+    assert [proposal["entityUrn"] for proposal in proposals] == [
+        mcp.entityUrn for mcp in mcps
+    ]
+
+
+def test_datahub_rest_emitter_batch_fallback(requests_mock):
+    batch_requests = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        status_code=400,
+        json={"status": 400, "message": "Action 'ingestProposalBatch' not found"},
+    )
+    single_requests = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal"
+    )
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    assert emitter.emit_mcps([_make_status_mcp(i) for i in range(3)]) == 3
+    assert emitter.emit_mcps([_make_status_mcp(i) for i in range(2)]) == 2
+
+    # We should only probe the batch endpoint once.
+    assert batch_requests.call_count == 1
+    assert single_requests.call_count == 5
+
+
+def test_datahub_rest_emitter_compression(requests_mock):
+    requests_mock.get(
+        f"{MOCK_GMS_ENDPOINT}/config",
+        json={"noCode": "true", "requestCompression": ["gzip", "deflate"]},
+    )
+    ingest_requests = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal"
+    )
+
+    emitter = DatahubRestEmitter(
+        MOCK_GMS_ENDPOINT, compression="gzip", compression_min_size=500
+    )
+    small_mcp = _make_status_mcp(0)
+    emitter.emit_mcp(small_mcp)
+    large_mcp = MetadataChangeProposalWrapper(
+        entityUrn="urn:li:dataset:(urn:li:dataPlatform:foo,bar,PROD)",
+        aspect=models.DatasetPropertiesClass(description="x" * 1000),
+    )
+    emitter.emit_mcp(large_mcp)
+
+    small_request, large_request = ingest_requests.request_history
+    assert "Content-Encoding" not in small_request.headers
+    assert large_request.headers["Content-Encoding"] == "gzip"
+    assert len(large_request.body) < 500
+    assert _request_json(large_request)["proposal"]["entityUrn"] == large_mcp.entityUrn
+
+
+def test_datahub_rest_emitter_compression_unsupported(requests_mock):
+    requests_mock.get(
+        f"{MOCK_GMS_ENDPOINT}/config",
+        json={"noCode": "true", "requestCompression": ["gzip", "deflate"]},
+    )
+    ingest_requests = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal",
+        [{"status_code": 415}, {"status_code": 200}, {"status_code": 200}],
+    )
+
+    emitter = DatahubRestEmitter(
+        MOCK_GMS_ENDPOINT, compression="gzip", compression_min_size=0
+    )
+    emitter.emit_mcp(_make_status_mcp(0))
+    emitter.emit_mcp(_make_status_mcp(1))
+
+    # After the 415, the request is resent and compression stays disabled.
+    assert [
+        r.headers.get("Content-Encoding") for r in ingest_requests.request_history
+    ] == [
+        "gzip",
+        None,
+        None,
+    ]
+    assert [
+        _request_json(r)["proposal"]["entityUrn"]
+        for r in ingest_requests.request_history
+    ] == [
+        _make_status_mcp(0).entityUrn,
+        _make_status_mcp(0).entityUrn,
+        _make_status_mcp(1).entityUrn,
+    ]
+
+
+def test_datahub_rest_emitter_compression_old_server(requests_mock):
+    # GMS versions without request compression support don't advertise it, and
+    # fail to parse compressed bodies as JSON.
+    config_requests = requests_mock.get(
+        f"{MOCK_GMS_ENDPOINT}/config", json={"noCode": "true"}
+    )
+
+    def ingest_callback(request: Any, context: Any) -> dict:
+        if request.headers.get("Content-Encoding"):
+            context.status_code = 400
+            return {"status": 400, "message": "Cannot parse request entity"}
+        return {}
+
+    ingest_requests = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal", json=ingest_callback
+    )
+
+    emitter = DatahubRestEmitter(
+        MOCK_GMS_ENDPOINT, compression="gzip", compression_min_size=0
+    )
+    emitter.emit_mcp(_make_status_mcp(0))
+    emitter.emit_mcp(_make_status_mcp(1))
+
+    # Compressed requests are never sent, and the config is only fetched once.
+    assert config_requests.call_count == 1
+    assert [
+        r.headers.get("Content-Encoding") for r in ingest_requests.request_history
+    ] == [None, None]
+
+
+def test_datahub_rest_emitter_chunked_body_is_retried():
+    # Uses a real server, since we need urllib3 to rewind the file-like body on retries.
+    received: List[bytes] = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length = int(self.headers["Content-Length"])
+            received.append(self.rfile.read(length))
+            self.send_response(503 if len(received) == 1 else 200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("localhost", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        emitter = DatahubRestEmitter(f"http://localhost:{server.server_address[1]}")
+        mcps = [_make_status_mcp(i) for i in range(3)]
+        assert emitter.emit_mcps(mcps) == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(received) == 2
+    assert received[0] == received[1]
+    assert [p["entityUrn"] for p in json.loads(received[1])["proposals"]] == [
+        mcp.entityUrn for mcp in mcps
+    ]
+
+
+def test_datahub_rest_sink_batch_fallback(requests_mock):
+    requests_mock.get(f"{MOCK_GMS_ENDPOINT}/config", json={"noCode": "true"})
+
+    # Batches that contain bar0, bar3, ... fail, which makes the sink re-send
+    # their records one by one.
+    def is_failed_batch(request: Any) -> bool:
+        return any(
+            int(proposal["entityUrn"].split(",")[1][3:]) % 3 == 0
+            for proposal in _request_json(request)["proposals"]
+        )
+
+    def batch_response(request: Any, context: Any) -> dict:
+        context.status_code = 400 if is_failed_batch(request) else 200
+        return {"message": "failed"}
+
+    batch_requests = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch", json=batch_response
+    )
+    single_requests = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal"
+    )
+
+    sink = DatahubRestSink.create(
+        {
+            "server": MOCK_GMS_ENDPOINT,
+            "mode": "ASYNC_BATCH",
+            "max_threads": 4,
+            "max_per_batch": 5,
+        },
+        PipelineContext(run_id="test"),
+    )
+    num_records = 200
+    for i in range(num_records):
+        sink.write_record_async(
+            RecordEnvelope(_make_status_mcp(i), metadata={}), NoopWriteCallback()
+        )
+    sink.close()
+
+    report = sink.get_report()
+    assert report.total_records_written == num_records
+    assert report.pending_requests == 0
+    assert report.async_batches_failed > 0
+    assert (
+        report.async_batches_emitted + report.async_batches_failed
+        == batch_requests.call_count
+    )
+    # Only the records of the failed batches are re-sent.
+    assert single_requests.call_count == sum(
+        len(_request_json(request)["proposals"])
+        for request in batch_requests.request_history
+        if is_failed_batch(request)
+    )
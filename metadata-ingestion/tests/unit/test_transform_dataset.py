@@ -6,6 +6,7 @@ from typing import (
     List,
     MutableSequence,
     Optional,
+    Tuple,
     Type,
     Union,
     cast,
@@ -2603,3 +2604,97 @@ def test_pattern_dataset_schema_tags_transformation_patch(
     assert builder.make_tag_urn("pii") in global_tags_urn
     assert builder.make_tag_urn("FirstName") in global_tags_urn
     assert builder.make_tag_urn("Name") in global_tags_urn
+
+
+def _make_tags_mcpw(urn: str) -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(
+        entityUrn=urn,
+        aspect=models.GlobalTagsClass(
+            tags=[models.TagAssociationClass(tag=builder.make_tag_urn("source"))]
+        ),
+    )
+
+
+def _make_patch_tags_transformer() -> Tuple[SimpleAddDatasetTags, mock.MagicMock]:
+    pipeline_context = PipelineContext(run_id="test_prefetch")
+    graph = mock.create_autospec(DataHubGraph, instance=True)
+    graph.get_tags.return_value = None
+    pipeline_context.graph = graph
+    transformer = SimpleAddDatasetTags.create(
+        {
+            "tag_urns": [builder.make_tag_urn("NeedsDocumentation")],
+            "semantics": TransformerSemantics.PATCH,
+        },
+        pipeline_context,
+    )
+    return transformer, graph
+
+
+def test_prefetch_server_aspects_for_workunits():
+    transformer, graph = _make_patch_tags_transformer()
+    urns = [builder.make_dataset_urn("bigquery", f"table_{i}") for i in range(3)]
+
+    transformer.prefetch(
+        [
+            *[_make_tags_mcpw(urn).as_workunit() for urn in urns],
+            # Neither of these has the aspect that the transformer patches.
+            MetadataChangeProposalWrapper(
+                entityUrn=builder.make_dataset_urn("bigquery", "other"),
+                aspect=models.StatusClass(removed=False),
+            ).as_workunit(),
+            _make_tags_mcpw(builder.make_chart_urn("looker", "chart")).as_workunit(),
+        ]
+    )
+    graph.prefetch_aspects.assert_called_once_with(urns, [models.GlobalTagsClass])
+
+    outputs = list(
+        transformer.transform(
+            [RecordEnvelope(_make_tags_mcpw(urn), metadata={}) for urn in urns]
+        )
+    )
+    assert len(outputs) == len(urns)
+    assert graph.get_tags.call_count == len(urns)
+
+    transformer.clear_prefetched()
+    graph.clear_prefetched_aspects.assert_called_once_with(
+        urns, models.GlobalTagsClass.ASPECT_NAME
+    )
+
+
+def test_prefetch_server_aspects_at_end_of_stream_in_batches():
+    transformer, graph = _make_patch_tags_transformer()
+    urns = [builder.make_dataset_urn("bigquery", f"table_{i}") for i in range(5)]
+
+    prefetched_batches: List[List[str]] = []
+    graph.prefetch_aspects.side_effect = lambda batch, _: prefetched_batches.append(
+        list(batch)
+    )
+
+    with mock.patch(
+        "datahub.ingestion.transformer.base_transformer._SERVER_ASPECT_PREFETCH_BATCH_SIZE",
+        2,
+    ):
+        outputs = list(
+            transformer.transform(
+                [
+                    *[
+                        RecordEnvelope(
+                            MetadataChangeProposalWrapper(
+                                entityUrn=urn, aspect=models.StatusClass(removed=False)
+                            ),
+                            metadata={},
+                        )
+                        for urn in urns
+                    ],
+                    RecordEnvelope(EndOfStream(), metadata={}),
+                ]
+            )
+        )
+
+    # One tags aspect per entity, besides the status aspects and the end of stream.
+    assert len(outputs) == 2 * len(urns) + 1
+    assert prefetched_batches == [urns[0:2], urns[2:4], urns[4:5]]
+    assert graph.clear_prefetched_aspects.call_args_list == [
+        mock.call(batch, models.GlobalTagsClass.ASPECT_NAME)
+        for batch in prefetched_batches
+    ]
@@ -1,5 +1,6 @@
 from datahub.utilities.delayed_iter import delayed_iter
 from datahub.utilities.sql_parser import SqlLineageSQLParser
+from datahub.utilities.sql_parser_base import SqlParserException
 
 
 def test_delayed_iter():
@@ -282,3 +283,21 @@ JOIN `admin-table` a on d.`column-date` = a.`column-admin`
     ]
     assert sorted(SqlLineageSQLParser(sql_query).get_tables()) == expected_tables
     assert sorted(SqlLineageSQLParser(sql_query).get_columns()) == expected_columns
+
+
+def test_sqllineage_sql_parser_batch():
+    results = SqlLineageSQLParser.get_tables_columns_batch(
+        [
+            "SELECT foo, bar FROM my_schema.foo_table",
+            # sqllineage can't handle multiple inserts in one statement.
+            "insert overwrite table tab1 select * from tab2 insert overwrite table tab3",
+            "SELECT baz FROM bar_table",
+        ]
+    )
+
+    assert not isinstance(results[0], Exception)
+    assert results[0][0] == ["my_schema.foo_table"]
+    assert sorted(results[0][1]) == ["bar", "foo"]
+    assert isinstance(results[1], SqlParserException)
+    assert "SQL lineage analyzer error" in str(results[1])
+    assert results[2] == (["bar_table"], ["baz"])
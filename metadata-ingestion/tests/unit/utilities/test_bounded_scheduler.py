@@ -0,0 +1,110 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from datahub.utilities.bounded_scheduler import (
+    TaskTimeoutError,
+    run_with_bounded_concurrency,
+)
+
+
+def _sleep_and_return(i: int) -> int:
+    # Make earlier tasks slower, so that reordering would be visible.
+    time.sleep(0.01 * (5 - i % 5))
+    if i == 7:
+        raise ValueError("seven")
+    return i
+
+
+def test_ordered_results() -> None:
+    results = list(
+        run_with_bounded_concurrency(
+            _sleep_and_return, range(20), max_workers=4, ordering_window=6
+        )
+    )
+    assert [item for item, _ in results] == list(range(20))
+    assert [result for _, result in results if not isinstance(result, Exception)] == [
+        i for i in range(20) if i != 7
+    ]
+    assert isinstance(results[7][1], ValueError)
+
+
+def test_unordered_results() -> None:
+    results = list(
+        run_with_bounded_concurrency(
+            _sleep_and_return, range(20), max_workers=4, ordered=False
+        )
+    )
+    assert sorted(item for item, _ in results) == list(range(20))
+    # A slow task does not hold back the ones after it.
+    assert [item for item, _ in results] != list(range(20))
+
+
+def test_max_in_flight_cost() -> None:
+    lock = threading.Lock()
+    running: List[int] = []
+    max_running_cost = 0
+
+    def task(cost: int) -> int:
+        nonlocal max_running_cost
+        with lock:
+            running.append(cost)
+            max_running_cost = max(max_running_cost, sum(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(cost)
+        return cost
+
+    costs = [5, 3, 20, 2, 2, 4, 1]
+    results = list(
+        run_with_bounded_concurrency(
+            task,
+            costs,
+            max_workers=4,
+            cost_fn=float,
+            max_in_flight_cost=10,
+            ordered=False,
+        )
+    )
+    assert sorted(result for _, result in results) == sorted(costs)  # type: ignore
+    # The task that costs 20 runs alone.
+    assert max_running_cost == 20
+
+
+def test_timeout() -> None:
+    release = threading.Event()
+    finished: List[int] = []
+
+    def task(i: int) -> int:
+        if i == 1:
+            release.wait()
+        finished.append(i)
+        return i
+
+    start = time.perf_counter()
+    try:
+        results = list(
+            run_with_bounded_concurrency(
+                task,
+                range(4),
+                max_workers=2,
+                timeout=0.2,
+                on_timeout=lambda i: release.set(),
+            )
+        )
+        assert time.perf_counter() - start < 2
+    finally:
+        release.set()
+
+    # The task that timed out was stopped and waited for.
+    assert sorted(finished) == [0, 1, 2, 3]
+    assert [item for item, _ in results] == [0, 1, 2, 3]
+    assert isinstance(results[1][1], TaskTimeoutError)
+    assert [result for _, result in results if isinstance(result, int)] == [0, 2, 3]
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        list(run_with_bounded_concurrency(_sleep_and_return, [1], max_workers=0))
@@ -289,6 +289,69 @@ def test_shared_connection() -> None:
         assert list(cur)[0][0] == 3
 
 
+def test_bulk_operations() -> None:
+    cache = FileBackedDict[Pair](
+        tablename="cache",
+        extra_columns={"y": lambda m: m.y},
+        cache_max_size=10,
+        cache_eviction_batch_size=10,
+    )
+
+    cache["key-000"] = Pair(-1, "cached")
+    cache["key-001"] = Pair(-1, "cached")
+    cache.update_many(
+        {f"key-{i:03}": Pair(i, "a" if i < 500 else "b") for i in range(1000)}
+    )
+    cache.update_many([("other", Pair(0, "b"))])
+
+    # update_many replaces cached values, dirty or not.
+    assert cache["key-000"] == Pair(0, "a")
+    cache.flush()
+    assert cache["key-001"] == Pair(1, "a")
+    assert len(cache) == 1001
+
+    keys = [f"key-{i:03}" for i in range(0, 1000, 3)] + ["missing"]
+    assert cache.get_many(keys) == {
+        f"key-{i:03}": Pair(i, "a" if i < 500 else "b") for i in range(0, 1000, 3)
+    }
+    # Unflushed values are returned too.
+    cache["key-003"] = Pair(3, "c")
+    assert cache.get_many(["key-003"]) == {"key-003": Pair(3, "c")}
+
+    assert list(cache.items_in_range("key-002", "key-005")) == [
+        ("key-002", Pair(2, "a")),
+        ("key-003", Pair(3, "c")),
+        ("key-004", Pair(4, "a")),
+    ]
+    assert [key for key, _ in cache.items_in_range(start="key-998")] == [
+        "key-998",
+        "key-999",
+        "other",
+    ]
+    assert len(list(cache.items_in_range(end="key-100"))) == 100
+
+    # The extra columns are written too.
+    assert (
+        cache.sql_query(f"SELECT count(*) FROM {cache.tablename} WHERE y = 'b'")[0][0]
+        == 501
+    )
+
+
+def test_custom_pragmas() -> None:
+    cache = FileBackedDict[int](
+        pragmas={"journal_mode": "WAL", "mmap_size": 2**20, "page_size": 16384}
+    )
+    cache["a"] = 1
+    cache.flush()
+
+    assert cache.sql_query("PRAGMA journal_mode")[0][0] == "wal"
+    assert cache.sql_query("PRAGMA page_size")[0][0] == 16384
+    # The defaults still apply for anything that isn't overridden.
+    assert cache.sql_query("PRAGMA synchronous")[0][0] == 0
+    assert cache["a"] == 1
+    cache.close()
+
+
 def test_file_list() -> None:
     my_list = FileBackedList[int](
         serializer=lambda x: x,
@@ -0,0 +1,92 @@
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+from datahub.utilities.partition_executor import (
+    BatchPartitionExecutor,
+    PartitionExecutor,
+)
+
+
+def test_partitioned_executor_preserves_order_per_key():
+    executed: Dict[str, List[int]] = defaultdict(list)
+
+    def task(key: str, i: int) -> int:
+        # Make earlier tasks slower, so that reordering would be visible.
+        time.sleep(0.001 * (5 - i % 5))
+        executed[key].append(i)
+        return i
+
+    with PartitionExecutor(max_workers=4, max_pending=10) as executor:
+        futures = [
+            executor.submit(f"key{i % 3}", task, f"key{i % 3}", i) for i in range(30)
+        ]
+
+    assert [f.result() for f in futures] == list(range(30))
+    for key, values in executed.items():
+        assert values == sorted(values), key
+    assert sum(len(values) for values in executed.values()) == 30
+
+
+def test_partitioned_executor_blocks_when_full():
+    def task() -> None:
+        time.sleep(0.2)
+
+    with PartitionExecutor(max_workers=2, max_pending=1) as executor:
+        executor.submit("key1", task)
+
+        start = time.perf_counter()
+        executor.submit("key2", task)
+        assert time.perf_counter() - start >= 0.15
+
+
+def test_batch_partition_executor_batches_and_orders():
+    batches: List[List[Tuple[str, int]]] = []
+
+    def process_batch(batch: List[Tuple[str, int]]) -> None:
+        batches.append(batch)
+
+    with BatchPartitionExecutor(
+        max_workers=3,
+        max_pending=20,
+        max_per_batch=4,
+        process_batch=process_batch,
+        max_batch_linger=timedelta(seconds=10),
+    ) as executor:
+        for i in range(30):
+            key = f"key{i % 5}"
+            executor.submit(key, (key, i))
+
+    assert all(len(batch) <= 4 for batch in batches)
+    assert sum(len(batch) for batch in batches) == 30
+
+    seen: Dict[str, List[int]] = defaultdict(list)
+    for batch in batches:
+        for key, i in batch:
+            seen[key].append(i)
+    for key, values in seen.items():
+        assert values == sorted(values), key
+
+
+def test_batch_partition_executor_linger():
+    batches: List[List[int]] = []
+
+    executor = BatchPartitionExecutor(
+        max_workers=1,
+        max_pending=10,
+        max_per_batch=100,
+        process_batch=batches.append,
+        max_batch_linger=timedelta(seconds=0.1),
+    )
+    try:
+        executor.submit("key", 1)
+        executor.submit("key", 2)
+
+        # The batch is not full, so it should only be sent once the linger expires.
+        deadline = time.perf_counter() + 2
+        while not batches and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        assert batches == [[1, 2]]
+    finally:
+        executor.close()
@@ -0,0 +1,74 @@
+import os
+from typing import List
+
+import pytest
+
+from datahub.utilities.process_pool import RecyclingProcessPool, WorkerProcessError
+
+_leaked: List[bytes] = []
+
+
+def _square(x: int) -> int:
+    if x < 0:
+        raise ValueError(f"negative: {x}")
+    return x * x
+
+
+def _get_pid(_: int) -> int:
+    return os.getpid()
+
+
+def _leak(_: int) -> int:
+    _leaked.append(b"x" * 20 * 1024 * 1024)
+    return os.getpid()
+
+
+def _exit_on_zero(x: int) -> int:
+    if x == 0:
+        os._exit(3)
+    return x
+
+
+def test_map_preserves_order() -> None:
+    with RecyclingProcessPool(_square, max_workers=3) as pool:
+        assert pool.map(range(20)) == [x * x for x in range(20)]
+        assert pool.apply(7) == 49
+
+        results = pool.map_with_exceptions([1, -2, 3])
+        assert results[0] == 1 and results[2] == 9
+        assert isinstance(results[1], ValueError)
+        with pytest.raises(ValueError, match="negative: -2"):
+            pool.map([1, -2, 3])
+
+        # Workers are reused across calls.
+        assert pool.num_workers_started == 3
+
+    with pytest.raises(RuntimeError):
+        pool.apply(1)
+
+
+def test_workers_are_recycled_after_max_tasks() -> None:
+    with RecyclingProcessPool(_get_pid, max_workers=1, max_tasks_per_worker=3) as pool:
+        pids = [pool.apply(i) for i in range(7)]
+    assert len(set(pids[0:3])) == 1
+    assert len(set(pids)) == 3
+    assert pool.num_workers_started == 3
+
+
+def test_workers_are_recycled_after_rss_growth() -> None:
+    with RecyclingProcessPool(
+        _leak, max_workers=1, max_worker_rss_growth=50 * 1024 * 1024
+    ) as pool:
+        pids = [pool.apply(i) for i in range(6)]
+    # Each worker leaks 20MB per task, so it's replaced after its third task.
+    assert pids[0] == pids[2] != pids[3] == pids[5]
+
+
+def test_worker_crash_fails_only_its_task() -> None:
+    with RecyclingProcessPool(_exit_on_zero, max_workers=2) as pool:
+        results = pool.map_with_exceptions([1, 0, 2, 3])
+        assert results[0] == 1 and results[2:] == [2, 3]
+        assert isinstance(results[1], WorkerProcessError)
+        assert "code 3" in str(results[1])
+
+        assert pool.map([4, 5]) == [4, 5]
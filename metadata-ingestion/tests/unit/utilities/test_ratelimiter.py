@@ -1,8 +1,12 @@
+import threading
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 
-from datahub.utilities.ratelimiter import RateLimiter
+import pytest
+
+from datahub.utilities import ratelimiter as ratelimiter_module
+from datahub.utilities.ratelimiter import ConcurrentRateLimiter, RateLimiter
 
 
 def test_rate_is_limited():
@@ -18,3 +22,67 @@ def test_rate_is_limited():
     assert len(actual_calls) == round(TOTAL_CALLS / MAX_CALLS_PER_SEC)
     assert all(calls <= MAX_CALLS_PER_SEC for calls in actual_calls.values())
     assert sum(actual_calls.values()) == TOTAL_CALLS
+
+
+class _FakeClock:
+    """Stands in for the time module. The clock stays put, and sleep only
+    records how long the caller would have waited."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: List[float] = []
+        self._lock = threading.Lock()
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleeps.append(seconds)
+
+
+def test_concurrent_rate_is_limited(monkeypatch: pytest.MonkeyPatch) -> None:
+    MAX_CALLS_PER_SEC = 20
+    THREADS = 8
+    CALLS_PER_THREAD = 5
+    clock = _FakeClock()
+    monkeypatch.setattr(ratelimiter_module, "time", clock)
+
+    ratelimiter = ConcurrentRateLimiter(max_calls=MAX_CALLS_PER_SEC, period=1)
+
+    def _run() -> None:
+        for _ in range(CALLS_PER_THREAD):
+            with ratelimiter:
+                pass
+
+    threads = [threading.Thread(target=_run) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every call gets its own slot, spaced 1 / MAX_CALLS_PER_SEC apart. The
+    # first one starts straight away, so it never sleeps.
+    slots = sorted(clock.sleeps)
+    assert slots == pytest.approx(
+        [i / MAX_CALLS_PER_SEC for i in range(1, THREADS * CALLS_PER_THREAD)]
+    )
+
+
+def test_concurrent_rate_limiter_does_not_bank_idle_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(ratelimiter_module, "time", clock)
+
+    ratelimiter = ConcurrentRateLimiter(max_calls=2, period=1)
+    with ratelimiter:
+        pass
+
+    # After a long pause the next call runs immediately, but unused slots
+    # from the pause can't be spent on a burst.
+    clock.now += 10
+    for _ in range(3):
+        with ratelimiter:
+            pass
+    assert clock.sleeps == pytest.approx([0.5, 1.0])
@@ -0,0 +1,110 @@
+import functools
+from typing import Any, Dict, Optional, Tuple
+
+import pytest
+import sqlalchemy as sa
+
+from datahub.utilities.sqlalchemy_query_combiner import SQLAlchemyQueryCombiner
+
+
+@pytest.fixture
+def engine() -> Any:
+    engine = sa.create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(sa.text("CREATE TABLE t1 (a INTEGER, b INTEGER)"))
+        conn.execute(sa.text("CREATE TABLE t2 (c INTEGER)"))
+        conn.execute(sa.text("INSERT INTO t1 VALUES (1, 10), (2, 20), (3, 30)"))
+        conn.execute(sa.text("INSERT INTO t2 VALUES (5)"))
+    return engine
+
+
+def _run_queries(
+    engine: Any, queries: Dict[str, Any], **kwargs: Any
+) -> Tuple[SQLAlchemyQueryCombiner, Dict[str, Any]]:
+    results: Dict[str, Any] = {}
+    combiner = SQLAlchemyQueryCombiner(
+        enabled=True,
+        catch_exceptions=False,
+        is_single_row_query_method=lambda query: True,
+        serial_execution_fallback_enabled=True,
+        **kwargs,
+    )
+    with engine.connect() as conn, combiner.activate():
+
+        def run_query(name: str, query: Any) -> None:
+            try:
+                results[name] = conn.execute(query).fetchone()[0]
+            except Exception as e:
+                results[name] = e
+
+        for name, query in queries.items():
+            combiner.run(functools.partial(run_query, name, query))
+        combiner.flush()
+
+    return combiner, results
+
+
+def test_batches_are_limited_and_grouped_by_table(engine: Any) -> None:
+    metadata = sa.MetaData()
+    t1 = sa.Table("t1", metadata, sa.Column("a"), sa.Column("b"))
+    t2 = sa.Table("t2", metadata, sa.Column("c"))
+    queries = {
+        "count_t1": sa.select([sa.func.count()]).select_from(t1),
+        "max_t2": sa.select([sa.func.max(t2.c.c)]),
+        "max_a": sa.select([sa.func.max(t1.c.a)]),
+        "min_a": sa.select([sa.func.min(t1.c.a)]),
+        "sum_b": sa.select([sa.func.sum(t1.c.b)]),
+    }
+
+    combiner, results = _run_queries(engine, queries, max_queries_per_batch=2)
+
+    assert results == {
+        "count_t1": 3,
+        "max_t2": 5,
+        "max_a": 3,
+        "min_a": 1,
+        "sum_b": 60,
+    }
+    report = combiner.report
+    assert report.uncombined_queries_issued == 0
+    # t1: [count_t1, max_a], [min_a, sum_b]; t2: [max_t2]
+    assert report.combined_queries_issued == 3
+    assert report.combined_query_sizes == {"1-2": 1, "2-5": 2}
+    assert sum(report.combined_query_latencies_sec.values()) == 3
+
+
+@pytest.mark.parametrize("max_length", [1, None])
+def test_max_combined_query_length(engine: Any, max_length: Optional[int]) -> None:
+    metadata = sa.MetaData()
+    t1 = sa.Table("t1", metadata, sa.Column("a"))
+    queries = {f"q{i}": sa.select([sa.func.max(t1.c.a) + i]) for i in range(4)}
+
+    combiner, results = _run_queries(
+        engine, queries, max_combined_query_length=max_length
+    )
+
+    assert results == {f"q{i}": 3 + i for i in range(4)}
+    # Each query is longer than the limit on its own, but still runs.
+    assert combiner.report.combined_queries_issued == (4 if max_length else 1)
+
+
+def test_failed_batch_is_split(engine: Any) -> None:
+    metadata = sa.MetaData()
+    t1 = sa.Table("t1", metadata, sa.Column("a"), sa.Column("missing"))
+    queries: Dict[str, Any] = {
+        f"q{i}": sa.select([sa.func.max(t1.c.a) + i]) for i in range(4)
+    }
+    queries["bad"] = sa.select([sa.func.max(t1.c.missing)])
+
+    combiner, results = _run_queries(engine, queries)
+
+    assert {k: v for k, v in results.items() if k != "bad"} == {
+        f"q{i}": 3 + i for i in range(4)
+    }
+    assert isinstance(results["bad"], sa.exc.OperationalError)
+    report = combiner.report
+    # [q0..q3, bad] -> [q0, q1], [q2, q3, bad] -> [q2], [q3, bad] -> [q3], [bad]
+    assert report.combined_queries_split == 3
+    assert report.combined_queries_issued == 3
+    assert report.uncombined_queries_issued == 1
+    assert report.query_exceptions == 4
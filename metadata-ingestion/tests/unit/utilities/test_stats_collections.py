@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from datahub.utilities.stats_collections import HeavyHittersCounter
+
+
+def test_heavy_hitters_counter_exact() -> None:
+    counter = HeavyHittersCounter[str](capacity=2)
+    for key in ["a", "b", "a", "c", "a", "b"]:
+        counter.add(key)
+
+    assert counter.is_exact
+    assert counter.most_common() == [("a", 3), ("b", 2), ("c", 1)]
+    assert counter.most_common(2) == [("a", 3), ("b", 2)]
+
+
+def test_heavy_hitters_counter_pruned() -> None:
+    capacity = 10
+    counter = HeavyHittersCounter[int](capacity=capacity)
+
+    # A few frequent keys, mixed in with many rare ones.
+    keys = [i % 5 for i in range(1000)] + list(range(100, 1100))
+    random.Random(0).shuffle(keys)
+    for key in keys:
+        counter.add(key)
+
+    assert not counter.is_exact
+    assert len(counter) <= 2 * capacity
+    top = counter.most_common(5)
+    assert sorted(key for key, _ in top) == [0, 1, 2, 3, 4]
+    # Counts can be overestimated, but never underestimated.
+    assert all(count >= 200 for _, count in top)
+
+
+def test_heavy_hitters_counter_invalid_capacity() -> None:
+    with pytest.raises(ValueError):
+        HeavyHittersCounter[str](capacity=0)
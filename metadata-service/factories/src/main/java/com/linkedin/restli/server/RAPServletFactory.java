@@ -6,6 +6,7 @@ import com.linkedin.metadata.filter.RestliLoggingFilter;
 import com.linkedin.parseq.Engine;
 import com.linkedin.parseq.EngineBuilder;
 import com.linkedin.r2.filter.FilterChains;
+import com.linkedin.r2.filter.compression.ServerCompressionFilter;
 import com.linkedin.r2.filter.transport.FilterChainDispatcher;
 import com.linkedin.r2.transport.http.server.RAPServlet;
 import com.linkedin.restli.docgen.DefaultDocumentationRequestHandler;
@@ -30,6 +31,11 @@ public class RAPServletFactory {
     @Value("${" + INGESTION_MAX_SERIALIZED_STRING_LENGTH + ":16000000}")
     private int maxSerializedStringLength;
 
+    // Content-Encodings that clients may use for request bodies, e.g. when ingesting large aspects.
+    // The /config endpoint advertises the same list, so keep the two in sync.
+    @Value("#{systemEnvironment['RESTLI_SERVLET_ACCEPT_COMPRESSION'] ?: 'gzip,deflate'}")
+    private String acceptCompression;
+
     @Bean(name = "restliSpringInjectResourceFactory")
     public SpringInjectResourceFactory springInjectResourceFactory() {
         return new SpringInjectResourceFactory();
@@ -63,6 +69,6 @@ public class RAPServletFactory {
 
         RestLiServer restLiServer = new RestLiServer(config, springInjectResourceFactory, parseqEngine);
         return new RAPServlet(new FilterChainDispatcher(new DelegatingTransportDispatcher(restLiServer, restLiServer),
-                FilterChains.empty()));
+                FilterChains.createRestChain(new ServerCompressionFilter(acceptCompression))));
     }
 }
@@ -42,6 +42,7 @@ import com.linkedin.restli.server.resources.CollectionResourceTaskTemplate;
 import io.opentelemetry.extension.annotations.WithSpan;
 import java.net.URISyntaxException;
 import java.time.Clock;
+import java.util.Arrays;
 import java.util.List;
 import java.util.Set;
 import java.util.stream.Collectors;
@@ -67,10 +68,12 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
 
   private static final String ACTION_GET_TIMESERIES_ASPECT = "getTimeseriesAspectValues";
   private static final String ACTION_INGEST_PROPOSAL = "ingestProposal";
+  private static final String ACTION_INGEST_PROPOSAL_BATCH = "ingestProposalBatch";
   private static final String ACTION_GET_COUNT = "getCount";
   private static final String PARAM_ENTITY = "entity";
   private static final String PARAM_ASPECT = "aspect";
   private static final String PARAM_PROPOSAL = "proposal";
+  private static final String PARAM_PROPOSALS = "proposals";
   private static final String PARAM_START_TIME_MILLIS = "startTimeMillis";
   private static final String PARAM_END_TIME_MILLIS = "endTimeMillis";
   private static final String PARAM_LATEST_VALUE = "latestValue";
@@ -184,14 +187,48 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
       @ActionParam(PARAM_ASYNC) @Optional(UNSET) String async) throws URISyntaxException {
     log.info("INGEST PROPOSAL proposal: {}", metadataChangeProposal);
 
-    final boolean asyncBool;
+    final boolean asyncBool = isAsyncIngest(async);
+
+    Authentication authentication = AuthenticationContext.getAuthentication();
+    authorizeProposal(authentication, metadataChangeProposal);
+    String actorUrnStr = authentication.getActor().toUrnStr();
+    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+
+    return RestliUtil.toTask(() -> ingestOneProposal(metadataChangeProposal, auditStamp, asyncBool),
+        MetricRegistry.name(this.getClass(), "ingestProposal"));
+  }
+
+  @Action(name = ACTION_INGEST_PROPOSAL_BATCH)
+  @Nonnull
+  @WithSpan
+  public Task<String[]> ingestProposalBatch(
+      @ActionParam(PARAM_PROPOSALS) @Nonnull MetadataChangeProposal[] metadataChangeProposals,
+      @ActionParam(PARAM_ASYNC) @Optional(UNSET) String async) throws URISyntaxException {
+    log.info("INGEST PROPOSAL BATCH proposals: {}", metadataChangeProposals.length);
+
+    final boolean asyncBool = isAsyncIngest(async);
+
+    Authentication authentication = AuthenticationContext.getAuthentication();
+    for (MetadataChangeProposal metadataChangeProposal : metadataChangeProposals) {
+      authorizeProposal(authentication, metadataChangeProposal);
+    }
+    String actorUrnStr = authentication.getActor().toUrnStr();
+    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+
+    return RestliUtil.toTask(() -> Arrays.stream(metadataChangeProposals)
+            .map(metadataChangeProposal -> ingestOneProposal(metadataChangeProposal, auditStamp, asyncBool))
+            .toArray(String[]::new),
+        MetricRegistry.name(this.getClass(), "ingestProposalBatch"));
+  }
+
+  private static boolean isAsyncIngest(String async) {
     if (UNSET.equals(async)) {
-      asyncBool = Boolean.parseBoolean(System.getenv(ASYNC_INGEST_DEFAULT_NAME));
-    } else {
-      asyncBool = Boolean.parseBoolean(async);
+      return Boolean.parseBoolean(System.getenv(ASYNC_INGEST_DEFAULT_NAME));
     }
+    return Boolean.parseBoolean(async);
+  }
 
-    Authentication authentication = AuthenticationContext.getAuthentication();
+  private void authorizeProposal(Authentication authentication, MetadataChangeProposal metadataChangeProposal) {
     com.linkedin.metadata.models.EntitySpec entitySpec = _entityService.getEntityRegistry().getEntitySpec(metadataChangeProposal.getEntityType());
     Urn urn = EntityKeyUtils.getUrnFromProposal(metadataChangeProposal, entitySpec.getKeyAspectSpec());
     if (Boolean.parseBoolean(System.getenv(REST_API_AUTHORIZATION_ENABLED_ENV))
@@ -199,44 +236,42 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
         new EntitySpec(urn.getEntityType(), urn.toString()))) {
       throw new RestLiServiceException(HttpStatus.S_401_UNAUTHORIZED, "User is unauthorized to modify entity " + urn);
     }
-    String actorUrnStr = authentication.getActor().toUrnStr();
-    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+  }
 
-    return RestliUtil.toTask(() -> {
-      log.debug("Proposal: {}", metadataChangeProposal);
-      try {
-        final AspectsBatch batch;
-        if (asyncBool) {
-          // if async we'll expand the getAdditionalChanges later, no need to do this early
-          batch = AspectsBatchImpl.builder()
-                  .mcps(List.of(metadataChangeProposal), _entityService.getEntityRegistry())
-                  .build();
-        } else {
-          Stream<MetadataChangeProposal> proposalStream = Stream.concat(Stream.of(metadataChangeProposal),
-                  AspectUtils.getAdditionalChanges(metadataChangeProposal, _entityService).stream());
-
-          batch = AspectsBatchImpl.builder()
-                  .mcps(proposalStream.collect(Collectors.toList()), _entityService.getEntityRegistry())
-                  .build();
-        }
-
-        Set<IngestResult> results =
-                _entityService.ingestProposal(batch, auditStamp, asyncBool);
-
-        IngestResult one = results.stream()
-                .findFirst()
-                .get();
-
-        // Update runIds, only works for existing documents, so ES document must exist
-        Urn resultUrn = one.getUrn();
-        if (one.isProcessedMCL() || one.isUpdate()) {
-          tryIndexRunId(resultUrn, metadataChangeProposal.getSystemMetadata(), _entitySearchService);
-        }
-        return resultUrn.toString();
-      } catch (ValidationException e) {
-        throw new RestLiServiceException(HttpStatus.S_422_UNPROCESSABLE_ENTITY, e.getMessage());
+  private String ingestOneProposal(MetadataChangeProposal metadataChangeProposal, AuditStamp auditStamp, boolean asyncBool) {
+    log.debug("Proposal: {}", metadataChangeProposal);
+    try {
+      final AspectsBatch batch;
+      if (asyncBool) {
+        // if async we'll expand the getAdditionalChanges later, no need to do this early
+        batch = AspectsBatchImpl.builder()
+                .mcps(List.of(metadataChangeProposal), _entityService.getEntityRegistry())
+                .build();
+      } else {
+        Stream<MetadataChangeProposal> proposalStream = Stream.concat(Stream.of(metadataChangeProposal),
+                AspectUtils.getAdditionalChanges(metadataChangeProposal, _entityService).stream());
+
+        batch = AspectsBatchImpl.builder()
+                .mcps(proposalStream.collect(Collectors.toList()), _entityService.getEntityRegistry())
+                .build();
+      }
+
+      Set<IngestResult> results =
+              _entityService.ingestProposal(batch, auditStamp, asyncBool);
+
+      IngestResult one = results.stream()
+              .findFirst()
+              .get();
+
+      // Update runIds, only works for existing documents, so ES document must exist
+      Urn resultUrn = one.getUrn();
+      if (one.isProcessedMCL() || one.isUpdate()) {
+        tryIndexRunId(resultUrn, metadataChangeProposal.getSystemMetadata(), _entitySearchService);
       }
-    }, MetricRegistry.name(this.getClass(), "ingestProposal"));
+      return resultUrn.toString();
+    } catch (ValidationException e) {
+      throw new RestLiServiceException(HttpStatus.S_422_UNPROCESSABLE_ENTITY, e.getMessage());
+    }
   }
 
   @Action(name = ACTION_GET_COUNT)
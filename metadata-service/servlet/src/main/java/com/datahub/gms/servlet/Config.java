@@ -12,9 +12,12 @@ import com.linkedin.metadata.version.GitVersion;
 import com.linkedin.util.Pair;
 import java.io.IOException;
 import java.io.PrintWriter;
+import java.util.Arrays;
 import java.util.HashMap;
+import java.util.List;
 import java.util.Map;
 import java.time.ZoneId;
+import java.util.stream.Collectors;
 import javax.servlet.ServletContext;
 import javax.servlet.http.HttpServlet;
 import javax.servlet.http.HttpServletRequest;
@@ -33,9 +36,23 @@ public class Config extends HttpServlet {
     put("statefulIngestionCapable", true);
     put("patchCapable", true);
     put("timeZone", ZoneId.systemDefault().toString());
+    // Content-Encodings that request bodies may use, as set up in RAPServletFactory.
+    // Clients only compress their requests if the encoding is listed here.
+    put("requestCompression", getRequestCompression());
   }};
   ObjectMapper objectMapper = new ObjectMapper().setSerializationInclusion(JsonInclude.Include.NON_NULL);
 
+  private static List<String> getRequestCompression() {
+    String acceptCompression = System.getenv("RESTLI_SERVLET_ACCEPT_COMPRESSION");
+    if (acceptCompression == null) {
+      acceptCompression = "gzip,deflate";
+    }
+    return Arrays.stream(acceptCompression.split(","))
+        .map(String::trim)
+        .filter(encoding -> !encoding.isEmpty())
+        .collect(Collectors.toList());
+  }
+
   private Map<String, Map<ComparableVersion, EntityRegistryLoadResult>> getPluginModels(ServletContext servletContext) {
     WebApplicationContext ctx = WebApplicationContextUtils.getRequiredWebApplicationContext(servletContext);
     PluginEntityRegistryLoader pluginEntityRegistryLoader =